@@ -6,12 +6,26 @@
 from __future__ import annotations
 
 import argparse
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
 from dataclasses import asdict, replace
+from datetime import UTC, datetime
 import json
 from pathlib import Path
+import signal
 import sys
+import threading
 
 from agentic_flows.core.errors import ConfigurationError, classify_failure
+from agentic_flows.runtime.cancellation import CancellationToken
+from agentic_flows.runtime.execution.reasoning_cache import (
+    ReasoningCache,
+    reasoning_cache_dir_from_env,
+)
+from agentic_flows.runtime.execution.retrieval_cache import (
+    RetrievalCache,
+    retrieval_cache_dir_from_env,
+)
 from agentic_flows.runtime.observability.analysis.trace_diff import (
     entropy_summary,
     semantic_trace_diff,
@@ -24,6 +38,19 @@ from agentic_flows.runtime.observability.storage.execution_store import (
     DuckDBExecutionReadStore,
     DuckDBExecutionWriteStore,
 )
+from agentic_flows.runtime.observability.storage.execution_store_protocol import (
+    ExecutionWriteStoreProtocol,
+)
+from agentic_flows.runtime.observability.storage.writer_service import (
+    ExecutionStoreServer,
+    QueuedExecutionWriteStore,
+    RemoteExecutionWriteStore,
+    store_authkey_path,
+)
+from agentic_flows.runtime.orchestration.execute_batch import (
+    BatchRunSummary,
+    execute_flows,
+)
 from agentic_flows.runtime.orchestration.execute_flow import (
     ExecutionConfig,
     RunMode,
@@ -66,11 +93,21 @@ from agentic_flows.spec.ontology.ids import (
 )
 from agentic_flows.spec.ontology.public import (
     EntropySource,
+    EventType,
     NonDeterminismIntentSource,
     ReplayAcceptability,
     ReplayMode,
 )
 
+_FAILURE_EVENT_TYPES = (
+    EventType.STEP_FAILED,
+    EventType.RETRIEVAL_FAILED,
+    EventType.REASONING_FAILED,
+    EventType.VERIFICATION_FAIL,
+    EventType.TOOL_CALL_FAIL,
+    EventType.EXECUTION_INTERRUPTED,
+)
+
 
 def _load_manifest(path: Path) -> FlowManifest:
     """Internal helper; not part of the public API."""
@@ -216,7 +253,7 @@ def _load_policy(path: Path) -> VerificationPolicy:
 
 
 # Stable commands: run, replay, inspect.
-# Diagnostic-only commands: experimental/* (plan, dry-run, unsafe-run, diff, explain, validate).
+# Diagnostic-only commands: experimental/* (plan, dry-run, unsafe-run, diff, explain, validate, serve-store, archive-runs).
 # The CLI is not the primary API surface; contract-first integration should use the API schema.
 EXIT_FAILURE = 1
 EXIT_CONTRACT_VIOLATION = 2
@@ -244,8 +281,26 @@ def main() -> None:
     run_parser.add_argument("--policy", required=True)
     run_parser.add_argument("--db-path", required=True)
     run_parser.add_argument("--strict-determinism", action="store_true")
+    run_parser.add_argument("--parallel-steps", type=int, default=1)
+    run_parser.add_argument("--retrieval-lookahead", type=int, default=0)
+    run_parser.add_argument("--incremental", action="store_true")
+    run_parser.add_argument("--store-socket")
     run_parser.add_argument("--json", action="store_true")
 
+    run_batch_parser = subparsers.add_parser(
+        "run-batch",
+        help=(
+            "Runs many manifests in one process with the guarantees of run; "
+            "writes one JSON summary line per finished run."
+        ),
+    )
+    run_batch_parser.add_argument("manifests", nargs="+")
+    run_batch_parser.add_argument("--policy", required=True)
+    run_batch_parser.add_argument("--db-path", required=True)
+    run_batch_parser.add_argument("--strict-determinism", action="store_true")
+    run_batch_parser.add_argument("--max-workers", type=int, default=4)
+    run_batch_parser.add_argument("--summary-path")
+
     replay_parser = subparsers.add_parser(
         "replay",
         help=(
@@ -259,6 +314,7 @@ def main() -> None:
     replay_parser.add_argument("--tenant-id", required=True)
     replay_parser.add_argument("--db-path", required=True)
     replay_parser.add_argument("--strict-determinism", action="store_true")
+    replay_parser.add_argument("--store-socket")
     replay_parser.add_argument("--json", action="store_true")
 
     inspect_parser = subparsers.add_parser(
@@ -277,6 +333,11 @@ def main() -> None:
     inspect_run_parser.add_argument("--tenant-id", required=True)
     inspect_run_parser.add_argument("--db-path", required=True)
     inspect_run_parser.add_argument("--json", action="store_true")
+    inspect_run_parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Include recorded wall-clock timings; they are never hashed or diffed.",
+    )
 
     experimental_parser = subparsers.add_parser(
         "experimental",
@@ -363,7 +424,29 @@ def main() -> None:
     validate_db_parser.add_argument("--db-path", required=True)
     validate_db_parser.add_argument("--json", action="store_true")
 
+    serve_store_parser = experimental_subparsers.add_parser(
+        "serve-store",
+        help=argparse.SUPPRESS,
+        description=argparse.SUPPRESS,
+    )
+    serve_store_parser.add_argument("--db-path", required=True)
+    serve_store_parser.add_argument("--socket", required=True)
+    serve_store_parser.add_argument("--buffered", action="store_true")
+
+    archive_parser = experimental_subparsers.add_parser(
+        "archive-runs",
+        help=argparse.SUPPRESS,
+        description=argparse.SUPPRESS,
+    )
+    archive_parser.add_argument("--db-path", required=True)
+    archive_parser.add_argument("--archive-dir", required=True)
+    archive_parser.add_argument("--before", required=True)
+    archive_parser.add_argument("--json", action="store_true")
+
     args = parser.parse_args()
+    if args.command == "run-batch":
+        _run_batch(args)
+        return
     if args.command == "inspect" and args.inspect_command == "run":
         _inspect_run(args, json_output=args.json)
         return
@@ -391,6 +474,12 @@ def main() -> None:
     ):
         _validate_db(args, json_output=args.json)
         return
+    if args.command == "experimental" and args.experimental_command == "serve-store":
+        _serve_store(args)
+        return
+    if args.command == "experimental" and args.experimental_command == "archive-runs":
+        _archive_runs(args, json_output=args.json)
+        return
 
     manifest_path = Path(args.manifest)
     manifest = _load_manifest(manifest_path)
@@ -405,15 +494,39 @@ def main() -> None:
         config = ExecutionConfig(
             mode=config.mode,
             determinism_level=manifest.determinism_level,
-            execution_store=DuckDBExecutionWriteStore(Path(args.db_path)),
+            execution_store=_write_store(args),
         )
     if getattr(args, "strict_determinism", False):
         config = replace(config, strict_determinism=True)
+    if getattr(args, "parallel_steps", 1) > 1:
+        config = replace(config, max_parallel_steps=args.parallel_steps)
+    if getattr(args, "retrieval_lookahead", 0) > 0:
+        config = replace(config, retrieval_lookahead=args.retrieval_lookahead)
+    if getattr(args, "incremental", False):
+        # Earlier outputs are read from the write store's database; with a
+        # daemon, its writer serves those reads.
+        config = replace(config, incremental=True)
+    retrieval_cache_dir = retrieval_cache_dir_from_env()
+    if retrieval_cache_dir is not None:
+        config = replace(
+            config, retrieval_cache=RetrievalCache(cache_dir=retrieval_cache_dir)
+        )
+    reasoning_cache_dir = reasoning_cache_dir_from_env()
+    if reasoning_cache_dir is not None:
+        config = replace(
+            config, reasoning_cache=ReasoningCache(cache_dir=reasoning_cache_dir)
+        )
     if getattr(args, "policy", None):
         policy = _load_policy(Path(args.policy))
         config = replace(config, verification_policy=policy)
+    # Plans never enter the step loop, so only executing modes can be cancelled.
+    cancellation = None
+    if config.mode != RunMode.PLAN:
+        cancellation = CancellationToken()
+        config = replace(config, cancellation=cancellation)
     try:
-        result = execute_flow(manifest, config=config)
+        with _cancel_on_interrupt(cancellation):
+            result = execute_flow(manifest, config=config)
     except Exception as exc:
         if isinstance(exc, ConfigurationError):
             print(str(exc), file=sys.stderr)
@@ -427,6 +540,29 @@ def main() -> None:
     _render_result(command, result, json_output=args.json)
 
 
+@contextmanager
+def _cancel_on_interrupt(cancellation: CancellationToken | None) -> Iterator[None]:
+    """Internal helper; not part of the public API."""
+    # SIGINT handlers can only be installed from the main thread, so the CLI
+    # owns this wiring; the runtime only polls the cancellation token.
+    if (
+        cancellation is None
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def _handle_interrupt(_signum, _frame) -> None:
+        """Internal helper; not part of the public API."""
+        cancellation.cancel("sigint")
+
+    previous_handler = signal.signal(signal.SIGINT, _handle_interrupt)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+
+
 def _render_result(command: str, result, *, json_output: bool) -> None:
     """Internal helper; not part of the public API."""
     if json_output:
@@ -611,24 +747,59 @@ def _normalize_for_json(value, *, normalize_timestamps: bool = False):
 def _inspect_run(args: argparse.Namespace, *, json_output: bool) -> None:
     """Internal helper; not part of the public API."""
     store = DuckDBExecutionReadStore(Path(args.db_path))
-    trace = store.load_trace(RunID(args.run_id), tenant_id=TenantID(args.tenant_id))
-    if json_output:
-        payload = _normalize_for_json(asdict(trace))
-        print(json.dumps(payload, sort_keys=True))
-        return
+    run_id = RunID(args.run_id)
+    tenant_id = TenantID(args.tenant_id)
+    # One session, so every count below comes from the same view of the run.
+    with store.session():
+        timings = (
+            store.load_timings(run_id, tenant_id=tenant_id) if args.timings else None
+        )
+        if json_output:
+            trace = store.load_trace(run_id, tenant_id=tenant_id)
+            payload = _normalize_for_json(asdict(trace))
+            if timings is not None:
+                payload["timings"] = [
+                    {**asdict(item), "duration_ns": item.duration_ns}
+                    for item in timings
+                ]
+            print(json.dumps(payload, sort_keys=True))
+            return
+        # Unknown runs still raise; the summary only counts rows, so event
+        # payloads are never decoded.
+        store.load_replay_envelope(run_id, tenant_id=tenant_id)
+        event_count = sum(
+            1
+            for _ in store.iter_events(
+                run_id, tenant_id=tenant_id, decode_payloads=False
+            )
+        )
+        tool_invocations = store.load_tool_invocations(run_id, tenant_id=tenant_id)
+        entropy_usage = store.load_entropy_usage(run_id, tenant_id=tenant_id)
     print(
-        f"Run {args.run_id}: events={len(trace.events)} "
-        f"tool_invocations={len(trace.tool_invocations)} "
-        f"entropy_entries={len(trace.entropy_usage)}"
+        f"Run {args.run_id}: events={event_count} "
+        f"tool_invocations={len(tool_invocations)} "
+        f"entropy_entries={len(entropy_usage)}"
     )
+    for item in timings or ():
+        step = "-" if item.step_index is None else item.step_index
+        print(
+            f"  {item.scope} {item.label} step={step} "
+            f"duration_ms={item.duration_ns / 1_000_000:.3f}"
+        )
 
 
 def _diff_runs(args: argparse.Namespace, *, json_output: bool) -> None:
     """Internal helper; not part of the public API."""
     store = DuckDBExecutionReadStore(Path(args.db_path))
     tenant_id = TenantID(args.tenant_id)
-    trace_a = store.load_trace(RunID(args.run_a), tenant_id=tenant_id)
-    trace_b = store.load_trace(RunID(args.run_b), tenant_id=tenant_id)
+    # The semantic diff compares event hashes, never payload bodies.
+    with store.session():
+        trace_a = store.load_trace(
+            RunID(args.run_a), tenant_id=tenant_id, decode_payloads=False
+        )
+        trace_b = store.load_trace(
+            RunID(args.run_b), tenant_id=tenant_id, decode_payloads=False
+        )
     diff = semantic_trace_diff(
         trace_a, trace_b, acceptability=trace_a.replay_acceptability
     )
@@ -644,34 +815,33 @@ def _diff_runs(args: argparse.Namespace, *, json_output: bool) -> None:
 def _explain_failure(args: argparse.Namespace, *, json_output: bool) -> None:
     """Internal helper; not part of the public API."""
     store = DuckDBExecutionReadStore(Path(args.db_path))
-    trace = store.load_trace(RunID(args.run_id), tenant_id=TenantID(args.tenant_id))
-    failure_events = [
-        event
-        for event in trace.events
-        if event.event_type.value
-        in {
-            "STEP_FAILED",
-            "RETRIEVAL_FAILED",
-            "REASONING_FAILED",
-            "VERIFICATION_FAIL",
-            "TOOL_CALL_FAIL",
-            "EXECUTION_INTERRUPTED",
-        }
-    ]
+    run_id = RunID(args.run_id)
+    tenant_id = TenantID(args.tenant_id)
+    with store.session():
+        # Unknown runs still raise.
+        store.load_replay_envelope(run_id, tenant_id=tenant_id)
+        # Only the most recent failure is reported; read one row from the end.
+        last = next(
+            store.iter_events(
+                run_id,
+                tenant_id=tenant_id,
+                batch_size=1,
+                event_types=_FAILURE_EVENT_TYPES,
+                newest_first=True,
+            ),
+            None,
+        )
     payload = {
         "run_id": args.run_id,
-        "failure": _normalize_for_json(
-            failure_events[-1].payload, normalize_timestamps=True
-        )
-        if failure_events
+        "failure": _normalize_for_json(last.payload, normalize_timestamps=True)
+        if last is not None
         else None,
-        "event_type": failure_events[-1].event_type.value if failure_events else None,
+        "event_type": last.event_type.value if last is not None else None,
     }
     if json_output:
         print(json.dumps(payload, sort_keys=True))
         return
-    if failure_events:
-        last = failure_events[-1]
+    if last is not None:
         print(f"Failure {last.event_type.value}: {_normalize_for_json(last.payload)}")
     else:
         print("No failure events recorded")
@@ -679,13 +849,103 @@ def _explain_failure(args: argparse.Namespace, *, json_output: bool) -> None:
 
 def _validate_db(args: argparse.Namespace, *, json_output: bool) -> None:
     """Internal helper; not part of the public API."""
-    DuckDBExecutionReadStore(Path(args.db_path))
+    # Validation replays migration checksums, which needs the writer path.
+    DuckDBExecutionWriteStore(Path(args.db_path)).close()
     if json_output:
         print(json.dumps({"status": "ok"}, sort_keys=True))
         return
     print("DB validated: ok")
 
 
+def _write_store(args: argparse.Namespace) -> ExecutionWriteStoreProtocol:
+    """Internal helper; not part of the public API."""
+    if getattr(args, "store_socket", None):
+        return RemoteExecutionWriteStore(Path(args.store_socket))
+    return DuckDBExecutionWriteStore(Path(args.db_path))
+
+
+def _run_batch(args: argparse.Namespace) -> None:
+    """Internal helper; not part of the public API."""
+    manifest_paths = [Path(path) for path in args.manifests]
+    try:
+        manifests = [_load_manifest(path) for path in manifest_paths]
+    except ConfigurationError as exc:
+        print(str(exc), file=sys.stderr)
+        raise SystemExit(EXIT_CONTRACT_VIOLATION) from exc
+    store = QueuedExecutionWriteStore(Path(args.db_path))
+    config = ExecutionConfig(
+        mode=RunMode.LIVE,
+        determinism_level=None,
+        verification_policy=_load_policy(Path(args.policy)),
+        execution_store=store,
+        strict_determinism=bool(args.strict_determinism),
+        cancellation=CancellationToken(),
+        # One cache serves every flow, so frozen-dataset queries repeated
+        # across manifests reach the backend once.
+        retrieval_cache=RetrievalCache(cache_dir=retrieval_cache_dir_from_env()),
+        reasoning_cache=ReasoningCache(cache_dir=reasoning_cache_dir_from_env()),
+    )
+    with ExitStack() as stack:
+        stack.callback(store.close)
+        stack.enter_context(_cancel_on_interrupt(config.cancellation))
+        summary_stream = (
+            stack.enter_context(Path(args.summary_path).open("a", encoding="utf-8"))
+            if args.summary_path
+            else sys.stdout
+        )
+
+        def _emit(summary: BatchRunSummary) -> None:
+            """Internal helper; not part of the public API."""
+            payload = asdict(summary)
+            payload["manifest"] = str(manifest_paths[summary.index])
+            summary_stream.write(json.dumps(payload, sort_keys=True) + "\n")
+            summary_stream.flush()
+
+        summaries = execute_flows(
+            manifests,
+            config,
+            max_workers=args.max_workers,
+            on_summary=_emit,
+        )
+    if any(summary.status == "failed" for summary in summaries):
+        raise SystemExit(EXIT_FAILURE)
+
+
+def _serve_store(args: argparse.Namespace) -> None:
+    """Internal helper; not part of the public API."""
+    server = ExecutionStoreServer(
+        Path(args.db_path),
+        Path(args.socket),
+        buffered=bool(args.buffered),
+    )
+    print(
+        f"Store daemon listening: socket={args.socket} db={args.db_path} "
+        f"key={store_authkey_path(Path(args.socket))}"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+def _archive_runs(args: argparse.Namespace, *, json_output: bool) -> None:
+    """Internal helper; not part of the public API."""
+    before = datetime.fromisoformat(args.before)
+    if before.tzinfo is None:
+        before = before.replace(tzinfo=UTC)
+    store = DuckDBExecutionWriteStore(Path(args.db_path))
+    try:
+        archived = store.archive_runs(Path(args.archive_dir), before=before)
+    finally:
+        store.close()
+    if json_output:
+        print(json.dumps({"archived_runs": list(archived)}, sort_keys=True))
+        return
+    print(f"Archived runs: {len(archived)} -> {args.archive_dir}")
+
+
 def _replay_confidence(acceptability: ReplayAcceptability) -> str:
     """Internal helper; not part of the public API."""
     if acceptability == ReplayAcceptability.EXACT_MATCH:
@@ -704,7 +964,7 @@ def _replay_run(args: argparse.Namespace, *, json_output: bool) -> None:
     planner = ExecutionPlanner()
     resolved_flow = planner.resolve(manifest)
     read_store = DuckDBExecutionReadStore(Path(args.db_path))
-    write_store = DuckDBExecutionWriteStore(Path(args.db_path))
+    write_store = _write_store(args)
     config = ExecutionConfig(
         mode=_config_mode_for_replay(),
         determinism_level=manifest.determinism_level,
@@ -712,14 +972,23 @@ def _replay_run(args: argparse.Namespace, *, json_output: bool) -> None:
         execution_read_store=read_store,
         verification_policy=policy,
         strict_determinism=bool(args.strict_determinism),
+        cancellation=CancellationToken(),
     )
-    diff, result = replay_with_store(
-        store=read_store,
-        run_id=RunID(args.run_id),
-        tenant_id=TenantID(args.tenant_id),
-        resolved_flow=resolved_flow,
-        config=config,
-    )
+    reasoning_cache_dir = reasoning_cache_dir_from_env()
+    if reasoning_cache_dir is not None:
+        # Replays of strict runs reason over the recorded inputs again, so
+        # bundles cached by the original run are served without the backend.
+        config = replace(
+            config, reasoning_cache=ReasoningCache(cache_dir=reasoning_cache_dir)
+        )
+    with _cancel_on_interrupt(config.cancellation):
+        diff, result = replay_with_store(
+            store=read_store,
+            run_id=RunID(args.run_id),
+            tenant_id=TenantID(args.tenant_id),
+            resolved_flow=resolved_flow,
+            config=config,
+        )
     if json_output:
         payload = {
             "diff": _normalize_for_json(diff, normalize_timestamps=True),
@@ -26,8 +26,9 @@ from agentic_flows.http_api.v1.schemas import (
     FlowRunRequest,
     ReplayRequest,
 )
-from agentic_flows.runtime.observability.storage.execution_store import (
-    DuckDBExecutionWriteStore,
+from agentic_flows.runtime.observability.storage.writer_service import (
+    STORE_SOCKET_ENV,
+    ping_store_daemon,
 )
 
 app = FastAPI(
@@ -118,14 +119,24 @@ def health() -> dict[str, str]:
 
 @app.get("/ready")
 @app.get("/api/v1/ready")
-def ready() -> dict[str, str]:
+def ready() -> dict[str, bool]:
     """Provide a readiness signal without performing deep dependency checks."""
+    socket_path = os.environ.get(STORE_SOCKET_ENV)
+    if socket_path:
+        # A shared writer daemon owns the store; probing it avoids taking the
+        # writer lock away from running flows.
+        if ping_store_daemon(Path(socket_path)):
+            return {"ready": True}
+        return JSONResponse(status_code=503, content={"ready": False})
     db_path = os.environ.get("AGENTIC_FLOWS_DB_PATH")
     if not db_path:
         return JSONResponse(status_code=503, content={"ready": False})
-    try:
-        DuckDBExecutionWriteStore(Path(db_path))
-    except Exception:
+    # Only file permissions are checked: opening the store would take the
+    # writer lock away from running flows on every probe.
+    target = Path(db_path)
+    if not target.exists():
+        target = target.parent
+    if not os.access(target, os.W_OK):
         return JSONResponse(status_code=503, content={"ready": False})
     return {"ready": True}
 
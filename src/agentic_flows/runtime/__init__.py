@@ -5,10 +5,24 @@
 
 from __future__ import annotations
 
+from agentic_flows.runtime.cancellation import CancellationToken
+from agentic_flows.runtime.orchestration.execute_batch import (
+    BatchRunSummary,
+    execute_flows,
+)
 from agentic_flows.runtime.orchestration.execute_flow import (
     FlowRunResult,
     RunMode,
     execute_flow,
+    execute_flow_async,
 )
 
-__all__ = ["FlowRunResult", "RunMode", "execute_flow"]
+__all__ = [
+    "BatchRunSummary",
+    "CancellationToken",
+    "FlowRunResult",
+    "RunMode",
+    "execute_flow",
+    "execute_flow_async",
+    "execute_flows",
+]
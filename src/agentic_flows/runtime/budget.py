@@ -5,7 +5,15 @@
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future
 from dataclasses import dataclass
+import threading
+import time
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
 
 
 @dataclass(frozen=True)
@@ -18,19 +26,118 @@ class ExecutionBudget:
     artifact_step_limit: int | None
     evidence_limit: int | None
     trace_event_limit: int | None
+    # Wall-clock limits in seconds.
+    run_time_limit: float | None = None
+    step_time_limit: float | None = None
+    tool_call_time_limit: float | None = None
+
+
+class DeadlineExceededError(ValueError):
+    """Wall-clock budget failure; misuse hides which deadline was missed."""
+
+    def __init__(self, scope: str) -> None:
+        """Internal helper; not part of the public API."""
+        super().__init__(f"{scope.replace('_', ' ')} deadline exceeded")
+        self.scope = scope
+
+
+class _ToolCallPool:
+    """Daemon workers for one run's deadline-bound calls; misuse leaks threads."""
+
+    def __init__(self, *, max_workers: int, idle_timeout: float = 5.0) -> None:
+        """Internal helper; not part of the public API."""
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._max_workers = max_workers
+        self._idle_timeout = idle_timeout
+        self._work: deque[tuple[Callable[[], object], Future[Any]]] = deque()
+        self._abandoned: set[Future[Any]] = set()
+        # Workers that still count against max_workers; abandoned ones do not.
+        self._workers = 0
+        self._idle = 0
+        self._ready = threading.Condition()
+
+    def submit(self, call: Callable[[], _T]) -> Future[_T]:
+        """Internal helper; not part of the public API."""
+        outcome: Future[_T] = Future()
+        with self._ready:
+            self._work.append((call, outcome))
+            self._grow()
+            self._ready.notify()
+        return outcome
+
+    def abandon(self, outcome: Future[Any]) -> None:
+        """Internal helper; not part of the public API."""
+        if outcome.cancel():
+            return
+        with self._ready:
+            if outcome.done():
+                return
+            # A hung call cannot be interrupted; its worker exits once the
+            # call returns, and a fresh one takes over the calls behind it.
+            self._abandoned.add(outcome)
+            self._workers -= 1
+            self._grow()
+
+    def _grow(self) -> None:
+        """Internal helper; not part of the public API."""
+        if len(self._work) > self._idle and self._workers < self._max_workers:
+            self._workers += 1
+            # Workers are daemons: a hung backend call cannot be
+            # interrupted, so it must not hold the process at exit.
+            threading.Thread(
+                target=self._work_loop,
+                name="agentic-flows-tool-call",
+                daemon=True,
+            ).start()
+
+    def _work_loop(self) -> None:
+        """Internal helper; not part of the public API."""
+        while True:
+            with self._ready:
+                while not self._work:
+                    self._idle += 1
+                    notified = self._ready.wait(self._idle_timeout)
+                    self._idle -= 1
+                    if not notified and not self._work:
+                        self._workers -= 1
+                        return
+                call, outcome = self._work.popleft()
+            if outcome.set_running_or_notify_cancel():
+                try:
+                    outcome.set_result(call())
+                except BaseException as exc:
+                    outcome.set_exception(exc)
+            with self._ready:
+                if outcome in self._abandoned:
+                    self._abandoned.discard(outcome)
+                    return
 
 
 class BudgetState:
     """Budget tracker; misuse breaks budget accounting."""
 
-    def __init__(self, budget: ExecutionBudget | None) -> None:
+    def __init__(
+        self,
+        budget: ExecutionBudget | None,
+        *,
+        run_started: float | None = None,
+        max_parallel_calls: int = 1,
+    ) -> None:
         """Internal helper; not part of the public API."""
         self._budget = budget
+        # Sized for the run's own concurrency; a call abandoned at its
+        # deadline stops counting, so hung calls never starve later ones.
+        self._tool_calls = _ToolCallPool(max_workers=max_parallel_calls)
         self._steps = 0
         self._tokens = 0
         self._artifacts = 0
         self._trace_events = 0
         self._step_artifacts = 0
+        # Flow preparation passes its own start so planning counts against
+        # run_time_limit; otherwise the run clock starts at the first step.
+        self._run_started = run_started
+        self._step_started: float | None = None
 
     def consume(self, *, steps: int = 0, tokens: int = 0, artifacts: int = 0) -> None:
         """Execute consume and enforce its contract."""
@@ -56,9 +163,64 @@ class BudgetState:
         ):
             raise ValueError("artifact budget exceeded")
 
+    def steps_remaining(self) -> int | None:
+        """Return how many more steps the budget admits, or None when unlimited."""
+        if self._budget is None or self._budget.step_limit is None:
+            return None
+        return self._budget.step_limit - self._steps
+
     def start_step(self) -> None:
         """Execute start_step and enforce its contract."""
         self._step_artifacts = 0
+        now = time.monotonic()
+        if self._run_started is None:
+            self._run_started = now
+        self._step_started = now
+
+    def check_deadlines(self) -> None:
+        """Raise when the run or the current step is past its wall-clock limit."""
+        remaining = self._remaining()
+        if remaining is not None and remaining[0] <= 0:
+            raise DeadlineExceededError(remaining[1])
+
+    def run_tool_call(self, call: Callable[[], _T]) -> _T:
+        """Run a backend call, giving up once the tightest deadline passes."""
+        remaining = self._remaining(
+            self._budget.tool_call_time_limit if self._budget is not None else None
+        )
+        if remaining is None:
+            return call()
+        timeout, scope = remaining
+        if timeout <= 0:
+            raise DeadlineExceededError(scope)
+        outcome = self._tool_calls.submit(call)
+        try:
+            return outcome.result(timeout=timeout)
+        except TimeoutError:
+            self._tool_calls.abandon(outcome)
+            raise DeadlineExceededError(scope) from None
+
+    def _remaining(
+        self, tool_call_limit: float | None = None
+    ) -> tuple[float, str] | None:
+        """Internal helper; not part of the public API."""
+        if self._budget is None:
+            return None
+        now = time.monotonic()
+        windows: list[tuple[float, str]] = []
+        if tool_call_limit is not None:
+            windows.append((tool_call_limit, "tool_call"))
+        if self._budget.step_time_limit is not None and self._step_started is not None:
+            windows.append(
+                (self._budget.step_time_limit - (now - self._step_started), "step")
+            )
+        if self._budget.run_time_limit is not None and self._run_started is not None:
+            windows.append(
+                (self._budget.run_time_limit - (now - self._run_started), "run")
+            )
+        if not windows:
+            return None
+        return min(windows, key=lambda window: window[0])
 
     def consume_step_artifacts(self, artifacts: int) -> None:
         """Execute consume_step_artifacts and enforce its contract."""
@@ -93,4 +255,4 @@ class BudgetState:
             raise ValueError("trace budget exceeded")
 
 
-__all__ = ["BudgetState", "ExecutionBudget"]
+__all__ = ["BudgetState", "DeadlineExceededError", "ExecutionBudget"]
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Module definitions for runtime/cancellation.py."""
+
+from __future__ import annotations
+
+import threading
+
+
+class CancellationToken:
+    """Cooperative cancellation flag polled by the step loop; safe across threads."""
+
+    def __init__(self) -> None:
+        """Internal helper; not part of the public API."""
+        self._event = threading.Event()
+        self._reason: str | None = None
+        self._lock = threading.Lock()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Request cancellation; the first reason given is kept."""
+        with self._lock:
+            if self._reason is None:
+                self._reason = reason
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        """Execute is_cancelled and enforce its contract."""
+        return self._event.is_set()
+
+    @property
+    def reason(self) -> str | None:
+        """Reason passed to the first cancel call, or None while not cancelled."""
+        return self._reason
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until cancelled or the timeout expires; return whether cancelled."""
+        return self._event.wait(timeout)
+
+
+__all__ = ["CancellationToken"]
@@ -5,15 +5,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 from agentic_flows.core.authority import AuthorityToken
 from agentic_flows.runtime.artifact_store import ArtifactStore
 from agentic_flows.runtime.budget import BudgetState
+from agentic_flows.runtime.cancellation import CancellationToken
 from agentic_flows.runtime.observability.capture.hooks import RuntimeObserver
 from agentic_flows.runtime.observability.capture.observed_run import ObservedRun
+from agentic_flows.runtime.observability.capture.timings import TimingRecorder
 from agentic_flows.runtime.observability.capture.trace_recorder import TraceRecorder
 from agentic_flows.runtime.orchestration.non_determinism_lifecycle import (
     NonDeterminismLifecycle,
@@ -37,10 +40,19 @@ from agentic_flows.spec.ontology.ids import (
 from agentic_flows.spec.ontology.public import EntropySource
 
 if TYPE_CHECKING:
+    from agentic_flows.runtime.execution.reasoning_cache import (
+        ReasoningCacheProtocol,
+    )
+    from agentic_flows.runtime.execution.retrieval_cache import (
+        RetrievalCacheProtocol,
+    )
+    from agentic_flows.runtime.execution.step_reuse import StepOutputIndex
     from agentic_flows.runtime.observability.storage.execution_store_protocol import (
         ExecutionWriteStoreProtocol,
     )
 
+_T = TypeVar("_T")
+
 
 class RunMode(str, Enum):
     """Execution mode; misuse breaks mode-specific guarantees."""
@@ -84,7 +96,11 @@ class ExecutionContext:
     _step_artifacts: dict[int, tuple[Artifact, ...]]
     strict_determinism: bool = False
     observed_run: ObservedRun | None = None
-    _cancelled: bool = False
+    cancellation: CancellationToken = field(default_factory=CancellationToken)
+    retrieval_cache: RetrievalCacheProtocol | None = None
+    step_outputs: StepOutputIndex | None = None
+    reasoning_cache: ReasoningCacheProtocol | None = None
+    timings: TimingRecorder = field(default_factory=TimingRecorder)
 
     def record_evidence(
         self, step_index: int, evidence: list[RetrievedEvidence]
@@ -127,6 +143,17 @@ class ExecutionContext:
         """Execute start_step_budget and enforce its contract."""
         self.budget.start_step()
 
+    def check_deadlines(self) -> None:
+        """Execute check_deadlines and enforce its contract."""
+        self.budget.check_deadlines()
+
+    def run_tool_call(
+        self, call: Callable[[], _T], *, tool_id: str, step_index: int
+    ) -> _T:
+        """Execute run_tool_call and enforce its contract."""
+        with self.timings.measure("tool_call", tool_id, step_index=step_index):
+            return self.budget.run_tool_call(call)
+
     def consume_step_artifacts(self, artifacts: int) -> None:
         """Execute consume_step_artifacts and enforce its contract."""
         self.budget.consume_step_artifacts(artifacts)
@@ -158,13 +185,13 @@ class ExecutionContext:
         """Execute entropy_usage and enforce its contract."""
         return self.entropy.usage()
 
-    def cancel(self) -> None:
+    def cancel(self, reason: str = "cancelled") -> None:
         """Execute cancel and enforce its contract."""
-        object.__setattr__(self, "_cancelled", True)
+        self.cancellation.cancel(reason)
 
     def is_cancelled(self) -> bool:
         """Execute is_cancelled and enforce its contract."""
-        return object.__getattribute__(self, "_cancelled")
+        return self.cancellation.is_cancelled()
 
 
 __all__ = ["RunMode"]
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 import hashlib
 from typing import Any
 
@@ -17,6 +18,7 @@ from agentic_flows.runtime.context import ExecutionContext
 from agentic_flows.runtime.execution.state_tracker import ExecutionStateTracker
 from agentic_flows.runtime.observability.classification.seed import deterministic_seed
 from agentic_flows.spec.model.artifact.artifact import Artifact
+from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
 from agentic_flows.spec.model.execution.resolved_step import ResolvedStep
 from agentic_flows.spec.ontology import (
     ArtifactScope,
@@ -41,12 +43,10 @@ class AgentExecutor:
             raise RuntimeError("bijux_agent.run is required for agent execution")
 
         evidence = list(context.evidence_for_step(step.step_index))
-        outputs = bijux_agent.run(
-            agent_id=step.agent_invocation.agent_id,
-            seed=seed,
-            inputs_fingerprint=step.inputs_fingerprint,
-            declared_outputs=step.agent_invocation.declared_outputs,
-            evidence=evidence,
+        outputs = context.run_tool_call(
+            lambda: self._invoke(step, seed, evidence),
+            tool_id="bijux-agent.run",
+            step_index=step.step_index,
         )
         artifacts = self._artifacts_from_outputs(step, outputs, context)
         state_artifact = self._state_artifact(step, artifacts, context)
@@ -54,13 +54,80 @@ class AgentExecutor:
         context.record_artifacts(step.step_index, artifacts)
         return artifacts
 
+    def reuse(
+        self,
+        step: ResolvedStep,
+        outputs: Sequence[Artifact],
+        context: ExecutionContext,
+    ) -> list[Artifact]:
+        """Record an earlier run's outputs for the step without invoking the agent."""
+        if self._state_tracker is None:
+            self._state_tracker = ExecutionStateTracker(context.seed)
+        artifacts = [
+            context.artifact_store.create(
+                spec_version=item.spec_version,
+                artifact_id=item.artifact_id,
+                tenant_id=context.tenant_id,
+                artifact_type=item.artifact_type,
+                producer=item.producer,
+                parent_artifacts=item.parent_artifacts,
+                content_hash=item.content_hash,
+                scope=item.scope,
+            )
+            for item in outputs
+        ]
+        artifacts.append(self._state_artifact(step, artifacts, context))
+        context.record_artifacts(step.step_index, artifacts)
+        return artifacts
+
+    def predict_artifacts(
+        self,
+        step: ResolvedStep,
+        outputs: Any,
+        context: ExecutionContext,
+        *,
+        state_hash: ContentHash,
+    ) -> list[Artifact]:
+        """Build the artifacts execute would record, without storing them."""
+        artifacts = self._artifacts_from_outputs(
+            step, outputs, context, create=Artifact
+        )
+        artifacts.append(
+            self._state_artifact(
+                step, artifacts, context, state_hash=state_hash, create=Artifact
+            )
+        )
+        return artifacts
+
+    def _invoke(
+        self, step: ResolvedStep, seed: int, evidence: list[RetrievedEvidence]
+    ) -> Any:
+        """Internal helper; not part of the public API."""
+        return bijux_agent.run(**self._run_arguments(step, seed, evidence))
+
+    @staticmethod
+    def _run_arguments(
+        step: ResolvedStep, seed: int, evidence: list[RetrievedEvidence]
+    ) -> dict[str, Any]:
+        """Internal helper; not part of the public API."""
+        return {
+            "agent_id": step.agent_invocation.agent_id,
+            "seed": seed,
+            "inputs_fingerprint": step.inputs_fingerprint,
+            "declared_outputs": step.agent_invocation.declared_outputs,
+            "evidence": evidence,
+        }
+
     def _artifacts_from_outputs(
         self,
         step: ResolvedStep,
         outputs: Any,
         context: ExecutionContext,
+        *,
+        create: Callable[..., Artifact] | None = None,
     ) -> list[Artifact]:
         """Internal helper; not part of the public API."""
+        create = create or context.artifact_store.create
         if not isinstance(outputs, list):
             raise ValueError("agent outputs must be a list")
 
@@ -82,7 +149,7 @@ class AgentExecutor:
 
             artifact_type = ArtifactType(str(entry["artifact_type"]))
             artifacts.append(
-                context.artifact_store.create(
+                create(
                     spec_version="v1",
                     artifact_id=ArtifactID(str(entry["artifact_id"])),
                     tenant_id=context.tenant_id,
@@ -102,10 +169,15 @@ class AgentExecutor:
         step: ResolvedStep,
         artifacts: list[Artifact],
         context: ExecutionContext,
+        *,
+        state_hash: ContentHash | None = None,
+        create: Callable[..., Artifact] | None = None,
     ) -> Artifact:
         """Internal helper; not part of the public API."""
-        state_hash = self._state_tracker.advance(step)
-        return context.artifact_store.create(
+        if state_hash is None:
+            state_hash = self._state_tracker.advance(step)
+        create = create or context.artifact_store.create
+        return create(
             spec_version="v1",
             artifact_id=ArtifactID(f"state-{step.step_index}-{step.agent_id}"),
             tenant_id=context.tenant_id,
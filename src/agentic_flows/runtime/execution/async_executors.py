@@ -0,0 +1,162 @@
+# INTERNAL — NOT A PUBLIC EXTENSION POINT
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Module definitions for runtime/execution/async_executors.py."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import inspect
+import threading
+from typing import Any, ClassVar, TypeVar
+
+import bijux_agent
+import bijux_rag
+import bijux_rar
+
+from agentic_flows.runtime.execution.agent_executor import AgentExecutor
+from agentic_flows.runtime.execution.reasoning_executor import ReasoningExecutor
+from agentic_flows.runtime.execution.retrieval_executor import RetrievalExecutor
+from agentic_flows.spec.model.artifact.artifact import Artifact
+from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
+from agentic_flows.spec.model.execution.resolved_step import ResolvedStep
+
+_T = TypeVar("_T")
+
+# Each flow holds one flow worker for its whole step loop, so this is also
+# the number of flows that progress at once on a shared adapter.
+DEFAULT_MAX_FLOWS = 32
+
+
+class SyncBackendAdapter:
+    """Awaitable bridge to backends; blocking ones run on a bounded thread pool.
+
+    Synchronous flow work (preparation, the step loop and finalization) runs
+    on a second pool of ``max_flows`` workers, so at most that many flows make
+    progress at once and the rest wait for a free worker.
+    """
+
+    _shared: ClassVar[dict[int, SyncBackendAdapter]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self, *, max_workers: int = 16, max_flows: int = DEFAULT_MAX_FLOWS
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_flows < 1:
+            raise ValueError("max_flows must be at least 1")
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="agentic-flows-backend"
+        )
+        # Kept apart from the backend pool: a step loop waits on backend
+        # calls, so sharing workers with them could starve both.
+        self._flow_pool = ThreadPoolExecutor(
+            max_workers=max_flows, thread_name_prefix="agentic-flows-flow"
+        )
+
+    @classmethod
+    def shared(cls, *, max_flows: int = DEFAULT_MAX_FLOWS) -> SyncBackendAdapter:
+        """Return the process-wide adapter for max_flows, used when none is supplied."""
+        with cls._shared_lock:
+            adapter = cls._shared.get(max_flows)
+            if adapter is None:
+                adapter = cls._shared[max_flows] = cls(max_flows=max_flows)
+            return adapter
+
+    async def call(self, backend: Callable[..., Any], /, **kwargs: Any) -> Any:
+        """Await a backend call, offloading it to the pool when it blocks."""
+        if inspect.iscoroutinefunction(backend):
+            return await backend(**kwargs)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self._pool, functools.partial(backend, **kwargs)
+        )
+        # Plain callables that hand back a coroutine are awaited on the loop.
+        if inspect.isawaitable(result):
+            return await result
+        return result
+
+    async def run_blocking(
+        self, function: Callable[..., _T], /, *args: Any, **kwargs: Any
+    ) -> _T:
+        """Await synchronous flow work on the bounded flow pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._flow_pool, functools.partial(function, *args, **kwargs)
+        )
+
+    def close(self) -> None:
+        """Shut both pools down once running calls finish."""
+        self._pool.shutdown(wait=True)
+        self._flow_pool.shutdown(wait=True)
+
+
+class AsyncAgentExecutor(AgentExecutor):
+    """Agent executor whose backend call can be awaited."""
+
+    def __init__(self, adapter: SyncBackendAdapter) -> None:
+        """Internal helper; not part of the public API."""
+        super().__init__()
+        self._adapter = adapter
+
+    async def invoke(
+        self, step: ResolvedStep, seed: int, evidence: list[RetrievedEvidence]
+    ) -> Any:
+        """Await bijux_agent.run for one step."""
+        if not hasattr(bijux_agent, "run"):
+            raise RuntimeError("bijux_agent.run is required for agent execution")
+        return await self._adapter.call(
+            bijux_agent.run, **self._run_arguments(step, seed, evidence)
+        )
+
+
+class AsyncRetrievalExecutor(RetrievalExecutor):
+    """Retrieval executor whose backend call can be awaited."""
+
+    def __init__(self, adapter: SyncBackendAdapter) -> None:
+        """Internal helper; not part of the public API."""
+        self._adapter = adapter
+
+    async def retrieve(self, step: ResolvedStep) -> Any:
+        """Await bijux_rag.retrieve for one step."""
+        if not hasattr(bijux_rag, "retrieve"):
+            raise RuntimeError("bijux_rag.retrieve is required for retrieval")
+        return await self._adapter.call(
+            bijux_rag.retrieve, **self._retrieve_arguments(step)
+        )
+
+
+class AsyncReasoningExecutor(ReasoningExecutor):
+    """Reasoning executor whose backend call can be awaited."""
+
+    def __init__(self, adapter: SyncBackendAdapter) -> None:
+        """Internal helper; not part of the public API."""
+        self._adapter = adapter
+
+    async def reason(
+        self,
+        agent_outputs: list[Artifact],
+        retrieved_evidence: list[RetrievedEvidence],
+    ) -> Any:
+        """Await bijux_rar.reason for one step."""
+        if not hasattr(bijux_rar, "reason"):
+            raise RuntimeError("bijux_rar.reason is required for reasoning")
+        return await self._adapter.call(
+            bijux_rar.reason,
+            **self._reason_arguments(agent_outputs, retrieved_evidence),
+        )
+
+
+__all__ = [
+    "DEFAULT_MAX_FLOWS",
+    "AsyncAgentExecutor",
+    "AsyncReasoningExecutor",
+    "AsyncRetrievalExecutor",
+    "SyncBackendAdapter",
+]
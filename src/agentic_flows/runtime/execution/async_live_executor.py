@@ -0,0 +1,216 @@
+# INTERNAL — SUBJECT TO CHANGE WITHOUT NOTICE
+# INTERNAL API — NOT STABLE
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Module definitions for runtime/execution/async_live_executor.py."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Coroutine, Sequence
+from typing import Any
+
+from agentic_flows.runtime.context import ExecutionContext
+from agentic_flows.runtime.execution.async_executors import (
+    AsyncAgentExecutor,
+    AsyncReasoningExecutor,
+    AsyncRetrievalExecutor,
+    SyncBackendAdapter,
+)
+from agentic_flows.runtime.execution.live_executor import LiveExecutor
+from agentic_flows.runtime.execution.parallel_steps import (
+    PrefetchedCall,
+    PrefetchedStep,
+    StepScheduler,
+)
+from agentic_flows.runtime.execution.step_executor import ExecutionOutcome
+from agentic_flows.runtime.observability.classification.seed import deterministic_seed
+from agentic_flows.spec.model.artifact.artifact import Artifact
+from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
+from agentic_flows.spec.model.datasets.dataset_descriptor import DatasetDescriptor
+from agentic_flows.spec.model.execution.execution_plan import ExecutionPlan
+from agentic_flows.spec.model.execution.resolved_step import ResolvedStep
+
+
+async def _capture(
+    arguments: tuple[object, ...], call: Awaitable[Any]
+) -> PrefetchedCall:
+    """Internal helper; not part of the public API."""
+    try:
+        return PrefetchedCall(arguments=arguments, value=await call)
+    except Exception as exc:
+        return PrefetchedCall(arguments=arguments, error=exc)
+
+
+class _AsyncStepScheduler(StepScheduler):
+    """Internal helper type; not part of the public API."""
+
+    def __init__(
+        self,
+        steps: Sequence[ResolvedStep],
+        context: ExecutionContext,
+        *,
+        adapter: SyncBackendAdapter,
+        max_parallel_steps: int,
+        loop: asyncio.AbstractEventLoop,
+        dataset: DatasetDescriptor | None = None,
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        super().__init__(steps, context, dataset=dataset)
+        self._loop = loop
+        self._async_agent = AsyncAgentExecutor(adapter)
+        self._async_retrieval = AsyncRetrievalExecutor(adapter)
+        self._async_reasoning = AsyncReasoningExecutor(adapter)
+        self._slots = asyncio.Semaphore(max_parallel_steps)
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+
+    def start(self) -> None:
+        """Schedule one task per step; each waits for its declared dependencies."""
+        for step in self._steps:
+            dependencies = [
+                self._tasks[str(dependency)]
+                for dependency in step.declared_dependencies
+                if str(dependency) in self._tasks
+            ]
+            self._tasks[str(step.agent_id)] = self._loop.create_task(
+                self._run_async(step, dependencies)
+            )
+
+    def close(self) -> None:
+        """Stop scheduling and cancel step tasks that are still running."""
+        self._halt()
+        for task in self._tasks.values():
+            task.cancel()
+
+    def _call_retrieval(self, step: ResolvedStep) -> Any:
+        """Internal helper; not part of the public API."""
+        return self._bridge(self._async_retrieval.retrieve(step))
+
+    def _call_agent(
+        self, step: ResolvedStep, seed: int, evidence: list[RetrievedEvidence]
+    ) -> Any:
+        """Internal helper; not part of the public API."""
+        return self._bridge(self._async_agent.invoke(step, seed, evidence))
+
+    def _call_reasoning(
+        self,
+        step: ResolvedStep,
+        agent_outputs: list[Artifact],
+        evidence: list[RetrievedEvidence],
+    ) -> Any:
+        """Internal helper; not part of the public API."""
+        return self._bridge(self._async_reasoning.reason(agent_outputs, evidence))
+
+    def _bridge(self, call: Coroutine[Any, Any, Any]) -> Any:
+        """Internal helper; not part of the public API."""
+        # Misses come from the step loop's thread; the backend still runs on
+        # the event loop so coroutine backends are awaited, never called bare.
+        return asyncio.run_coroutine_threadsafe(call, self._loop).result()
+
+    async def _run_async(
+        self, step: ResolvedStep, dependencies: list[asyncio.Task[None]]
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        claimed = False
+        try:
+            if dependencies:
+                await asyncio.wait(dependencies)
+            async with self._slots:
+                # A step that is never claimed resolves empty once scheduling
+                # halts, and the step loop then calls its backends itself.
+                claimed = self._claim(step)
+                if not claimed:
+                    return
+                prefetched = await self._prefetch_async(step)
+        except asyncio.CancelledError:
+            self._abandon(step, claimed, RuntimeError("step prefetch cancelled"))
+            raise
+        except Exception as exc:
+            self._abandon(step, claimed, exc)
+            return
+        if prefetched.failed:
+            self._halt()
+        self._publish(step, prefetched)
+
+    def _abandon(self, step: ResolvedStep, claimed: bool, exc: BaseException) -> None:
+        """Internal helper; not part of the public API."""
+        self._halt()
+        if claimed:
+            self._fail(step, exc)
+
+    async def _prefetch_async(self, step: ResolvedStep) -> PrefetchedStep:
+        """Internal helper; not part of the public API."""
+        retrieval = None
+        evidence = self._cached_evidence(step)
+        if evidence is None:
+            evidence = []
+            if step.retrieval_request is not None:
+                retrieval = await _capture((), self._async_retrieval.retrieve(step))
+                if retrieval.error is not None:
+                    return PrefetchedStep(retrieval=retrieval)
+                evidence = self._evidence(retrieval)
+        agent = None
+        agent_outputs = self._reused_outputs(step, evidence)
+        if agent_outputs is None:
+            seed = deterministic_seed(step.step_index, step.inputs_fingerprint)
+            agent = await _capture(
+                (tuple(evidence),), self._async_agent.invoke(step, seed, evidence)
+            )
+            if agent.error is not None:
+                return PrefetchedStep(retrieval=retrieval, agent=agent)
+            agent_outputs = self._agent_outputs(step, agent)
+        if self._has_cached_bundle(step, agent_outputs, evidence):
+            return PrefetchedStep(retrieval=retrieval, agent=agent)
+        reasoning = await _capture(
+            (tuple(agent_outputs), tuple(evidence)),
+            self._async_reasoning.reason(agent_outputs, evidence),
+        )
+        return PrefetchedStep(retrieval=retrieval, agent=agent, reasoning=reasoning)
+
+
+class AsyncLiveExecutor:
+    """Live executor for a shared event loop; steps still commit in plan order."""
+
+    def __init__(
+        self,
+        *,
+        max_parallel_steps: int = 1,
+        adapter: SyncBackendAdapter | None = None,
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        self._live = LiveExecutor()
+        self._max_parallel_steps = max_parallel_steps
+        self._adapter = adapter
+
+    async def execute(
+        self,
+        plan: ExecutionPlan,
+        context: ExecutionContext,
+    ) -> ExecutionOutcome:
+        """Execute execute and enforce its contract."""
+        adapter = self._adapter or SyncBackendAdapter.shared()
+        scheduler = _AsyncStepScheduler(
+            plan.plan.steps,
+            context,
+            adapter=adapter,
+            max_parallel_steps=self._max_parallel_steps,
+            loop=asyncio.get_running_loop(),
+            dataset=plan.plan.dataset,
+        )
+        scheduler.start()
+        try:
+            # Backend calls are awaited on the loop; the step loop records
+            # events and writes the store synchronously, so it runs off-loop
+            # and holds one of the adapter's flow workers until it returns.
+            return await adapter.run_blocking(
+                self._live.execute, plan, context, scheduler=scheduler
+            )
+        except asyncio.CancelledError:
+            context.cancel()
+            raise
+        finally:
+            scheduler.close()
+
+
+__all__ = ["AsyncLiveExecutor"]
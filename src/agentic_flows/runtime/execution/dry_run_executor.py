@@ -16,7 +16,7 @@ from agentic_flows.runtime.execution.state_tracker import ExecutionStateTracker
 from agentic_flows.runtime.execution.step_executor import ExecutionOutcome
 from agentic_flows.runtime.observability.capture.time import utc_now_deterministic
 from agentic_flows.runtime.observability.classification.fingerprint import (
-    fingerprint_inputs,
+    encode_canonical,
     fingerprint_policy,
 )
 from agentic_flows.runtime.orchestration.flow_boundary import enforce_flow_boundary
@@ -59,6 +59,7 @@ class DryRunExecutor:
                 "step_index": step.step_index,
                 "agent_id": step.agent_id,
             }
+            payload_json, payload_hash, payload_key = encode_canonical(start_payload)
             event = ExecutionEvent(
                 spec_version="v1",
                 event_index=event_index,
@@ -67,7 +68,9 @@ class DryRunExecutor:
                 causality_tag=_causality_tag(EventType.STEP_START),
                 timestamp_utc=utc_now_deterministic(event_index),
                 payload=start_payload,
-                payload_hash=fingerprint_inputs(start_payload),
+                payload_hash=payload_hash,
+                payload_json=payload_json,
+                payload_key=payload_key,
             )
             recorder.record(event, context.authority)
             for observer in context.observers:
@@ -84,6 +87,7 @@ class DryRunExecutor:
                     "agent_id": step.agent_id,
                     "error": str(exc),
                 }
+                payload_json, payload_hash, payload_key = encode_canonical(fail_payload)
                 event = ExecutionEvent(
                     spec_version="v1",
                     event_index=event_index,
@@ -92,7 +96,9 @@ class DryRunExecutor:
                     causality_tag=_causality_tag(EventType.STEP_FAILED),
                     timestamp_utc=utc_now_deterministic(event_index),
                     payload=fail_payload,
-                    payload_hash=fingerprint_inputs(fail_payload),
+                    payload_hash=payload_hash,
+                    payload_json=payload_json,
+                    payload_key=payload_key,
                 )
                 recorder.record(event, context.authority)
                 for observer in context.observers:
@@ -122,6 +128,7 @@ class DryRunExecutor:
                 "step_index": step.step_index,
                 "agent_id": step.agent_id,
             }
+            payload_json, payload_hash, payload_key = encode_canonical(end_payload)
             event = ExecutionEvent(
                 spec_version="v1",
                 event_index=event_index,
@@ -130,7 +137,9 @@ class DryRunExecutor:
                 causality_tag=_causality_tag(EventType.STEP_END),
                 timestamp_utc=utc_now_deterministic(event_index),
                 payload=end_payload,
-                payload_hash=fingerprint_inputs(end_payload),
+                payload_hash=payload_hash,
+                payload_json=payload_json,
+                payload_key=payload_key,
             )
             recorder.record(event, context.authority)
             for observer in context.observers:
@@ -173,6 +182,7 @@ class DryRunExecutor:
             entropy_exhausted=nondeterminism_verdict.entropy_exhausted,
             entropy_exhaustion_action=nondeterminism_verdict.entropy_exhaustion_action,
             non_certifiable=nondeterminism_verdict.non_certifiable,
+            plan_tree=steps_plan.plan_tree,
             finalized=False,
         )
         finalize_trace(trace)
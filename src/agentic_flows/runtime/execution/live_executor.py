@@ -7,16 +7,22 @@
 
 from __future__ import annotations
 
+from contextlib import ExitStack
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from agentic_flows.runtime.context import ExecutionContext, RunMode
+from agentic_flows.runtime.execution.parallel_steps import (
+    ParallelStepScheduler,
+    StepScheduler,
+)
 from agentic_flows.runtime.execution.phases import (
     execute_step_phase,
     execution_phase,
     finalization_phase,
     planning_phase,
 )
+from agentic_flows.runtime.execution.retrieval_prefetch import RetrievalPrefetcher
 from agentic_flows.runtime.execution.step_executor import ExecutionOutcome
 from agentic_flows.spec.model.artifact.artifact import Artifact
 from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
@@ -89,17 +95,49 @@ def _causality_tag(event_type: EventType) -> CausalityTag:
 class LiveExecutor:
     """Behavioral contract for LiveExecutor."""
 
+    def __init__(
+        self, *, max_parallel_steps: int = 1, retrieval_lookahead: int = 0
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        self._max_parallel_steps = max_parallel_steps
+        self._retrieval_lookahead = retrieval_lookahead
+
     def execute(
         self,
         plan: ExecutionPlan,
         context: ExecutionContext,
+        *,
+        scheduler: StepScheduler | None = None,
     ) -> ExecutionOutcome:
         """Execute execute and enforce its contract."""
         _notify_stage(context, "planning", "start")
         steps_plan = self._planning_phase(plan)
         _notify_stage(context, "planning", "end")
         _notify_stage(context, "execution", "start")
-        phase_state = self._execution_phase(steps_plan, context)
+        with ExitStack() as stack:
+            retrievals = None
+            if scheduler is None and self._retrieval_lookahead > 0:
+                retrievals = RetrievalPrefetcher(
+                    steps_plan.steps,
+                    context,
+                    lookahead=self._retrieval_lookahead,
+                    dataset=steps_plan.dataset,
+                )
+                retrievals.start()
+                stack.callback(retrievals.close)
+            if scheduler is None and self._max_parallel_steps > 1:
+                scheduler = ParallelStepScheduler(
+                    steps_plan.steps,
+                    context,
+                    max_workers=self._max_parallel_steps,
+                    dataset=steps_plan.dataset,
+                    retrievals=retrievals,
+                )
+                scheduler.start()
+                stack.callback(scheduler.close)
+            phase_state = self._execution_phase(
+                steps_plan, context, scheduler, retrievals
+            )
         _notify_stage(context, "execution", "end")
         _notify_stage(context, "finalization", "start")
         result = self._finalization_phase(steps_plan, context, phase_state)
@@ -111,13 +149,21 @@ class LiveExecutor:
         """Internal helper; not part of the public API."""
         return planning_phase(plan)
 
-    def _execution_phase(self, steps_plan, context: ExecutionContext) -> _PhaseState:
+    def _execution_phase(
+        self,
+        steps_plan,
+        context: ExecutionContext,
+        scheduler: StepScheduler | None = None,
+        retrievals: RetrievalPrefetcher | None = None,
+    ) -> _PhaseState:
         """Internal helper; not part of the public API."""
         return execution_phase(
             steps_plan=steps_plan,
             context=context,
             phase_state_cls=_PhaseState,
             handle_verification_phase_override=self._handle_verification_phase_override,
+            scheduler=scheduler,
+            retrievals=retrievals,
         )
 
     def _execute_step_phase(
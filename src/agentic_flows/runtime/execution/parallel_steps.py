@@ -0,0 +1,468 @@
+# INTERNAL — NOT A PUBLIC EXTENSION POINT
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Module definitions for runtime/execution/parallel_steps.py."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import threading
+from typing import TYPE_CHECKING, Any
+
+from agentic_flows.runtime.context import ExecutionContext
+from agentic_flows.runtime.execution.agent_executor import AgentExecutor
+from agentic_flows.runtime.execution.reasoning_cache import ReasoningCacheKey
+from agentic_flows.runtime.execution.reasoning_executor import ReasoningExecutor
+from agentic_flows.runtime.execution.retrieval_cache import RetrievalCacheKey
+from agentic_flows.runtime.execution.retrieval_executor import RetrievalExecutor
+from agentic_flows.runtime.execution.state_tracker import ExecutionStateTracker
+from agentic_flows.runtime.execution.step_reuse import step_output_key
+from agentic_flows.runtime.observability.classification.seed import deterministic_seed
+from agentic_flows.spec.model.artifact.artifact import Artifact
+from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
+from agentic_flows.spec.model.datasets.dataset_descriptor import DatasetDescriptor
+from agentic_flows.spec.model.execution.resolved_step import ResolvedStep
+from agentic_flows.spec.ontology.ids import ContentHash
+
+if TYPE_CHECKING:
+    from agentic_flows.runtime.execution.retrieval_prefetch import (
+        RetrievalPrefetcher,
+    )
+
+
+@dataclass(frozen=True)
+class PrefetchedCall:
+    """One backend call made ahead of the step loop, with its arguments."""
+
+    arguments: tuple[object, ...]
+    value: Any = None
+    error: BaseException | None = None
+
+    def unwrap(self) -> Any:
+        """Internal helper; not part of the public API."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+@dataclass(frozen=True)
+class PrefetchedStep:
+    """Backend calls made ahead of the step loop for one step."""
+
+    retrieval: PrefetchedCall | None = None
+    agent: PrefetchedCall | None = None
+    reasoning: PrefetchedCall | None = None
+
+    @property
+    def failed(self) -> bool:
+        """Return whether any backend call made for the step raised."""
+        return any(
+            call is not None and call.error is not None
+            for call in (self.retrieval, self.agent, self.reasoning)
+        )
+
+
+def _capture(arguments: tuple[object, ...], call: Callable[[], Any]) -> PrefetchedCall:
+    """Internal helper; not part of the public API."""
+    try:
+        return PrefetchedCall(arguments=arguments, value=call())
+    except Exception as exc:
+        return PrefetchedCall(arguments=arguments, error=exc)
+
+
+class StepScheduler(ABC):
+    """Serves backend calls made ahead of the step loop; misuse breaks trace ordering."""
+
+    def __init__(
+        self,
+        steps: Sequence[ResolvedStep],
+        context: ExecutionContext,
+        *,
+        dataset: DatasetDescriptor | None = None,
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        self._context = context
+        self._dataset = dataset
+        self._steps = [
+            step for step in steps if step.step_index > context.resume_from_step_index
+        ]
+        # The step loop consumes one step of budget per step it reaches, so
+        # steps past the step limit never run and are never scheduled.
+        remaining = context.budget.steps_remaining()
+        if remaining is not None:
+            self._steps = self._steps[: max(remaining, 0)]
+        self._agent = AgentExecutor()
+        self._retrieval = RetrievalExecutor()
+        self._results: dict[int, Future[PrefetchedStep]] = {
+            step.step_index: Future() for step in self._steps
+        }
+        # The agent executor chains a state hash through steps in plan order,
+        # so each step's state artifact is known before any step runs.
+        tracker = ExecutionStateTracker(context.seed)
+        self._state_hashes = {
+            step.step_index: tracker.advance(step) for step in self._steps
+        }
+        self._lock = threading.Lock()
+        self._closed = False
+        self._started: set[int] = set()
+
+    @abstractmethod
+    def start(self) -> None:
+        """Begin calling the backends of ready steps ahead of the step loop."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop scheduling; calls already running finish in the background."""
+
+    def retrieve(self, step: ResolvedStep) -> Any:
+        """Return the retrieval result for a step, calling the backend on a miss."""
+        prefetched = self._lookup(step)
+        if prefetched is not None and prefetched.retrieval is not None:
+            return prefetched.retrieval.unwrap()
+        return self._call_retrieval(step)
+
+    def invoke(
+        self, step: ResolvedStep, seed: int, evidence: list[RetrievedEvidence]
+    ) -> Any:
+        """Return agent outputs for a step, reusing a prefetch that saw the same evidence."""
+        prefetched = self._lookup(step)
+        call = prefetched.agent if prefetched is not None else None
+        if call is not None and call.arguments == (tuple(evidence),):
+            return call.unwrap()
+        return self._call_agent(step, seed, evidence)
+
+    def reason(
+        self,
+        step: ResolvedStep,
+        agent_outputs: list[Artifact],
+        evidence: list[RetrievedEvidence],
+    ) -> Any:
+        """Return a reasoning bundle, reusing a prefetch that saw the same inputs."""
+        prefetched = self._lookup(step)
+        call = prefetched.reasoning if prefetched is not None else None
+        if call is not None and call.arguments == (
+            tuple(agent_outputs),
+            tuple(evidence),
+        ):
+            return call.unwrap()
+        return self._call_reasoning(step, agent_outputs, evidence)
+
+    @abstractmethod
+    def _call_retrieval(self, step: ResolvedStep) -> Any:
+        """Internal helper; not part of the public API."""
+
+    @abstractmethod
+    def _call_agent(
+        self, step: ResolvedStep, seed: int, evidence: list[RetrievedEvidence]
+    ) -> Any:
+        """Internal helper; not part of the public API."""
+
+    @abstractmethod
+    def _call_reasoning(
+        self,
+        step: ResolvedStep,
+        agent_outputs: list[Artifact],
+        evidence: list[RetrievedEvidence],
+    ) -> Any:
+        """Internal helper; not part of the public API."""
+
+    def _lookup(self, step: ResolvedStep) -> PrefetchedStep | None:
+        """Internal helper; not part of the public API."""
+        future = self._results.get(step.step_index)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def _publish(self, step: ResolvedStep, prefetched: PrefetchedStep) -> None:
+        """Internal helper; not part of the public API."""
+        self._results[step.step_index].set_result(prefetched)
+
+    def _fail(self, step: ResolvedStep, exc: BaseException) -> None:
+        """Internal helper; not part of the public API."""
+        self._results[step.step_index].set_exception(exc)
+
+    def _claim(self, step: ResolvedStep) -> bool:
+        """Internal helper; not part of the public API."""
+        with self._lock:
+            if self._closed:
+                return False
+            self._started.add(step.step_index)
+            return True
+
+    def _halt(self) -> None:
+        """Internal helper; not part of the public API."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            unstarted = [
+                future
+                for index, future in self._results.items()
+                if index not in self._started
+            ]
+        # Steps that never started resolve empty; if the step loop still
+        # reaches one, it calls the backends itself.
+        for future in unstarted:
+            future.set_result(PrefetchedStep())
+
+    def _cached_evidence(self, step: ResolvedStep) -> list[RetrievedEvidence] | None:
+        """Internal helper; not part of the public API."""
+        # A cache hit here is also a hit in the step loop, so the backend is
+        # not called speculatively for evidence that will never be used.
+        cache = self._context.retrieval_cache
+        if cache is None or self._dataset is None or step.retrieval_request is None:
+            return None
+        key = RetrievalCacheKey.for_request(
+            step.retrieval_request, self._dataset, tenant_id=self._context.tenant_id
+        )
+        cached = cache.get(key) if key is not None else None
+        return list(cached) if cached is not None else None
+
+    def _has_cached_bundle(
+        self,
+        step: ResolvedStep,
+        agent_outputs: list[Artifact],
+        evidence: list[RetrievedEvidence],
+    ) -> bool:
+        """Internal helper; not part of the public API."""
+        # The step loop serves a cached bundle for the same inputs, so the
+        # reasoning backend is not called ahead for it.
+        cache = self._context.reasoning_cache
+        if cache is None:
+            return False
+        key = ReasoningCacheKey.for_inputs(
+            step, agent_outputs, evidence, tenant_id=self._context.tenant_id
+        )
+        return key is not None and cache.get(key) is not None
+
+    def _reused_outputs(
+        self, step: ResolvedStep, evidence: list[RetrievedEvidence]
+    ) -> list[Artifact] | None:
+        """Internal helper; not part of the public API."""
+        # A step the loop will reuse never calls the agent; its reasoning still
+        # runs ahead on the artifacts the loop rebuilds from the earlier run.
+        index = self._context.step_outputs
+        if index is None:
+            return None
+        reused = index.lookup(step_output_key(step, evidence))
+        if reused is None:
+            return None
+        artifacts = list(reused.artifacts)
+        artifacts.append(
+            self._agent._state_artifact(
+                step,
+                artifacts,
+                self._context,
+                state_hash=ContentHash(self._state_hashes[step.step_index]),
+                create=Artifact,
+            )
+        )
+        return artifacts
+
+    def _evidence(self, retrieval: PrefetchedCall) -> list[RetrievedEvidence]:
+        """Internal helper; not part of the public API."""
+        return self._retrieval._normalize_evidence(
+            retrieval.value, tenant_id=self._context.tenant_id
+        )
+
+    def _agent_outputs(
+        self, step: ResolvedStep, agent: PrefetchedCall
+    ) -> list[Artifact]:
+        """Internal helper; not part of the public API."""
+        return self._agent.predict_artifacts(
+            step,
+            agent.value,
+            self._context,
+            state_hash=ContentHash(self._state_hashes[step.step_index]),
+        )
+
+
+class ParallelStepScheduler(StepScheduler):
+    """Runs backend calls of ready steps on a thread pool; misuse breaks trace ordering."""
+
+    def __init__(
+        self,
+        steps: Sequence[ResolvedStep],
+        context: ExecutionContext,
+        *,
+        max_workers: int,
+        dataset: DatasetDescriptor | None = None,
+        retrievals: RetrievalPrefetcher | None = None,
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        super().__init__(steps, context, dataset=dataset)
+        self._retrievals = retrievals
+        self._max_workers = max_workers
+        self._reasoning = ReasoningExecutor()
+        scheduled = {step.agent_id for step in self._steps}
+        self._waiting = {
+            step.step_index: sum(dep in scheduled for dep in step.declared_dependencies)
+            for step in self._steps
+        }
+        self._dependents: dict[str, list[ResolvedStep]] = {}
+        for step in self._steps:
+            for dependency in step.declared_dependencies:
+                if dependency in scheduled:
+                    self._dependents.setdefault(str(dependency), []).append(step)
+        self._pool: ThreadPoolExecutor | None = None
+
+    def start(self) -> None:
+        """Submit every step whose dependencies are already satisfied."""
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="agentic-flows-step"
+        )
+        with self._lock:
+            for step in self._steps:
+                if self._waiting[step.step_index] == 0:
+                    self._pool.submit(self._run, step)
+
+    def close(self) -> None:
+        """Stop scheduling; calls already running finish in the background."""
+        self._halt()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _call_retrieval(self, step: ResolvedStep) -> Any:
+        """Internal helper; not part of the public API."""
+        # Steps waiting on dependencies still find their retrieval started.
+        if self._retrievals is not None:
+            return self._retrievals.retrieve(step)
+        return self._retrieval._retrieve(step)
+
+    def _call_agent(
+        self, step: ResolvedStep, seed: int, evidence: list[RetrievedEvidence]
+    ) -> Any:
+        """Internal helper; not part of the public API."""
+        return self._agent._invoke(step, seed, evidence)
+
+    def _call_reasoning(
+        self,
+        step: ResolvedStep,
+        agent_outputs: list[Artifact],
+        evidence: list[RetrievedEvidence],
+    ) -> Any:
+        """Internal helper; not part of the public API."""
+        return self._reasoning._reason(step, agent_outputs, evidence)
+
+    def _run(self, step: ResolvedStep) -> None:
+        """Internal helper; not part of the public API."""
+        if not self._claim(step):
+            return
+        try:
+            prefetched = self._prefetch(step)
+        except Exception as exc:
+            self._halt()
+            self._fail(step, exc)
+            return
+        # A failed backend call stops the step loop at this step, so nothing
+        # after it is worth calling ahead.
+        if prefetched.failed:
+            self._halt()
+        else:
+            # Dependents are released before the result is published, so by
+            # the time the step loop commits this step they are scheduled.
+            self._release(step)
+        self._publish(step, prefetched)
+
+    def _release(self, step: ResolvedStep) -> None:
+        """Internal helper; not part of the public API."""
+        with self._lock:
+            for dependent in self._dependents.get(str(step.agent_id), ()):
+                self._waiting[dependent.step_index] -= 1
+                if (
+                    self._waiting[dependent.step_index] == 0
+                    and not self._closed
+                    and self._pool is not None
+                ):
+                    self._pool.submit(self._run, dependent)
+
+    def _prefetch(self, step: ResolvedStep) -> PrefetchedStep:
+        """Internal helper; not part of the public API."""
+        retrieval = None
+        evidence = self._cached_evidence(step)
+        if evidence is None:
+            evidence = []
+            if step.retrieval_request is not None:
+                retrieval = _capture((), lambda: self._call_retrieval(step))
+                if retrieval.error is not None:
+                    return PrefetchedStep(retrieval=retrieval)
+                evidence = self._evidence(retrieval)
+        agent = None
+        agent_outputs = self._reused_outputs(step, evidence)
+        if agent_outputs is None:
+            seed = deterministic_seed(step.step_index, step.inputs_fingerprint)
+            agent = _capture(
+                (tuple(evidence),), lambda: self._call_agent(step, seed, evidence)
+            )
+            if agent.error is not None:
+                return PrefetchedStep(retrieval=retrieval, agent=agent)
+            agent_outputs = self._agent_outputs(step, agent)
+        if self._has_cached_bundle(step, agent_outputs, evidence):
+            return PrefetchedStep(retrieval=retrieval, agent=agent)
+        reasoning = _capture(
+            (tuple(agent_outputs), tuple(evidence)),
+            lambda: self._call_reasoning(step, agent_outputs, evidence),
+        )
+        return PrefetchedStep(retrieval=retrieval, agent=agent, reasoning=reasoning)
+
+
+class PrefetchedRetrievalExecutor(RetrievalExecutor):
+    """Retrieval executor reading prefetched backend calls."""
+
+    def __init__(self, scheduler: StepScheduler) -> None:
+        """Internal helper; not part of the public API."""
+        self._scheduler = scheduler
+
+    def _retrieve(self, step: ResolvedStep) -> Any:
+        """Internal helper; not part of the public API."""
+        return self._scheduler.retrieve(step)
+
+
+class PrefetchedAgentExecutor(AgentExecutor):
+    """Agent executor reading prefetched backend calls."""
+
+    def __init__(self, scheduler: StepScheduler) -> None:
+        """Internal helper; not part of the public API."""
+        super().__init__()
+        self._scheduler = scheduler
+
+    def _invoke(
+        self, step: ResolvedStep, seed: int, evidence: list[RetrievedEvidence]
+    ) -> Any:
+        """Internal helper; not part of the public API."""
+        return self._scheduler.invoke(step, seed, evidence)
+
+
+class PrefetchedReasoningExecutor(ReasoningExecutor):
+    """Reasoning executor reading prefetched backend calls."""
+
+    def __init__(self, scheduler: StepScheduler) -> None:
+        """Internal helper; not part of the public API."""
+        self._scheduler = scheduler
+
+    def _reason(
+        self,
+        step: ResolvedStep,
+        agent_outputs: list[Artifact],
+        retrieved_evidence: list[RetrievedEvidence],
+    ) -> object:
+        """Internal helper; not part of the public API."""
+        return self._scheduler.reason(step, agent_outputs, retrieved_evidence)
+
+
+__all__ = [
+    "PrefetchedAgentExecutor",
+    "PrefetchedCall",
+    "PrefetchedReasoningExecutor",
+    "PrefetchedRetrievalExecutor",
+    "PrefetchedStep",
+    "ParallelStepScheduler",
+    "StepScheduler",
+]
@@ -11,12 +11,28 @@ import os
 import signal
 
 from agentic_flows.core.errors import NonDeterminismViolationError
+from agentic_flows.runtime.budget import DeadlineExceededError
 from agentic_flows.runtime.context import ExecutionContext, RunMode
 from agentic_flows.runtime.execution.agent_executor import AgentExecutor
+from agentic_flows.runtime.execution.parallel_steps import (
+    PrefetchedAgentExecutor,
+    PrefetchedReasoningExecutor,
+    PrefetchedRetrievalExecutor,
+    StepScheduler,
+)
+from agentic_flows.runtime.execution.reasoning_cache import CachedReasoningExecutor
 from agentic_flows.runtime.execution.reasoning_executor import ReasoningExecutor
+from agentic_flows.runtime.execution.retrieval_cache import CachedRetrievalExecutor
 from agentic_flows.runtime.execution.retrieval_executor import RetrievalExecutor
+from agentic_flows.runtime.execution.retrieval_prefetch import (
+    LookaheadRetrievalExecutor,
+    RetrievalPrefetcher,
+)
+from agentic_flows.runtime.execution.step_reuse import IncrementalAgentExecutor
 from agentic_flows.runtime.observability.capture.time import utc_now_deterministic
 from agentic_flows.runtime.observability.classification.fingerprint import (
+    CanonicalPayload,
+    encode_canonical,
     fingerprint_inputs,
 )
 from agentic_flows.runtime.observability.classification.retrieval_fingerprint import (
@@ -51,6 +67,10 @@ from agentic_flows.spec.ontology.ids import (
 )
 from agentic_flows.spec.ontology.public import EventType
 
+# Payload keys describing how a result was obtained rather than what it is;
+# replays diff payload hashes, so these keys are left out of the hash.
+_CACHE_ANNOTATIONS = frozenset({"cache", "reused_run_id"})
+
 
 def execution_phase(
     *,
@@ -58,6 +78,8 @@ def execution_phase(
     context: ExecutionContext,
     phase_state_cls,
     handle_verification_phase_override: Callable,
+    scheduler: StepScheduler | None = None,
+    retrievals: RetrievalPrefetcher | None = None,
 ):
     """Internal helper; not part of the public API."""
     recorder = context.trace_recorder
@@ -71,6 +93,27 @@ def execution_phase(
     agent_executor = AgentExecutor()
     retrieval_executor = RetrievalExecutor()
     reasoning_executor = ReasoningExecutor()
+    if scheduler is not None:
+        # Backend calls of ready steps run ahead of this loop; it still
+        # commits every step in plan order, so event, evidence and tool
+        # invocation indices match a sequential run.
+        agent_executor = PrefetchedAgentExecutor(scheduler)
+        retrieval_executor = PrefetchedRetrievalExecutor(scheduler)
+        reasoning_executor = PrefetchedReasoningExecutor(scheduler)
+    elif retrievals is not None:
+        # Only the backend call moves ahead; evidence, entropy and events are
+        # still recorded when the step reaches retrieval.
+        retrieval_executor = LookaheadRetrievalExecutor(retrievals)
+    if context.retrieval_cache is not None:
+        retrieval_executor = CachedRetrievalExecutor(
+            retrieval_executor, context.retrieval_cache, dataset=steps_plan.dataset
+        )
+    if context.step_outputs is not None:
+        agent_executor = IncrementalAgentExecutor(agent_executor, context.step_outputs)
+    if context.reasoning_cache is not None:
+        reasoning_executor = CachedReasoningExecutor(
+            reasoning_executor, context.reasoning_cache
+        )
     verification_orchestrator = VerificationOrchestrator()
     policy = context.verification_policy
     tool_agent = ToolID("bijux-agent.run")
@@ -89,7 +132,20 @@ def execution_phase(
     ) -> None:
         """Execute record_event and enforce its contract."""
         nonlocal event_index
+        with context.timings.measure("event", event_type.value, step_index=step_index):
+            _record_event(event_type, step_index, payload)
+        event_index += 1
+
+    def _record_event(
+        event_type: EventType, step_index: int, payload: dict[str, object]
+    ) -> None:
+        """Internal helper; not part of the public API."""
         payload["event_type"] = event_type.value
+        # Annotations are stored with the payload but kept out of its hash,
+        # so a cache hit exact-matches the run that missed.
+        payload_json, payload_hash, payload_key = encode_canonical(
+            payload, unhashed=_CACHE_ANNOTATIONS
+        )
         event = ExecutionEvent(
             spec_version="v1",
             event_index=event_index,
@@ -98,35 +154,40 @@ def execution_phase(
             causality_tag=_causality_tag(event_type),
             timestamp_utc=utc_now_deterministic(event_index),
             payload=payload,
-            payload_hash=fingerprint_inputs(payload),
+            payload_hash=payload_hash,
+            payload_json=payload_json,
+            payload_key=payload_key,
         )
         recorder.record(
             event,
             context.authority,
         )
         if context.execution_store is not None and context.run_id is not None:
-            context.execution_store.save_events(
-                run_id=context.run_id,
-                tenant_id=context.tenant_id,
-                events=(event,),
-            )
+            with context.timings.measure(
+                "store_flush", "save_events", step_index=step_index
+            ):
+                context.execution_store.save_events(
+                    run_id=context.run_id,
+                    tenant_id=context.tenant_id,
+                    events=(event,),
+                )
         for observer in context.observers:
             observer.on_event(event)
         with suppress(Exception):
             context.consume_budget(trace_events=1)
-        event_index += 1
 
     def record_tool_invocation(invocation: ToolInvocation) -> None:
         """Execute record_tool_invocation and enforce its contract."""
         nonlocal tool_invocation_index
         tool_invocations.append(invocation)
         if context.execution_store is not None and context.run_id is not None:
-            context.execution_store.append_tool_invocations(
-                run_id=context.run_id,
-                tenant_id=context.tenant_id,
-                tool_invocations=(invocation,),
-                starting_index=tool_invocation_index,
-            )
+            with context.timings.measure("store_flush", "append_tool_invocations"):
+                context.execution_store.append_tool_invocations(
+                    run_id=context.run_id,
+                    tenant_id=context.tenant_id,
+                    tool_invocations=(invocation,),
+                    starting_index=tool_invocation_index,
+                )
         tool_invocation_index += 1
 
     def record_evidence(items: list[RetrievedEvidence]) -> None:
@@ -135,11 +196,12 @@ def execution_phase(
         if not items:
             return
         if context.execution_store is not None and context.run_id is not None:
-            context.execution_store.append_evidence(
-                run_id=context.run_id,
-                evidence=items,
-                starting_index=evidence_index,
-            )
+            with context.timings.measure("store_flush", "append_evidence"):
+                context.execution_store.append_evidence(
+                    run_id=context.run_id,
+                    evidence=items,
+                    starting_index=evidence_index,
+                )
         evidence_index += len(items)
 
     def record_artifacts(items: list[Artifact]) -> None:
@@ -147,20 +209,22 @@ def execution_phase(
         if not items:
             return
         if context.execution_store is not None and context.run_id is not None:
-            context.execution_store.save_artifacts(
-                run_id=context.run_id, artifacts=items
-            )
+            with context.timings.measure("store_flush", "save_artifacts"):
+                context.execution_store.save_artifacts(
+                    run_id=context.run_id, artifacts=items
+                )
 
     def record_claims(claims: tuple[ClaimID, ...]) -> None:
         """Execute record_claims and enforce its contract."""
         if not claims:
             return
         if context.execution_store is not None and context.run_id is not None:
-            context.execution_store.append_claim_ids(
-                run_id=context.run_id,
-                tenant_id=context.tenant_id,
-                claim_ids=claims,
-            )
+            with context.timings.measure("store_flush", "append_claim_ids"):
+                context.execution_store.append_claim_ids(
+                    run_id=context.run_id,
+                    tenant_id=context.tenant_id,
+                    claim_ids=claims,
+                )
 
     def flush_entropy_usage() -> None:
         """Execute flush_entropy_usage and enforce its contract."""
@@ -171,11 +235,12 @@ def execution_phase(
         if len(usage) <= entropy_index:
             return
         new_entries = usage[entropy_index:]
-        context.execution_store.append_entropy_usage(
-            run_id=context.run_id,
-            usage=new_entries,
-            starting_index=entropy_index,
-        )
+        with context.timings.measure("store_flush", "append_entropy_usage"):
+            context.execution_store.append_entropy_usage(
+                run_id=context.run_id,
+                usage=new_entries,
+                starting_index=entropy_index,
+            )
         entropy_index = len(usage)
 
     def enforce_entropy_authorization() -> None:
@@ -194,24 +259,36 @@ def execution_phase(
                     "entropy source used without explicit authorization"
                 )
 
+    def flush_timings() -> None:
+        """Internal helper; not part of the public API."""
+        if context.execution_store is None or context.run_id is None:
+            return
+        starting_index, timings = context.timings.drain()
+        if timings:
+            context.execution_store.save_timings(
+                run_id=context.run_id,
+                tenant_id=context.tenant_id,
+                timings=timings,
+                starting_index=starting_index,
+            )
+
     def save_checkpoint(step_index: int) -> None:
         """Execute save_checkpoint and enforce its contract."""
         if context.execution_store is None or context.run_id is None:
             return
-        context.execution_store.save_checkpoint(
-            run_id=context.run_id,
-            tenant_id=context.tenant_id,
-            step_index=step_index,
-            event_index=event_index - 1,
-        )
-
-    previous_handler = signal.getsignal(signal.SIGINT)
-
-    def _handle_interrupt(_signum, _frame) -> None:
-        """Internal helper; not part of the public API."""
-        context.cancel()
+        # Timings ride on the checkpoint flush, so an interrupted run keeps
+        # the samples of every step it got through.
+        flush_timings()
+        with context.timings.measure(
+            "store_flush", "save_checkpoint", step_index=step_index
+        ):
+            context.execution_store.save_checkpoint(
+                run_id=context.run_id,
+                tenant_id=context.tenant_id,
+                step_index=step_index,
+                event_index=event_index - 1,
+            )
 
-    signal.signal(signal.SIGINT, _handle_interrupt)
     try:
         interrupted = execute_step_phase(
             steps_plan=steps_plan,
@@ -241,8 +318,19 @@ def execution_phase(
             tool_reasoning=tool_reasoning,
             handle_verification_phase_override=handle_verification_phase_override,
         )
+    except BaseException:
+        # Finalization never runs for a failed loop, so samples taken since
+        # the last checkpoint are saved here; a store failure must not hide
+        # the original error.
+        context.timings.close_step()
+        with suppress(Exception):
+            flush_timings()
+        raise
     finally:
-        signal.signal(signal.SIGINT, previous_handler)
+        # Once the loop stops, steps past the stopping point are never
+        # committed, so their backends are not called ahead either.
+        if scheduler is not None:
+            scheduler.close()
 
     return phase_state_cls(
         recorder=recorder,
@@ -293,11 +381,15 @@ def execute_step_phase(
     for step in steps_plan.steps:
         if step.step_index <= context.resume_from_step_index:
             continue
+        context.timings.start_step(step.step_index)
         if context.is_cancelled():
             record_event(
                 EventType.EXECUTION_INTERRUPTED,
                 step.step_index,
-                {"step_index": step.step_index, "reason": "sigint"},
+                {
+                    "step_index": step.step_index,
+                    "reason": context.cancellation.reason,
+                },
             )
             interrupted = True
             break
@@ -314,6 +406,7 @@ def execute_step_phase(
         )
         try:
             context.consume_budget(steps=1)
+            context.check_deadlines()
         except Exception as exc:
             record_event(
                 EventType.STEP_FAILED,
@@ -321,7 +414,7 @@ def execute_step_phase(
                 {
                     "step_index": step.step_index,
                     "agent_id": step.agent_id,
-                    "error": str(exc),
+                    **_failure_fields(exc),
                 },
             )
             break
@@ -339,22 +432,24 @@ def execute_step_phase(
                     "request_fingerprint": request_fingerprint,
                 },
             )
-            tool_input = {
-                "tool_id": tool_retrieval,
-                "request_id": step.retrieval_request.request_id,
-                "vector_contract_id": step.retrieval_request.vector_contract_id,
-                "request_fingerprint": request_fingerprint,
-            }
+            tool_input = CanonicalPayload(
+                {
+                    "tool_id": tool_retrieval,
+                    "request_id": step.retrieval_request.request_id,
+                    "vector_contract_id": step.retrieval_request.vector_contract_id,
+                    "request_fingerprint": request_fingerprint,
+                }
+            )
             record_event(
                 EventType.TOOL_CALL_START,
                 step.step_index,
                 {
                     "tool_id": tool_retrieval,
-                    "input_fingerprint": fingerprint_inputs(tool_input),
+                    "input_fingerprint": tool_input.fingerprint,
                 },
             )
             pending_invocations[(step.step_index, tool_retrieval)] = ContentHash(
-                fingerprint_inputs(tool_input)
+                tool_input.fingerprint
             )
 
             try:
@@ -362,7 +457,7 @@ def execute_step_phase(
             except Exception as exc:
                 input_fingerprint = pending_invocations.pop(
                     (step.step_index, tool_retrieval),
-                    ContentHash(fingerprint_inputs(tool_input)),
+                    ContentHash(tool_input.fingerprint),
                 )
                 record_tool_invocation(
                     ToolInvocation(
@@ -380,8 +475,8 @@ def execute_step_phase(
                     step.step_index,
                     {
                         "tool_id": tool_retrieval,
-                        "input_fingerprint": fingerprint_inputs(tool_input),
-                        "error": str(exc),
+                        "input_fingerprint": tool_input.fingerprint,
+                        **_failure_fields(exc),
                     },
                 )
                 record_event(
@@ -391,7 +486,7 @@ def execute_step_phase(
                         "step_index": step.step_index,
                         "request_id": step.retrieval_request.request_id,
                         "vector_contract_id": step.retrieval_request.vector_contract_id,
-                        "error": str(exc),
+                        **_failure_fields(exc),
                     },
                 )
                 break
@@ -412,7 +507,7 @@ def execute_step_phase(
                         "step_index": step.step_index,
                         "request_id": step.retrieval_request.request_id,
                         "vector_contract_id": step.retrieval_request.vector_contract_id,
-                        "error": str(exc),
+                        **_failure_fields(exc),
                     },
                 )
                 break
@@ -438,7 +533,7 @@ def execute_step_phase(
                         "step_index": step.step_index,
                         "request_id": step.retrieval_request.request_id,
                         "vector_contract_id": step.retrieval_request.vector_contract_id,
-                        "error": str(exc),
+                        **_failure_fields(exc),
                     },
                 )
                 break
@@ -454,7 +549,7 @@ def execute_step_phase(
             )
             input_fingerprint = pending_invocations.pop(
                 (step.step_index, tool_retrieval),
-                ContentHash(fingerprint_inputs(tool_input)),
+                ContentHash(tool_input.fingerprint),
             )
             record_tool_invocation(
                 ToolInvocation(
@@ -472,39 +567,40 @@ def execute_step_phase(
                 step.step_index,
                 {
                     "tool_id": tool_retrieval,
-                    "input_fingerprint": fingerprint_inputs(tool_input),
+                    "input_fingerprint": tool_input.fingerprint,
                     "output_fingerprint": output_fingerprint,
                 },
             )
 
-            record_event(
-                EventType.RETRIEVAL_END,
-                step.step_index,
-                {
-                    "step_index": step.step_index,
-                    "request_id": step.retrieval_request.request_id,
-                    "vector_contract_id": step.retrieval_request.vector_contract_id,
-                    "evidence_hashes": [item.content_hash for item in retrieved],
-                },
-            )
+            retrieval_end: dict[str, object] = {
+                "step_index": step.step_index,
+                "request_id": step.retrieval_request.request_id,
+                "vector_contract_id": step.retrieval_request.vector_contract_id,
+                "evidence_hashes": [item.content_hash for item in retrieved],
+            }
+            if isinstance(retrieval_executor, CachedRetrievalExecutor):
+                retrieval_end["cache"] = retrieval_executor.outcome(step.step_index)
+            record_event(EventType.RETRIEVAL_END, step.step_index, retrieval_end)
 
         # Phase: agent execution.
-        tool_input = {
-            "tool_id": tool_agent,
-            "agent_id": step.agent_id,
-            "inputs_fingerprint": step.inputs_fingerprint,
-            "evidence_ids": [item.evidence_id for item in current_evidence],
-        }
+        tool_input = CanonicalPayload(
+            {
+                "tool_id": tool_agent,
+                "agent_id": step.agent_id,
+                "inputs_fingerprint": step.inputs_fingerprint,
+                "evidence_ids": [item.evidence_id for item in current_evidence],
+            }
+        )
         record_event(
             EventType.TOOL_CALL_START,
             step.step_index,
             {
                 "tool_id": tool_agent,
-                "input_fingerprint": fingerprint_inputs(tool_input),
+                "input_fingerprint": tool_input.fingerprint,
             },
         )
         pending_invocations[(step.step_index, tool_agent)] = ContentHash(
-            fingerprint_inputs(tool_input)
+            tool_input.fingerprint
         )
         step_artifacts: list[Artifact] = []
         try:
@@ -517,7 +613,7 @@ def execute_step_phase(
         except Exception as exc:
             input_fingerprint = pending_invocations.pop(
                 (step.step_index, tool_agent),
-                ContentHash(fingerprint_inputs(tool_input)),
+                ContentHash(tool_input.fingerprint),
             )
             record_tool_invocation(
                 ToolInvocation(
@@ -535,8 +631,8 @@ def execute_step_phase(
                 step.step_index,
                 {
                     "tool_id": tool_agent,
-                    "input_fingerprint": fingerprint_inputs(tool_input),
-                    "error": str(exc),
+                    "input_fingerprint": tool_input.fingerprint,
+                    **_failure_fields(exc),
                 },
             )
             record_event(
@@ -545,7 +641,7 @@ def execute_step_phase(
                 {
                     "step_index": step.step_index,
                     "agent_id": step.agent_id,
-                    "error": str(exc),
+                    **_failure_fields(exc),
                 },
             )
             break
@@ -561,7 +657,7 @@ def execute_step_phase(
         )
         input_fingerprint = pending_invocations.pop(
             (step.step_index, tool_agent),
-            ContentHash(fingerprint_inputs(tool_input)),
+            ContentHash(tool_input.fingerprint),
         )
         record_tool_invocation(
             ToolInvocation(
@@ -574,15 +670,28 @@ def execute_step_phase(
                 outcome="success",
             )
         )
-        record_event(
-            EventType.TOOL_CALL_END,
-            step.step_index,
-            {
-                "tool_id": tool_agent,
-                "input_fingerprint": fingerprint_inputs(tool_input),
-                "output_fingerprint": output_fingerprint,
-            },
-        )
+        agent_end: dict[str, object] = {
+            "tool_id": tool_agent,
+            "input_fingerprint": tool_input.fingerprint,
+            "output_fingerprint": output_fingerprint,
+        }
+        if isinstance(agent_executor, IncrementalAgentExecutor):
+            reused_run_id = agent_executor.reused_run_id(step.step_index)
+            agent_end["cache"] = "miss" if reused_run_id is None else "hit"
+            if reused_run_id is not None:
+                agent_end["reused_run_id"] = reused_run_id
+            if context.execution_store is not None and context.run_id is not None:
+                with context.timings.measure(
+                    "store_flush", "save_step_outputs", step_index=step.step_index
+                ):
+                    context.execution_store.save_step_outputs(
+                        run_id=context.run_id,
+                        tenant_id=context.tenant_id,
+                        step_index=step.step_index,
+                        step_key=agent_executor.step_key(step.step_index),
+                        artifact_ids=tuple(item.artifact_id for item in step_artifacts),
+                    )
+        record_event(EventType.TOOL_CALL_END, step.step_index, agent_end)
 
         # Phase: forced verification override.
         forced_action = handle_verification_phase_override(
@@ -606,29 +715,32 @@ def execute_step_phase(
                 "agent_id": step.agent_id,
             },
         )
-        tool_input = {
-            "tool_id": tool_reasoning,
-            "agent_id": step.agent_id,
-            "artifact_ids": [artifact.artifact_id for artifact in step_artifacts],
-            "evidence_ids": [item.evidence_id for item in current_evidence],
-        }
+        tool_input = CanonicalPayload(
+            {
+                "tool_id": tool_reasoning,
+                "agent_id": step.agent_id,
+                "artifact_ids": [artifact.artifact_id for artifact in step_artifacts],
+                "evidence_ids": [item.evidence_id for item in current_evidence],
+            }
+        )
         # Phase: verification.
         record_event(
             EventType.TOOL_CALL_START,
             step.step_index,
             {
                 "tool_id": tool_reasoning,
-                "input_fingerprint": fingerprint_inputs(tool_input),
+                "input_fingerprint": tool_input.fingerprint,
             },
         )
         pending_invocations[(step.step_index, tool_reasoning)] = ContentHash(
-            fingerprint_inputs(tool_input)
+            tool_input.fingerprint
         )
 
         try:
             bundle = reasoning_executor.execute(step, context)
             reasoning_bundles.append(bundle)
             bundle_hash = ContentHash(reasoning_executor.bundle_hash(bundle))
+            bundle_output = CanonicalPayload({"bundle_hash": bundle_hash})
 
             evidence_ids = {item.evidence_id for item in current_evidence}
             for claim in bundle.claims:
@@ -643,15 +755,13 @@ def execute_step_phase(
                 step.step_index,
                 {
                     "tool_id": tool_reasoning,
-                    "input_fingerprint": fingerprint_inputs(tool_input),
-                    "output_fingerprint": fingerprint_inputs(
-                        {"bundle_hash": bundle_hash}
-                    ),
+                    "input_fingerprint": tool_input.fingerprint,
+                    "output_fingerprint": bundle_output.fingerprint,
                 },
             )
             input_fingerprint = pending_invocations.pop(
                 (step.step_index, tool_reasoning),
-                ContentHash(fingerprint_inputs(tool_input)),
+                ContentHash(tool_input.fingerprint),
             )
             record_tool_invocation(
                 ToolInvocation(
@@ -659,22 +769,19 @@ def execute_step_phase(
                     tool_id=tool_reasoning,
                     determinism_level=step.determinism_level,
                     inputs_fingerprint=input_fingerprint,
-                    outputs_fingerprint=ContentHash(
-                        fingerprint_inputs({"bundle_hash": bundle_hash})
-                    ),
+                    outputs_fingerprint=ContentHash(bundle_output.fingerprint),
                     duration=0.0,
                     outcome="success",
                 )
             )
-            record_event(
-                EventType.REASONING_END,
-                step.step_index,
-                {
-                    "step_index": step.step_index,
-                    "bundle_hash": bundle_hash,
-                    "claim_count": len(bundle.claims),
-                },
-            )
+            reasoning_end: dict[str, object] = {
+                "step_index": step.step_index,
+                "bundle_hash": bundle_hash,
+                "claim_count": len(bundle.claims),
+            }
+            if isinstance(reasoning_executor, CachedReasoningExecutor):
+                reasoning_end["cache"] = reasoning_executor.outcome(step.step_index)
+            record_event(EventType.REASONING_END, step.step_index, reasoning_end)
             record_claims(tuple(claim.claim_id for claim in bundle.claims))
 
             artifacts.append(
@@ -705,7 +812,7 @@ def execute_step_phase(
         except Exception as exc:
             input_fingerprint = pending_invocations.pop(
                 (step.step_index, tool_reasoning),
-                ContentHash(fingerprint_inputs(tool_input)),
+                ContentHash(tool_input.fingerprint),
             )
             record_tool_invocation(
                 ToolInvocation(
@@ -723,8 +830,8 @@ def execute_step_phase(
                 step.step_index,
                 {
                     "tool_id": tool_reasoning,
-                    "input_fingerprint": fingerprint_inputs(tool_input),
-                    "error": str(exc),
+                    "input_fingerprint": tool_input.fingerprint,
+                    **_failure_fields(exc),
                 },
             )
             record_event(
@@ -733,7 +840,7 @@ def execute_step_phase(
                 {
                     "step_index": step.step_index,
                     "agent_id": step.agent_id,
-                    "error": str(exc),
+                    **_failure_fields(exc),
                 },
             )
             break
@@ -854,6 +961,7 @@ def execute_step_phase(
         crash_step = os.environ.get("AF_CRASH_AT_STEP")
         if crash_step is not None and int(crash_step) == step.step_index:
             os.kill(os.getpid(), signal.SIGKILL)
+    context.timings.close_step()
 
     # Phase exit: flow-level verification.
     if not interrupted and policy is not None and reasoning_bundles:
@@ -877,6 +985,14 @@ def execute_step_phase(
     return interrupted
 
 
+def _failure_fields(exc: Exception) -> dict[str, object]:
+    """Internal helper; not part of the public API."""
+    fields: dict[str, object] = {"error": str(exc)}
+    if isinstance(exc, DeadlineExceededError):
+        fields["deadline"] = exc.scope
+    return fields
+
+
 def _causality_tag(event_type: EventType) -> CausalityTag:
     """Internal helper; not part of the public API."""
     if event_type in {
@@ -78,6 +78,7 @@ def finalization_phase(
         entropy_exhausted=nondeterminism_verdict.entropy_exhausted,
         entropy_exhaustion_action=nondeterminism_verdict.entropy_exhaustion_action,
         non_certifiable=nondeterminism_verdict.non_certifiable,
+        plan_tree=steps_plan.plan_tree,
         finalized=False,
     )
     finalize_trace(trace)
@@ -0,0 +1,309 @@
+# INTERNAL — NOT A PUBLIC EXTENSION POINT
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Module definitions for runtime/execution/reasoning_cache.py."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+import hashlib
+from importlib.metadata import PackageNotFoundError, version
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Protocol
+
+from agentic_flows.runtime.context import ExecutionContext
+from agentic_flows.runtime.execution.reasoning_executor import ReasoningExecutor
+from agentic_flows.runtime.observability.classification.fingerprint import (
+    fingerprint_inputs,
+)
+from agentic_flows.spec.model.artifact.artifact import Artifact
+from agentic_flows.spec.model.artifact.reasoning_claim import ReasoningClaim
+from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
+from agentic_flows.spec.model.execution.resolved_step import ResolvedStep
+from agentic_flows.spec.model.reasoning_bundle import ReasoningBundle
+from agentic_flows.spec.model.reasoning_step import ReasoningStep
+from agentic_flows.spec.ontology import DeterminismLevel
+from agentic_flows.spec.ontology.ids import (
+    AgentID,
+    BundleID,
+    ClaimID,
+    EvidenceID,
+    StepID,
+    TenantID,
+)
+
+try:
+    bijux_rar_version = version("bijux-rar")
+except PackageNotFoundError:
+    bijux_rar_version = "0.0.0"
+
+REASONING_CACHE_DIR_ENV = "AGENTIC_FLOWS_REASONING_CACHE_DIR"
+
+# Bump when the on-disk bundle layout changes so stale files are ignored.
+_DISK_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class ReasoningCacheKey:
+    """Reasoning cache key; misuse serves bundles across tenants or inputs."""
+
+    tenant_id: TenantID
+    inputs_hash: str
+    agent_version: str
+    reasoner_version: str
+
+    @classmethod
+    def for_inputs(
+        cls,
+        step: ResolvedStep,
+        agent_outputs: Sequence[Artifact],
+        evidence: Sequence[RetrievedEvidence],
+        *,
+        tenant_id: TenantID,
+    ) -> ReasoningCacheKey | None:
+        """Build a key, or None when the step may reason differently on equal inputs."""
+        if step.determinism_level != DeterminismLevel.STRICT:
+            return None
+        # The seed payload only hashes contents; bundles cite evidence and
+        # artifacts by id, so equal contents under other ids are a miss.
+        return cls(
+            tenant_id=tenant_id,
+            inputs_hash=fingerprint_inputs(
+                {
+                    "artifacts": [
+                        {
+                            "artifact_id": item.artifact_id,
+                            "content_hash": item.content_hash,
+                        }
+                        for item in agent_outputs
+                    ],
+                    "evidence": [
+                        {
+                            "evidence_id": item.evidence_id,
+                            "content_hash": item.content_hash,
+                        }
+                        for item in evidence
+                    ],
+                }
+            ),
+            agent_version=str(step.agent_invocation.agent_version),
+            reasoner_version=bijux_rar_version,
+        )
+
+    def digest(self) -> str:
+        """Execute digest and enforce its contract."""
+        parts = (
+            str(_DISK_FORMAT),
+            str(self.tenant_id),
+            self.inputs_hash,
+            self.agent_version,
+            self.reasoner_version,
+        )
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class ReasoningCacheProtocol(Protocol):
+    """Reasoning cache contract; misuse breaks bundle reuse."""
+
+    def get(self, key: ReasoningCacheKey) -> ReasoningBundle | None:
+        """Execute get and enforce its contract."""
+        ...
+
+    def put(self, key: ReasoningCacheKey, bundle: ReasoningBundle) -> None:
+        """Execute put and enforce its contract."""
+        ...
+
+
+class ReasoningCache:
+    """Reasoning bundles keyed by reasoning inputs; misuse serves unverified claims."""
+
+    def __init__(
+        self, *, max_entries: int = 1024, cache_dir: Path | None = None
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        self._max_entries = max_entries
+        self._cache_dir = cache_dir
+        self._entries: OrderedDict[ReasoningCacheKey, tuple[str, ReasoningBundle]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: ReasoningCacheKey) -> ReasoningBundle | None:
+        """Return a cached bundle whose hash still matches the one stored."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None:
+            bundle_hash, bundle = entry
+            if ReasoningExecutor.bundle_hash(bundle) == bundle_hash:
+                return bundle
+            self._forget(key)
+            return None
+        if self._cache_dir is None:
+            return None
+        loaded = _read_bundle(self._cache_dir, key)
+        if loaded is None:
+            return None
+        self._remember(key, *loaded)
+        return loaded[1]
+
+    def put(self, key: ReasoningCacheKey, bundle: ReasoningBundle) -> None:
+        """Store a bundle under its content hash and point the key at it."""
+        bundle_hash = ReasoningExecutor.bundle_hash(bundle)
+        self._remember(key, bundle_hash, bundle)
+        if self._cache_dir is not None:
+            _write_bundle(self._cache_dir, key, bundle_hash, bundle)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry; on-disk entries are left in place."""
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(
+        self, key: ReasoningCacheKey, bundle_hash: str, bundle: ReasoningBundle
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        with self._lock:
+            self._entries[key] = (bundle_hash, bundle)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _forget(self, key: ReasoningCacheKey) -> None:
+        """Internal helper; not part of the public API."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class CachedReasoningExecutor(ReasoningExecutor):
+    """Reasoning executor that reuses verified bundles for identical strict inputs."""
+
+    def __init__(self, inner: ReasoningExecutor, cache: ReasoningCacheProtocol) -> None:
+        """Internal helper; not part of the public API."""
+        self._inner = inner
+        self._cache = cache
+        self._outcomes: dict[int, str] = {}
+
+    def execute(self, step: ResolvedStep, context: ExecutionContext) -> ReasoningBundle:
+        """Execute execute and enforce its contract."""
+        key = ReasoningCacheKey.for_inputs(
+            step,
+            context.artifacts_for_step(step.step_index),
+            context.evidence_for_step(step.step_index),
+            tenant_id=context.tenant_id,
+        )
+        if key is None:
+            self._outcomes[step.step_index] = "bypass"
+            return self._inner.execute(step, context)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._outcomes[step.step_index] = "hit"
+            return cached
+        self._outcomes[step.step_index] = "miss"
+        bundle = self._inner.execute(step, context)
+        self._cache.put(key, bundle)
+        return bundle
+
+    def outcome(self, step_index: int) -> str:
+        """Return hit, miss, or bypass for the step's last reasoning call."""
+        return self._outcomes.get(step_index, "bypass")
+
+
+def reasoning_cache_dir_from_env() -> Path | None:
+    """Read the on-disk reasoning cache directory from the environment."""
+    value = os.environ.get(REASONING_CACHE_DIR_ENV)
+    return Path(value) if value else None
+
+
+def _read_bundle(
+    cache_dir: Path, key: ReasoningCacheKey
+) -> tuple[str, ReasoningBundle] | None:
+    """Internal helper; not part of the public API."""
+    try:
+        bundle_hash = (
+            (cache_dir / "keys" / key.digest()).read_text(encoding="utf-8").strip()
+        )
+        payload = json.loads(
+            (cache_dir / "bundles" / f"{bundle_hash}.json").read_text(encoding="utf-8")
+        )
+        bundle = ReasoningBundle(
+            spec_version=str(payload["spec_version"]),
+            bundle_id=BundleID(str(payload["bundle_id"])),
+            claims=tuple(
+                ReasoningClaim(
+                    spec_version=str(entry["spec_version"]),
+                    claim_id=ClaimID(str(entry["claim_id"])),
+                    statement=str(entry["statement"]),
+                    confidence=float(entry["confidence"]),
+                    supported_by=tuple(
+                        EvidenceID(str(item)) for item in entry["supported_by"]
+                    ),
+                )
+                for entry in payload["claims"]
+            ),
+            steps=tuple(
+                ReasoningStep(
+                    spec_version=str(entry["spec_version"]),
+                    step_id=StepID(str(entry["step_id"])),
+                    input_claims=tuple(
+                        ClaimID(str(item)) for item in entry["input_claims"]
+                    ),
+                    output_claims=tuple(
+                        ClaimID(str(item)) for item in entry["output_claims"]
+                    ),
+                    method=str(entry["method"]),
+                )
+                for entry in payload["steps"]
+            ),
+            evidence_ids=tuple(
+                EvidenceID(str(item)) for item in payload["evidence_ids"]
+            ),
+            producer_agent_id=AgentID(str(payload["producer_agent_id"])),
+        )
+    except Exception:
+        # A missing, truncated, or outdated file is a miss; reasoning reruns.
+        return None
+    # The file name is the content address; anything else was tampered with
+    # or decoded differently and must not be served.
+    if ReasoningExecutor.bundle_hash(bundle) != bundle_hash:
+        return None
+    return bundle_hash, bundle
+
+
+def _write_bundle(
+    cache_dir: Path,
+    key: ReasoningCacheKey,
+    bundle_hash: str,
+    bundle: ReasoningBundle,
+) -> None:
+    """Internal helper; not part of the public API."""
+    bundle_path = cache_dir / "bundles" / f"{bundle_hash}.json"
+    if not bundle_path.exists():
+        _write_atomic(bundle_path, json.dumps(asdict(bundle), sort_keys=True))
+    # The key is written last so readers never see a key without its bundle.
+    _write_atomic(cache_dir / "keys" / key.digest(), bundle_hash)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Internal helper; not part of the public API."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    staging.write_text(text, encoding="utf-8")
+    os.replace(staging, path)
+
+
+__all__ = [
+    "REASONING_CACHE_DIR_ENV",
+    "CachedReasoningExecutor",
+    "ReasoningCache",
+    "ReasoningCacheKey",
+    "ReasoningCacheProtocol",
+    "reasoning_cache_dir_from_env",
+]
@@ -8,6 +8,7 @@ from __future__ import annotations
 from dataclasses import asdict
 import hashlib
 import json
+from typing import Any
 
 import bijux_rar
 
@@ -28,16 +29,38 @@ class ReasoningExecutor:
 
         agent_outputs = list(context.artifacts_for_step(step.step_index))
         retrieved_evidence = list(context.evidence_for_step(step.step_index))
-        seed = self._deterministic_seed(agent_outputs, retrieved_evidence)
-        bundle = bijux_rar.reason(
-            agent_outputs=agent_outputs,
-            evidence=retrieved_evidence,
-            seed=seed,
+        bundle = context.run_tool_call(
+            lambda: self._reason(step, agent_outputs, retrieved_evidence),
+            tool_id="bijux-rar.reason",
+            step_index=step.step_index,
         )
         if not isinstance(bundle, ReasoningBundle):
             raise ValueError("bijux_rar.reason must return ReasoningBundle")
         return bundle
 
+    def _reason(
+        self,
+        step: ResolvedStep,
+        agent_outputs: list[Artifact],
+        retrieved_evidence: list[RetrievedEvidence],
+    ) -> object:
+        """Internal helper; not part of the public API."""
+        return bijux_rar.reason(
+            **self._reason_arguments(agent_outputs, retrieved_evidence)
+        )
+
+    def _reason_arguments(
+        self,
+        agent_outputs: list[Artifact],
+        retrieved_evidence: list[RetrievedEvidence],
+    ) -> dict[str, Any]:
+        """Internal helper; not part of the public API."""
+        return {
+            "agent_outputs": agent_outputs,
+            "evidence": retrieved_evidence,
+            "seed": self._deterministic_seed(agent_outputs, retrieved_evidence),
+        }
+
     @staticmethod
     def bundle_hash(bundle: ReasoningBundle) -> str:
         """Execute bundle_hash and enforce its contract."""
@@ -0,0 +1,252 @@
+# INTERNAL — NOT A PUBLIC EXTENSION POINT
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Module definitions for runtime/execution/retrieval_cache.py."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Protocol
+
+from agentic_flows.runtime.context import ExecutionContext
+from agentic_flows.runtime.execution.retrieval_executor import RetrievalExecutor
+from agentic_flows.runtime.observability.classification.retrieval_fingerprint import (
+    fingerprint_retrieval,
+)
+from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
+from agentic_flows.spec.model.datasets.dataset_descriptor import DatasetDescriptor
+from agentic_flows.spec.model.datasets.retrieval_request import RetrievalRequest
+from agentic_flows.spec.model.execution.resolved_step import ResolvedStep
+from agentic_flows.spec.ontology import DatasetState, EvidenceDeterminism
+from agentic_flows.spec.ontology.ids import (
+    ContentHash,
+    ContractID,
+    EvidenceID,
+    TenantID,
+)
+
+RETRIEVAL_CACHE_DIR_ENV = "AGENTIC_FLOWS_RETRIEVAL_CACHE_DIR"
+
+# Bump when the on-disk evidence layout changes so stale files are ignored.
+_DISK_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class RetrievalCacheKey:
+    """Retrieval cache key; misuse serves evidence across tenants or datasets."""
+
+    tenant_id: TenantID
+    request_fingerprint: str
+    dataset_id: str
+    dataset_version: str
+    dataset_hash: str
+
+    @classmethod
+    def for_request(
+        cls,
+        request: RetrievalRequest,
+        dataset: DatasetDescriptor,
+        *,
+        tenant_id: TenantID,
+    ) -> RetrievalCacheKey | None:
+        """Build a key, or None when the dataset may still change."""
+        if dataset.dataset_state != DatasetState.FROZEN:
+            return None
+        return cls(
+            tenant_id=tenant_id,
+            request_fingerprint=fingerprint_retrieval(request),
+            dataset_id=str(dataset.dataset_id),
+            dataset_version=dataset.dataset_version,
+            dataset_hash=dataset.dataset_hash,
+        )
+
+    def digest(self) -> str:
+        """Execute digest and enforce its contract."""
+        parts = (
+            str(_DISK_FORMAT),
+            str(self.tenant_id),
+            self.request_fingerprint,
+            self.dataset_id,
+            self.dataset_version,
+            self.dataset_hash,
+        )
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class RetrievalCacheProtocol(Protocol):
+    """Retrieval cache contract; misuse breaks evidence reuse."""
+
+    def get(self, key: RetrievalCacheKey) -> tuple[RetrievedEvidence, ...] | None:
+        """Execute get and enforce its contract."""
+        ...
+
+    def put(
+        self, key: RetrievalCacheKey, evidence: tuple[RetrievedEvidence, ...]
+    ) -> None:
+        """Execute put and enforce its contract."""
+        ...
+
+
+class RetrievalCache:
+    """Validated evidence keyed by request and frozen dataset; misuse serves stale evidence."""
+
+    def __init__(
+        self, *, max_entries: int = 4096, cache_dir: Path | None = None
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        self._max_entries = max_entries
+        self._cache_dir = cache_dir
+        self._entries: OrderedDict[RetrievalCacheKey, tuple[RetrievedEvidence, ...]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: RetrievalCacheKey) -> tuple[RetrievedEvidence, ...] | None:
+        """Return cached evidence, promoting on-disk hits into memory."""
+        with self._lock:
+            evidence = self._entries.get(key)
+            if evidence is not None:
+                self._entries.move_to_end(key)
+                return evidence
+        if self._cache_dir is None:
+            return None
+        evidence = _read_evidence(self._cache_dir / f"{key.digest()}.json", key)
+        if evidence is not None:
+            self._remember(key, evidence)
+        return evidence
+
+    def put(
+        self, key: RetrievalCacheKey, evidence: tuple[RetrievedEvidence, ...]
+    ) -> None:
+        """Store evidence when every item is deterministic."""
+        if not evidence or any(
+            item.determinism != EvidenceDeterminism.DETERMINISTIC for item in evidence
+        ):
+            return
+        self._remember(key, evidence)
+        if self._cache_dir is not None:
+            _write_evidence(self._cache_dir / f"{key.digest()}.json", evidence)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry; on-disk entries are left in place."""
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(
+        self, key: RetrievalCacheKey, evidence: tuple[RetrievedEvidence, ...]
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        with self._lock:
+            self._entries[key] = evidence
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+class CachedRetrievalExecutor(RetrievalExecutor):
+    """Retrieval executor that reuses validated evidence for frozen datasets."""
+
+    def __init__(
+        self,
+        inner: RetrievalExecutor,
+        cache: RetrievalCacheProtocol,
+        *,
+        dataset: DatasetDescriptor,
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        self._inner = inner
+        self._cache = cache
+        self._dataset = dataset
+        self._outcomes: dict[int, str] = {}
+
+    def execute(
+        self, step: ResolvedStep, context: ExecutionContext
+    ) -> list[RetrievedEvidence]:
+        """Execute execute and enforce its contract."""
+        key = None
+        if step.retrieval_request is not None:
+            key = RetrievalCacheKey.for_request(
+                step.retrieval_request, self._dataset, tenant_id=context.tenant_id
+            )
+        if key is None:
+            self._outcomes[step.step_index] = "bypass"
+            return self._inner.execute(step, context)
+        cached = self._cache.get(key)
+        if cached is not None:
+            # Cached evidence already passed contract enforcement and is
+            # deterministic, so no entropy is recorded for it.
+            self._outcomes[step.step_index] = "hit"
+            evidence = list(cached)
+            context.record_evidence(step.step_index, evidence)
+            return evidence
+        self._outcomes[step.step_index] = "miss"
+        evidence = self._inner.execute(step, context)
+        self._cache.put(key, tuple(evidence))
+        return evidence
+
+    def outcome(self, step_index: int) -> str:
+        """Return hit, miss, or bypass for the step's last retrieval."""
+        return self._outcomes.get(step_index, "bypass")
+
+
+def retrieval_cache_dir_from_env() -> Path | None:
+    """Read the on-disk retrieval cache directory from the environment."""
+    value = os.environ.get(RETRIEVAL_CACHE_DIR_ENV)
+    return Path(value) if value else None
+
+
+def _read_evidence(
+    path: Path, key: RetrievalCacheKey
+) -> tuple[RetrievedEvidence, ...] | None:
+    """Internal helper; not part of the public API."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        evidence = tuple(
+            RetrievedEvidence(
+                spec_version=str(entry["spec_version"]),
+                evidence_id=EvidenceID(str(entry["evidence_id"])),
+                tenant_id=TenantID(str(entry["tenant_id"])),
+                determinism=EvidenceDeterminism(str(entry["determinism"])),
+                source_uri=str(entry["source_uri"]),
+                content_hash=ContentHash(str(entry["content_hash"])),
+                score=float(entry["score"]),
+                vector_contract_id=ContractID(str(entry["vector_contract_id"])),
+            )
+            for entry in payload
+        )
+    except Exception:
+        # A missing, truncated, or outdated file is a miss; retrieval reruns.
+        return None
+    if not evidence or any(
+        item.tenant_id != key.tenant_id
+        or item.determinism != EvidenceDeterminism.DETERMINISTIC
+        for item in evidence
+    ):
+        return None
+    return evidence
+
+
+def _write_evidence(path: Path, evidence: tuple[RetrievedEvidence, ...]) -> None:
+    """Internal helper; not part of the public API."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    payload = [asdict(item) for item in evidence]
+    staging.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+    os.replace(staging, path)
+
+
+__all__ = [
+    "RETRIEVAL_CACHE_DIR_ENV",
+    "CachedRetrievalExecutor",
+    "RetrievalCache",
+    "RetrievalCacheKey",
+    "RetrievalCacheProtocol",
+    "retrieval_cache_dir_from_env",
+]
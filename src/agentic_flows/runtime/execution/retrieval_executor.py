@@ -47,11 +47,10 @@ class RetrievalExecutor:
         if not hasattr(bijux_vex, "enforce_contract"):
             raise RuntimeError("bijux_vex.enforce_contract is required for enforcement")
 
-        raw_evidence = bijux_rag.retrieve(
-            query=request.query,
-            top_k=request.top_k,
-            scope=request.scope,
-            vector_contract_id=request.vector_contract_id,
+        raw_evidence = context.run_tool_call(
+            lambda: self._retrieve(step),
+            tool_id="bijux-rag.retrieve",
+            step_index=step.step_index,
         )
 
         evidence = self._normalize_evidence(raw_evidence, tenant_id=context.tenant_id)
@@ -88,6 +87,23 @@ class RetrievalExecutor:
         context.record_evidence(step.step_index, evidence)
         return evidence
 
+    def _retrieve(self, step: ResolvedStep) -> Any:
+        """Internal helper; not part of the public API."""
+        return bijux_rag.retrieve(**self._retrieve_arguments(step))
+
+    @staticmethod
+    def _retrieve_arguments(step: ResolvedStep) -> dict[str, Any]:
+        """Internal helper; not part of the public API."""
+        request = step.retrieval_request
+        if request is None:
+            raise ValueError("step has no retrieval request")
+        return {
+            "query": request.query,
+            "top_k": request.top_k,
+            "scope": request.scope,
+            "vector_contract_id": request.vector_contract_id,
+        }
+
     def _normalize_evidence(
         self, raw: Any, *, tenant_id: TenantID
     ) -> list[RetrievedEvidence]:
@@ -0,0 +1,132 @@
+# INTERNAL — NOT A PUBLIC EXTENSION POINT
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Module definitions for runtime/execution/retrieval_prefetch.py."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+from typing import Any
+
+from agentic_flows.runtime.context import ExecutionContext
+from agentic_flows.runtime.execution.retrieval_cache import RetrievalCacheKey
+from agentic_flows.runtime.execution.retrieval_executor import RetrievalExecutor
+from agentic_flows.spec.model.datasets.dataset_descriptor import DatasetDescriptor
+from agentic_flows.spec.model.execution.resolved_step import ResolvedStep
+
+
+class RetrievalPrefetcher:
+    """Issues retrievals of upcoming steps ahead of the step loop; misuse breaks evidence ordering."""
+
+    def __init__(
+        self,
+        steps: Sequence[ResolvedStep],
+        context: ExecutionContext,
+        *,
+        lookahead: int,
+        dataset: DatasetDescriptor | None = None,
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        if lookahead < 1:
+            raise ValueError("retrieval lookahead must be at least 1")
+        self._context = context
+        self._dataset = dataset
+        self._lookahead = lookahead
+        self._retrieval = RetrievalExecutor()
+        # Requests are fixed at plan time, so every remaining step's retrieval
+        # can start before the steps ahead of it finish.
+        self._queue = deque(
+            step
+            for step in steps
+            if step.step_index > context.resume_from_step_index
+            and step.retrieval_request is not None
+        )
+        self._in_flight: dict[int, Future[Any]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._pool: ThreadPoolExecutor | None = None
+
+    def start(self) -> None:
+        """Submit retrievals for the first steps of the window."""
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._lookahead,
+            thread_name_prefix="agentic-flows-retrieval",
+        )
+        with self._lock:
+            self._fill()
+
+    def close(self) -> None:
+        """Stop scheduling; retrievals already running finish in the background."""
+        with self._lock:
+            self._closed = True
+            self._queue.clear()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def retrieve(self, step: ResolvedStep) -> Any:
+        """Return the raw retrieval result for a step, calling the backend on a miss."""
+        with self._lock:
+            future = self._in_flight.pop(step.step_index, None)
+            if future is None:
+                # The window has not reached the step yet; it is fetched here
+                # instead of behind the steps already queued ahead of it.
+                self._queue = deque(
+                    item for item in self._queue if item.step_index != step.step_index
+                )
+            self._fill()
+        if future is None:
+            return self._call_retrieval(step)
+        return future.result()
+
+    def _fill(self) -> None:
+        """Internal helper; not part of the public API."""
+        while (
+            not self._closed
+            and self._pool is not None
+            and self._queue
+            and len(self._in_flight) < self._lookahead
+        ):
+            step = self._queue.popleft()
+            if self._is_cached(step):
+                continue
+            self._in_flight[step.step_index] = self._pool.submit(
+                self._call_retrieval, step
+            )
+
+    def _is_cached(self, step: ResolvedStep) -> bool:
+        """Internal helper; not part of the public API."""
+        # A cache hit never reaches the backend, so its window slot goes to
+        # a step that will.
+        cache = self._context.retrieval_cache
+        if cache is None or self._dataset is None or step.retrieval_request is None:
+            return False
+        key = RetrievalCacheKey.for_request(
+            step.retrieval_request, self._dataset, tenant_id=self._context.tenant_id
+        )
+        return key is not None and cache.get(key) is not None
+
+    def _call_retrieval(self, step: ResolvedStep) -> Any:
+        """Internal helper; not part of the public API."""
+        return self._retrieval._retrieve(step)
+
+
+class LookaheadRetrievalExecutor(RetrievalExecutor):
+    """Retrieval executor reading retrievals issued ahead by the prefetcher."""
+
+    def __init__(self, prefetcher: RetrievalPrefetcher) -> None:
+        """Internal helper; not part of the public API."""
+        self._prefetcher = prefetcher
+
+    def _retrieve(self, step: ResolvedStep) -> Any:
+        """Internal helper; not part of the public API."""
+        return self._prefetcher.retrieve(step)
+
+
+__all__ = [
+    "LookaheadRetrievalExecutor",
+    "RetrievalPrefetcher",
+]
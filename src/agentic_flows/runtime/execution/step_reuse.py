@@ -0,0 +1,132 @@
+# INTERNAL — NOT A PUBLIC EXTENSION POINT
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Module definitions for runtime/execution/step_reuse.py."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+import threading
+
+from agentic_flows.runtime.context import ExecutionContext
+from agentic_flows.runtime.execution.agent_executor import AgentExecutor
+from agentic_flows.runtime.observability.classification.fingerprint import (
+    fingerprint_inputs,
+)
+from agentic_flows.runtime.observability.classification.seed import deterministic_seed
+from agentic_flows.runtime.observability.storage.execution_store_protocol import (
+    ExecutionReadStoreProtocol,
+)
+from agentic_flows.runtime.orchestration.plan_tree import step_leaf_hash
+from agentic_flows.spec.model.artifact.artifact import Artifact
+from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
+from agentic_flows.spec.model.execution.resolved_step import ResolvedStep
+from agentic_flows.spec.ontology import ArtifactType
+from agentic_flows.spec.ontology.ids import RunID, TenantID
+
+
+def step_output_key(step: ResolvedStep, evidence: Sequence[RetrievedEvidence]) -> str:
+    """Fingerprint every input of the step's agent call."""
+    # The plan leaf covers the step's declared shape; the agent invocation adds
+    # what the leaf leaves out, and the seed and evidence are what the agent
+    # actually receives.
+    return fingerprint_inputs(
+        {
+            "step_hash": step_leaf_hash(step),
+            "seed": deterministic_seed(step.step_index, step.inputs_fingerprint),
+            "agent_version": step.agent_invocation.agent_version,
+            "declared_outputs": list(step.agent_invocation.declared_outputs),
+            "execution_mode": step.agent_invocation.execution_mode,
+            "evidence": [
+                {
+                    "evidence_id": item.evidence_id,
+                    "content_hash": item.content_hash,
+                }
+                for item in evidence
+            ],
+        }
+    )
+
+
+@dataclass(frozen=True)
+class ReusedStep:
+    """Agent outputs an earlier finalized run recorded for the same step key."""
+
+    run_id: RunID
+    artifacts: tuple[Artifact, ...]
+
+
+class StepOutputIndex:
+    """Earlier step outputs by step key; misuse reuses outputs of changed steps."""
+
+    def __init__(
+        self, store: ExecutionReadStoreProtocol, *, tenant_id: TenantID
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        self._store = store
+        self._tenant_id = tenant_id
+        self._found: dict[str, ReusedStep | None] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, step_key: str) -> ReusedStep | None:
+        """Return reusable outputs, remembering the answer for this run."""
+        with self._lock:
+            if step_key in self._found:
+                return self._found[step_key]
+        loaded = self._store.load_step_outputs(step_key, tenant_id=self._tenant_id)
+        reused = None
+        if loaded is not None:
+            run_id, artifacts = loaded
+            # State artifacts chain through every earlier step of a run, so
+            # the reusing run rebuilds its own instead of copying them.
+            reused = ReusedStep(
+                run_id=run_id,
+                artifacts=tuple(
+                    item
+                    for item in artifacts
+                    if item.artifact_type != ArtifactType.EXECUTOR_STATE
+                ),
+            )
+        # The prefetcher and the step loop may both ask; the first answer
+        # wins so both commit the same outputs for the step.
+        with self._lock:
+            return self._found.setdefault(step_key, reused)
+
+
+class IncrementalAgentExecutor(AgentExecutor):
+    """Agent executor that reuses outputs of unchanged steps from earlier runs."""
+
+    def __init__(self, inner: AgentExecutor, index: StepOutputIndex) -> None:
+        """Internal helper; not part of the public API."""
+        self._inner = inner
+        self._index = index
+        self._keys: dict[int, str] = {}
+        self._reused: dict[int, RunID] = {}
+
+    def execute(self, step: ResolvedStep, context: ExecutionContext) -> list[Artifact]:
+        """Execute execute and enforce its contract."""
+        key = step_output_key(step, context.evidence_for_step(step.step_index))
+        self._keys[step.step_index] = key
+        reused = self._index.lookup(key)
+        if reused is None:
+            return self._inner.execute(step, context)
+        self._reused[step.step_index] = reused.run_id
+        return self._inner.reuse(step, reused.artifacts, context)
+
+    def step_key(self, step_index: int) -> str:
+        """Return the key the step's outputs are recorded under."""
+        return self._keys[step_index]
+
+    def reused_run_id(self, step_index: int) -> RunID | None:
+        """Return the run whose outputs the step reused, or None on a miss."""
+        return self._reused.get(step_index)
+
+
+__all__ = [
+    "IncrementalAgentExecutor",
+    "ReusedStep",
+    "StepOutputIndex",
+    "step_output_key",
+]
@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import asdict
 
 from agentic_flows.runtime.observability.classification.determinism_classification import (
@@ -14,8 +15,9 @@ from agentic_flows.runtime.observability.classification.determinism_classificati
 )
 from agentic_flows.spec.model.artifact.entropy_usage import EntropyUsage
 from agentic_flows.spec.model.execution.execution_trace import ExecutionTrace
+from agentic_flows.spec.model.identifiers.execution_event import ExecutionEvent
 from agentic_flows.spec.ontology import EntropyMagnitude
-from agentic_flows.spec.ontology.public import ReplayAcceptability
+from agentic_flows.spec.ontology.public import EventType, ReplayAcceptability
 
 _MAGNITUDE_ORDER = {
     EntropyMagnitude.LOW: 0,
@@ -77,16 +79,19 @@ def semantic_trace_diff(
             "expected": expected.verification_policy_fingerprint,
             "observed": observed.verification_policy_fingerprint,
         }
-    expected_events = _event_signature(expected, acceptability)
-    observed_events = _event_signature(observed, acceptability)
+    expected_exact = _event_signature(expected.events)
+    observed_exact = _event_signature(observed.events)
+    expected_events = _project_signature(expected_exact, acceptability)
+    observed_events = _project_signature(observed_exact, acceptability)
     if expected_events != observed_events:
         diffs["events"] = {
             "expected": expected_events,
             "observed": observed_events,
         }
-    elif acceptability != ReplayAcceptability.EXACT_MATCH and _event_signature(
-        expected, ReplayAcceptability.EXACT_MATCH
-    ) != _event_signature(observed, ReplayAcceptability.EXACT_MATCH):
+    elif (
+        acceptability != ReplayAcceptability.EXACT_MATCH
+        and expected_exact != observed_exact
+    ):
         diffs["acceptable_events"] = "different but acceptable under policy"
     if acceptability == ReplayAcceptability.STATISTICALLY_BOUNDED:
         diffs.update(_statistical_envelope_diff(expected, observed))
@@ -106,22 +111,27 @@ def render_semantic_diff(diff: dict[str, object]) -> str:
 
 
 def _event_signature(
-    trace: ExecutionTrace, acceptability: ReplayAcceptability
+    events: Iterable[ExecutionEvent],
+) -> list[tuple[EventType, int, str]]:
+    """Internal helper; not part of the public API."""
+    # One pass over the events; only type, step and hash are read, so traces
+    # loaded without decoded payloads diff identically.
+    return [
+        (event.event_type, event.step_index, event.payload_hash) for event in events
+    ]
+
+
+def _project_signature(
+    signature: list[tuple[EventType, int, str]], acceptability: ReplayAcceptability
 ) -> list[tuple[object, ...]]:
     """Internal helper; not part of the public API."""
-    if acceptability == ReplayAcceptability.EXACT_MATCH:
-        return [
-            (event.event_type, event.step_index, event.payload_hash)
-            for event in trace.events
-        ]
     if acceptability == ReplayAcceptability.INVARIANT_PRESERVING:
-        return [(event.event_type, event.step_index) for event in trace.events]
+        return [(event_type, step_index) for event_type, step_index, _ in signature]
     if acceptability == ReplayAcceptability.STATISTICALLY_BOUNDED:
-        return sorted((event.event_type, event.step_index) for event in trace.events)
-    return [
-        (event.event_type, event.step_index, event.payload_hash)
-        for event in trace.events
-    ]
+        return sorted(
+            (event_type, step_index) for event_type, step_index, _ in signature
+        )
+    return list(signature)
 
 
 def _dataset_payload(dataset) -> dict[str, object]:
@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import metadata
 import platform
 import sys
@@ -15,19 +16,77 @@ from agentic_flows.runtime.observability.classification.fingerprint import (
     fingerprint_inputs,
 )
 
+_FINGERPRINTED_PACKAGES = (
+    "bijux-agent",
+    "bijux-cli",
+    "bijux-rag",
+    "bijux-rar",
+    "bijux-vex",
+)
+
 
 def compute_environment_fingerprint() -> str:
     """Execute compute_environment_fingerprint and enforce its contract."""
-    packages = {
-        "bijux-agent": metadata.version("bijux-agent"),
-        "bijux-cli": metadata.version("bijux-cli"),
-        "bijux-rag": metadata.version("bijux-rag"),
-        "bijux-rar": metadata.version("bijux-rar"),
-        "bijux-vex": metadata.version("bijux-vex"),
-    }
-    snapshot = {
+    return _environment_fingerprint()
+
+
+def environment_snapshot(*, detailed: bool = False) -> dict[str, object]:
+    """Return the fingerprinted environment; detailed adds unfingerprinted diagnostics."""
+    snapshot: dict[str, object] = {
         "python_version": sys.version,
-        "os": platform.platform(),
-        "packages": packages,
+        "os": _platform(),
+        "packages": dict(_package_versions()),
+    }
+    if detailed:
+        # Only needed to explain a mismatch, so it is never computed eagerly.
+        snapshot["details"] = {
+            "python_implementation": platform.python_implementation(),
+            "executable": sys.executable,
+            "machine": platform.machine(),
+            "bijux_distributions": _installed_bijux_distributions(),
+        }
+    return snapshot
+
+
+def invalidate_environment_fingerprint() -> None:
+    """Drop the process-wide snapshot after the interpreter environment changes."""
+    _environment_fingerprint.cache_clear()
+    _package_versions.cache_clear()
+    _platform.cache_clear()
+
+
+# Package metadata lookups scan every distribution on sys.path and
+# platform.platform() inspects the interpreter binary, so both are read once
+# per process; the environment cannot change under a running flow.
+@lru_cache(maxsize=1)
+def _environment_fingerprint() -> str:
+    """Internal helper; not part of the public API."""
+    return fingerprint_inputs(environment_snapshot())
+
+
+@lru_cache(maxsize=1)
+def _package_versions() -> tuple[tuple[str, str], ...]:
+    """Internal helper; not part of the public API."""
+    return tuple((name, metadata.version(name)) for name in _FINGERPRINTED_PACKAGES)
+
+
+@lru_cache(maxsize=1)
+def _platform() -> str:
+    """Internal helper; not part of the public API."""
+    return platform.platform()
+
+
+def _installed_bijux_distributions() -> dict[str, str]:
+    """Internal helper; not part of the public API."""
+    return {
+        name: distribution.version
+        for distribution in metadata.distributions()
+        if (name := distribution.metadata["Name"] or "").startswith("bijux")
     }
-    return fingerprint_inputs(snapshot)
+
+
+__all__ = [
+    "compute_environment_fingerprint",
+    "environment_snapshot",
+    "invalidate_environment_fingerprint",
+]
@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Module definitions for runtime/observability/capture/timings.py."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import threading
+import time
+
+TIMING_SCOPES = ("event", "step", "tool_call", "store_flush")
+
+
+@dataclass(frozen=True)
+class TimingRecord:
+    """Wall-clock timing sample; misuse leaks real time into hashed state."""
+
+    scope: str
+    label: str
+    step_index: int | None
+    started_ns: int
+    ended_ns: int
+
+    @property
+    def duration_ns(self) -> int:
+        """Return the elapsed nanoseconds between start and end."""
+        return self.ended_ns - self.started_ns
+
+
+class TimingRecorder:
+    """Monotonic timing side channel; misuse mixes timings into the trace."""
+
+    def __init__(self, *, starting_index: int = 0) -> None:
+        """Internal helper; not part of the public API."""
+        # Offsets are relative to the recorder's origin, so samples from one
+        # process are comparable with each other but not across resumes.
+        self._origin = time.monotonic_ns()
+        self._records: list[TimingRecord] = []
+        self._next_index = starting_index
+        self._open_step: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(
+        self, scope: str, label: str, *, step_index: int | None = None
+    ) -> Iterator[None]:
+        """Record the wall-clock span of the block, including when it raises."""
+        started = self._now()
+        try:
+            yield
+        finally:
+            self._append(TimingRecord(scope, label, step_index, started, self._now()))
+
+    def start_step(self, step_index: int) -> None:
+        """Close the open step span, if any, and open one for the step."""
+        self.close_step()
+        self._open_step = (step_index, self._now())
+
+    def close_step(self) -> None:
+        """Close the open step span; calling it with no open span is a no-op."""
+        if self._open_step is None:
+            return
+        step_index, started = self._open_step
+        self._open_step = None
+        self._append(
+            TimingRecord("step", str(step_index), step_index, started, self._now())
+        )
+
+    def records(self) -> tuple[TimingRecord, ...]:
+        """Return the samples not drained yet, in completion order."""
+        with self._lock:
+            return tuple(self._records)
+
+    def drain(self) -> tuple[int, tuple[TimingRecord, ...]]:
+        """Hand over and forget pending samples, with the index of the first one."""
+        with self._lock:
+            pending = tuple(self._records)
+            starting_index = self._next_index
+            self._records.clear()
+            self._next_index += len(pending)
+        return starting_index, pending
+
+    def _now(self) -> int:
+        """Internal helper; not part of the public API."""
+        return time.monotonic_ns() - self._origin
+
+    def _append(self, record: TimingRecord) -> None:
+        """Internal helper; not part of the public API."""
+        with self._lock:
+            self._records.append(record)
+
+
+__all__ = [
+    "TIMING_SCOPES",
+    "TimingRecord",
+    "TimingRecorder",
+]
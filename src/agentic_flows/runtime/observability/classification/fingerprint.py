@@ -5,32 +5,171 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, is_dataclass
+from collections.abc import Collection, Mapping
+from dataclasses import asdict, dataclass, field, is_dataclass
 import hashlib
-import json
+from json.encoder import encode_basestring_ascii
+from types import MappingProxyType
 from typing import Any
 
+_INFINITY = float("inf")
 
-def _normalize(value: Any) -> Any:
+
+# The canonical form is compact, ASCII-only JSON with dict keys sorted and
+# every list, tuple, and set sorted by the canonical text of its elements.
+# Each element is encoded once; ASCII text sorts the same as its bytes.
+def _encode(value: Any) -> str:
     """Internal helper; not part of the public API."""
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
     if isinstance(value, dict):
-        return {key: _normalize(value[key]) for key in sorted(value)}
+        return _encode_dict(value)
     if isinstance(value, list | tuple | set):
-        normalized = [_normalize(item) for item in value]
-        return sorted(
-            normalized,
-            key=lambda item: json.dumps(item, sort_keys=True, separators=(",", ":")),
+        return "[" + ",".join(sorted(map(_encode, value))) + "]"
+    if isinstance(value, CanonicalPayload):
+        return _encode_dict(value.data)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return _encode_float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# The stored form differs only in keeping list and tuple order: it is what an
+# event recorded, while the canonical form is what it is identified by. Both
+# come out of one pass; where no list was reordered they are the same string.
+def _encode_pair(value: Any) -> tuple[str, str]:
+    """Internal helper; not part of the public API."""
+    if isinstance(value, dict):
+        return _encode_pair_dict(value)
+    if isinstance(value, list | tuple):
+        pairs = [_encode_pair(item) for item in value]
+        ordered = "[" + ",".join(pair[0] for pair in pairs) + "]"
+        canonical = "[" + ",".join(sorted(pair[1] for pair in pairs)) + "]"
+        return ordered, ordered if canonical == ordered else canonical
+    if isinstance(value, CanonicalPayload):
+        return _encode_pair_dict(value.data)
+    text = _encode(value)
+    return text, text
+
+
+def _encode_pair_dict(
+    value: Mapping[Any, Any], unhashed: Collection[str] = ()
+) -> tuple[str, str]:
+    """Internal helper; not part of the public API."""
+    ordered: list[str] = []
+    canonical: list[str] = []
+    for key in sorted(value):
+        prefix = _encode_key(key) + ":"
+        ordered_member, canonical_member = _encode_pair(value[key])
+        ordered.append(prefix + ordered_member)
+        if key not in unhashed:
+            canonical.append(prefix + canonical_member)
+    ordered_text = "{" + ",".join(ordered) + "}"
+    canonical_text = "{" + ",".join(canonical) + "}"
+    if canonical_text == ordered_text:
+        return ordered_text, ordered_text
+    return ordered_text, canonical_text
+
+
+def _encode_dict(value: Mapping[Any, Any]) -> str:
+    """Internal helper; not part of the public API."""
+    return (
+        "{"
+        + ",".join(
+            _encode_key(key) + ":" + _encode(value[key]) for key in sorted(value)
         )
-    return value
+        + "}"
+    )
 
 
-def fingerprint_inputs(data: dict) -> str:
-    """Execute fingerprint_inputs and enforce its contract."""
-    normalized = _normalize(data)
-    payload = json.dumps(
-        normalized, sort_keys=True, separators=(",", ":"), ensure_ascii=True
+def _encode_key(key: Any) -> str:
+    """Internal helper; not part of the public API."""
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+    if key is None:
+        return '"null"'
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if isinstance(key, int):
+        return '"' + int.__repr__(key) + '"'
+    if isinstance(key, float):
+        return '"' + _encode_float(key) + '"'
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
     )
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _encode_float(value: float) -> str:
+    """Internal helper; not part of the public API."""
+    if value != value:
+        return "NaN"
+    if value == _INFINITY:
+        return "Infinity"
+    if value == -_INFINITY:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+@dataclass(frozen=True)
+class CanonicalPayload:
+    """Frozen fingerprint input; its fingerprint is computed once and reused."""
+
+    data: Mapping[str, Any]
+    fingerprint: str = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Internal helper; not part of the public API."""
+        data = dict(self.data)
+        object.__setattr__(self, "data", MappingProxyType(data))
+        object.__setattr__(self, "fingerprint", fingerprint_inputs(data))
+
+    def __hash__(self) -> int:
+        """Internal helper; not part of the public API."""
+        return hash(self.fingerprint)
+
+
+def fingerprint_inputs(data: dict | CanonicalPayload) -> str:
+    """Execute fingerprint_inputs and enforce its contract."""
+    if isinstance(data, CanonicalPayload):
+        return data.fingerprint
+    digest = hashlib.sha256()
+    if not isinstance(data, dict) or not data:
+        digest.update(_encode(data).encode("ascii"))
+        return digest.hexdigest()
+    # Stream top-level members; only sorted containers are buffered.
+    separator = "{"
+    for key in sorted(data):
+        member = separator + _encode_key(key) + ":" + _encode(data[key])
+        digest.update(member.encode("ascii"))
+        separator = ","
+    digest.update(b"}")
+    return digest.hexdigest()
+
+
+def encode_canonical(
+    data: dict | CanonicalPayload, *, unhashed: Collection[str] = ()
+) -> tuple[str, str, str]:
+    """Return the order-preserving JSON of data, its fingerprint, and its key."""
+    # Lists are sorted only for the fingerprint; the returned text keeps them
+    # in recorded order, e.g. evidence ids in retrieval rank. Keys in unhashed
+    # are stored in the text but left out of the fingerprint. The last value
+    # is the SHA-256 of the text, which is the fingerprint whenever the two
+    # encodings coincide.
+    members = data.data if isinstance(data, CanonicalPayload) else data
+    ordered, canonical = _encode_pair_dict(members, unhashed)
+    fingerprint = hashlib.sha256(canonical.encode("ascii")).hexdigest()
+    if canonical is ordered:
+        return ordered, fingerprint, fingerprint
+    return ordered, fingerprint, hashlib.sha256(ordered.encode("ascii")).hexdigest()
 
 
 def fingerprint_policy(policy: object) -> str:
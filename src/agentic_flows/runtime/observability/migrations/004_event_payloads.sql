@@ -0,0 +1,31 @@
+-- INTERNAL — NOT A PUBLIC EXTENSION POINT
+-- SPDX-License-Identifier: Apache-2.0
+-- Copyright © 2025 Bijan Mousavi
+
+CREATE TABLE IF NOT EXISTS payloads (
+    payload_key TEXT PRIMARY KEY,
+    payload_json TEXT NOT NULL
+);
+
+INSERT OR IGNORE INTO payloads (payload_key, payload_json)
+SELECT DISTINCT sha256(payload_json), payload_json
+FROM events
+WHERE payload_json IS NOT NULL;
+
+-- DuckDB cannot alter an indexed table; rebuild the event indexes around it.
+DROP INDEX IF EXISTS events_run_step_idx;
+DROP INDEX IF EXISTS events_run_type_idx;
+DROP INDEX IF EXISTS events_run_time_idx;
+
+ALTER TABLE events RENAME COLUMN payload_json TO payload_key;
+
+UPDATE events
+SET payload_key = sha256(payload_key)
+WHERE payload_key IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS events_run_step_idx
+    ON events (tenant_id, run_id, step_index);
+CREATE INDEX IF NOT EXISTS events_run_type_idx
+    ON events (tenant_id, run_id, event_type);
+CREATE INDEX IF NOT EXISTS events_run_time_idx
+    ON events (tenant_id, run_id, timestamp_utc);
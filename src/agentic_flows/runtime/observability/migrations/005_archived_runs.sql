@@ -0,0 +1,12 @@
+-- INTERNAL — NOT A PUBLIC EXTENSION POINT
+-- SPDX-License-Identifier: Apache-2.0
+-- Copyright © 2025 Bijan Mousavi
+
+CREATE TABLE IF NOT EXISTS archived_runs (
+    tenant_id TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    run_date TEXT NOT NULL,
+    archive_uri TEXT NOT NULL,
+    archived_at TEXT NOT NULL,
+    PRIMARY KEY (tenant_id, run_id)
+);
@@ -0,0 +1,15 @@
+-- INTERNAL — NOT A PUBLIC EXTENSION POINT
+-- SPDX-License-Identifier: Apache-2.0
+-- Copyright © 2025 Bijan Mousavi
+
+CREATE TABLE IF NOT EXISTS plan_nodes (
+    tenant_id TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    node_kind TEXT NOT NULL CHECK (node_kind IN ('section', 'step')),
+    node_level INTEGER NOT NULL CHECK (node_level >= 0),
+    node_position INTEGER NOT NULL CHECK (node_position >= 0),
+    node_key TEXT,
+    node_hash TEXT NOT NULL,
+    PRIMARY KEY (tenant_id, run_id, node_kind, node_level, node_position),
+    FOREIGN KEY (tenant_id, run_id) REFERENCES runs (tenant_id, run_id)
+);
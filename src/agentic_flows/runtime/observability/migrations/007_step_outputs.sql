@@ -0,0 +1,17 @@
+-- INTERNAL — NOT A PUBLIC EXTENSION POINT
+-- SPDX-License-Identifier: Apache-2.0
+-- Copyright © 2025 Bijan Mousavi
+
+CREATE TABLE IF NOT EXISTS step_outputs (
+    tenant_id TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    step_index INTEGER NOT NULL CHECK (step_index >= 0),
+    output_index INTEGER NOT NULL CHECK (output_index >= 0),
+    step_key TEXT NOT NULL,
+    artifact_id TEXT NOT NULL,
+    PRIMARY KEY (tenant_id, run_id, step_index, output_index),
+    FOREIGN KEY (tenant_id, run_id) REFERENCES runs (tenant_id, run_id)
+);
+
+CREATE INDEX IF NOT EXISTS step_outputs_key_idx
+    ON step_outputs (tenant_id, step_key);
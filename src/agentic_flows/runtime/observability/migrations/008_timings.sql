@@ -0,0 +1,18 @@
+-- INTERNAL — NOT A PUBLIC EXTENSION POINT
+-- SPDX-License-Identifier: Apache-2.0
+-- Copyright © 2025 Bijan Mousavi
+
+CREATE TABLE IF NOT EXISTS timings (
+    tenant_id TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    timing_index INTEGER NOT NULL CHECK (timing_index >= 0),
+    scope TEXT NOT NULL CHECK (
+        scope IN ('event', 'step', 'tool_call', 'store_flush')
+    ),
+    label TEXT NOT NULL,
+    step_index INTEGER CHECK (step_index IS NULL OR step_index >= 0),
+    started_ns BIGINT NOT NULL,
+    ended_ns BIGINT NOT NULL CHECK (ended_ns >= started_ns),
+    PRIMARY KEY (tenant_id, run_id, timing_index),
+    FOREIGN KEY (tenant_id, run_id) REFERENCES runs (tenant_id, run_id)
+);
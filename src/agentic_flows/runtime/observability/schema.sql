@@ -74,6 +74,15 @@ CREATE TABLE IF NOT EXISTS runs (
         REFERENCES datasets (tenant_id, dataset_id, version)
 );
 
+CREATE TABLE IF NOT EXISTS archived_runs (
+    tenant_id TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    run_date TEXT NOT NULL,
+    archive_uri TEXT NOT NULL,
+    archived_at TEXT NOT NULL,
+    PRIMARY KEY (tenant_id, run_id)
+);
+
 CREATE TABLE IF NOT EXISTS run_children (
     tenant_id TEXT NOT NULL,
     run_id TEXT NOT NULL,
@@ -169,6 +178,29 @@ CREATE TABLE IF NOT EXISTS step_dependencies (
         REFERENCES steps (tenant_id, run_id, step_index)
 );
 
+CREATE TABLE IF NOT EXISTS plan_nodes (
+    tenant_id TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    node_kind TEXT NOT NULL CHECK (node_kind IN ('section', 'step')),
+    node_level INTEGER NOT NULL CHECK (node_level >= 0),
+    node_position INTEGER NOT NULL CHECK (node_position >= 0),
+    node_key TEXT,
+    node_hash TEXT NOT NULL,
+    PRIMARY KEY (tenant_id, run_id, node_kind, node_level, node_position),
+    FOREIGN KEY (tenant_id, run_id) REFERENCES runs (tenant_id, run_id)
+);
+
+CREATE TABLE IF NOT EXISTS step_outputs (
+    tenant_id TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    step_index INTEGER NOT NULL CHECK (step_index >= 0),
+    output_index INTEGER NOT NULL CHECK (output_index >= 0),
+    step_key TEXT NOT NULL,
+    artifact_id TEXT NOT NULL,
+    PRIMARY KEY (tenant_id, run_id, step_index, output_index),
+    FOREIGN KEY (tenant_id, run_id) REFERENCES runs (tenant_id, run_id)
+);
+
 CREATE TABLE IF NOT EXISTS events (
     tenant_id TEXT NOT NULL,
     run_id TEXT NOT NULL,
@@ -204,11 +236,16 @@ CREATE TABLE IF NOT EXISTS events (
     timestamp_utc TEXT NOT NULL,
     payload_hash TEXT NOT NULL,
     agent_id TEXT,
-    payload_json TEXT,
+    payload_key TEXT,
     PRIMARY KEY (tenant_id, run_id, event_index),
     FOREIGN KEY (tenant_id, run_id) REFERENCES runs (tenant_id, run_id)
 );
 
+CREATE TABLE IF NOT EXISTS payloads (
+    payload_key TEXT PRIMARY KEY,
+    payload_json TEXT NOT NULL
+);
+
 CREATE TABLE IF NOT EXISTS artifacts (
     tenant_id TEXT NOT NULL,
     run_id TEXT NOT NULL,
@@ -286,9 +323,26 @@ CREATE TABLE IF NOT EXISTS claims (
     FOREIGN KEY (tenant_id, run_id) REFERENCES runs (tenant_id, run_id)
 );
 
+CREATE TABLE IF NOT EXISTS timings (
+    tenant_id TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    timing_index INTEGER NOT NULL CHECK (timing_index >= 0),
+    scope TEXT NOT NULL CHECK (
+        scope IN ('event', 'step', 'tool_call', 'store_flush')
+    ),
+    label TEXT NOT NULL,
+    step_index INTEGER CHECK (step_index IS NULL OR step_index >= 0),
+    started_ns BIGINT NOT NULL,
+    ended_ns BIGINT NOT NULL CHECK (ended_ns >= started_ns),
+    PRIMARY KEY (tenant_id, run_id, timing_index),
+    FOREIGN KEY (tenant_id, run_id) REFERENCES runs (tenant_id, run_id)
+);
+
 CREATE INDEX IF NOT EXISTS events_run_step_idx
     ON events (tenant_id, run_id, step_index);
 CREATE INDEX IF NOT EXISTS events_run_type_idx
     ON events (tenant_id, run_id, event_type);
 CREATE INDEX IF NOT EXISTS events_run_time_idx
     ON events (tenant_id, run_id, timestamp_utc);
+CREATE INDEX IF NOT EXISTS step_outputs_key_idx
+    ON step_outputs (tenant_id, step_key);
@@ -7,21 +7,36 @@
 
 from __future__ import annotations
 
-from contextlib import suppress
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 import json
+from multiprocessing import AuthenticationError
 import os
 from pathlib import Path
+import threading
+import time
+from typing import Any, ClassVar
 from uuid import uuid4
+import weakref
 
 import duckdb
 
 from agentic_flows.runtime.context import RunMode
-from agentic_flows.runtime.observability.storage import schema_contracts
+from agentic_flows.runtime.observability.capture.timings import TimingRecord
+from agentic_flows.runtime.observability.storage import run_archive, schema_contracts
 from agentic_flows.runtime.observability.storage.execution_store_protocol import (
     ExecutionReadStoreProtocol,
     ExecutionWriteStoreProtocol,
 )
+from agentic_flows.runtime.observability.storage.reader_service import (
+    ExecutionReadServer,
+    RemoteExecutionReader,
+    read_socket_path,
+)
+from agentic_flows.runtime.observability.storage.write_buffer import WriteBuffer
 from agentic_flows.spec.contracts.dataset_contract import (
     validate_dataset_descriptor,
     validate_transition,
@@ -35,6 +50,7 @@ from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEviden
 from agentic_flows.spec.model.datasets.dataset_descriptor import DatasetDescriptor
 from agentic_flows.spec.model.execution.execution_steps import ExecutionSteps
 from agentic_flows.spec.model.execution.execution_trace import ExecutionTrace
+from agentic_flows.spec.model.execution.plan_tree import PlanTree
 from agentic_flows.spec.model.execution.replay_envelope import ReplayEnvelope
 from agentic_flows.spec.model.identifiers.execution_event import ExecutionEvent
 from agentic_flows.spec.model.identifiers.tool_invocation import ToolInvocation
@@ -50,6 +66,7 @@ from agentic_flows.spec.ontology import (
     FlowState,
 )
 from agentic_flows.spec.ontology.ids import (
+    AgentID,
     ArtifactID,
     ClaimID,
     ContentHash,
@@ -73,12 +90,277 @@ from agentic_flows.spec.ontology.public import (
     ReplayMode,
 )
 
-SCHEMA_VERSION = 3
+SCHEMA_VERSION = 8
 MIGRATIONS_DIR = Path(__file__).resolve().parents[1] / "migrations"
 SCHEMA_CONTRACT_PATH = Path(__file__).resolve().parents[1] / "schema.sql"
 SCHEMA_HASH_PATH = Path(__file__).resolve().parents[1] / "schema.hash"
 
 
+@dataclass(frozen=True)
+class _BulkInsert:
+    """Internal helper; not part of the public API."""
+
+    row_statement: str
+    batch_statement: str
+
+
+def _bulk_insert(
+    table: str, columns: tuple[tuple[str, str], ...], *, conflict: str = ""
+) -> _BulkInsert:
+    """Internal helper; not part of the public API."""
+    verb = f"INSERT {conflict} INTO" if conflict else "INSERT INTO"
+    names = ", ".join(name for name, _ in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    # Each column travels as one typed list; DuckDB zips parallel unnest calls
+    # back into rows, so a batch is a single vectorized statement.
+    unnested = ", ".join(f"unnest(?::{sql_type}[])" for _, sql_type in columns)
+    return _BulkInsert(
+        row_statement=f"{verb} {table} ({names}) VALUES ({placeholders})",  # noqa: S608
+        batch_statement=f"{verb} {table} ({names}) SELECT {unnested}",  # noqa: S608
+    )
+
+
+_BULK_INSERTS: dict[str, _BulkInsert] = {
+    "steps": _bulk_insert(
+        "steps",
+        (
+            ("tenant_id", "VARCHAR"),
+            ("run_id", "VARCHAR"),
+            ("step_index", "INTEGER"),
+            ("agent_id", "VARCHAR"),
+            ("step_type", "VARCHAR"),
+            ("determinism_level", "VARCHAR"),
+            ("inputs_fingerprint", "VARCHAR"),
+            ("declared_entropy_min_magnitude", "VARCHAR"),
+            ("declared_entropy_max_magnitude", "VARCHAR"),
+            ("declared_entropy_exhaustion_action", "VARCHAR"),
+            ("allowed_variance_class", "VARCHAR"),
+        ),
+        conflict="OR IGNORE",
+    ),
+    "step_dependencies": _bulk_insert(
+        "step_dependencies",
+        (
+            ("tenant_id", "VARCHAR"),
+            ("run_id", "VARCHAR"),
+            ("step_index", "INTEGER"),
+            ("dependency_agent_id", "VARCHAR"),
+        ),
+        conflict="OR IGNORE",
+    ),
+    "plan_nodes": _bulk_insert(
+        "plan_nodes",
+        (
+            ("tenant_id", "VARCHAR"),
+            ("run_id", "VARCHAR"),
+            ("node_kind", "VARCHAR"),
+            ("node_level", "INTEGER"),
+            ("node_position", "INTEGER"),
+            ("node_key", "VARCHAR"),
+            ("node_hash", "VARCHAR"),
+        ),
+    ),
+    "step_outputs": _bulk_insert(
+        "step_outputs",
+        (
+            ("tenant_id", "VARCHAR"),
+            ("run_id", "VARCHAR"),
+            ("step_index", "INTEGER"),
+            ("output_index", "INTEGER"),
+            ("step_key", "VARCHAR"),
+            ("artifact_id", "VARCHAR"),
+        ),
+    ),
+    "events": _bulk_insert(
+        "events",
+        (
+            ("tenant_id", "VARCHAR"),
+            ("run_id", "VARCHAR"),
+            ("event_index", "INTEGER"),
+            ("step_index", "INTEGER"),
+            ("event_type", "VARCHAR"),
+            ("causality_tag", "VARCHAR"),
+            ("timestamp_utc", "VARCHAR"),
+            ("payload_hash", "VARCHAR"),
+            ("agent_id", "VARCHAR"),
+            ("payload_key", "VARCHAR"),
+        ),
+    ),
+    "payloads": _bulk_insert(
+        "payloads",
+        (
+            ("payload_key", "VARCHAR"),
+            ("payload_json", "VARCHAR"),
+        ),
+        conflict="OR IGNORE",
+    ),
+    "artifacts": _bulk_insert(
+        "artifacts",
+        (
+            ("tenant_id", "VARCHAR"),
+            ("run_id", "VARCHAR"),
+            ("artifact_id", "VARCHAR"),
+            ("artifact_type", "VARCHAR"),
+            ("producer", "VARCHAR"),
+            ("content_hash", "VARCHAR"),
+            ("scope", "VARCHAR"),
+        ),
+    ),
+    "artifact_parents": _bulk_insert(
+        "artifact_parents",
+        (
+            ("tenant_id", "VARCHAR"),
+            ("run_id", "VARCHAR"),
+            ("artifact_id", "VARCHAR"),
+            ("parent_artifact_id", "VARCHAR"),
+        ),
+    ),
+    "evidence": _bulk_insert(
+        "evidence",
+        (
+            ("tenant_id", "VARCHAR"),
+            ("run_id", "VARCHAR"),
+            ("entry_index", "INTEGER"),
+            ("evidence_id", "VARCHAR"),
+            ("determinism", "VARCHAR"),
+            ("source_uri", "VARCHAR"),
+            ("content_hash", "VARCHAR"),
+            ("score", "DOUBLE"),
+            ("vector_contract_id", "VARCHAR"),
+        ),
+    ),
+    "entropy_usage": _bulk_insert(
+        "entropy_usage",
+        (
+            ("tenant_id", "VARCHAR"),
+            ("run_id", "VARCHAR"),
+            ("entry_index", "INTEGER"),
+            ("source", "VARCHAR"),
+            ("magnitude", "VARCHAR"),
+            ("description", "VARCHAR"),
+            ("step_index", "INTEGER"),
+            ("nondeterminism_authorized", "BOOLEAN"),
+            ("nondeterminism_scope_id", "VARCHAR"),
+            ("nondeterminism_scope_type", "VARCHAR"),
+        ),
+    ),
+    "tool_invocations": _bulk_insert(
+        "tool_invocations",
+        (
+            ("tenant_id", "VARCHAR"),
+            ("run_id", "VARCHAR"),
+            ("entry_index", "INTEGER"),
+            ("tool_id", "VARCHAR"),
+            ("determinism_level", "VARCHAR"),
+            ("inputs_fingerprint", "VARCHAR"),
+            ("outputs_fingerprint", "VARCHAR"),
+            ("duration", "DOUBLE"),
+            ("outcome", "VARCHAR"),
+        ),
+    ),
+    "claims": _bulk_insert(
+        "claims",
+        (
+            ("tenant_id", "VARCHAR"),
+            ("run_id", "VARCHAR"),
+            ("claim_id", "VARCHAR"),
+        ),
+        conflict="OR IGNORE",
+    ),
+    "timings": _bulk_insert(
+        "timings",
+        (
+            ("tenant_id", "VARCHAR"),
+            ("run_id", "VARCHAR"),
+            ("timing_index", "INTEGER"),
+            ("scope", "VARCHAR"),
+            ("label", "VARCHAR"),
+            ("step_index", "INTEGER"),
+            ("started_ns", "BIGINT"),
+            ("ended_ns", "BIGINT"),
+        ),
+    ),
+}
+
+
+@dataclass(frozen=True)
+class _CodeContract:
+    """Internal helper; not part of the public API."""
+
+    migrations: dict[int, str]
+    checksums: dict[int, str]
+    contract_hash: str
+    expected_hash: str
+
+    @property
+    def latest_version(self) -> int:
+        """Internal helper; not part of the public API."""
+        return max(self.migrations, default=0)
+
+
+@lru_cache(maxsize=8)
+def _code_contract(
+    migrations_dir: Path, contract_path: Path, hash_path: Path
+) -> _CodeContract:
+    """Internal helper; not part of the public API."""
+    # Migrations and schema.sql ship with the package, so they are read and
+    # hashed once per process; callers that repoint a path get a fresh entry.
+    if not migrations_dir.exists():
+        raise RuntimeError("Migration directory missing.")
+    migrations: dict[int, str] = {}
+    for file in sorted(migrations_dir.glob("*.sql")):
+        version = int(file.name.split("_", 1)[0])
+        migrations[version] = file.read_text(encoding="utf-8")
+    return _CodeContract(
+        migrations=migrations,
+        checksums={
+            version: schema_contracts.hash_payload(statement)
+            for version, statement in migrations.items()
+        },
+        contract_hash=schema_contracts.hash_payload(
+            schema_contracts.load_schema_contract(contract_path)
+        ),
+        expected_hash=schema_contracts.load_schema_hash(hash_path),
+    )
+
+
+_PAYLOAD_CACHE_SIZE = 4096
+
+# Writers open in this process, by resolved path; DuckDB refuses a read-only
+# connection next to them, so readers in the same process read through them.
+_LIVE_WRITERS: weakref.WeakValueDictionary[Path, DuckDBExecutionStore] = (
+    weakref.WeakValueDictionary()
+)
+_LIVE_WRITERS_LOCK = threading.Lock()
+
+
+def _decode_payload(payload_key: str, payload_json: str) -> dict[str, object]:
+    """Internal helper; not part of the public API."""
+    # Each caller gets its own dict, so editing one event's payload never
+    # leaks into the cache or into other loaded events.
+    return dict(_parse_payload(payload_key, payload_json))
+
+
+@lru_cache(maxsize=_PAYLOAD_CACHE_SIZE)
+def _parse_payload(payload_key: str, payload_json: str) -> dict[str, object]:
+    """Internal helper; not part of the public API."""
+    # Payloads are content addressed, so repeated keys across runs decode once.
+    decoded: dict[str, object] = json.loads(payload_json)
+    return decoded
+
+
+_CHECKPOINT_UPSERT = """
+    INSERT OR REPLACE INTO run_checkpoints (
+        tenant_id,
+        run_id,
+        step_index,
+        event_index,
+        updated_at
+    )
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+
 def _acquire_lock(path: Path) -> int:
     """Internal helper; not part of the public API."""
     payload = f"{os.getpid()}\n".encode("ascii")
@@ -110,18 +392,65 @@ def _acquire_lock(path: Path) -> int:
 
 # Single-writer assumption; no concurrent mutation guarantees are provided.
 # This store is for audit and replay only, not transactional execution.
+# Buffered mode holds append-only rows in memory and commits them in one
+# transaction together with the next checkpoint, so a crash never persists a
+# checkpoint without the rows it covers.
 class DuckDBExecutionStore:
     """Persists runs, steps, events, artifact, evidence, entropy usage, tool invocations, claim ids, dataset metadata, and replay envelopes; intentionally excludes in-memory execution state, transient executor caches, and any non-persisted runtime objects."""
 
-    def __init__(self, path: Path) -> None:
+    # In-memory store that cold loads of archived runs read through.
+    _archive: ClassVar[DuckDBExecutionStore | None] = None
+    _archive_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        buffered: bool = False,
+        flush_rows: int | None = None,
+        flush_interval_ms: int | None = None,
+    ) -> None:
         """Internal helper; not part of the public API."""
+        self._buffer = (
+            WriteBuffer(max_rows=flush_rows, max_delay_ms=flush_interval_ms)
+            if buffered
+            else None
+        )
         self._lock_path = path.with_suffix(f"{path.suffix}.lock")
         self._lock_fd = _acquire_lock(self._lock_path)
         self._connection = duckdb.connect(str(path))
         self._migrate()
+        self._live_key: Path | None = path.resolve()
+        with _LIVE_WRITERS_LOCK:
+            serving = _LIVE_WRITERS.get(self._live_key) is None
+            _LIVE_WRITERS[self._live_key] = self
+        # Other processes cannot open the file while it is held here, so the
+        # writer answers their reads; a second writer on the same file in
+        # this process leaves that to the first.
+        self._read_server = (
+            ExecutionReadServer(read_socket_path(path), self._serve_reads)
+            if serving
+            else None
+        )
+
+    def flush(self) -> None:
+        """Execute flush and enforce its contract."""
+        self._flush()
 
     def close(self) -> None:
         """Internal helper; not part of the public API."""
+        read_server = getattr(self, "_read_server", None)
+        if read_server is not None:
+            read_server.close()
+            self._read_server = None
+        live_key = getattr(self, "_live_key", None)
+        if live_key is not None:
+            with _LIVE_WRITERS_LOCK:
+                if _LIVE_WRITERS.get(live_key) is self:
+                    del _LIVE_WRITERS[live_key]
+            self._live_key = None
+        with suppress(Exception):
+            self.flush()
         with suppress(Exception):
             self._connection.close()
         if getattr(self, "_lock_fd", None) is None:
@@ -218,11 +547,13 @@ class DuckDBExecutionStore:
         )
         self._persist_entropy_budget(run_id, plan)
         self._persist_nondeterminism_intents(run_id, plan)
+        self._persist_plan_tree(run_id, plan)
         self._connection.commit()
         return run_id
 
     def finalize_run(self, *, run_id: RunID, trace: ExecutionTrace) -> None:
         """Execute finalize_run and enforce its contract."""
+        self.flush()
         self._connection.execute(
             """
             UPDATE runs
@@ -269,6 +600,7 @@ class DuckDBExecutionStore:
                 tenant_id=trace.tenant_id,
                 claim_ids=trace.claim_ids,
             )
+        self.flush()
         self._connection.commit()
 
     def save_run(
@@ -305,24 +637,11 @@ class DuckDBExecutionStore:
         self, *, run_id: RunID, tenant_id: TenantID, plan: ExecutionSteps
     ) -> None:
         """Execute save_steps and enforce its contract."""
+        step_rows: list[tuple[object, ...]] = []
+        dependency_rows: list[tuple[object, ...]] = []
         for step in plan.steps:
-            self._connection.execute(
-                """
-                INSERT OR IGNORE INTO steps (
-                    tenant_id,
-                    run_id,
-                    step_index,
-                    agent_id,
-                    step_type,
-                    determinism_level,
-                    inputs_fingerprint,
-                    declared_entropy_min_magnitude,
-                    declared_entropy_max_magnitude,
-                    declared_entropy_exhaustion_action,
-                    allowed_variance_class
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            budget = step.declared_entropy_budget
+            step_rows.append(
                 (
                     str(tenant_id),
                     str(run_id),
@@ -331,38 +650,20 @@ class DuckDBExecutionStore:
                     step.step_type.value,
                     step.determinism_level.value,
                     str(step.inputs_fingerprint),
-                    step.declared_entropy_budget.min_magnitude.value
-                    if step.declared_entropy_budget is not None
-                    else None,
-                    step.declared_entropy_budget.max_magnitude.value
-                    if step.declared_entropy_budget is not None
-                    else None,
-                    step.declared_entropy_budget.exhaustion_action.value
-                    if step.declared_entropy_budget is not None
-                    else None,
+                    budget.min_magnitude.value if budget is not None else None,
+                    budget.max_magnitude.value if budget is not None else None,
+                    budget.exhaustion_action.value if budget is not None else None,
                     step.allowed_variance_class.value
                     if step.allowed_variance_class is not None
                     else None,
-                ),
-            )
-            for dependency in step.declared_dependencies:
-                self._connection.execute(
-                    """
-                    INSERT OR IGNORE INTO step_dependencies (
-                        tenant_id,
-                        run_id,
-                        step_index,
-                        dependency_agent_id
-                    )
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (
-                        str(tenant_id),
-                        str(run_id),
-                        step.step_index,
-                        str(dependency),
-                    ),
                 )
+            )
+            dependency_rows.extend(
+                (str(tenant_id), str(run_id), step.step_index, str(dependency))
+                for dependency in step.declared_dependencies
+            )
+        self._insert(_BULK_INSERTS["steps"], step_rows)
+        self._insert(_BULK_INSERTS["step_dependencies"], dependency_rows)
         self._connection.commit()
 
     def save_events(
@@ -373,24 +674,23 @@ class DuckDBExecutionStore:
         events: tuple[ExecutionEvent, ...],
     ) -> None:
         """Execute save_events and enforce its contract."""
+        rows: list[tuple[object, ...]] = []
+        payloads: dict[str, str] = {}
         for event in events:
             payload = event.payload or {}
-            self._connection.execute(
-                """
-                INSERT INTO events (
-                    tenant_id,
-                    run_id,
-                    event_index,
-                    step_index,
-                    event_type,
-                    causality_tag,
-                    timestamp_utc,
-                    payload_hash,
-                    agent_id,
-                    payload_json
+            # The stored text keeps list order, so it is keyed by its own hash;
+            # payload_hash ignores list order and may cover several texts.
+            payload_json = event.payload_json
+            payload_key = event.payload_key
+            if payload_json is None:
+                payload_json = json.dumps(
+                    payload, sort_keys=True, separators=(",", ":")
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                payload_key = None
+            if payload_key is None:
+                payload_key = schema_contracts.hash_payload(payload_json)
+            payloads.setdefault(payload_key, payload_json)
+            rows.append(
                 (
                     str(tenant_id),
                     str(run_id),
@@ -401,10 +701,13 @@ class DuckDBExecutionStore:
                     event.timestamp_utc,
                     str(event.payload_hash),
                     str(payload.get("agent_id")) if "agent_id" in payload else None,
-                    json.dumps(payload, separators=(",", ":")),
-                ),
+                    payload_key,
+                )
             )
-        self._connection.commit()
+        # Payload bodies are stored once per content hash; events reference them.
+        self._write("payloads", list(payloads.items()), counted=False)
+        self._write("events", rows)
+        self._commit()
 
     def save_checkpoint(
         self,
@@ -415,43 +718,25 @@ class DuckDBExecutionStore:
         event_index: int,
     ) -> None:
         """Execute save_checkpoint and enforce its contract."""
-        self._connection.execute(
-            """
-            INSERT OR REPLACE INTO run_checkpoints (
-                tenant_id,
-                run_id,
-                step_index,
-                event_index,
-                updated_at
-            )
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (
-                str(tenant_id),
-                str(run_id),
-                step_index,
-                event_index,
-                datetime.now(tz=UTC).isoformat(),
-            ),
+        checkpoint = (
+            str(tenant_id),
+            str(run_id),
+            step_index,
+            event_index,
+            datetime.now(tz=UTC).isoformat(),
         )
+        if self._buffer is not None:
+            self._flush(checkpoint=checkpoint)
+            return
+        self._connection.execute(_CHECKPOINT_UPSERT, checkpoint)
         self._connection.commit()
 
     def save_artifacts(self, *, run_id: RunID, artifacts: list[Artifact]) -> None:
         """Execute save_artifacts and enforce its contract."""
+        artifact_rows: list[tuple[object, ...]] = []
+        parent_rows: list[tuple[object, ...]] = []
         for artifact in artifacts:
-            self._connection.execute(
-                """
-                INSERT INTO artifacts (
-                    tenant_id,
-                    run_id,
-                    artifact_id,
-                    artifact_type,
-                    producer,
-                    content_hash,
-                    scope
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+            artifact_rows.append(
                 (
                     str(artifact.tenant_id),
                     str(run_id),
@@ -460,27 +745,20 @@ class DuckDBExecutionStore:
                     artifact.producer,
                     str(artifact.content_hash),
                     artifact.scope.value,
-                ),
+                )
             )
-            for parent in artifact.parent_artifacts:
-                self._connection.execute(
-                    """
-                    INSERT INTO artifact_parents (
-                        tenant_id,
-                        run_id,
-                        artifact_id,
-                        parent_artifact_id
-                    )
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (
-                        str(artifact.tenant_id),
-                        str(run_id),
-                        str(artifact.artifact_id),
-                        str(parent),
-                    ),
+            parent_rows.extend(
+                (
+                    str(artifact.tenant_id),
+                    str(run_id),
+                    str(artifact.artifact_id),
+                    str(parent),
                 )
-        self._connection.commit()
+                for parent in artifact.parent_artifacts
+            )
+        self._write("artifacts", artifact_rows)
+        self._write("artifact_parents", parent_rows)
+        self._commit()
 
     def append_evidence(
         self,
@@ -490,22 +768,9 @@ class DuckDBExecutionStore:
         starting_index: int,
     ) -> None:
         """Execute append_evidence and enforce its contract."""
-        for offset, item in enumerate(evidence):
-            self._connection.execute(
-                """
-                INSERT INTO evidence (
-                    tenant_id,
-                    run_id,
-                    entry_index,
-                    evidence_id,
-                    determinism,
-                    source_uri,
-                    content_hash,
-                    score,
-                    vector_contract_id
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        self._write(
+            "evidence",
+            [
                 (
                     str(item.tenant_id),
                     str(run_id),
@@ -516,9 +781,11 @@ class DuckDBExecutionStore:
                     str(item.content_hash),
                     item.score,
                     str(item.vector_contract_id),
-                ),
-            )
-        self._connection.commit()
+                )
+                for offset, item in enumerate(evidence)
+            ],
+        )
+        self._commit()
 
     def append_entropy_usage(
         self,
@@ -528,23 +795,9 @@ class DuckDBExecutionStore:
         starting_index: int,
     ) -> None:
         """Execute append_entropy_usage and enforce its contract."""
-        for offset, item in enumerate(usage):
-            self._connection.execute(
-                """
-                INSERT INTO entropy_usage (
-                    tenant_id,
-                    run_id,
-                    entry_index,
-                    source,
-                    magnitude,
-                    description,
-                    step_index,
-                    nondeterminism_authorized,
-                    nondeterminism_scope_id,
-                    nondeterminism_scope_type
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        self._write(
+            "entropy_usage",
+            [
                 (
                     str(item.tenant_id),
                     str(run_id),
@@ -556,9 +809,11 @@ class DuckDBExecutionStore:
                     item.nondeterminism_source.authorized,
                     str(item.nondeterminism_source.scope),
                     self._scope_type(item.nondeterminism_source.scope),
-                ),
-            )
-        self._connection.commit()
+                )
+                for offset, item in enumerate(usage)
+            ],
+        )
+        self._commit()
 
     def append_tool_invocations(
         self,
@@ -569,22 +824,9 @@ class DuckDBExecutionStore:
         starting_index: int,
     ) -> None:
         """Execute append_tool_invocations and enforce its contract."""
-        for offset, item in enumerate(tool_invocations):
-            self._connection.execute(
-                """
-                INSERT INTO tool_invocations (
-                    tenant_id,
-                    run_id,
-                    entry_index,
-                    tool_id,
-                    determinism_level,
-                    inputs_fingerprint,
-                    outputs_fingerprint,
-                    duration,
-                    outcome
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        self._write(
+            "tool_invocations",
+            [
                 (
                     str(tenant_id),
                     str(run_id),
@@ -597,23 +839,74 @@ class DuckDBExecutionStore:
                     else None,
                     item.duration,
                     item.outcome,
-                ),
-            )
-        self._connection.commit()
+                )
+                for offset, item in enumerate(tool_invocations)
+            ],
+        )
+        self._commit()
 
     def append_claim_ids(
         self, *, run_id: RunID, tenant_id: TenantID, claim_ids: tuple[ClaimID, ...]
     ) -> None:
         """Execute append_claim_ids and enforce its contract."""
-        for claim_id in claim_ids:
-            self._connection.execute(
-                """
-                INSERT OR IGNORE INTO claims (tenant_id, run_id, claim_id)
-                VALUES (?, ?, ?)
-                """,
-                (str(tenant_id), str(run_id), str(claim_id)),
-            )
-        self._connection.commit()
+        self._write(
+            "claims",
+            [(str(tenant_id), str(run_id), str(claim_id)) for claim_id in claim_ids],
+        )
+        self._commit()
+
+    def save_step_outputs(
+        self,
+        *,
+        run_id: RunID,
+        tenant_id: TenantID,
+        step_index: int,
+        step_key: str,
+        artifact_ids: tuple[ArtifactID, ...],
+    ) -> None:
+        """Execute save_step_outputs and enforce its contract."""
+        self._write(
+            "step_outputs",
+            [
+                (
+                    str(tenant_id),
+                    str(run_id),
+                    step_index,
+                    offset,
+                    step_key,
+                    str(artifact_id),
+                )
+                for offset, artifact_id in enumerate(artifact_ids)
+            ],
+        )
+        self._commit()
+
+    def save_timings(
+        self,
+        *,
+        run_id: RunID,
+        tenant_id: TenantID,
+        timings: tuple[TimingRecord, ...],
+        starting_index: int,
+    ) -> None:
+        """Execute save_timings and enforce its contract."""
+        self._write(
+            "timings",
+            [
+                (
+                    str(tenant_id),
+                    str(run_id),
+                    starting_index + offset,
+                    item.scope,
+                    item.label,
+                    item.step_index,
+                    item.started_ns,
+                    item.ended_ns,
+                )
+                for offset, item in enumerate(timings)
+            ],
+        )
+        self._commit()
 
     def register_dataset(self, dataset: DatasetDescriptor) -> None:
         """Execute register_dataset and enforce its contract."""
@@ -680,7 +973,33 @@ class DuckDBExecutionStore:
             )
         self._connection.commit()
 
-    def load_trace(self, run_id: RunID, *, tenant_id: TenantID) -> ExecutionTrace:
+    def archive_runs(self, archive_dir: Path, *, before: datetime) -> tuple[RunID, ...]:
+        """Move finalized runs created before a cutoff into the Parquet tier."""
+        self.flush()
+        archive_dir = archive_dir.resolve()
+        rows = self._connection.execute(
+            """
+            SELECT tenant_id, run_id, left(created_at, 10)
+            FROM runs
+            WHERE finalized
+              AND CAST(created_at AS TIMESTAMPTZ) < ?
+              AND NOT EXISTS (
+                  SELECT 1 FROM archived_runs
+                  WHERE archived_runs.tenant_id = runs.tenant_id
+                    AND archived_runs.run_id = runs.run_id
+              )
+            ORDER BY tenant_id, run_id
+            """,
+            (before,),
+        ).fetchall()
+        if rows:
+            self._export_runs(archive_dir, rows)
+        self._evict_archived_runs()
+        return tuple(RunID(row[1]) for row in rows)
+
+    def load_trace(
+        self, run_id: RunID, *, tenant_id: TenantID, decode_payloads: bool = True
+    ) -> ExecutionTrace:
         """Execute load_trace and enforce its contract."""
         run_row = self._connection.execute(
             """
@@ -716,11 +1035,18 @@ class DuckDBExecutionStore:
         ).fetchone()
         if run_row is None:
             raise KeyError(f"Run not found: {run_id}")
-        events = self._load_events(run_id, tenant_id=tenant_id)
+        events = tuple(
+            self.iter_events(
+                run_id, tenant_id=tenant_id, decode_payloads=decode_payloads
+            )
+        )
         tool_invocations = self._load_tool_invocations(run_id, tenant_id=tenant_id)
         entropy_usage = self._load_entropy_usage(run_id, tenant_id=tenant_id)
         claim_ids = self._load_claim_ids(run_id, tenant_id=tenant_id)
         child_flow_ids = self._load_child_flow_ids(run_id, tenant_id=tenant_id)
+        plan_tree = self._load_plan_tree(
+            run_id, tenant_id=tenant_id, root=PlanHash(run_row[14])
+        )
         dataset = DatasetDescriptor(
             spec_version="v1",
             dataset_id=DatasetID(run_row[5]),
@@ -766,6 +1092,7 @@ class DuckDBExecutionStore:
             if run_row[22] is not None
             else None,
             non_certifiable=bool(run_row[23]),
+            plan_tree=plan_tree,
         )
 
     def load_replay_envelope(
@@ -865,40 +1192,177 @@ class DuckDBExecutionStore:
             return None
         return int(row[0]), int(row[1])
 
-    def _load_events(
+    def load_timings(
         self, run_id: RunID, *, tenant_id: TenantID
-    ) -> tuple[ExecutionEvent, ...]:
-        """Internal helper; not part of the public API."""
+    ) -> tuple[TimingRecord, ...]:
+        """Execute load_timings and enforce its contract."""
         rows = self._connection.execute(
             """
-            SELECT
-                event_index,
-                step_index,
-                event_type,
-                causality_tag,
-                timestamp_utc,
-                payload_hash,
-                payload_json
-            FROM events
+            SELECT scope, label, step_index, started_ns, ended_ns
+            FROM timings
             WHERE tenant_id = ? AND run_id = ?
-            ORDER BY event_index
+            ORDER BY timing_index
             """,
             (str(tenant_id), str(run_id)),
         ).fetchall()
         return tuple(
-            ExecutionEvent(
-                spec_version="v1",
-                event_index=int(row[0]),
-                step_index=int(row[1]),
-                event_type=EventType(row[2]),
-                causality_tag=CausalityTag(row[3]),
-                timestamp_utc=row[4],
-                payload=json.loads(row[6]) if row[6] else {},
-                payload_hash=ContentHash(row[5]),
+            TimingRecord(
+                scope=row[0],
+                label=row[1],
+                step_index=int(row[2]) if row[2] is not None else None,
+                started_ns=int(row[3]),
+                ended_ns=int(row[4]),
             )
             for row in rows
         )
 
+    def load_step_outputs(
+        self, step_key: str, *, tenant_id: TenantID
+    ) -> tuple[RunID, tuple[Artifact, ...]] | None:
+        """Return the newest finalized run's artifacts for a step key."""
+        row = self._connection.execute(
+            """
+            SELECT step_outputs.run_id, step_outputs.step_index
+            FROM step_outputs
+            JOIN runs USING (tenant_id, run_id)
+            WHERE step_outputs.tenant_id = ?
+                AND step_outputs.step_key = ?
+                AND runs.finalized
+                AND NOT runs.non_certifiable
+            ORDER BY runs.created_at DESC, step_outputs.run_id DESC
+            LIMIT 1
+            """,
+            (str(tenant_id), step_key),
+        ).fetchone()
+        if row is None:
+            return None
+        run_id = RunID(row[0])
+        rows = self._connection.execute(
+            """
+            SELECT
+                artifacts.artifact_id,
+                artifacts.artifact_type,
+                artifacts.producer,
+                artifacts.content_hash,
+                artifacts.scope
+            FROM step_outputs
+            JOIN artifacts USING (tenant_id, run_id, artifact_id)
+            WHERE step_outputs.tenant_id = ?
+                AND step_outputs.run_id = ?
+                AND step_outputs.step_index = ?
+            ORDER BY step_outputs.output_index
+            """,
+            (str(tenant_id), str(run_id), int(row[1])),
+        ).fetchall()
+        parent_rows = self._connection.execute(
+            """
+            SELECT artifact_parents.artifact_id, artifact_parents.parent_artifact_id
+            FROM step_outputs
+            JOIN artifact_parents USING (tenant_id, run_id, artifact_id)
+            WHERE step_outputs.tenant_id = ?
+                AND step_outputs.run_id = ?
+                AND step_outputs.step_index = ?
+            """,
+            (str(tenant_id), str(run_id), int(row[1])),
+        ).fetchall()
+        parent_map: dict[str, list[ArtifactID]] = {}
+        for artifact_id, parent_id in parent_rows:
+            parent_map.setdefault(artifact_id, []).append(ArtifactID(parent_id))
+        artifacts = tuple(
+            Artifact(
+                spec_version="v1",
+                artifact_id=ArtifactID(item[0]),
+                tenant_id=tenant_id,
+                artifact_type=ArtifactType(item[1]),
+                producer=item[2],
+                parent_artifacts=tuple(parent_map.get(item[0], [])),
+                content_hash=ContentHash(item[3]),
+                scope=ArtifactScope(item[4]),
+            )
+            for item in rows
+        )
+        return run_id, artifacts
+
+    def iter_events(
+        self,
+        run_id: RunID,
+        *,
+        tenant_id: TenantID,
+        batch_size: int = 1000,
+        step_range: tuple[int, int] | None = None,
+        event_types: Iterable[EventType] | None = None,
+        newest_first: bool = False,
+        decode_payloads: bool = True,
+    ) -> Iterator[ExecutionEvent]:
+        """Stream events page by page; filters run in SQL, payloads decode per row."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        filters = ["tenant_id = ?", "run_id = ?"]
+        params: list[object] = [str(tenant_id), str(run_id)]
+        if step_range is not None:
+            # Half-open like range(): start <= step_index < stop.
+            filters.append("step_index >= ? AND step_index < ?")
+            params.extend(step_range)
+        if event_types is not None:
+            filters.append("list_contains(?::VARCHAR[], event_type)")
+            params.append(sorted({EventType(value).value for value in event_types}))
+        order, cursor_op = ("DESC", "<") if newest_first else ("ASC", ">")
+        payload_columns, payload_join = "NULL, NULL", ""
+        if decode_payloads:
+            payload_columns = "payload_key, payloads.payload_json"
+            payload_join = "LEFT JOIN payloads USING (payload_key)"
+        cursor: int | None = None
+        while True:
+            page_filters = list(filters)
+            page_params = list(params)
+            if cursor is not None:
+                page_filters.append(f"event_index {cursor_op} ?")
+                page_params.append(cursor)
+            rows = self._connection.execute(
+                f"""
+                SELECT
+                    event_index,
+                    step_index,
+                    event_type,
+                    causality_tag,
+                    timestamp_utc,
+                    payload_hash,
+                    {payload_columns}
+                FROM events {payload_join}
+                WHERE {" AND ".join(page_filters)}
+                ORDER BY event_index {order}
+                LIMIT ?
+                """,  # noqa: S608
+                (*page_params, batch_size),
+            ).fetchall()
+            for row in rows:
+                yield self._event_from_row(row)
+            if len(rows) < batch_size:
+                return
+            cursor = int(rows[-1][0])
+
+    def _load_events(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> tuple[ExecutionEvent, ...]:
+        """Internal helper; not part of the public API."""
+        return tuple(self.iter_events(run_id, tenant_id=tenant_id))
+
+    @staticmethod
+    def _event_from_row(row: tuple[Any, ...]) -> ExecutionEvent:
+        """Internal helper; not part of the public API."""
+        return ExecutionEvent(
+            spec_version="v1",
+            event_index=int(row[0]),
+            step_index=int(row[1]),
+            event_type=EventType(row[2]),
+            causality_tag=CausalityTag(row[3]),
+            timestamp_utc=row[4],
+            payload=_decode_payload(row[6], row[7]) if row[7] else {},
+            payload_hash=ContentHash(row[5]),
+            payload_json=row[7],
+            payload_key=row[6],
+        )
+
     def _load_artifacts(
         self, run_id: RunID, *, tenant_id: TenantID
     ) -> tuple[Artifact, ...]:
@@ -1039,6 +1503,48 @@ class DuckDBExecutionStore:
         ).fetchall()
         return tuple(ClaimID(row[0]) for row in rows)
 
+    def _write(
+        self, table: str, rows: list[tuple[object, ...]], *, counted: bool = True
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        if self._buffer is None:
+            self._insert(_BULK_INSERTS[table], rows)
+            return
+        self._buffer.append(table, rows, counted=counted)
+
+    def _commit(self) -> None:
+        """Internal helper; not part of the public API."""
+        if self._buffer is None:
+            self._connection.commit()
+        elif self._buffer.due():
+            self._flush()
+
+    def _flush(self, *, checkpoint: tuple[object, ...] | None = None) -> None:
+        """Internal helper; not part of the public API."""
+        if self._buffer is None or (not len(self._buffer) and checkpoint is None):
+            return
+        self._connection.execute("BEGIN")
+        try:
+            for table, rows in self._buffer.batches():
+                self._insert(_BULK_INSERTS[table], rows)
+            if checkpoint is not None:
+                self._connection.execute(_CHECKPOINT_UPSERT, checkpoint)
+            self._connection.execute("COMMIT")
+        except Exception:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._buffer.clear()
+
+    def _insert(self, insert: _BulkInsert, rows: list[tuple[object, ...]]) -> None:
+        """Internal helper; not part of the public API."""
+        if not rows:
+            return
+        if len(rows) == 1:
+            self._connection.execute(insert.row_statement, rows[0])
+            return
+        columns = [list(column) for column in zip(*rows, strict=True)]
+        self._connection.execute(insert.batch_statement, columns)
+
     @staticmethod
     def _scope_type(scope: StepID | FlowID) -> str:
         """Internal helper; not part of the public API."""
@@ -1072,6 +1578,39 @@ class DuckDBExecutionStore:
         ).fetchall()
         return tuple(FlowID(row[0]) for row in rows)
 
+    def _load_plan_tree(
+        self, run_id: RunID, *, tenant_id: TenantID, root: PlanHash
+    ) -> PlanTree | None:
+        """Internal helper; not part of the public API."""
+        rows = self._connection.execute(
+            """
+            SELECT node_kind, node_level, node_key, node_hash FROM plan_nodes
+            WHERE tenant_id = ? AND run_id = ?
+            ORDER BY node_kind, node_level, node_position
+            """,
+            (str(tenant_id), str(run_id)),
+        ).fetchall()
+        if not rows:
+            return None
+        sections: list[tuple[str, str]] = []
+        step_ids: list[AgentID] = []
+        step_levels: list[list[str]] = []
+        for kind, level, key, node_hash in rows:
+            if kind == "section":
+                sections.append((key, node_hash))
+                continue
+            if level == len(step_levels):
+                step_levels.append([])
+            step_levels[level].append(node_hash)
+            if level == 0:
+                step_ids.append(AgentID(key))
+        return PlanTree(
+            root=root,
+            sections=tuple(sections),
+            step_ids=tuple(step_ids),
+            step_levels=tuple(tuple(level) for level in step_levels),
+        )
+
     def _assert_dvc_dataset(self, dataset: DatasetDescriptor) -> None:
         """Internal helper; not part of the public API."""
         if dataset.dataset_state is not DatasetState.FROZEN:
@@ -1231,8 +1770,38 @@ class DuckDBExecutionStore:
                     ),
                 )
 
+    def _persist_plan_tree(self, run_id: RunID, plan: ExecutionSteps) -> None:
+        """Internal helper; not part of the public API."""
+        tree = plan.plan_tree
+        if tree is None:
+            return
+        tenant_id, run = str(plan.tenant_id), str(run_id)
+        rows: list[tuple[object, ...]] = [
+            (tenant_id, run, "section", 0, position, name, node_hash)
+            for position, (name, node_hash) in enumerate(tree.sections)
+        ]
+        for level, hashes in enumerate(tree.step_levels):
+            rows.extend(
+                (
+                    tenant_id,
+                    run,
+                    "step",
+                    level,
+                    position,
+                    str(tree.step_ids[position]) if level == 0 else None,
+                    node_hash,
+                )
+                for position, node_hash in enumerate(hashes)
+            )
+        self._insert(_BULK_INSERTS["plan_nodes"], rows)
+
     def _migrate(self) -> None:
         """Internal helper; not part of the public API."""
+        contract = _code_contract(
+            MIGRATIONS_DIR, SCHEMA_CONTRACT_PATH, SCHEMA_HASH_PATH
+        )
+        if self._schema_is_current(contract):
+            return
         self._connection.execute(
             """
             CREATE TABLE IF NOT EXISTS schema_migrations (
@@ -1242,7 +1811,7 @@ class DuckDBExecutionStore:
             )
             """
         )
-        migrations = self._load_migrations()
+        migrations = contract.migrations
         applied = {
             int(row[0]): row[1]
             for row in self._connection.execute(
@@ -1254,8 +1823,9 @@ class DuckDBExecutionStore:
             raise RuntimeError(
                 "Database schema is ahead of code migrations; refusing to start."
             )
+        upgraded = False
         for version, statement in migrations.items():
-            checksum = schema_contracts.hash_payload(statement)
+            checksum = contract.checksums[version]
             if version in applied:
                 if applied[version] != checksum:
                     raise RuntimeError(
@@ -1276,6 +1846,7 @@ class DuckDBExecutionStore:
             except Exception:
                 self._connection.execute("ROLLBACK")
                 raise
+            upgraded = bool(applied)
         final_versions = {
             int(row[0])
             for row in self._connection.execute(
@@ -1284,14 +1855,263 @@ class DuckDBExecutionStore:
         }
         if final_versions != set(migrations.keys()):
             raise RuntimeError("Schema migrations are out of sync with code.")
-        self._assert_schema_contract(latest_version)
+        self._assert_schema_contract(contract, upgraded=upgraded)
 
-    def _assert_schema_contract(self, latest_version: int) -> None:
+    def _schema_is_current(self, contract: _CodeContract) -> bool:
         """Internal helper; not part of the public API."""
-        contract_payload = schema_contracts.load_schema_contract(SCHEMA_CONTRACT_PATH)
-        contract_hash = schema_contracts.hash_payload(contract_payload)
-        expected_hash = schema_contracts.load_schema_hash(SCHEMA_HASH_PATH)
-        if contract_hash != expected_hash:
+        # Fast path: an up-to-date store opens with two small reads and no DDL.
+        # Any drift falls through to the full migration path, which reports it.
+        if contract.contract_hash != contract.expected_hash:
+            return False
+        try:
+            applied = self._connection.execute(
+                "SELECT version, checksum FROM schema_migrations"
+            ).fetchall()
+            row = self._connection.execute(
+                """
+                SELECT schema_version, schema_hash
+                FROM schema_contract
+                ORDER BY schema_version DESC
+                LIMIT 1
+                """
+            ).fetchone()
+        except duckdb.CatalogException:
+            return False
+        return (
+            row is not None
+            and int(row[0]) == contract.latest_version
+            and row[1] == contract.contract_hash
+            and {int(version): checksum for version, checksum in applied}
+            == contract.checksums
+        )
+
+    def _export_runs(self, archive_dir: Path, rows: list[tuple[Any, ...]]) -> None:
+        """Internal helper; not part of the public API."""
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        tag = run_archive.batch_tag(rows)
+        archived_at = datetime.now(tz=UTC).isoformat()
+        self._connection.execute("BEGIN")
+        try:
+            self._connection.execute(
+                """
+                CREATE OR REPLACE TEMP TABLE archive_batch (
+                    tenant_id TEXT,
+                    run_id TEXT,
+                    run_date TEXT
+                )
+                """
+            )
+            self._connection.executemany(
+                "INSERT INTO archive_batch VALUES (?, ?, ?)", rows
+            )
+            for statement in run_archive.export_statements(archive_dir, tag):
+                self._connection.execute(statement)
+            # Runs are marked only once every file is written; readers follow
+            # the mark to the archive even if eviction below is interrupted.
+            self._connection.executemany(
+                """
+                INSERT INTO archived_runs (
+                    tenant_id, run_id, run_date, archive_uri, archived_at
+                )
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [(*row, str(archive_dir), archived_at) for row in rows],
+            )
+            self._connection.execute("DROP TABLE archive_batch")
+            self._connection.execute("COMMIT")
+        except Exception:
+            self._connection.execute("ROLLBACK")
+            raise
+
+    def _evict_archived_runs(self) -> None:
+        """Internal helper; not part of the public API."""
+        references = self._run_references()
+        for level in reversed(run_archive.RUN_TABLE_LEVELS):
+            self._connection.execute("BEGIN")
+            try:
+                for table in level:
+                    # A row still referenced by a table that was not evicted
+                    # (or not archived) stays; the archive mark still routes
+                    # reads of the run to the archive.
+                    retained = "".join(
+                        f"""
+                          AND NOT EXISTS (
+                              SELECT 1 FROM {child}
+                              WHERE {child}.tenant_id = {table}.tenant_id
+                                AND {child}.run_id = {table}.run_id
+                          )"""  # noqa: S608
+                        for child in references.get(table, ())
+                    )
+                    self._connection.execute(
+                        f"""
+                        DELETE FROM {table}
+                        WHERE EXISTS (
+                            SELECT 1 FROM archived_runs
+                            WHERE archived_runs.tenant_id = {table}.tenant_id
+                              AND archived_runs.run_id = {table}.run_id
+                        ){retained}
+                        """  # noqa: S608
+                    )
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+        self._connection.execute(
+            """
+            DELETE FROM payloads
+            WHERE payload_key NOT IN (
+                SELECT payload_key FROM events WHERE payload_key IS NOT NULL
+            )
+            """
+        )
+
+    def _run_references(self) -> dict[str, tuple[str, ...]]:
+        """Internal helper; not part of the public API."""
+        rows = self._connection.execute(
+            """
+            SELECT DISTINCT referenced_table, table_name
+            FROM duckdb_constraints()
+            WHERE constraint_type = 'FOREIGN KEY'
+              AND list_has_all(constraint_column_names, ['tenant_id', 'run_id'])
+            ORDER BY referenced_table, table_name
+            """
+        ).fetchall()
+        references: dict[str, list[str]] = {}
+        for parent, child in rows:
+            references.setdefault(parent, []).append(child)
+        return {parent: tuple(children) for parent, children in references.items()}
+
+    def _archive_location(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> tuple[Path, str] | None:
+        """Internal helper; not part of the public API."""
+        row = self._connection.execute(
+            """
+            SELECT archive_uri, run_date
+            FROM archived_runs
+            WHERE tenant_id = ? AND run_id = ?
+            """,
+            (str(tenant_id), str(run_id)),
+        ).fetchone()
+        if row is None:
+            return None
+        return Path(row[0]), row[1]
+
+    @classmethod
+    @contextmanager
+    def _attach_archive(
+        cls,
+        archive_dir: Path,
+        *,
+        run_id: RunID,
+        tenant_id: TenantID,
+        run_date: str,
+    ) -> Iterator[DuckDBExecutionStore]:
+        """Internal helper; not part of the public API."""
+        # Cold loads share one in-memory store, migrated once per process and
+        # never written. Each load gets its own cursor, whose temp views over
+        # the run's Parquet partitions shadow the empty tables, so concurrent
+        # loads share no rows and nothing outlives the cursor.
+        store = cls.__new__(cls)
+        store._buffer = None
+        store._lock_fd = None
+        store._live_key = None
+        store._connection = cls._archive_store()._connection.cursor()
+        try:
+            for statement in run_archive.view_statements(
+                archive_dir,
+                tenant_id=str(tenant_id),
+                run_id=str(run_id),
+                run_date=run_date,
+            ):
+                store._connection.execute(statement)
+            yield store
+        finally:
+            store.close()
+
+    @classmethod
+    def _archive_store(cls) -> DuckDBExecutionStore:
+        """Internal helper; not part of the public API."""
+        with cls._archive_lock:
+            if cls._archive is None:
+                store = cls.__new__(cls)
+                store._buffer = None
+                store._lock_fd = None
+                store._live_key = None
+                store._connection = duckdb.connect()
+                store._migrate()
+                cls._archive = store
+            return cls._archive
+
+    @classmethod
+    def _attach_reader(
+        cls, connection: duckdb.DuckDBPyConnection
+    ) -> DuckDBExecutionStore:
+        """Internal helper; not part of the public API."""
+        store = cls.__new__(cls)
+        store._buffer = None
+        store._lock_fd = None
+        store._live_key = None
+        store._connection = connection
+        try:
+            store._assert_reader_contract()
+        except Exception:
+            store.close()
+            raise
+        return store
+
+    @contextmanager
+    def _serve_reads(self) -> Iterator[DuckDBExecutionStore]:
+        """Internal helper; not part of the public API."""
+        # Runs on the read server's session threads, each on its own cursor.
+        store = DuckDBExecutionStore._attach_reader(self._connection.cursor())
+        try:
+            with store._read_transaction():
+                yield store
+        finally:
+            store.close()
+
+    @contextmanager
+    def _read_transaction(self) -> Iterator[None]:
+        """Internal helper; not part of the public API."""
+        self._connection.execute("BEGIN TRANSACTION READ ONLY")
+        try:
+            yield
+        finally:
+            self._connection.execute("ROLLBACK")
+
+    def _assert_reader_contract(self) -> None:
+        """Internal helper; not part of the public API."""
+        try:
+            row = self._connection.execute(
+                """
+                SELECT schema_version, schema_hash
+                FROM schema_contract
+                ORDER BY schema_version DESC
+                LIMIT 1
+                """
+            ).fetchone()
+        except duckdb.CatalogException as exc:
+            raise RuntimeError(
+                "Schema contract table missing; database schema is out of sync."
+            ) from exc
+        if row is None or int(row[0]) != SCHEMA_VERSION:
+            raise RuntimeError(
+                "Database schema version does not match code contract version."
+            )
+        contract = _code_contract(
+            MIGRATIONS_DIR, SCHEMA_CONTRACT_PATH, SCHEMA_HASH_PATH
+        )
+        if row[1] != contract.contract_hash:
+            raise RuntimeError("Database schema hash does not match code contract.")
+
+    def _assert_schema_contract(
+        self, contract: _CodeContract, *, upgraded: bool = False
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        latest_version = contract.latest_version
+        contract_hash = contract.contract_hash
+        if contract_hash != contract.expected_hash:
             raise RuntimeError("Schema contract hash does not match schema.hash.")
         try:
             row = self._connection.execute(
@@ -1306,7 +2126,8 @@ class DuckDBExecutionStore:
             raise RuntimeError(
                 "Schema contract table missing; database schema is out of sync."
             ) from exc
-        if row is None:
+        # A store migrated forward in this open records the new contract.
+        if row is None or (upgraded and int(row[0]) < latest_version):
             self._connection.execute(
                 """
                 INSERT INTO schema_contract (schema_version, schema_hash, applied_at)
@@ -1339,27 +2160,40 @@ class DuckDBExecutionStore:
         """Internal helper; not part of the public API."""
         return schema_contracts.load_schema_hash(SCHEMA_HASH_PATH)
 
-    @staticmethod
-    def _load_migrations() -> dict[int, str]:
-        """Internal helper; not part of the public API."""
-        if not MIGRATIONS_DIR.exists():
-            raise RuntimeError("Migration directory missing.")
-        migrations: dict[int, str] = {}
-        for file in sorted(MIGRATIONS_DIR.glob("*.sql")):
-            version = int(file.name.split("_", 1)[0])
-            migrations[version] = file.read_text(encoding="utf-8")
-        return migrations
-
 
 class DuckDBExecutionWriteStore(ExecutionWriteStoreProtocol):
     """DuckDB write store; misuse breaks append-only guarantees."""
 
-    def __init__(self, path: Path) -> None:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        buffered: bool = False,
+        flush_rows: int | None = None,
+        flush_interval_ms: int | None = None,
+    ) -> None:
         """Internal helper; not part of the public API."""
         self.path = path
-        self._store = DuckDBExecutionStore(path)
+        self._store = DuckDBExecutionStore(
+            path,
+            buffered=buffered,
+            flush_rows=flush_rows,
+            flush_interval_ms=flush_interval_ms,
+        )
         self._connection = self._store._connection
 
+    def flush(self) -> None:
+        """Execute flush and enforce its contract."""
+        self._store.flush()
+
+    def close(self) -> None:
+        """Internal helper; not part of the public API."""
+        self._store.close()
+
+    def archive_runs(self, archive_dir: Path, *, before: datetime) -> tuple[RunID, ...]:
+        """Move finalized runs created before a cutoff into the Parquet tier."""
+        return self._store.archive_runs(archive_dir, before=before)
+
     def begin_run(self, *, plan: ExecutionSteps, mode: RunMode) -> RunID:
         """Execute begin_run and enforce its contract."""
         return self._store.begin_run(plan=plan, mode=mode)
@@ -1462,6 +2296,40 @@ class DuckDBExecutionWriteStore(ExecutionWriteStoreProtocol):
             run_id=run_id, tenant_id=tenant_id, claim_ids=claim_ids
         )
 
+    def save_step_outputs(
+        self,
+        *,
+        run_id: RunID,
+        tenant_id: TenantID,
+        step_index: int,
+        step_key: str,
+        artifact_ids: tuple[ArtifactID, ...],
+    ) -> None:
+        """Execute save_step_outputs and enforce its contract."""
+        self._store.save_step_outputs(
+            run_id=run_id,
+            tenant_id=tenant_id,
+            step_index=step_index,
+            step_key=step_key,
+            artifact_ids=artifact_ids,
+        )
+
+    def save_timings(
+        self,
+        *,
+        run_id: RunID,
+        tenant_id: TenantID,
+        timings: tuple[TimingRecord, ...],
+        starting_index: int,
+    ) -> None:
+        """Execute save_timings and enforce its contract."""
+        self._store.save_timings(
+            run_id=run_id,
+            tenant_id=tenant_id,
+            timings=timings,
+            starting_index=starting_index,
+        )
+
     def register_dataset(self, dataset: DatasetDescriptor) -> None:
         """Execute register_dataset and enforce its contract."""
         self._store.register_dataset(dataset)
@@ -1472,71 +2340,240 @@ class DuckDBExecutionWriteStore(ExecutionWriteStoreProtocol):
         return DuckDBExecutionStore._hash_payload(payload)
 
 
+_ReadSource = DuckDBExecutionStore | RemoteExecutionReader
+
+
+# Readers never take the writer lock, migrate, or create the database file.
+# Each call reads inside one read-only transaction, and every call made in a
+# session() block on the same thread shares one. A reader goes through a
+# cursor on a writer open in this process, or a read-only connection. When
+# another process holds the file, that writer serves the reads over its read
+# socket; a holder without one is waited for up to lock_timeout seconds.
 class DuckDBExecutionReadStore(ExecutionReadStoreProtocol):
     """DuckDB read store; misuse breaks replay analysis."""
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, *, lock_timeout: float = 5.0) -> None:
         """Internal helper; not part of the public API."""
-        self._store = DuckDBExecutionStore(path)
-        self._connection = self._store._connection
+        self.path = path
+        self._lock_timeout = lock_timeout
+        self._last_remote = False
+        self._session = threading.local()
+
+    def close(self) -> None:
+        """Internal helper; not part of the public API."""
+        # Connections live for one read or one session; nothing is held open.
+
+    @property
+    def is_remote(self) -> bool:
+        """Report whether the latest read was served by a writer in another process."""
+        return self._last_remote
+
+    @contextmanager
+    def session(self) -> Iterator[None]:
+        """Serve every read this thread makes in the block from one consistent view."""
+        if getattr(self._session, "source", None) is not None:
+            yield
+            return
+        with self._open_source() as source:
+            self._session.source = source
+            try:
+                yield
+            finally:
+                self._session.source = None
 
-    def load_trace(self, run_id: RunID, *, tenant_id: TenantID) -> ExecutionTrace:
+    def load_trace(
+        self, run_id: RunID, *, tenant_id: TenantID, decode_payloads: bool = True
+    ) -> ExecutionTrace:
         """Execute load_trace and enforce its contract."""
-        return self._store.load_trace(run_id, tenant_id=tenant_id)
+        with self._run_reader(run_id, tenant_id=tenant_id) as store:
+            return store.load_trace(
+                run_id, tenant_id=tenant_id, decode_payloads=decode_payloads
+            )
 
     def load_events(
         self, run_id: RunID, *, tenant_id: TenantID
     ) -> tuple[ExecutionEvent, ...]:
         """Execute load_events and enforce its contract."""
-        return self._store.load_events(run_id, tenant_id=tenant_id)
+        with self._run_reader(run_id, tenant_id=tenant_id) as store:
+            return store.load_events(run_id, tenant_id=tenant_id)
 
     def load_artifacts(
         self, run_id: RunID, *, tenant_id: TenantID
     ) -> tuple[Artifact, ...]:
         """Execute load_artifacts and enforce its contract."""
-        return self._store.load_artifacts(run_id, tenant_id=tenant_id)
+        with self._run_reader(run_id, tenant_id=tenant_id) as store:
+            return store.load_artifacts(run_id, tenant_id=tenant_id)
 
     def load_evidence(
         self, run_id: RunID, *, tenant_id: TenantID
     ) -> tuple[RetrievedEvidence, ...]:
         """Execute load_evidence and enforce its contract."""
-        return self._store.load_evidence(run_id, tenant_id=tenant_id)
+        with self._run_reader(run_id, tenant_id=tenant_id) as store:
+            return store.load_evidence(run_id, tenant_id=tenant_id)
 
     def load_tool_invocations(
         self, run_id: RunID, *, tenant_id: TenantID
     ) -> tuple[ToolInvocation, ...]:
         """Execute load_tool_invocations and enforce its contract."""
-        return self._store.load_tool_invocations(run_id, tenant_id=tenant_id)
+        with self._run_reader(run_id, tenant_id=tenant_id) as store:
+            return store.load_tool_invocations(run_id, tenant_id=tenant_id)
 
     def load_entropy_usage(
         self, run_id: RunID, *, tenant_id: TenantID
     ) -> tuple[EntropyUsage, ...]:
         """Execute load_entropy_usage and enforce its contract."""
-        return self._store.load_entropy_usage(run_id, tenant_id=tenant_id)
+        with self._run_reader(run_id, tenant_id=tenant_id) as store:
+            return store.load_entropy_usage(run_id, tenant_id=tenant_id)
 
     def load_claim_ids(
         self, run_id: RunID, *, tenant_id: TenantID
     ) -> tuple[ClaimID, ...]:
         """Execute load_claim_ids and enforce its contract."""
-        return self._store.load_claim_ids(run_id, tenant_id=tenant_id)
+        with self._run_reader(run_id, tenant_id=tenant_id) as store:
+            return store.load_claim_ids(run_id, tenant_id=tenant_id)
 
     def load_checkpoint(
         self, run_id: RunID, *, tenant_id: TenantID
     ) -> tuple[int, int] | None:
         """Execute load_checkpoint and enforce its contract."""
-        return self._store.load_checkpoint(run_id, tenant_id=tenant_id)
+        with self._run_reader(run_id, tenant_id=tenant_id) as store:
+            return store.load_checkpoint(run_id, tenant_id=tenant_id)
 
     def load_replay_envelope(
         self, run_id: RunID, *, tenant_id: TenantID
     ) -> ReplayEnvelope:
         """Execute load_replay_envelope and enforce its contract."""
-        return self._store.load_replay_envelope(run_id, tenant_id=tenant_id)
+        with self._run_reader(run_id, tenant_id=tenant_id) as store:
+            return store.load_replay_envelope(run_id, tenant_id=tenant_id)
 
     def load_dataset_descriptor(
         self, run_id: RunID, *, tenant_id: TenantID
     ) -> DatasetDescriptor:
         """Execute load_dataset_descriptor and enforce its contract."""
-        return self._store.load_dataset_descriptor(run_id, tenant_id=tenant_id)
+        with self._run_reader(run_id, tenant_id=tenant_id) as store:
+            return store.load_dataset_descriptor(run_id, tenant_id=tenant_id)
+
+    def load_timings(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> tuple[TimingRecord, ...]:
+        """Execute load_timings and enforce its contract."""
+        with self._run_reader(run_id, tenant_id=tenant_id) as store:
+            return store.load_timings(run_id, tenant_id=tenant_id)
+
+    def load_step_outputs(
+        self, step_key: str, *, tenant_id: TenantID
+    ) -> tuple[RunID, tuple[Artifact, ...]] | None:
+        """Execute load_step_outputs and enforce its contract."""
+        with self._reader() as store:
+            return store.load_step_outputs(step_key, tenant_id=tenant_id)
+
+    def iter_events(
+        self,
+        run_id: RunID,
+        *,
+        tenant_id: TenantID,
+        batch_size: int = 1000,
+        step_range: tuple[int, int] | None = None,
+        event_types: Iterable[EventType] | None = None,
+        newest_first: bool = False,
+        decode_payloads: bool = True,
+    ) -> Iterator[ExecutionEvent]:
+        """Stream events; the read transaction stays open until exhausted or closed."""
+        with self._run_reader(run_id, tenant_id=tenant_id) as store:
+            yield from store.iter_events(
+                run_id,
+                tenant_id=tenant_id,
+                batch_size=batch_size,
+                step_range=step_range,
+                event_types=event_types,
+                newest_first=newest_first,
+                decode_payloads=decode_payloads,
+            )
+
+    @contextmanager
+    def _run_reader(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> Iterator[_ReadSource]:
+        """Internal helper; not part of the public API."""
+        # Archived runs are marked in the hot store; every run-scoped load
+        # follows the mark so cold runs read exactly like hot ones.
+        with self._reader() as store:
+            location = store._archive_location(run_id, tenant_id=tenant_id)
+            if location is None:
+                yield store
+                return
+        archive_dir, run_date = location
+        with DuckDBExecutionStore._attach_archive(
+            archive_dir, run_id=run_id, tenant_id=tenant_id, run_date=run_date
+        ) as archived:
+            yield archived
+
+    @contextmanager
+    def _reader(self) -> Iterator[_ReadSource]:
+        """Internal helper; not part of the public API."""
+        pinned = getattr(self._session, "source", None)
+        if pinned is not None:
+            yield pinned
+            return
+        with self._open_source() as source:
+            yield source
+
+    @contextmanager
+    def _open_source(self) -> Iterator[_ReadSource]:
+        """Internal helper; not part of the public API."""
+        source = self._attach()
+        try:
+            if isinstance(source, RemoteExecutionReader):
+                # The serving writer holds the session's transaction.
+                yield source
+            else:
+                with source._read_transaction():
+                    yield source
+        finally:
+            source.close()
+
+    def _attach(self) -> _ReadSource:
+        """Internal helper; not part of the public API."""
+        if not self.path.exists():
+            raise RuntimeError(f"Execution store not found: {self.path}")
+        self._last_remote = False
+        with _LIVE_WRITERS_LOCK:
+            writer = _LIVE_WRITERS.get(self.path.resolve())
+        if writer is not None:
+            return DuckDBExecutionStore._attach_reader(writer._connection.cursor())
+        deadline = time.monotonic() + self._lock_timeout
+        while True:
+            try:
+                connection = duckdb.connect(str(self.path), read_only=True)
+            except duckdb.ConnectionException as exc:
+                raise RuntimeError(
+                    f"Execution store is open for writing outside a store: {self.path}"
+                ) from exc
+            except duckdb.IOException as exc:
+                if "lock" not in str(exc).lower():
+                    raise
+                remote = self._connect_writer()
+                if remote is not None:
+                    self._last_remote = True
+                    return remote
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(
+                        f"Execution store is locked by another process: {self.path}"
+                    ) from exc
+                time.sleep(0.05)
+                continue
+            return DuckDBExecutionStore._attach_reader(connection)
+
+    def _connect_writer(self) -> RemoteExecutionReader | None:
+        """Internal helper; not part of the public API."""
+        address = read_socket_path(self.path)
+        if not address.exists():
+            return None
+        try:
+            return RemoteExecutionReader(address)
+        except (OSError, EOFError, AuthenticationError):
+            # A socket left by a writer that died, or one that is not ours.
+            return None
 
 
 __all__ = [
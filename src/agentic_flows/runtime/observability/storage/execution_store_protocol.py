@@ -5,9 +5,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager
 from typing import Protocol
 
 from agentic_flows.runtime.context import RunMode
+from agentic_flows.runtime.observability.capture.timings import TimingRecord
 from agentic_flows.spec.model.artifact.artifact import Artifact
 from agentic_flows.spec.model.artifact.entropy_usage import EntropyUsage
 from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
@@ -17,7 +20,8 @@ from agentic_flows.spec.model.execution.execution_trace import ExecutionTrace
 from agentic_flows.spec.model.execution.replay_envelope import ReplayEnvelope
 from agentic_flows.spec.model.identifiers.execution_event import ExecutionEvent
 from agentic_flows.spec.model.identifiers.tool_invocation import ToolInvocation
-from agentic_flows.spec.ontology.ids import ClaimID, RunID, TenantID
+from agentic_flows.spec.ontology.ids import ArtifactID, ClaimID, RunID, TenantID
+from agentic_flows.spec.ontology.public import EventType
 
 
 class ExecutionWriteStoreProtocol(Protocol):
@@ -114,6 +118,29 @@ class ExecutionWriteStoreProtocol(Protocol):
         """Execute append_claim_ids and enforce its contract."""
         ...
 
+    def save_step_outputs(
+        self,
+        *,
+        run_id: RunID,
+        tenant_id: TenantID,
+        step_index: int,
+        step_key: str,
+        artifact_ids: tuple[ArtifactID, ...],
+    ) -> None:
+        """Execute save_step_outputs and enforce its contract."""
+        ...
+
+    def save_timings(
+        self,
+        *,
+        run_id: RunID,
+        tenant_id: TenantID,
+        timings: tuple[TimingRecord, ...],
+        starting_index: int,
+    ) -> None:
+        """Execute save_timings and enforce its contract."""
+        ...
+
     def register_dataset(self, dataset: DatasetDescriptor) -> None:
         """Execute register_dataset and enforce its contract."""
         ...
@@ -122,6 +149,10 @@ class ExecutionWriteStoreProtocol(Protocol):
 class ExecutionReadStoreProtocol(Protocol):
     """Read store protocol; misuse breaks replay guarantees."""
 
+    def session(self) -> AbstractContextManager[None]:
+        """Serve the reads made inside the block from one consistent view."""
+        ...
+
     def load_trace(self, run_id: RunID, *, tenant_id: TenantID) -> ExecutionTrace:
         """Execute load_trace and enforce its contract."""
         ...
@@ -132,6 +163,20 @@ class ExecutionReadStoreProtocol(Protocol):
         """Execute load_events and enforce its contract."""
         ...
 
+    def iter_events(
+        self,
+        run_id: RunID,
+        *,
+        tenant_id: TenantID,
+        batch_size: int = 1000,
+        step_range: tuple[int, int] | None = None,
+        event_types: Iterable[EventType] | None = None,
+        newest_first: bool = False,
+        decode_payloads: bool = True,
+    ) -> Iterator[ExecutionEvent]:
+        """Execute iter_events and enforce its contract."""
+        ...
+
     def load_artifacts(
         self, run_id: RunID, *, tenant_id: TenantID
     ) -> tuple[Artifact, ...]:
@@ -180,5 +225,17 @@ class ExecutionReadStoreProtocol(Protocol):
         """Execute load_dataset_descriptor and enforce its contract."""
         ...
 
+    def load_timings(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> tuple[TimingRecord, ...]:
+        """Execute load_timings and enforce its contract."""
+        ...
+
+    def load_step_outputs(
+        self, step_key: str, *, tenant_id: TenantID
+    ) -> tuple[RunID, tuple[Artifact, ...]] | None:
+        """Execute load_step_outputs and enforce its contract."""
+        ...
+
 
 __all__ = ["ExecutionReadStoreProtocol", "ExecutionWriteStoreProtocol"]
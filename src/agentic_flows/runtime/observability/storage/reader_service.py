@@ -0,0 +1,409 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+# INTERNAL — NOT A PUBLIC EXTENSION POINT
+
+"""Module definitions for runtime/observability/storage/reader_service.py."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, ExitStack, contextmanager, suppress
+import hashlib
+from itertools import count, islice
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+import os
+from pathlib import Path
+import secrets
+import socket
+import stat
+import tempfile
+import threading
+from typing import Any
+
+from agentic_flows.runtime.observability.capture.timings import TimingRecord
+from agentic_flows.spec.model.artifact.artifact import Artifact
+from agentic_flows.spec.model.artifact.entropy_usage import EntropyUsage
+from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
+from agentic_flows.spec.model.datasets.dataset_descriptor import DatasetDescriptor
+from agentic_flows.spec.model.execution.execution_trace import ExecutionTrace
+from agentic_flows.spec.model.execution.replay_envelope import ReplayEnvelope
+from agentic_flows.spec.model.identifiers.execution_event import ExecutionEvent
+from agentic_flows.spec.model.identifiers.tool_invocation import ToolInvocation
+from agentic_flows.spec.ontology.ids import ClaimID, RunID, TenantID
+from agentic_flows.spec.ontology.public import EventType
+
+_SERVED_METHODS = frozenset(
+    {
+        "load_trace",
+        "load_events",
+        "load_artifacts",
+        "load_evidence",
+        "load_tool_invocations",
+        "load_entropy_usage",
+        "load_claim_ids",
+        "load_checkpoint",
+        "load_replay_envelope",
+        "load_dataset_descriptor",
+        "load_timings",
+        "load_step_outputs",
+        "_archive_location",
+    }
+)
+
+# AF_UNIX addresses are limited to 108 bytes including the terminator.
+_MAX_SOCKET_PATH = 100
+
+
+def store_authkey_path(address: Path) -> Path:
+    """Return the key file a store service writes beside its socket."""
+    return address.with_name(f"{address.name}.key")
+
+
+def read_socket_path(path: Path) -> Path:
+    """Return the socket on which the writer of the database at path serves reads."""
+    resolved = path.resolve()
+    address = resolved.with_name(f"{resolved.name}.reads")
+    if len(str(address)) <= _MAX_SOCKET_PATH:
+        return address
+    # Too long for a socket beside the database; readers derive the same
+    # name, and only trust it when the key file is their own.
+    digest = hashlib.sha256(str(resolved).encode("utf-8")).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"agentic-flows-{digest}.reads"
+
+
+# Every connection is one read session: the writer opens a read-only
+# transaction on a cursor of its own database when the client connects and
+# serves each request from it, so all reads of a session agree.
+class ExecutionReadServer:
+    """Serves a writer's store to readers in other processes; misuse breaks read consistency."""
+
+    def __init__(
+        self,
+        address: Path,
+        open_session: Callable[[], AbstractContextManager[Any]],
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        self.address = address
+        self._open_session = open_session
+        self._authkey = secrets.token_bytes(32)
+        clear_stale_socket(address)
+        self._key_path = store_authkey_path(address)
+        with owner_only_umask():
+            publish_authkey(self._key_path, self._authkey)
+            self._listener = Listener(
+                str(address), family="AF_UNIX", authkey=self._authkey
+            )
+        self._stopped = threading.Event()
+        self._sessions: dict[Connection, threading.Thread] = {}
+        self._sessions_lock = threading.Lock()
+        self._acceptor = threading.Thread(
+            target=self._accept, name="agentic-flows-store-reads", daemon=True
+        )
+        self._acceptor.start()
+
+    def close(self) -> None:
+        """Stop accepting readers and end every open session."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        with suppress(Exception), socket.socket(socket.AF_UNIX) as wakeup:
+            wakeup.connect(str(self.address))
+        with suppress(Exception):
+            self._listener.close()
+        self._acceptor.join()
+        self._key_path.unlink(missing_ok=True)
+        with self._sessions_lock:
+            sessions = dict(self._sessions)
+        for connection in sessions:
+            # Shutting the socket down wakes a session blocked in recv().
+            with (
+                suppress(OSError),
+                socket.socket(fileno=os.dup(connection.fileno())) as peer,
+            ):
+                peer.shutdown(socket.SHUT_RDWR)
+        # Sessions hold cursors on the writer's database, which stays open
+        # until the last of them is closed.
+        for thread in sessions.values():
+            thread.join()
+
+    def _accept(self) -> None:
+        """Internal helper; not part of the public API."""
+        while not self._stopped.is_set():
+            try:
+                connection = self._listener.accept()
+            except (AuthenticationError, EOFError, ConnectionError):
+                continue
+            except OSError:
+                return
+            with self._sessions_lock:
+                if self._stopped.is_set():
+                    connection.close()
+                    return
+                thread = threading.Thread(
+                    target=self._serve, args=(connection,), daemon=True
+                )
+                self._sessions[connection] = thread
+            thread.start()
+
+    def _serve(self, connection: Connection) -> None:
+        """Internal helper; not part of the public API."""
+        try:
+            with connection, ExitStack() as stack:
+                failure: Exception | None = None
+                store: Any = None
+                try:
+                    store = stack.enter_context(self._open_session())
+                except Exception as exc:
+                    failure = exc
+                events: dict[int, tuple[Iterator[ExecutionEvent], int]] = {}
+                keys = count()
+                while True:
+                    try:
+                        method, kwargs = connection.recv()
+                    except (EOFError, OSError):
+                        return
+                    try:
+                        if failure is not None:
+                            raise failure
+                        reply: tuple[str, Any] = (
+                            "ok",
+                            self._dispatch(store, method, kwargs, events, keys),
+                        )
+                    except Exception as exc:
+                        reply = ("error", exc)
+                    try:
+                        connection.send(reply)
+                    except (EOFError, OSError):
+                        return
+                    except Exception as exc:
+                        connection.send(("error", RuntimeError(f"{exc}: {reply[1]!r}")))
+        finally:
+            with self._sessions_lock:
+                self._sessions.pop(connection, None)
+
+    @staticmethod
+    def _dispatch(
+        store: Any,
+        method: str,
+        kwargs: dict[str, Any],
+        events: dict[int, tuple[Iterator[ExecutionEvent], int]],
+        keys: Iterator[int],
+    ) -> Any:
+        """Internal helper; not part of the public API."""
+        if method in _SERVED_METHODS:
+            return getattr(store, method)(**kwargs)
+        if method == "iter_events":
+            key = next(keys)
+            events[key] = (store.iter_events(**kwargs), kwargs["batch_size"])
+            return key, _next_page(events, key)
+        if method == "iter_next":
+            return _next_page(events, kwargs["key"])
+        if method == "iter_close":
+            events.pop(kwargs["key"], None)
+            return None
+        raise ValueError(f"Unsupported execution store read: {method}")
+
+
+class RemoteExecutionReader:
+    """One read session served by a writer in another process; misuse breaks read consistency."""
+
+    def __init__(self, address: Path) -> None:
+        """Internal helper; not part of the public API."""
+        key_path = store_authkey_path(address)
+        metadata = key_path.stat()
+        # The session unpickles what the server sends, so only a key that
+        # this user wrote and nobody else can read is trusted.
+        if metadata.st_uid != os.getuid() or stat.S_IMODE(metadata.st_mode) & 0o077:
+            raise PermissionError(f"Untrusted store key file: {key_path}")
+        self._connection = Client(
+            str(address), family="AF_UNIX", authkey=key_path.read_bytes()
+        )
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """End the session and close the connection."""
+        with suppress(Exception):
+            self._connection.close()
+
+    def load_trace(
+        self, run_id: RunID, *, tenant_id: TenantID, decode_payloads: bool = True
+    ) -> ExecutionTrace:
+        """Execute load_trace and enforce its contract."""
+        return self._call(
+            "load_trace",
+            run_id=run_id,
+            tenant_id=tenant_id,
+            decode_payloads=decode_payloads,
+        )
+
+    def load_events(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> tuple[ExecutionEvent, ...]:
+        """Execute load_events and enforce its contract."""
+        return self._call("load_events", run_id=run_id, tenant_id=tenant_id)
+
+    def load_artifacts(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> tuple[Artifact, ...]:
+        """Execute load_artifacts and enforce its contract."""
+        return self._call("load_artifacts", run_id=run_id, tenant_id=tenant_id)
+
+    def load_evidence(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> tuple[RetrievedEvidence, ...]:
+        """Execute load_evidence and enforce its contract."""
+        return self._call("load_evidence", run_id=run_id, tenant_id=tenant_id)
+
+    def load_tool_invocations(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> tuple[ToolInvocation, ...]:
+        """Execute load_tool_invocations and enforce its contract."""
+        return self._call("load_tool_invocations", run_id=run_id, tenant_id=tenant_id)
+
+    def load_entropy_usage(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> tuple[EntropyUsage, ...]:
+        """Execute load_entropy_usage and enforce its contract."""
+        return self._call("load_entropy_usage", run_id=run_id, tenant_id=tenant_id)
+
+    def load_claim_ids(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> tuple[ClaimID, ...]:
+        """Execute load_claim_ids and enforce its contract."""
+        return self._call("load_claim_ids", run_id=run_id, tenant_id=tenant_id)
+
+    def load_checkpoint(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> tuple[int, int] | None:
+        """Execute load_checkpoint and enforce its contract."""
+        return self._call("load_checkpoint", run_id=run_id, tenant_id=tenant_id)
+
+    def load_replay_envelope(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> ReplayEnvelope:
+        """Execute load_replay_envelope and enforce its contract."""
+        return self._call("load_replay_envelope", run_id=run_id, tenant_id=tenant_id)
+
+    def load_dataset_descriptor(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> DatasetDescriptor:
+        """Execute load_dataset_descriptor and enforce its contract."""
+        return self._call("load_dataset_descriptor", run_id=run_id, tenant_id=tenant_id)
+
+    def load_timings(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> tuple[TimingRecord, ...]:
+        """Execute load_timings and enforce its contract."""
+        return self._call("load_timings", run_id=run_id, tenant_id=tenant_id)
+
+    def load_step_outputs(
+        self, step_key: str, *, tenant_id: TenantID
+    ) -> tuple[RunID, tuple[Artifact, ...]] | None:
+        """Execute load_step_outputs and enforce its contract."""
+        return self._call("load_step_outputs", step_key=step_key, tenant_id=tenant_id)
+
+    def iter_events(
+        self,
+        run_id: RunID,
+        *,
+        tenant_id: TenantID,
+        batch_size: int = 1000,
+        step_range: tuple[int, int] | None = None,
+        event_types: Iterable[EventType] | None = None,
+        newest_first: bool = False,
+        decode_payloads: bool = True,
+    ) -> Iterator[ExecutionEvent]:
+        """Stream events a page per round trip; abandoning the stream releases it."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        key, page = self._call(
+            "iter_events",
+            run_id=run_id,
+            tenant_id=tenant_id,
+            batch_size=batch_size,
+            step_range=step_range,
+            event_types=tuple(event_types) if event_types is not None else None,
+            newest_first=newest_first,
+            decode_payloads=decode_payloads,
+        )
+        exhausted = False
+        try:
+            while True:
+                yield from page
+                if len(page) < batch_size:
+                    exhausted = True
+                    return
+                page = self._call("iter_next", key=key)
+        finally:
+            if not exhausted:
+                with suppress(Exception):
+                    self._call("iter_close", key=key)
+
+    def _archive_location(
+        self, run_id: RunID, *, tenant_id: TenantID
+    ) -> tuple[Path, str] | None:
+        """Internal helper; not part of the public API."""
+        return self._call("_archive_location", run_id=run_id, tenant_id=tenant_id)
+
+    def _call(self, method: str, **kwargs: Any) -> Any:
+        """Internal helper; not part of the public API."""
+        with self._lock:
+            self._connection.send((method, kwargs))
+            status, value = self._connection.recv()
+        if status == "error":
+            raise value
+        return value
+
+
+def _next_page(
+    events: dict[int, tuple[Iterator[ExecutionEvent], int]], key: int
+) -> list[ExecutionEvent]:
+    """Internal helper; not part of the public API."""
+    stream, batch_size = events[key]
+    page = list(islice(stream, batch_size))
+    if len(page) < batch_size:
+        del events[key]
+    return page
+
+
+def publish_authkey(path: Path, authkey: bytes) -> None:
+    """Write a socket authkey owner-only, replacing any earlier key file."""
+    path.unlink(missing_ok=True)
+    descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(descriptor, "wb") as handle:
+        handle.write(authkey)
+
+
+@contextmanager
+def owner_only_umask() -> Iterator[None]:
+    """Create files and sockets in the block readable by their owner only."""
+    previous = os.umask(0o077)
+    try:
+        yield
+    finally:
+        os.umask(previous)
+
+
+def clear_stale_socket(address: Path) -> None:
+    """Remove a socket left by a dead service; raise when one still listens."""
+    if not address.exists():
+        return
+    with socket.socket(socket.AF_UNIX) as probe:
+        try:
+            probe.connect(str(address))
+        except OSError:
+            address.unlink(missing_ok=True)
+            return
+    raise RuntimeError(f"execution store socket already in use: {address}")
+
+
+__all__ = [
+    "ExecutionReadServer",
+    "RemoteExecutionReader",
+    "clear_stale_socket",
+    "owner_only_umask",
+    "publish_authkey",
+    "read_socket_path",
+    "store_authkey_path",
+]
@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+# INTERNAL — NOT A PUBLIC EXTENSION POINT
+
+"""Module definitions for runtime/observability/storage/run_archive.py."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import hashlib
+from pathlib import Path
+
+# Run-scoped tables, parent level first. DuckDB cannot delete a parent row in
+# the transaction that deleted its children, so eviction commits one level at
+# a time, deepest first, and cold loads insert them in this order.
+RUN_TABLE_LEVELS: tuple[tuple[str, ...], ...] = (
+    ("runs",),
+    (
+        "run_children",
+        "run_checkpoints",
+        "entropy_budget_sources",
+        "entropy_budget_magnitudes",
+        "entropy_budget",
+        "entropy_budget_slices",
+        "nondeterminism_intents",
+        "steps",
+        "plan_nodes",
+        "step_outputs",
+        "events",
+        "artifacts",
+        "evidence",
+        "tool_invocations",
+        "claims",
+        "timings",
+    ),
+    ("step_dependencies", "artifact_parents", "entropy_usage"),
+)
+
+_HIVE_TYPES = "{'tenant_id': VARCHAR, 'run_date': VARCHAR}"
+
+# Each query yields the archived rows plus the run_date partition column; the
+# batch of runs being archived is staged in the archive_batch temp table.
+_RUN_ROWS = """
+    SELECT archived.*, batch.run_date
+    FROM {table} AS archived
+    JOIN archive_batch AS batch USING (tenant_id, run_id)
+"""
+_DATASET_ROWS = """
+    SELECT DISTINCT datasets.*, batch.run_date
+    FROM datasets
+    JOIN runs
+        ON runs.tenant_id = datasets.tenant_id
+        AND runs.dataset_id = datasets.dataset_id
+        AND runs.dataset_version = datasets.version
+    JOIN archive_batch AS batch
+        ON batch.tenant_id = runs.tenant_id AND batch.run_id = runs.run_id
+"""
+_PAYLOAD_ROWS = """
+    SELECT DISTINCT payloads.*, batch.tenant_id, batch.run_date
+    FROM events
+    JOIN archive_batch AS batch USING (tenant_id, run_id)
+    JOIN payloads USING (payload_key)
+"""
+
+
+def batch_tag(runs: Iterable[tuple[object, ...]]) -> str:
+    """Name an archive batch; re-exporting the same runs overwrites its files."""
+    digest = hashlib.sha256()
+    for tenant_id, run_id, *_ in sorted(runs):
+        digest.update(f"{tenant_id}/{run_id}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def export_statements(archive_dir: Path, tag: str) -> Iterator[str]:
+    """Yield COPY statements writing the staged batch as partitioned Parquet."""
+    # Datasets and payload bodies are shared with hot runs; they are copied,
+    # never evicted, so a cold run loads without the hot store.
+    yield _copy(_DATASET_ROWS, archive_dir / "datasets", tag)
+    for level in RUN_TABLE_LEVELS:
+        for table in level:
+            yield _copy(_RUN_ROWS.format(table=table), archive_dir / table, tag)
+    yield _copy(_PAYLOAD_ROWS, archive_dir / "payloads", tag)
+
+
+def view_statements(
+    archive_dir: Path, *, tenant_id: str, run_id: str, run_date: str
+) -> Iterator[str]:
+    """Yield CREATE TEMP VIEW statements exposing one archived run under its table names."""
+    # (table, run-scoped, partition columns that are not table columns)
+    tables = [
+        ("datasets", False, "run_date"),
+        *((table, True, "run_date") for level in RUN_TABLE_LEVELS for table in level),
+        ("payloads", False, "tenant_id, run_date"),
+    ]
+    for table, run_scoped, excluded in tables:
+        files = archive_dir / table
+        if not any(files.glob("*/*/*.parquet")):
+            continue
+        run_filter = f" AND run_id = {_literal(run_id)}" if run_scoped else ""
+        # Shared rows are copied by every batch that referenced them.
+        distinct = "" if run_scoped else "DISTINCT "
+        yield f"""
+            CREATE TEMP VIEW {table} AS
+            SELECT {distinct}* EXCLUDE ({excluded})
+            FROM read_parquet(
+                {_literal(str(files / "*" / "*" / "*.parquet"))},
+                hive_partitioning = true,
+                hive_types = {_HIVE_TYPES}
+            )
+            WHERE tenant_id = {_literal(tenant_id)}
+              AND run_date = {_literal(run_date)}{run_filter}
+            """  # noqa: S608
+
+
+def _copy(query: str, target: Path, tag: str) -> str:
+    """Internal helper; not part of the public API."""
+    return f"""
+        COPY ({query}) TO {_literal(str(target))} (
+            FORMAT PARQUET,
+            PARTITION_BY (tenant_id, run_date),
+            FILENAME_PATTERN {_literal(f"batch_{tag}_{{i}}")},
+            OVERWRITE_OR_IGNORE true
+        )
+    """
+
+
+def _literal(value: str) -> str:
+    """Internal helper; not part of the public API."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+__all__ = [
+    "RUN_TABLE_LEVELS",
+    "batch_tag",
+    "export_statements",
+    "view_statements",
+]
@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+# INTERNAL — NOT A PUBLIC EXTENSION POINT
+
+"""Module definitions for runtime/observability/storage/write_buffer.py."""
+
+from __future__ import annotations
+
+import time
+
+
+class WriteBuffer:
+    """Pending store writes; misuse breaks checkpoint atomicity."""
+
+    def __init__(
+        self,
+        *,
+        max_rows: int | None = None,
+        max_delay_ms: int | None = None,
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        if max_rows is not None and max_rows < 1:
+            raise ValueError("max_rows must be positive")
+        if max_delay_ms is not None and max_delay_ms < 0:
+            raise ValueError("max_delay_ms must be non-negative")
+        self._max_rows = max_rows
+        self._max_delay_ms = max_delay_ms
+        self._batches: dict[str, list[tuple[object, ...]]] = {}
+        self._rows = 0
+        self._opened_at: float | None = None
+
+    def __len__(self) -> int:
+        """Internal helper; not part of the public API."""
+        return self._rows
+
+    def append(
+        self, table: str, rows: list[tuple[object, ...]], *, counted: bool = True
+    ) -> None:
+        """Queue rows; tables flush in the order they were first touched."""
+        if not rows:
+            return
+        self._batches.setdefault(table, []).extend(rows)
+        if self._opened_at is None:
+            self._opened_at = time.monotonic()
+        # Uncounted rows ride along with counted ones and never trigger a flush.
+        if counted:
+            self._rows += len(rows)
+
+    def due(self) -> bool:
+        """Report whether the row or delay threshold has been reached."""
+        if not self._rows:
+            return False
+        if self._max_rows is not None and self._rows >= self._max_rows:
+            return True
+        if self._max_delay_ms is None or self._opened_at is None:
+            return False
+        elapsed_ms = (time.monotonic() - self._opened_at) * 1000
+        return elapsed_ms >= self._max_delay_ms
+
+    def batches(self) -> tuple[tuple[str, list[tuple[object, ...]]], ...]:
+        """Return pending rows grouped by table in first-touch order."""
+        return tuple(self._batches.items())
+
+    def clear(self) -> None:
+        """Drop pending batches after a successful flush."""
+        self._batches = {}
+        self._rows = 0
+        self._opened_at = None
+
+
+__all__ = ["WriteBuffer"]
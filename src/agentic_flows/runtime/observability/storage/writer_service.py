@@ -0,0 +1,455 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+# INTERNAL — NOT A PUBLIC EXTENSION POINT
+
+"""Module definitions for runtime/observability/storage/writer_service.py."""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from concurrent.futures import Future
+from contextlib import suppress
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+import os
+from pathlib import Path
+import queue
+import secrets
+import socket
+import threading
+from typing import Any
+
+from agentic_flows.runtime.context import RunMode
+from agentic_flows.runtime.observability.capture.timings import TimingRecord
+from agentic_flows.runtime.observability.storage.execution_store import (
+    DuckDBExecutionStore,
+)
+from agentic_flows.runtime.observability.storage.execution_store_protocol import (
+    ExecutionWriteStoreProtocol,
+)
+from agentic_flows.runtime.observability.storage.reader_service import (
+    clear_stale_socket,
+    owner_only_umask,
+    publish_authkey,
+    store_authkey_path,
+)
+from agentic_flows.spec.model.artifact.artifact import Artifact
+from agentic_flows.spec.model.artifact.entropy_usage import EntropyUsage
+from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
+from agentic_flows.spec.model.datasets.dataset_descriptor import DatasetDescriptor
+from agentic_flows.spec.model.execution.execution_steps import ExecutionSteps
+from agentic_flows.spec.model.execution.execution_trace import ExecutionTrace
+from agentic_flows.spec.model.identifiers.execution_event import ExecutionEvent
+from agentic_flows.spec.model.identifiers.tool_invocation import ToolInvocation
+from agentic_flows.spec.ontology.ids import ArtifactID, ClaimID, RunID, TenantID
+
+STORE_AUTHKEY_ENV = "AGENTIC_FLOWS_STORE_AUTHKEY"
+STORE_SOCKET_ENV = "AGENTIC_FLOWS_STORE_SOCKET"
+
+_FORWARDED_METHODS = frozenset(
+    {
+        "begin_run",
+        "finalize_run",
+        "save_run",
+        "save_steps",
+        "save_checkpoint",
+        "save_events",
+        "save_artifacts",
+        "append_evidence",
+        "append_entropy_usage",
+        "append_tool_invocations",
+        "append_claim_ids",
+        "save_step_outputs",
+        "save_timings",
+        "register_dataset",
+        "flush",
+    }
+)
+
+
+def store_authkey_from_env() -> bytes | None:
+    """Read the daemon authkey; misuse breaks socket authentication."""
+    value = os.environ.get(STORE_AUTHKEY_ENV)
+    return value.encode("utf-8") if value else None
+
+
+def load_store_authkey(address: Path) -> bytes:
+    """Read the daemon authkey from the environment or its key file."""
+    authkey = store_authkey_from_env()
+    if authkey is not None:
+        return authkey
+    return store_authkey_path(address).read_bytes()
+
+
+class _ForwardingWriteStore(ExecutionWriteStoreProtocol):
+    """Internal helper; not part of the public API."""
+
+    @abstractmethod
+    def _call(self, method: str, **kwargs: Any) -> Any:
+        """Internal helper; not part of the public API."""
+
+    def begin_run(self, *, plan: ExecutionSteps, mode: RunMode) -> RunID:
+        """Execute begin_run and enforce its contract."""
+        return self._call("begin_run", plan=plan, mode=mode)
+
+    def finalize_run(self, *, run_id: RunID, trace: ExecutionTrace) -> None:
+        """Execute finalize_run and enforce its contract."""
+        self._call("finalize_run", run_id=run_id, trace=trace)
+
+    def save_run(
+        self,
+        *,
+        trace: ExecutionTrace | None,
+        plan: ExecutionSteps,
+        mode: RunMode,
+    ) -> RunID:
+        """Execute save_run and enforce its contract."""
+        return self._call("save_run", trace=trace, plan=plan, mode=mode)
+
+    def save_steps(
+        self, *, run_id: RunID, tenant_id: TenantID, plan: ExecutionSteps
+    ) -> None:
+        """Execute save_steps and enforce its contract."""
+        self._call("save_steps", run_id=run_id, tenant_id=tenant_id, plan=plan)
+
+    def save_checkpoint(
+        self,
+        *,
+        run_id: RunID,
+        tenant_id: TenantID,
+        step_index: int,
+        event_index: int,
+    ) -> None:
+        """Execute save_checkpoint and enforce its contract."""
+        self._call(
+            "save_checkpoint",
+            run_id=run_id,
+            tenant_id=tenant_id,
+            step_index=step_index,
+            event_index=event_index,
+        )
+
+    def save_events(
+        self,
+        *,
+        run_id: RunID,
+        tenant_id: TenantID,
+        events: tuple[ExecutionEvent, ...],
+    ) -> None:
+        """Execute save_events and enforce its contract."""
+        self._call("save_events", run_id=run_id, tenant_id=tenant_id, events=events)
+
+    def save_artifacts(self, *, run_id: RunID, artifacts: list[Artifact]) -> None:
+        """Execute save_artifacts and enforce its contract."""
+        self._call("save_artifacts", run_id=run_id, artifacts=artifacts)
+
+    def append_evidence(
+        self,
+        *,
+        run_id: RunID,
+        evidence: list[RetrievedEvidence],
+        starting_index: int,
+    ) -> None:
+        """Execute append_evidence and enforce its contract."""
+        self._call(
+            "append_evidence",
+            run_id=run_id,
+            evidence=evidence,
+            starting_index=starting_index,
+        )
+
+    def append_entropy_usage(
+        self,
+        *,
+        run_id: RunID,
+        usage: tuple[EntropyUsage, ...],
+        starting_index: int,
+    ) -> None:
+        """Execute append_entropy_usage and enforce its contract."""
+        self._call(
+            "append_entropy_usage",
+            run_id=run_id,
+            usage=usage,
+            starting_index=starting_index,
+        )
+
+    def append_tool_invocations(
+        self,
+        *,
+        run_id: RunID,
+        tenant_id: TenantID,
+        tool_invocations: tuple[ToolInvocation, ...],
+        starting_index: int,
+    ) -> None:
+        """Execute append_tool_invocations and enforce its contract."""
+        self._call(
+            "append_tool_invocations",
+            run_id=run_id,
+            tenant_id=tenant_id,
+            tool_invocations=tool_invocations,
+            starting_index=starting_index,
+        )
+
+    def append_claim_ids(
+        self, *, run_id: RunID, tenant_id: TenantID, claim_ids: tuple[ClaimID, ...]
+    ) -> None:
+        """Execute append_claim_ids and enforce its contract."""
+        self._call(
+            "append_claim_ids", run_id=run_id, tenant_id=tenant_id, claim_ids=claim_ids
+        )
+
+    def save_step_outputs(
+        self,
+        *,
+        run_id: RunID,
+        tenant_id: TenantID,
+        step_index: int,
+        step_key: str,
+        artifact_ids: tuple[ArtifactID, ...],
+    ) -> None:
+        """Execute save_step_outputs and enforce its contract."""
+        self._call(
+            "save_step_outputs",
+            run_id=run_id,
+            tenant_id=tenant_id,
+            step_index=step_index,
+            step_key=step_key,
+            artifact_ids=artifact_ids,
+        )
+
+    def save_timings(
+        self,
+        *,
+        run_id: RunID,
+        tenant_id: TenantID,
+        timings: tuple[TimingRecord, ...],
+        starting_index: int,
+    ) -> None:
+        """Execute save_timings and enforce its contract."""
+        self._call(
+            "save_timings",
+            run_id=run_id,
+            tenant_id=tenant_id,
+            timings=timings,
+            starting_index=starting_index,
+        )
+
+    def register_dataset(self, dataset: DatasetDescriptor) -> None:
+        """Execute register_dataset and enforce its contract."""
+        self._call("register_dataset", dataset=dataset)
+
+    def flush(self) -> None:
+        """Execute flush and enforce its contract."""
+        self._call("flush")
+
+
+# One writer thread owns the DuckDB connection; callers on any thread block
+# until their write has been applied, so per-flow ordering is preserved.
+class QueuedExecutionWriteStore(_ForwardingWriteStore):
+    """Queued write store shared by concurrent flows; misuse breaks append-only guarantees."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        buffered: bool = False,
+        flush_rows: int | None = None,
+        flush_interval_ms: int | None = None,
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        self.path = path
+        self._store = DuckDBExecutionStore(
+            path,
+            buffered=buffered,
+            flush_rows=flush_rows,
+            flush_interval_ms=flush_interval_ms,
+        )
+        self._requests: queue.Queue[tuple[str, dict[str, Any], Future[Any]] | None] = (
+            queue.Queue()
+        )
+        self._state_lock = threading.Lock()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._drain, name="agentic-flows-store-writer", daemon=True
+        )
+        self._writer.start()
+
+    def close(self) -> None:
+        """Stop the writer thread after pending writes are applied."""
+        with self._state_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._requests.put(None)
+        self._writer.join()
+        self._store.close()
+
+    def _call(self, method: str, **kwargs: Any) -> Any:
+        """Internal helper; not part of the public API."""
+        if method not in _FORWARDED_METHODS:
+            raise ValueError(f"Unsupported execution store method: {method}")
+        future: Future[Any] = Future()
+        with self._state_lock:
+            if self._closed:
+                raise RuntimeError("execution store writer is closed")
+            self._requests.put((method, kwargs, future))
+        return future.result()
+
+    def _drain(self) -> None:
+        """Internal helper; not part of the public API."""
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            method, kwargs, future = request
+            try:
+                future.set_result(getattr(self._store, method)(**kwargs))
+            except Exception as exc:
+                future.set_exception(exc)
+
+
+class ExecutionStoreServer:
+    """Local writer daemon over a Unix socket; misuse breaks single-writer guarantees."""
+
+    def __init__(
+        self,
+        path: Path,
+        address: Path,
+        *,
+        authkey: bytes | None = None,
+        buffered: bool = False,
+    ) -> None:
+        """Internal helper; not part of the public API."""
+        self.address = address
+        # Clients are always authenticated, since the daemon unpickles what
+        # they send; without a configured key a random one is generated.
+        self._authkey = authkey or store_authkey_from_env() or secrets.token_bytes(32)
+        clear_stale_socket(address)
+        self._store = QueuedExecutionWriteStore(path, buffered=buffered)
+        self._key_path = store_authkey_path(address)
+        with owner_only_umask():
+            # Both files are created owner-only, so there is no window in
+            # which another user can connect or read the key.
+            publish_authkey(self._key_path, self._authkey)
+            self._listener = Listener(
+                str(address), family="AF_UNIX", authkey=self._authkey
+            )
+        self._stopped = threading.Event()
+
+    def serve_forever(self) -> None:
+        """Accept clients until close() is called."""
+        while not self._stopped.is_set():
+            try:
+                connection = self._listener.accept()
+            except (AuthenticationError, EOFError, ConnectionError):
+                if self._stopped.is_set():
+                    return
+                # A client that fails the handshake must not stop the daemon.
+                continue
+            except OSError:
+                if self._stopped.is_set():
+                    return
+                raise
+            if self._stopped.is_set():
+                connection.close()
+                return
+            threading.Thread(
+                target=self._serve_client, args=(connection,), daemon=True
+            ).start()
+
+    def close(self) -> None:
+        """Stop accepting clients and close the underlying store."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        with suppress(Exception), socket.socket(socket.AF_UNIX) as wakeup:
+            wakeup.connect(str(self.address))
+        with suppress(Exception):
+            self._listener.close()
+        self._key_path.unlink(missing_ok=True)
+        self._store.close()
+
+    def _serve_client(self, connection: Connection) -> None:
+        """Internal helper; not part of the public API."""
+        with connection:
+            while True:
+                try:
+                    method, kwargs = connection.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    if method == "ping":
+                        reply: tuple[str, Any] = ("ok", True)
+                    elif method == "path":
+                        reply = ("ok", str(self._store.path))
+                    else:
+                        reply = ("ok", self._store._call(method, **kwargs))
+                except Exception as exc:
+                    reply = ("error", exc)
+                try:
+                    connection.send(reply)
+                except (EOFError, OSError):
+                    return
+                except Exception as exc:
+                    connection.send(("error", RuntimeError(f"{exc}: {reply[1]!r}")))
+
+
+class RemoteExecutionWriteStore(_ForwardingWriteStore):
+    """Client for the local writer daemon; misuse breaks append-only guarantees."""
+
+    def __init__(self, address: Path, *, authkey: bytes | None = None) -> None:
+        """Internal helper; not part of the public API."""
+        self.address = address
+        self._connection = Client(
+            str(address),
+            family="AF_UNIX",
+            authkey=authkey if authkey is not None else load_store_authkey(address),
+        )
+        self._lock = threading.Lock()
+        # The daemon's database path, so resumes can open a read store on it.
+        self.path = Path(self._call("path"))
+
+    def ping(self) -> bool:
+        """Report whether the daemon answered."""
+        return bool(self._call("ping"))
+
+    def close(self) -> None:
+        """Close the client connection."""
+        with suppress(Exception):
+            self._connection.close()
+
+    def _call(self, method: str, **kwargs: Any) -> Any:
+        """Internal helper; not part of the public API."""
+        with self._lock:
+            self._connection.send((method, kwargs))
+            status, value = self._connection.recv()
+        if status == "error":
+            raise value
+        return value
+
+
+def ping_store_daemon(address: Path, *, authkey: bytes | None = None) -> bool:
+    """Probe the writer daemon; misuse breaks readiness reporting."""
+    try:
+        client = RemoteExecutionWriteStore(address, authkey=authkey)
+    except Exception:
+        return False
+    try:
+        return client.ping()
+    except Exception:
+        return False
+    finally:
+        client.close()
+
+
+__all__ = [
+    "ExecutionStoreServer",
+    "QueuedExecutionWriteStore",
+    "RemoteExecutionWriteStore",
+    "STORE_AUTHKEY_ENV",
+    "STORE_SOCKET_ENV",
+    "load_store_authkey",
+    "ping_store_daemon",
+    "store_authkey_from_env",
+    "store_authkey_path",
+]
@@ -6,18 +6,26 @@
 
 from __future__ import annotations
 
+from agentic_flows.runtime.orchestration.execute_batch import (
+    BatchRunSummary,
+    execute_flows,
+)
 from agentic_flows.runtime.orchestration.execute_flow import (
     FlowRunResult,
     RunMode,
     execute_flow,
+    execute_flow_async,
 )
 from agentic_flows.runtime.orchestration.flow_boundary import enforce_flow_boundary
 from agentic_flows.runtime.orchestration.planner import ExecutionPlanner
 
 __all__ = [
+    "BatchRunSummary",
     "ExecutionPlanner",
     "FlowRunResult",
     "RunMode",
     "enforce_flow_boundary",
     "execute_flow",
+    "execute_flow_async",
+    "execute_flows",
 ]
@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+import json
 from typing import Any
 
 from agentic_flows.runtime.observability.analysis.trace_diff import (
@@ -14,11 +15,13 @@ from agentic_flows.runtime.observability.analysis.trace_diff import (
 )
 from agentic_flows.runtime.observability.capture.environment import (
     compute_environment_fingerprint,
+    environment_snapshot,
 )
 from agentic_flows.runtime.observability.classification.fingerprint import (
     fingerprint_inputs,
     fingerprint_policy,
 )
+from agentic_flows.runtime.orchestration.plan_tree import diff_plan_trees
 from agentic_flows.spec.model.artifact.artifact import Artifact
 from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
 from agentic_flows.spec.model.execution.execution_steps import ExecutionSteps
@@ -47,7 +50,12 @@ def validate_determinism(
     if not environment_fingerprint:
         raise ValueError("environment_fingerprint is required before execution")
     if environment_fingerprint != current_fingerprint:
-        raise ValueError("environment_fingerprint mismatch")
+        current = json.dumps(
+            environment_snapshot(detailed=True), sort_keys=True, separators=(",", ":")
+        )
+        raise ValueError(
+            f"environment_fingerprint mismatch; current environment: {current}"
+        )
     if determinism_level in {DeterminismLevel.STRICT, DeterminismLevel.BOUNDED}:
         if seed is None:
             raise ValueError("deterministic seed is required for strict runs")
@@ -188,10 +196,15 @@ def replay_diff(
     """Input contract: trace and plan describe the same run boundary and are finalized for comparison; output guarantee: returns a diff map of all contract mismatches across plan, environment, dataset, artifact, evidence, and policy; failure semantics: raises ReplayDiffError when any mismatch is detected."""
     diffs: dict[str, object] = {}
     if trace.plan_hash != plan.plan_hash:
-        diffs["plan_hash"] = {
+        plan_drift: dict[str, object] = {
             "expected": plan.plan_hash,
             "observed": trace.plan_hash,
         }
+        # Both trees descend only where hashes differ, naming the edited
+        # sections and steps instead of a bare root mismatch.
+        if plan.plan_tree is not None and trace.plan_tree is not None:
+            plan_drift["changed"] = diff_plan_trees(plan.plan_tree, trace.plan_tree)
+        diffs["plan_hash"] = plan_drift
     if trace.determinism_level != plan.determinism_level:
         diffs["determinism_level"] = {
             "expected": plan.determinism_level,
@@ -0,0 +1,139 @@
+# INTERNAL — NOT A PUBLIC EXTENSION POINT
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Module definitions for runtime/orchestration/execute_batch.py."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+
+from agentic_flows.core.errors import classify_failure
+from agentic_flows.runtime.observability.storage.execution_store import (
+    DuckDBExecutionWriteStore,
+)
+from agentic_flows.runtime.orchestration.execute_flow import (
+    ExecutionConfig,
+    FlowRunResult,
+    execute_flow,
+)
+from agentic_flows.runtime.orchestration.planner import ExecutionPlanner
+from agentic_flows.spec.model.flow_manifest import FlowManifest
+from agentic_flows.spec.ontology.ids import FlowID, PlanHash, RunID, TenantID
+
+
+@dataclass(frozen=True)
+class BatchRunSummary:
+    """Outcome of one flow in a batch; misuse breaks batch accounting."""
+
+    index: int
+    flow_id: FlowID
+    tenant_id: TenantID
+    status: str
+    run_id: RunID | None = None
+    plan_hash: PlanHash | None = None
+    event_count: int = 0
+    failure_class: str | None = None
+    error: str | None = None
+
+
+def execute_flows(
+    manifests: Iterable[FlowManifest],
+    config: ExecutionConfig,
+    *,
+    max_workers: int = 4,
+    on_summary: Callable[[BatchRunSummary], None] | None = None,
+) -> list[BatchRunSummary]:
+    """Run many manifests in one process and report each run as it finishes.
+
+    - Every flow shares the config's store, the process environment
+      fingerprint and one planner, so its plan cache serves repeated manifests.
+    - A config without a determinism level runs each flow at its manifest's.
+    - A failing flow is summarized and does not stop the batch.
+    - on_summary is called from the calling thread in completion order; the
+      returned summaries are in manifest order.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if max_workers > 1 and isinstance(
+        config.execution_store, DuckDBExecutionWriteStore
+    ):
+        raise ValueError(
+            "concurrent batches need a store shared across threads, "
+            "such as QueuedExecutionWriteStore"
+        )
+    planner = ExecutionPlanner()
+    summaries: dict[int, BatchRunSummary] = {}
+    pending: dict[Future[BatchRunSummary], int] = {}
+
+    def collect(done: Iterable[Future[BatchRunSummary]]) -> None:
+        """Internal helper; not part of the public API."""
+        for future in done:
+            pending.pop(future)
+            summary = future.result()
+            summaries[summary.index] = summary
+            if on_summary is not None:
+                on_summary(summary)
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="agentic-flows-batch"
+    ) as pool:
+        for index, manifest in enumerate(manifests):
+            # Submission is bounded so very large batches are not held as
+            # futures all at once.
+            if len(pending) >= 2 * max_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            future = pool.submit(_run_one, index, manifest, config, planner)
+            pending[future] = index
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+    return [summaries[index] for index in sorted(summaries)]
+
+
+def _run_one(
+    index: int,
+    manifest: FlowManifest,
+    config: ExecutionConfig,
+    planner: ExecutionPlanner,
+) -> BatchRunSummary:
+    """Internal helper; not part of the public API."""
+    if config.determinism_level is None:
+        config = replace(config, determinism_level=manifest.determinism_level)
+    try:
+        result = execute_flow(resolved_flow=planner.resolve(manifest), config=config)
+    except Exception as exc:
+        try:
+            failure_class: str | None = classify_failure(exc).value
+        except KeyError:
+            failure_class = None
+        return BatchRunSummary(
+            index=index,
+            flow_id=manifest.flow_id,
+            tenant_id=manifest.tenant_id,
+            status="failed",
+            failure_class=failure_class,
+            error=str(exc),
+        )
+    return _summary(index, result)
+
+
+def _summary(index: int, result: FlowRunResult) -> BatchRunSummary:
+    """Internal helper; not part of the public API."""
+    plan = result.resolved_flow.plan
+    trace = result.trace
+    return BatchRunSummary(
+        index=index,
+        flow_id=plan.flow_id,
+        tenant_id=plan.tenant_id,
+        status="finalized" if trace is not None and trace.finalized else "planned",
+        run_id=result.run_id,
+        plan_hash=plan.plan_hash,
+        event_count=len(trace.events) if trace is not None else 0,
+    )
+
+
+__all__ = ["BatchRunSummary", "execute_flows"]
@@ -9,21 +9,33 @@ from __future__ import annotations
 
 from dataclasses import dataclass, replace
 import os
+import time
 
 from agentic_flows.core.authority import authority_token, enforce_runtime_semantics
 from agentic_flows.core.errors import ConfigurationError, NonDeterminismViolationError
 from agentic_flows.runtime.artifact_store import ArtifactStore, InMemoryArtifactStore
 from agentic_flows.runtime.budget import BudgetState, ExecutionBudget
+from agentic_flows.runtime.cancellation import CancellationToken
 from agentic_flows.runtime.context import ExecutionContext, RunMode
+from agentic_flows.runtime.execution.async_executors import (
+    DEFAULT_MAX_FLOWS,
+    SyncBackendAdapter,
+)
+from agentic_flows.runtime.execution.async_live_executor import AsyncLiveExecutor
 from agentic_flows.runtime.execution.dry_run_executor import DryRunExecutor
 from agentic_flows.runtime.execution.live_executor import LiveExecutor
 from agentic_flows.runtime.execution.observer_executor import ObserverExecutor
+from agentic_flows.runtime.execution.reasoning_cache import ReasoningCacheProtocol
+from agentic_flows.runtime.execution.retrieval_cache import RetrievalCacheProtocol
+from agentic_flows.runtime.execution.step_executor import ExecutionOutcome
+from agentic_flows.runtime.execution.step_reuse import StepOutputIndex
 from agentic_flows.runtime.observability.capture.hooks import RuntimeObserver
 from agentic_flows.runtime.observability.capture.observed_run import ObservedRun
 from agentic_flows.runtime.observability.capture.time import utc_now_deterministic
+from agentic_flows.runtime.observability.capture.timings import TimingRecorder
 from agentic_flows.runtime.observability.capture.trace_recorder import TraceRecorder
 from agentic_flows.runtime.observability.classification.fingerprint import (
-    fingerprint_inputs,
+    encode_canonical,
 )
 from agentic_flows.runtime.observability.storage.execution_store import (
     DuckDBExecutionReadStore,
@@ -33,6 +45,10 @@ from agentic_flows.runtime.observability.storage.execution_store_protocol import
     ExecutionReadStoreProtocol,
     ExecutionWriteStoreProtocol,
 )
+from agentic_flows.runtime.observability.storage.writer_service import (
+    QueuedExecutionWriteStore,
+    RemoteExecutionWriteStore,
+)
 from agentic_flows.runtime.orchestration.non_determinism_lifecycle import (
     NonDeterminismLifecycle,
 )
@@ -95,6 +111,12 @@ class ExecutionConfig:
     observers: tuple[RuntimeObserver, ...] | None = None
     resume_run_id: RunID | None = None
     strict_determinism: bool = False
+    max_parallel_steps: int = 1
+    cancellation: CancellationToken | None = None
+    retrieval_cache: RetrievalCacheProtocol | None = None
+    incremental: bool = False
+    reasoning_cache: ReasoningCacheProtocol | None = None
+    retrieval_lookahead: int = 0
 
     @classmethod
     def from_command(cls, command: str) -> ExecutionConfig:
@@ -121,6 +143,7 @@ class ResumeState:
     starting_evidence_index: int
     starting_tool_invocation_index: int
     starting_entropy_index: int
+    starting_timing_index: int
     events: tuple[ExecutionEvent, ...]
     artifacts: tuple[Artifact, ...]
     evidence: tuple[RetrievedEvidence, ...]
@@ -156,6 +179,8 @@ class FlowPreparation:
 
     def run(self) -> PreparedFlow:
         """Execute preparation and enforce its contract."""
+        # run_time_limit covers planning and store setup, not just the steps.
+        started = time.monotonic()
         execution_config = self._config
         manifest = self._manifest
         resolved_flow = self._resolved_flow
@@ -183,7 +208,7 @@ class FlowPreparation:
                 mode=execution_config.mode,
                 verification_policy=execution_config.verification_policy,
                 observers=execution_config.observers or (),
-                budget=BudgetState(execution_config.budget),
+                budget=BudgetState(execution_config.budget, run_started=started),
                 entropy=NonDeterminismLifecycle(
                     budget=resolved_flow.manifest.entropy_budget,
                     intents=resolved_flow.manifest.nondeterminism_intent,
@@ -226,7 +251,19 @@ class FlowPreparation:
             )
             _validate_non_determinism_policy(resolved_flow, execution_config)
 
-        strategy = LiveExecutor()
+        if execution_config.max_parallel_steps < 1:
+            raise ValueError("max_parallel_steps must be at least 1")
+        if execution_config.retrieval_lookahead < 0:
+            raise ValueError("retrieval_lookahead must not be negative")
+        if (
+            execution_config.incremental
+            and resolved_flow.manifest.determinism_level != DeterminismLevel.STRICT
+        ):
+            raise ValueError("incremental execution requires strict determinism")
+        strategy = LiveExecutor(
+            max_parallel_steps=execution_config.max_parallel_steps,
+            retrieval_lookahead=execution_config.retrieval_lookahead,
+        )
         if execution_config.mode == RunMode.DRY_RUN:
             strategy = DryRunExecutor()
         if execution_config.mode == RunMode.OBSERVE:
@@ -239,6 +276,7 @@ class FlowPreparation:
         starting_evidence_index = 0
         starting_tool_invocation_index = 0
         starting_entropy_index = 0
+        starting_timing_index = 0
         initial_claim_ids = ()
         initial_artifacts: list[Artifact] = []
         initial_evidence: list[RetrievedEvidence] = []
@@ -259,12 +297,19 @@ class FlowPreparation:
             starting_evidence_index = resume_state.starting_evidence_index
             starting_tool_invocation_index = resume_state.starting_tool_invocation_index
             starting_entropy_index = resume_state.starting_entropy_index
+            starting_timing_index = resume_state.starting_timing_index
             initial_claim_ids = resume_state.claim_ids
             initial_artifacts = list(resume_state.artifacts)
             initial_evidence = list(resume_state.evidence)
             initial_tool_invocations = list(resume_state.tool_invocations)
             trace_recorder = TraceRecorder(resume_state.events)
             lifecycle.seed(resume_state.entropy_usage)
+        step_outputs = None
+        if execution_config.incremental:
+            step_outputs = StepOutputIndex(
+                _resolve_read_store(execution_config),
+                tenant_id=resolved_flow.manifest.tenant_id,
+            )
         if run_id is None:
             execution_config.execution_store.register_dataset(
                 resolved_flow.plan.dataset
@@ -296,6 +341,7 @@ class FlowPreparation:
                     else None
                 ),
             }
+            payload_json, payload_hash, payload_key = encode_canonical(payload)
             warning_event = ExecutionEvent(
                 spec_version="v1",
                 event_index=starting_event_index,
@@ -304,7 +350,9 @@ class FlowPreparation:
                 causality_tag=CausalityTag.ENVIRONMENT,
                 timestamp_utc=utc_now_deterministic(starting_event_index),
                 payload=payload,
-                payload_hash=fingerprint_inputs(payload),
+                payload_hash=payload_hash,
+                payload_json=payload_json,
+                payload_key=payload_key,
             )
             trace_recorder.record(warning_event, authority_token())
             if execution_config.execution_store is not None and run_id is not None:
@@ -327,7 +375,14 @@ class FlowPreparation:
             mode=execution_config.mode,
             verification_policy=execution_config.verification_policy,
             observers=execution_config.observers or (),
-            budget=BudgetState(execution_config.budget),
+            budget=BudgetState(
+                execution_config.budget,
+                run_started=started,
+                # Step workers and retrieval lookahead each hold at most one
+                # backend call at a time.
+                max_parallel_calls=execution_config.max_parallel_steps
+                + execution_config.retrieval_lookahead,
+            ),
             entropy=lifecycle,
             execution_store=execution_config.execution_store,
             run_id=run_id,
@@ -344,6 +399,11 @@ class FlowPreparation:
             _step_artifacts={},
             observed_run=execution_config.observed_run,
             strict_determinism=execution_config.strict_determinism,
+            cancellation=execution_config.cancellation or CancellationToken(),
+            retrieval_cache=execution_config.retrieval_cache,
+            step_outputs=step_outputs,
+            reasoning_cache=execution_config.reasoning_cache,
+            timings=TimingRecorder(starting_index=starting_timing_index),
         )
         return PreparedFlow(
             resolved_flow=resolved_flow,
@@ -365,6 +425,23 @@ class FlowExecution:
         outcome = self._prepared.strategy.execute(
             self._prepared.resolved_flow, self._prepared.context
         )
+        return self._result(outcome)
+
+    async def run_async(
+        self, *, adapter: SyncBackendAdapter | None = None
+    ) -> FlowRunResult:
+        """Execute execution on the running event loop and enforce its contract."""
+        strategy = self._prepared.strategy
+        if not isinstance(strategy, LiveExecutor):
+            return await (adapter or SyncBackendAdapter.shared()).run_blocking(self.run)
+        outcome = await AsyncLiveExecutor(
+            max_parallel_steps=self._prepared.config.max_parallel_steps,
+            adapter=adapter,
+        ).execute(self._prepared.resolved_flow, self._prepared.context)
+        return self._result(outcome)
+
+    def _result(self, outcome: ExecutionOutcome) -> FlowRunResult:
+        """Internal helper; not part of the public API."""
         return FlowRunResult(
             resolved_flow=self._prepared.resolved_flow,
             trace=outcome.trace,
@@ -388,7 +465,9 @@ class FlowFinalization:
         enforce_runtime_semantics(result, mode=self._prepared.config.mode.value)
         if self._prepared.config.mode == RunMode.PLAN:
             return result
-        return _persist_run(result, self._prepared.config)
+        return _persist_run(
+            result, self._prepared.config, timings=self._prepared.context.timings
+        )
 
 
 def execute_flow(
@@ -428,6 +507,59 @@ def execute_flow(
     return finalization.run(result)
 
 
+async def execute_flow_async(
+    manifest: FlowManifest | None = None,
+    *,
+    resolved_flow: ExecutionPlan | None = None,
+    config: ExecutionConfig | None = None,
+    adapter: SyncBackendAdapter | None = None,
+    max_flows: int | None = None,
+) -> FlowRunResult:
+    """Asyncio counterpart of execute_flow.
+
+    - Live and unsafe runs await agent, retrieval and reasoning backends on the
+      running loop; blocking backends run on the adapter's bounded pool.
+    - Preparation, the step loop, other strategies and finalization touch the
+      store synchronously and run on the adapter's flow pool. A flow holds one
+      flow worker for its whole step loop, so at most ``max_flows`` flows per
+      adapter progress at once and later flows wait for a free worker.
+    - Without an adapter, flows run on a process-wide adapter shared by every
+      call with the same ``max_flows`` (default 32); pass a larger value for
+      more concurrent flows, or pass an adapter, not both.
+    - Traces are identical to execute_flow for the same plan and backends.
+    - Flows sharing a loop write from several threads, so they need a store
+      such as QueuedExecutionWriteStore.
+    """
+    execution_config = config or ExecutionConfig(
+        mode=RunMode.LIVE,
+        determinism_level=None,
+    )
+    if adapter is not None and max_flows is not None:
+        raise ValueError("pass either adapter or max_flows, not both")
+    workers = adapter or SyncBackendAdapter.shared(
+        max_flows=max_flows if max_flows is not None else DEFAULT_MAX_FLOWS
+    )
+    preparation = FlowPreparation(
+        manifest=manifest, resolved_flow=resolved_flow, config=execution_config
+    )
+    prepared = await workers.run_blocking(preparation.run)
+    if prepared.config.mode == RunMode.PLAN:
+        return FlowRunResult(
+            resolved_flow=prepared.resolved_flow,
+            trace=None,
+            artifacts=[],
+            evidence=[],
+            reasoning_bundles=[],
+            verification_results=[],
+            verification_arbitrations=[],
+            run_id=None,
+        )
+    execution = FlowExecution(prepared=prepared)
+    result = await execution.run_async(adapter=workers)
+    finalization = FlowFinalization(prepared=prepared)
+    return await workers.run_blocking(finalization.run, result)
+
+
 def _derive_seed_token(plan: ExecutionSteps) -> str | None:
     """Internal helper; not part of the public API."""
     if not plan.steps:
@@ -520,7 +652,12 @@ def _validate_non_determinism_policy(
         )
 
 
-def _persist_run(result: FlowRunResult, config: ExecutionConfig) -> FlowRunResult:
+def _persist_run(
+    result: FlowRunResult,
+    config: ExecutionConfig,
+    *,
+    timings: TimingRecorder | None = None,
+) -> FlowRunResult:
     """Internal helper; not part of the public API."""
     store = config.execution_store
     if store is None:
@@ -558,6 +695,17 @@ def _persist_run(result: FlowRunResult, config: ExecutionConfig) -> FlowRunResul
                 tenant_id=plan.tenant_id,
                 claim_ids=result.trace.claim_ids,
             )
+        if timings is not None:
+            # Samples recorded after the last checkpoint; the table sits
+            # beside the trace, so none of it reaches a hash or a diff.
+            starting_index, pending = timings.drain()
+            if pending:
+                store.save_timings(
+                    run_id=run_id,
+                    tenant_id=plan.tenant_id,
+                    timings=pending,
+                    starting_index=starting_index,
+                )
         store.finalize_run(run_id=run_id, trace=result.trace)
     return FlowRunResult(
         resolved_flow=result.resolved_flow,
@@ -575,9 +723,15 @@ def _resolve_read_store(config: ExecutionConfig) -> ExecutionReadStoreProtocol:
     """Internal helper; not part of the public API."""
     if config.execution_read_store is not None:
         return config.execution_read_store
-    if isinstance(config.execution_store, DuckDBExecutionWriteStore):
+    # A daemon's process holds the file, so its writer serves these reads.
+    if isinstance(
+        config.execution_store,
+        DuckDBExecutionWriteStore
+        | QueuedExecutionWriteStore
+        | RemoteExecutionWriteStore,
+    ):
         return DuckDBExecutionReadStore(config.execution_store.path)
-    raise ValueError("execution_read_store is required for resume")
+    raise ValueError("execution_read_store is required for resume or incremental runs")
 
 
 def _load_resume_state(
@@ -587,13 +741,15 @@ def _load_resume_state(
     tenant_id: TenantID,
 ) -> ResumeState:
     """Internal helper; not part of the public API."""
-    events = store.load_events(run_id, tenant_id=tenant_id)
-    artifacts = store.load_artifacts(run_id, tenant_id=tenant_id)
-    evidence = store.load_evidence(run_id, tenant_id=tenant_id)
-    tool_invocations = store.load_tool_invocations(run_id, tenant_id=tenant_id)
-    entropy_usage = store.load_entropy_usage(run_id, tenant_id=tenant_id)
-    claim_ids = store.load_claim_ids(run_id, tenant_id=tenant_id)
-    checkpoint = store.load_checkpoint(run_id, tenant_id=tenant_id)
+    with store.session():
+        events = store.load_events(run_id, tenant_id=tenant_id)
+        artifacts = store.load_artifacts(run_id, tenant_id=tenant_id)
+        evidence = store.load_evidence(run_id, tenant_id=tenant_id)
+        tool_invocations = store.load_tool_invocations(run_id, tenant_id=tenant_id)
+        entropy_usage = store.load_entropy_usage(run_id, tenant_id=tenant_id)
+        claim_ids = store.load_claim_ids(run_id, tenant_id=tenant_id)
+        checkpoint = store.load_checkpoint(run_id, tenant_id=tenant_id)
+        timings = store.load_timings(run_id, tenant_id=tenant_id)
     resume_from_step_index = -1
     starting_event_index = 0
     if events:
@@ -615,6 +771,7 @@ def _load_resume_state(
         starting_evidence_index=len(evidence),
         starting_tool_invocation_index=len(tool_invocations),
         starting_entropy_index=len(entropy_usage),
+        starting_timing_index=len(timings),
         events=events,
         artifacts=artifacts,
         evidence=evidence,
@@ -624,4 +781,10 @@ def _load_resume_state(
     )
 
 
-__all__ = ["ExecutionConfig", "FlowRunResult", "RunMode", "execute_flow"]
+__all__ = [
+    "ExecutionConfig",
+    "FlowRunResult",
+    "RunMode",
+    "execute_flow",
+    "execute_flow_async",
+]
@@ -0,0 +1,210 @@
+# INTERNAL — NOT A PUBLIC EXTENSION POINT
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Module definitions for runtime/orchestration/plan_cache.py."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import asdict, fields, is_dataclass
+from enum import Enum
+from functools import cache
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin, get_type_hints
+
+from agentic_flows.spec.model.execution.execution_plan import ExecutionPlan
+from agentic_flows.spec.model.flow_manifest import FlowManifest
+
+PLAN_CACHE_DIR_ENV = "AGENTIC_FLOWS_PLAN_CACHE_DIR"
+
+# Bump when the on-disk ExecutionPlan layout changes so stale files are ignored.
+_DISK_FORMAT = 4
+
+
+def manifest_fingerprint(manifest: FlowManifest) -> str:
+    """Fingerprint every manifest field, order included; misuse breaks plan reuse."""
+    payload = json.dumps(
+        asdict(manifest), sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PlanCache:
+    """Resolved plans keyed by manifest and resolution scope; misuse serves stale plans."""
+
+    def __init__(self, *, max_entries: int = 512) -> None:
+        """Internal helper; not part of the public API."""
+        self._max_entries = max_entries
+        self._entries: OrderedDict[
+            tuple[FlowManifest, tuple[str, ...]], ExecutionPlan
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        manifest: FlowManifest,
+        scope: tuple[str, ...],
+        *,
+        cache_dir: Path | None = None,
+    ) -> ExecutionPlan | None:
+        """Return the cached plan, promoting on-disk hits into memory."""
+        # Frozen manifests hash by value, so memory hits skip fingerprinting.
+        key = (manifest, scope)
+        with self._lock:
+            try:
+                plan = self._entries.get(key)
+            except TypeError:
+                # Manifests built with list fields are unhashable; never cached.
+                return None
+            if plan is not None:
+                self._entries.move_to_end(key)
+                return plan
+        if cache_dir is None:
+            return None
+        plan = _read_plan(cache_dir, manifest, scope)
+        if plan is not None:
+            self._remember(key, plan)
+        return plan
+
+    def put(
+        self,
+        manifest: FlowManifest,
+        scope: tuple[str, ...],
+        plan: ExecutionPlan,
+        *,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """Store a resolved plan in memory and, when configured, on disk."""
+        if not self._remember((manifest, scope), plan):
+            return
+        if cache_dir is not None:
+            _write_plan(cache_dir, manifest, scope, plan)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry; on-disk entries are left in place."""
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(
+        self, key: tuple[FlowManifest, tuple[str, ...]], plan: ExecutionPlan
+    ) -> bool:
+        """Internal helper; not part of the public API."""
+        with self._lock:
+            try:
+                self._entries[key] = plan
+            except TypeError:
+                return False
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+
+def plan_cache_dir_from_env() -> Path | None:
+    """Read the on-disk plan cache directory from the environment."""
+    value = os.environ.get(PLAN_CACHE_DIR_ENV)
+    return Path(value) if value else None
+
+
+def _plan_key(manifest: FlowManifest, scope: tuple[str, ...]) -> str:
+    """Internal helper; not part of the public API."""
+    key = (str(_DISK_FORMAT), manifest_fingerprint(manifest), *scope)
+    return hashlib.sha256("\0".join(key).encode("utf-8")).hexdigest()
+
+
+def _read_plan(
+    cache_dir: Path, manifest: FlowManifest, scope: tuple[str, ...]
+) -> ExecutionPlan | None:
+    """Internal helper; not part of the public API."""
+    key = _plan_key(manifest, scope)
+    try:
+        payload = json.loads((cache_dir / f"{key}.json").read_text(encoding="utf-8"))
+        if payload["format"] != _DISK_FORMAT or payload["key"] != key:
+            return None
+        plan = _decode(ExecutionPlan, payload["plan"])
+    except Exception:
+        # A missing, truncated, or outdated file is a miss; the plan is rebuilt.
+        return None
+    # Files are plain data, so a file copied under another name can at most
+    # claim the wrong manifest; such a plan is never served.
+    return plan if plan.manifest == manifest else None
+
+
+def _write_plan(
+    cache_dir: Path,
+    manifest: FlowManifest,
+    scope: tuple[str, ...],
+    plan: ExecutionPlan,
+) -> None:
+    """Internal helper; not part of the public API."""
+    key = _plan_key(manifest, scope)
+    path = cache_dir / f"{key}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    staging.write_text(
+        json.dumps(
+            {"format": _DISK_FORMAT, "key": key, "plan": asdict(plan)},
+            sort_keys=True,
+        ),
+        encoding="utf-8",
+    )
+    os.replace(staging, path)
+
+
+def _decode(hint: Any, value: Any) -> Any:
+    """Internal helper; not part of the public API."""
+    # Plans are frozen dataclasses of enums, str ids, scalars, and tuples, so
+    # their annotations are enough to rebuild them from asdict output.
+    origin = get_origin(hint)
+    if origin is UnionType or origin is Union:
+        options = [item for item in get_args(hint) if item is not NoneType]
+        if value is None and len(options) < len(get_args(hint)):
+            return None
+        if len(options) != 1:
+            raise TypeError(f"ambiguous plan field type {hint!r}")
+        return _decode(options[0], value)
+    if origin is tuple:
+        args = get_args(hint)
+        if len(args) == 2 and args[1] is Ellipsis:
+            return tuple(_decode(args[0], item) for item in value)
+        return tuple(_decode(arg, item) for arg, item in zip(args, value, strict=True))
+    if is_dataclass(hint) and isinstance(hint, type):
+        hints = _field_hints(hint)
+        return hint(
+            **{
+                item.name: _decode(hints[item.name], value[item.name])
+                for item in fields(hint)
+                if item.init
+            }
+        )
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return hint(value)
+    if hint is bool or hint is int:
+        if type(value) is not hint:
+            raise TypeError(f"expected {hint.__name__}, got {value!r}")
+        return value
+    if hint is float and isinstance(value, int | float) and type(value) is not bool:
+        return float(value)
+    if isinstance(hint, type) and issubclass(hint, str) and isinstance(value, str):
+        return hint(value)
+    raise TypeError(f"cannot decode {value!r} as {hint!r}")
+
+
+@cache
+def _field_hints(cls: type) -> dict[str, Any]:
+    """Internal helper; not part of the public API."""
+    return get_type_hints(cls)
+
+
+__all__ = [
+    "PLAN_CACHE_DIR_ENV",
+    "PlanCache",
+    "manifest_fingerprint",
+    "plan_cache_dir_from_env",
+]
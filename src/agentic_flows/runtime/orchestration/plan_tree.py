@@ -0,0 +1,222 @@
+# INTERNAL — NOT A PUBLIC EXTENSION POINT
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Module definitions for runtime/orchestration/plan_tree.py."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+import hashlib
+from typing import Any
+
+from agentic_flows.runtime.observability.classification.fingerprint import (
+    fingerprint_inputs,
+)
+from agentic_flows.spec.model.execution.plan_tree import PlanTree
+from agentic_flows.spec.model.execution.resolved_step import ResolvedStep
+from agentic_flows.spec.ontology.ids import PlanHash
+
+_EMPTY_STEPS = hashlib.sha256(b"").hexdigest()
+# Leaves and internal nodes hash under distinct prefixes, so no leaf can be
+# presented as a subtree root and no subtree as a leaf.
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def build_plan_tree(
+    sections: Mapping[str, Mapping[str, Any]],
+    steps: Sequence[ResolvedStep],
+    *,
+    previous: tuple[Sequence[ResolvedStep], PlanTree] | None = None,
+) -> PlanTree:
+    """Hash a plan as a Merkle tree, reusing unchanged nodes of a previous plan."""
+    reusable: dict[str, tuple[ResolvedStep, str]] = {}
+    previous_levels: tuple[tuple[str, ...], ...] = ()
+    if previous is not None:
+        previous_steps, previous_tree = previous
+        reusable = {
+            str(step.agent_id): (step, leaf)
+            for step, leaf in zip(previous_steps, _leaves(previous_tree), strict=True)
+        }
+        previous_levels = previous_tree.step_levels
+    leaves = []
+    for step in steps:
+        known = reusable.get(str(step.agent_id))
+        if known is not None and _leaf_fields(known[0]) == _leaf_fields(step):
+            leaves.append(known[1])
+        else:
+            leaves.append(step_leaf_hash(step))
+    step_levels = _step_levels(tuple(leaves), previous_levels)
+    section_hashes = tuple(
+        (name, fingerprint_inputs(dict(payload))) for name, payload in sections.items()
+    )
+    return PlanTree(
+        root=plan_root(section_hashes, step_levels),
+        sections=section_hashes,
+        step_ids=tuple(step.agent_id for step in steps),
+        step_levels=step_levels,
+    )
+
+
+def step_leaf_hash(step: ResolvedStep) -> str:
+    """Hash one resolved step; its position is carried by the tree, not the leaf."""
+    budget = step.declared_entropy_budget
+    fields = fingerprint_inputs(
+        {
+            "agent_id": step.agent_id,
+            "inputs_fingerprint": step.inputs_fingerprint,
+            "declared_dependencies": list(step.declared_dependencies),
+            "step_type": step.step_type,
+            "determinism_level": step.determinism_level,
+            "declared_entropy_budget": (
+                {
+                    "allowed_sources": list(budget.allowed_sources),
+                    "min_magnitude": budget.min_magnitude,
+                    "max_magnitude": budget.max_magnitude,
+                    "exhaustion_action": budget.exhaustion_action,
+                    "per_source": [
+                        {
+                            "source": entry.source,
+                            "min_magnitude": entry.min_magnitude,
+                            "max_magnitude": entry.max_magnitude,
+                            "exhaustion_action": entry.exhaustion_action,
+                        }
+                        for entry in budget.per_source
+                    ],
+                }
+                if budget
+                else None
+            ),
+            "allowed_variance_class": step.allowed_variance_class,
+            "nondeterminism_intent": [
+                {
+                    "source": intent.source,
+                    "min_entropy_magnitude": intent.min_entropy_magnitude,
+                    "max_entropy_magnitude": intent.max_entropy_magnitude,
+                    "justification": intent.justification,
+                }
+                for intent in step.nondeterminism_intent
+            ],
+        }
+    )
+    return hashlib.sha256(_LEAF_PREFIX + fields.encode("ascii")).hexdigest()
+
+
+def plan_root(
+    sections: tuple[tuple[str, str], ...],
+    step_levels: tuple[tuple[str, ...], ...],
+) -> PlanHash:
+    """Combine section hashes and the steps root into the plan hash."""
+    steps_root = step_levels[-1][0] if step_levels else _EMPTY_STEPS
+    return PlanHash(
+        fingerprint_inputs({"sections": dict(sections), "steps": steps_root})
+    )
+
+
+def diff_plan_trees(expected: PlanTree, observed: PlanTree) -> dict[str, list[str]]:
+    """Name the sections and steps whose hashes differ between two plan trees."""
+    sections = sorted(
+        name
+        for name in dict(expected.sections).keys() | dict(observed.sections).keys()
+        if dict(expected.sections).get(name) != dict(observed.sections).get(name)
+    )
+    if expected.step_ids != observed.step_ids:
+        return {"sections": sections, "steps": _diff_by_agent(expected, observed)}
+    # Same steps in the same order give both trees the same shape, so only
+    # subtrees whose hashes differ are descended.
+    changed: list[int] = []
+    pending = [(len(expected.step_levels) - 1, 0)] if expected.step_levels else []
+    while pending:
+        level, position = pending.pop()
+        if (
+            expected.step_levels[level][position]
+            == observed.step_levels[level][position]
+        ):
+            continue
+        if level == 0:
+            changed.append(position)
+            continue
+        below = len(expected.step_levels[level - 1])
+        pending.extend(
+            (level - 1, child)
+            for child in (2 * position + 1, 2 * position)
+            if child < below
+        )
+    return {
+        "sections": sections,
+        "steps": [str(expected.step_ids[position]) for position in sorted(changed)],
+    }
+
+
+def _diff_by_agent(expected: PlanTree, observed: PlanTree) -> list[str]:
+    """Internal helper; not part of the public API."""
+    expected_leaves = dict(zip(expected.step_ids, _leaves(expected), strict=True))
+    observed_leaves = dict(zip(observed.step_ids, _leaves(observed), strict=True))
+    ordered = list(expected.step_ids) + [
+        agent_id for agent_id in observed.step_ids if agent_id not in expected_leaves
+    ]
+    return [
+        str(agent_id)
+        for agent_id in ordered
+        if expected_leaves.get(agent_id) != observed_leaves.get(agent_id)
+    ]
+
+
+def _leaves(tree: PlanTree) -> tuple[str, ...]:
+    """Internal helper; not part of the public API."""
+    return tree.step_levels[0] if tree.step_levels else ()
+
+
+def _leaf_fields(step: ResolvedStep) -> tuple[object, ...]:
+    """Internal helper; not part of the public API."""
+    return (
+        step.agent_id,
+        step.inputs_fingerprint,
+        step.declared_dependencies,
+        step.step_type,
+        step.determinism_level,
+        step.declared_entropy_budget,
+        step.allowed_variance_class,
+        step.nondeterminism_intent,
+    )
+
+
+def _step_levels(
+    leaves: tuple[str, ...], previous: tuple[tuple[str, ...], ...]
+) -> tuple[tuple[str, ...], ...]:
+    """Internal helper; not part of the public API."""
+    if not leaves:
+        return ()
+    levels = [leaves]
+    depth = 0
+    while len(levels[-1]) > 1:
+        below = levels[-1]
+        earlier_below = previous[depth] if depth < len(previous) else ()
+        earlier = previous[depth + 1] if depth + 1 < len(previous) else ()
+        parents = []
+        for start in range(0, len(below), 2):
+            pair = below[start : start + 2]
+            parent = start // 2
+            if parent < len(earlier) and earlier_below[start : start + 2] == pair:
+                parents.append(earlier[parent])
+            elif len(pair) == 1:
+                # An unpaired node is promoted unchanged to the next level.
+                parents.append(pair[0])
+            else:
+                parents.append(
+                    hashlib.sha256(
+                        _NODE_PREFIX + "".join(pair).encode("ascii")
+                    ).hexdigest()
+                )
+        levels.append(tuple(parents))
+        depth += 1
+    return tuple(levels)
+
+
+__all__ = [
+    "build_plan_tree",
+    "diff_plan_trees",
+    "plan_root",
+    "step_leaf_hash",
+]
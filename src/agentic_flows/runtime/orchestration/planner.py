@@ -6,7 +6,12 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+import heapq
 from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+import threading
+from typing import ClassVar
 
 try:
     bijux_agent_version = version("bijux-agent")
@@ -24,6 +29,11 @@ from agentic_flows.runtime.observability.capture.environment import (
 from agentic_flows.runtime.observability.classification.fingerprint import (
     fingerprint_inputs,
 )
+from agentic_flows.runtime.orchestration.plan_cache import (
+    PlanCache,
+    plan_cache_dir_from_env,
+)
+from agentic_flows.runtime.orchestration.plan_tree import build_plan_tree
 from agentic_flows.spec.contracts.execution_plan_contract import (
     validate as validate_execution_plan,
 )
@@ -32,6 +42,7 @@ from agentic_flows.spec.contracts.flow_contract import (
 )
 from agentic_flows.spec.model.execution.execution_plan import ExecutionPlan
 from agentic_flows.spec.model.execution.execution_steps import ExecutionSteps
+from agentic_flows.spec.model.execution.plan_tree import PlanTree
 from agentic_flows.spec.model.execution.resolved_step import ResolvedStep
 from agentic_flows.spec.model.flow_manifest import FlowManifest
 from agentic_flows.spec.model.identifiers.agent_invocation import AgentInvocation
@@ -41,7 +52,6 @@ from agentic_flows.spec.ontology.ids import (
     EnvironmentFingerprint,
     FlowID,
     InputsFingerprint,
-    PlanHash,
     ResolverID,
     VersionID,
 )
@@ -53,12 +63,46 @@ class ExecutionPlanner:
     resolver_id: ResolverID = ResolverID("agentic-flows:v0")
     _bijux_cli_version: str = bijux_cli_version
     _bijux_agent_version: str = bijux_agent_version
+    # Shared by every planner in the process; resolution is a pure function of
+    # the cache key, so a hit skips validation and planning entirely.
+    _plan_cache: ClassVar[PlanCache] = PlanCache()
+    # Latest plan per recently planned flow, least recently used evicted first;
+    # re-planning an edited flow rehashes only the steps and tree nodes that
+    # changed since.
+    _previous_trees: ClassVar[
+        OrderedDict[tuple[str, str], tuple[tuple[ResolvedStep, ...], PlanTree]]
+    ] = OrderedDict()
+    _max_previous_trees: ClassVar[int] = 512
+    _previous_trees_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, *, cache_dir: Path | None = None) -> None:
+        """Internal helper; not part of the public API."""
+        self._cache_dir = (
+            cache_dir if cache_dir is not None else plan_cache_dir_from_env()
+        )
 
     def resolve(self, manifest: FlowManifest) -> ExecutionPlan:
         """Execute resolve and enforce its contract."""
+        scope = (
+            compute_environment_fingerprint(),
+            self.resolver_id,
+            self._bijux_agent_version,
+            self._bijux_cli_version,
+        )
+        cached = self._plan_cache.get(manifest, scope, cache_dir=self._cache_dir)
+        if cached is not None:
+            return cached
+        resolved = self._resolve(manifest)
+        self._plan_cache.put(manifest, scope, resolved, cache_dir=self._cache_dir)
+        return resolved
+
+    def _resolve(self, manifest: FlowManifest) -> ExecutionPlan:
+        """Internal helper; not part of the public API."""
         validate_flow_manifest(manifest)
-        ordered_agents = self._toposort_agents(manifest)
         dependencies = self._parse_dependencies(manifest)
+        ordered_agents = self._toposort_agents(manifest, dependencies)
+        retrieval_contracts = list(manifest.retrieval_contracts)
+        verification_gates = list(manifest.verification_gates)
         steps = []
         for index, agent_id in enumerate(ordered_agents):
             declared = sorted(dependencies.get(agent_id, []))
@@ -67,8 +111,8 @@ class ExecutionPlanner:
                     {
                         "agent_id": agent_id,
                         "declared_dependencies": declared,
-                        "retrieval_contracts": list(manifest.retrieval_contracts),
-                        "verification_gates": list(manifest.verification_gates),
+                        "retrieval_contracts": retrieval_contracts,
+                        "verification_gates": verification_gates,
                     }
                 )
             )
@@ -96,7 +140,7 @@ class ExecutionPlanner:
                     nondeterminism_intent=manifest.nondeterminism_intent,
                 )
             )
-        plan_hash = self._plan_hash(manifest, steps, dependencies)
+        plan_tree = self._plan_tree(manifest, steps)
         plan = ExecutionSteps(
             spec_version="v1",
             flow_id=FlowID(manifest.flow_id),
@@ -115,11 +159,12 @@ class ExecutionPlanner:
             environment_fingerprint=EnvironmentFingerprint(
                 compute_environment_fingerprint()
             ),
-            plan_hash=plan_hash,
+            plan_hash=plan_tree.root,
             resolution_metadata=(
                 ("resolver_id", self.resolver_id),
                 ("bijux_cli_version", self._bijux_cli_version),
             ),
+            plan_tree=plan_tree,
         )
         resolved = ExecutionPlan(
             spec_version="v1",
@@ -129,28 +174,35 @@ class ExecutionPlanner:
         validate_execution_plan(resolved)
         return resolved
 
-    def _toposort_agents(self, manifest: FlowManifest) -> list[str]:
+    def _toposort_agents(
+        self,
+        manifest: FlowManifest,
+        dependencies: dict[str, list[str]] | None = None,
+    ) -> list[str]:
         """Deterministic topological sort using lexical tie-breaking for stability."""
-        dependencies = self._parse_dependencies(manifest)
+        if dependencies is None:
+            dependencies = self._parse_dependencies(manifest)
         agents = set(manifest.agents)
         indegree = dict.fromkeys(agents, 0)
-        forward = {agent: [] for agent in agents}
+        forward: dict[str, list[str]] = {agent: [] for agent in agents}
 
         for agent, deps in dependencies.items():
             for dep in deps:
                 forward[dep].append(agent)
                 indegree[agent] += 1
 
-        ready = sorted([agent for agent, degree in indegree.items() if degree == 0])
+        # Popping the heap minimum yields the lexically smallest ready agent,
+        # exactly as a re-sorted ready list would, in O(log n) per agent.
+        ready = [agent for agent, degree in indegree.items() if degree == 0]
+        heapq.heapify(ready)
         ordered = []
         while ready:
-            current = ready.pop(0)
+            current = heapq.heappop(ready)
             ordered.append(current)
-            for downstream in sorted(forward[current]):
+            for downstream in forward[current]:
                 indegree[downstream] -= 1
                 if indegree[downstream] == 0:
-                    ready.append(downstream)
-                    ready.sort()
+                    heapq.heappush(ready, downstream)
 
         if len(ordered) != len(agents):
             raise ValueError("dependencies contain a cycle or reference unknown agents")
@@ -161,29 +213,34 @@ class ExecutionPlanner:
         agents = set(manifest.agents)
         mapping: dict[str, list[str]] = {agent: [] for agent in agents}
         for entry in manifest.dependencies:
-            parts = [part.strip() for part in entry.split(":")]
-            if len(parts) != 2 or not all(parts):
+            agent_id, separator, dependency_id = entry.partition(":")
+            agent_id = agent_id.strip()
+            dependency_id = dependency_id.strip()
+            if (
+                not separator
+                or ":" in dependency_id
+                or not agent_id
+                or not dependency_id
+            ):
                 raise ValueError("dependencies must use 'agent:dependency' format")
-            agent_id, dependency_id = parts
             if agent_id not in agents or dependency_id not in agents:
                 raise ValueError("dependencies must reference known agents")
             mapping[agent_id].append(dependency_id)
         return mapping
 
-    def _plan_hash(
-        self,
-        manifest: FlowManifest,
-        steps: list[ResolvedStep],
-        dependencies: dict[str, list[str]],
-    ) -> PlanHash:
+    def _plan_tree(self, manifest: FlowManifest, steps: list[ResolvedStep]) -> PlanTree:
         """Internal helper; not part of the public API."""
-        payload = {
-            "flow_id": manifest.flow_id,
-            "tenant_id": manifest.tenant_id,
-            "flow_state": manifest.flow_state,
-            "determinism_level": manifest.determinism_level,
-            "replay_mode": manifest.replay_mode,
-            "replay_acceptability": manifest.replay_acceptability,
+        sections = {
+            "flow": {
+                "flow_id": manifest.flow_id,
+                "tenant_id": manifest.tenant_id,
+                "flow_state": manifest.flow_state,
+                "determinism_level": manifest.determinism_level,
+                "replay_mode": manifest.replay_mode,
+                "replay_acceptability": manifest.replay_acceptability,
+                "allowed_variance_class": manifest.allowed_variance_class,
+                "allow_deprecated_datasets": manifest.allow_deprecated_datasets,
+            },
             "entropy_budget": {
                 "allowed_sources": list(manifest.entropy_budget.allowed_sources),
                 "min_magnitude": manifest.entropy_budget.min_magnitude,
@@ -199,16 +256,17 @@ class ExecutionPlanner:
                     for entry in manifest.entropy_budget.per_source
                 ],
             },
-            "allowed_variance_class": manifest.allowed_variance_class,
-            "nondeterminism_intent": [
-                {
-                    "source": intent.source,
-                    "min_entropy_magnitude": intent.min_entropy_magnitude,
-                    "max_entropy_magnitude": intent.max_entropy_magnitude,
-                    "justification": intent.justification,
-                }
-                for intent in manifest.nondeterminism_intent
-            ],
+            "nondeterminism_intent": {
+                "intents": [
+                    {
+                        "source": intent.source,
+                        "min_entropy_magnitude": intent.min_entropy_magnitude,
+                        "max_entropy_magnitude": intent.max_entropy_magnitude,
+                        "justification": intent.justification,
+                    }
+                    for intent in manifest.nondeterminism_intent
+                ],
+            },
             "replay_envelope": {
                 "min_claim_overlap": manifest.replay_envelope.min_claim_overlap,
                 "max_contradiction_delta": (
@@ -222,51 +280,14 @@ class ExecutionPlanner:
                 "dataset_hash": manifest.dataset.dataset_hash,
                 "dataset_state": manifest.dataset.dataset_state,
             },
-            "allow_deprecated_datasets": manifest.allow_deprecated_datasets,
-            "steps": [
-                {
-                    "index": step.step_index,
-                    "agent_id": step.agent_id,
-                    "inputs_fingerprint": step.inputs_fingerprint,
-                    "declared_dependencies": list(step.declared_dependencies),
-                    "step_type": step.step_type,
-                    "determinism_level": step.determinism_level,
-                    "declared_entropy_budget": (
-                        {
-                            "allowed_sources": list(
-                                step.declared_entropy_budget.allowed_sources
-                            ),
-                            "min_magnitude": step.declared_entropy_budget.min_magnitude,
-                            "max_magnitude": step.declared_entropy_budget.max_magnitude,
-                            "exhaustion_action": step.declared_entropy_budget.exhaustion_action,
-                            "per_source": [
-                                {
-                                    "source": entry.source,
-                                    "min_magnitude": entry.min_magnitude,
-                                    "max_magnitude": entry.max_magnitude,
-                                    "exhaustion_action": entry.exhaustion_action,
-                                }
-                                for entry in step.declared_entropy_budget.per_source
-                            ],
-                        }
-                        if step.declared_entropy_budget
-                        else None
-                    ),
-                    "allowed_variance_class": step.allowed_variance_class,
-                    "nondeterminism_intent": [
-                        {
-                            "source": intent.source,
-                            "min_entropy_magnitude": intent.min_entropy_magnitude,
-                            "max_entropy_magnitude": intent.max_entropy_magnitude,
-                            "justification": intent.justification,
-                        }
-                        for intent in step.nondeterminism_intent
-                    ],
-                }
-                for step in steps
-            ],
-            "dependencies": {
-                agent_id: sorted(deps) for agent_id, deps in dependencies.items()
-            },
         }
-        return PlanHash(fingerprint_inputs(payload))
+        key = (str(manifest.tenant_id), str(manifest.flow_id))
+        with self._previous_trees_lock:
+            previous = self._previous_trees.get(key)
+        tree = build_plan_tree(sections, steps, previous=previous)
+        with self._previous_trees_lock:
+            self._previous_trees[key] = (tuple(steps), tree)
+            self._previous_trees.move_to_end(key)
+            while len(self._previous_trees) > self._max_previous_trees:
+                self._previous_trees.popitem(last=False)
+        return tree
@@ -28,9 +28,10 @@ def replay_with_store(
     config: ExecutionConfig,
 ) -> tuple[dict[str, object], FlowRunResult]:
     """Replay using store; misuse breaks auditability."""
-    stored_trace = store.load_trace(run_id, tenant_id=tenant_id)
-    _ = store.load_dataset_descriptor(run_id, tenant_id=tenant_id)
-    _ = store.load_replay_envelope(run_id, tenant_id=tenant_id)
+    with store.session():
+        stored_trace = store.load_trace(run_id, tenant_id=tenant_id)
+        _ = store.load_dataset_descriptor(run_id, tenant_id=tenant_id)
+        _ = store.load_replay_envelope(run_id, tenant_id=tenant_id)
     result = execute_flow(resolved_flow=resolved_flow, config=config)
     diff = semantic_trace_diff(stored_trace, result.trace)
     _ = validate_replay(
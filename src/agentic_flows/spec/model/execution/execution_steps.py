@@ -12,6 +12,7 @@ from agentic_flows.spec.model.datasets.dataset_descriptor import DatasetDescript
 from agentic_flows.spec.model.execution.non_deterministic_intent import (
     NonDeterministicIntent,
 )
+from agentic_flows.spec.model.execution.plan_tree import PlanTree
 from agentic_flows.spec.model.execution.replay_envelope import ReplayEnvelope
 from agentic_flows.spec.model.execution.resolved_step import ResolvedStep
 from agentic_flows.spec.ontology import (
@@ -51,6 +52,8 @@ class ExecutionSteps:
         default_factory=tuple
     )
     replay_mode: ReplayMode = ReplayMode.STRICT
+    # The tree is derived from the fields above; plan_hash is its root.
+    plan_tree: PlanTree | None = field(default=None, compare=False)
 
 
 __all__ = ["ExecutionSteps"]
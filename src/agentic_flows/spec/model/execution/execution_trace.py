@@ -5,10 +5,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from agentic_flows.spec.model.artifact.entropy_usage import EntropyUsage
 from agentic_flows.spec.model.datasets.dataset_descriptor import DatasetDescriptor
+from agentic_flows.spec.model.execution.plan_tree import PlanTree
 from agentic_flows.spec.model.execution.replay_envelope import ReplayEnvelope
 from agentic_flows.spec.model.identifiers.execution_event import ExecutionEvent
 from agentic_flows.spec.model.identifiers.tool_invocation import ToolInvocation
@@ -59,6 +60,7 @@ class ExecutionTrace:
     entropy_exhausted: bool = False
     entropy_exhaustion_action: EntropyExhaustionAction | None = None
     non_certifiable: bool = False
+    plan_tree: PlanTree | None = field(default=None, compare=False)
 
     def finalize(self) -> ExecutionTrace:
         """Execute finalize and enforce its contract."""
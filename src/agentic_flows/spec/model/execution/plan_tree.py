@@ -0,0 +1,25 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Module definitions for spec/model/execution/plan_tree.py."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from agentic_flows.spec.ontology.ids import AgentID, PlanHash
+
+
+@dataclass(frozen=True)
+class PlanTree:
+    """Merkle tree behind a plan hash; misuse breaks plan drift attribution."""
+
+    root: PlanHash
+    sections: tuple[tuple[str, str], ...]
+    step_ids: tuple[AgentID, ...]
+    # Level 0 holds one leaf hash per step in plan order; each later level
+    # pairs the one below it, ending with the single steps root.
+    step_levels: tuple[tuple[str, ...], ...]
+
+
+__all__ = ["PlanTree"]
@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from agentic_flows.spec.ontology import CausalityTag
 from agentic_flows.spec.ontology.public import EventType
@@ -23,6 +23,12 @@ class ExecutionEvent:
     timestamp_utc: str
     payload: dict[str, object]
     payload_hash: str
+    # Order-preserving JSON of payload, when the producer encoded it; stores
+    # persist it verbatim instead of re-serializing payload. payload_hash is
+    # computed from the canonical form, which sorts lists.
+    payload_json: str | None = field(default=None, compare=False, repr=False)
+    # SHA-256 of payload_json, when the producer already has it.
+    payload_key: str | None = field(default=None, compare=False, repr=False)
 
 
 __all__ = ["ExecutionEvent"]
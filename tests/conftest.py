@@ -3,25 +3,34 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+import os
+from pathlib import Path
+import subprocess
 import sys
 import types
-from pathlib import Path
+from typing import Any
 
 import pytest
 
+import agentic_flows
 from agentic_flows.runtime.artifact_store import InMemoryArtifactStore
 from agentic_flows.runtime.observability.capture.environment import (
     compute_environment_fingerprint,
 )
-from agentic_flows.runtime.observability.classification.fingerprint import (
-    fingerprint_inputs,
-)
 from agentic_flows.runtime.observability.storage.execution_store import (
     DuckDBExecutionReadStore,
     DuckDBExecutionWriteStore,
 )
+from agentic_flows.runtime.orchestration.execute_flow import (
+    ExecutionConfig,
+    RunMode,
+    execute_flow,
+)
+from agentic_flows.runtime.orchestration.plan_tree import build_plan_tree
 from agentic_flows.spec.model.artifact.entropy_budget import EntropyBudget
 from agentic_flows.spec.model.datasets.dataset_descriptor import DatasetDescriptor
+from agentic_flows.spec.model.datasets.retrieval_request import RetrievalRequest
 from agentic_flows.spec.model.execution.execution_plan import ExecutionPlan
 from agentic_flows.spec.model.execution.execution_steps import ExecutionSteps
 from agentic_flows.spec.model.execution.non_deterministic_intent import (
@@ -51,6 +60,7 @@ from agentic_flows.spec.ontology.ids import (
     GateID,
     InputsFingerprint,
     PlanHash,
+    RequestID,
     ResolverID,
     TenantID,
     VersionID,
@@ -60,6 +70,7 @@ from agentic_flows.spec.ontology.public import (
     ReplayAcceptability,
     ReplayMode,
 )
+from tests.helpers import agent_payload, evidence_payload, reasoning_bundle
 
 
 def pytest_configure() -> None:
@@ -191,14 +202,79 @@ def execution_read_store(tmp_path: Path) -> DuckDBExecutionReadStore:
     return DuckDBExecutionReadStore(tmp_path / "execution.duckdb")
 
 
+_SERVE_STORE = """
+import sys
+import threading
+from pathlib import Path
+
+from agentic_flows.runtime.observability.storage.writer_service import (
+    ExecutionStoreServer,
+)
+
+server = ExecutionStoreServer(Path(sys.argv[1]), Path(sys.argv[2]))
+threading.Thread(target=server.serve_forever, daemon=True).start()
+print("ready", flush=True)
+sys.stdin.read()
+server.close()
+"""
+
+
+@pytest.fixture
+def store_daemon(tmp_path: Path) -> Iterator[Path]:
+    """Serve tmp_path/daemon.duckdb from another process; yields its socket."""
+    address = tmp_path / "store.sock"
+    daemon = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-c", _SERVE_STORE, str(tmp_path / "daemon.duckdb"), address],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(agentic_flows.__file__).parents[1])},
+    )
+    try:
+        assert daemon.stdout is not None
+        assert daemon.stdout.readline().strip() == "ready"
+        yield address
+    finally:
+        daemon.communicate(input="")
+
+
 @pytest.fixture
 def plan_hash_for():
+    def _budget_payload(budget: EntropyBudget) -> dict[str, object]:
+        return {
+            "allowed_sources": list(budget.allowed_sources),
+            "min_magnitude": budget.min_magnitude,
+            "max_magnitude": budget.max_magnitude,
+            "exhaustion_action": budget.exhaustion_action,
+            "per_source": [
+                {
+                    "source": entry.source,
+                    "min_magnitude": entry.min_magnitude,
+                    "max_magnitude": entry.max_magnitude,
+                    "exhaustion_action": entry.exhaustion_action,
+                }
+                for entry in budget.per_source
+            ],
+        }
+
+    def _intents_payload(
+        intents: tuple[NonDeterministicIntent, ...],
+    ) -> list[dict[str, object]]:
+        return [
+            {
+                "source": intent.source,
+                "min_entropy_magnitude": intent.min_entropy_magnitude,
+                "max_entropy_magnitude": intent.max_entropy_magnitude,
+                "justification": intent.justification,
+            }
+            for intent in intents
+        ]
+
     def _plan_hash_for(
         flow_id: str,
         tenant_id: str,
         flow_state: FlowState,
         steps: tuple[ResolvedStep, ...],
-        dependencies: dict[str, list[str]],
         *,
         determinism_level: DeterminismLevel,
         replay_acceptability: ReplayAcceptability,
@@ -210,38 +286,21 @@ def plan_hash_for():
         allowed_variance_class: EntropyMagnitude | None = None,
         nondeterminism_intent: tuple[NonDeterministicIntent, ...] = (),
     ) -> PlanHash:
-        payload = {
-            "flow_id": flow_id,
-            "tenant_id": tenant_id,
-            "flow_state": flow_state,
-            "determinism_level": determinism_level,
-            "replay_mode": replay_mode,
-            "replay_acceptability": replay_acceptability,
-            "entropy_budget": {
-                "allowed_sources": list(entropy_budget.allowed_sources),
-                "min_magnitude": entropy_budget.min_magnitude,
-                "max_magnitude": entropy_budget.max_magnitude,
-                "exhaustion_action": entropy_budget.exhaustion_action,
-                "per_source": [
-                    {
-                        "source": entry.source,
-                        "min_magnitude": entry.min_magnitude,
-                        "max_magnitude": entry.max_magnitude,
-                        "exhaustion_action": entry.exhaustion_action,
-                    }
-                    for entry in entropy_budget.per_source
-                ],
+        sections = {
+            "flow": {
+                "flow_id": flow_id,
+                "tenant_id": tenant_id,
+                "flow_state": flow_state,
+                "determinism_level": determinism_level,
+                "replay_mode": replay_mode,
+                "replay_acceptability": replay_acceptability,
+                "allowed_variance_class": allowed_variance_class,
+                "allow_deprecated_datasets": allow_deprecated_datasets,
+            },
+            "entropy_budget": _budget_payload(entropy_budget),
+            "nondeterminism_intent": {
+                "intents": _intents_payload(nondeterminism_intent)
             },
-            "allowed_variance_class": allowed_variance_class,
-            "nondeterminism_intent": [
-                {
-                    "source": intent.source,
-                    "min_entropy_magnitude": intent.min_entropy_magnitude,
-                    "max_entropy_magnitude": intent.max_entropy_magnitude,
-                    "justification": intent.justification,
-                }
-                for intent in nondeterminism_intent
-            ],
             "replay_envelope": {
                 "min_claim_overlap": replay_envelope.min_claim_overlap,
                 "max_contradiction_delta": replay_envelope.max_contradiction_delta,
@@ -253,54 +312,8 @@ def plan_hash_for():
                 "dataset_hash": getattr(dataset, "dataset_hash", None),
                 "dataset_state": getattr(dataset, "dataset_state", None),
             },
-            "allow_deprecated_datasets": allow_deprecated_datasets,
-            "steps": [
-                {
-                    "index": step.step_index,
-                    "agent_id": step.agent_id,
-                    "inputs_fingerprint": step.inputs_fingerprint,
-                    "declared_dependencies": list(step.declared_dependencies),
-                    "step_type": step.step_type,
-                    "determinism_level": step.determinism_level,
-                    "declared_entropy_budget": (
-                        {
-                            "allowed_sources": list(
-                                step.declared_entropy_budget.allowed_sources
-                            ),
-                            "min_magnitude": step.declared_entropy_budget.min_magnitude,
-                            "max_magnitude": step.declared_entropy_budget.max_magnitude,
-                            "exhaustion_action": step.declared_entropy_budget.exhaustion_action,
-                            "per_source": [
-                                {
-                                    "source": entry.source,
-                                    "min_magnitude": entry.min_magnitude,
-                                    "max_magnitude": entry.max_magnitude,
-                                    "exhaustion_action": entry.exhaustion_action,
-                                }
-                                for entry in step.declared_entropy_budget.per_source
-                            ],
-                        }
-                        if step.declared_entropy_budget
-                        else None
-                    ),
-                    "allowed_variance_class": step.allowed_variance_class,
-                    "nondeterminism_intent": [
-                        {
-                            "source": intent.source,
-                            "min_entropy_magnitude": intent.min_entropy_magnitude,
-                            "max_entropy_magnitude": intent.max_entropy_magnitude,
-                            "justification": intent.justification,
-                        }
-                        for intent in step.nondeterminism_intent
-                    ],
-                }
-                for step in steps
-            ],
-            "dependencies": {
-                agent_id: sorted(deps) for agent_id, deps in dependencies.items()
-            },
         }
-        return PlanHash(fingerprint_inputs(payload))
+        return build_plan_tree(sections, steps).root
 
     return _plan_hash_for
 
@@ -367,7 +380,6 @@ def resolved_flow(
             str(tenant_id),
             FlowState.VALIDATED,
             (step,),
-            {},
             determinism_level=manifest.determinism_level,
             replay_acceptability=manifest.replay_acceptability,
             entropy_budget=manifest.entropy_budget,
@@ -387,12 +399,10 @@ def resolved_flow_factory(plan_hash_for, entropy_budget):
         steps: tuple[ResolvedStep, ...],
         *,
         environment_fingerprint: EnvironmentFingerprint | None = None,
-        dependencies: dict[str, list[str]] | None = None,
     ) -> ExecutionPlan:
         fingerprint = environment_fingerprint or EnvironmentFingerprint(
             compute_environment_fingerprint()
         )
-        deps = dependencies or {}
         plan = ExecutionSteps(
             spec_version="v1",
             flow_id=FlowID(manifest.flow_id),
@@ -411,7 +421,6 @@ def resolved_flow_factory(plan_hash_for, entropy_budget):
                 str(manifest.tenant_id),
                 manifest.flow_state,
                 steps,
-                deps,
                 determinism_level=manifest.determinism_level,
                 replay_acceptability=manifest.replay_acceptability,
                 entropy_budget=manifest.entropy_budget,
@@ -424,3 +433,133 @@ def resolved_flow_factory(plan_hash_for, entropy_budget):
         return ExecutionPlan(spec_version="v1", manifest=manifest, plan=plan)
 
     return _factory
+
+
+@pytest.fixture
+def live_backends(monkeypatch: pytest.MonkeyPatch):
+    def _install(
+        *,
+        run: Callable[..., object] | None = None,
+        retrieve: Callable[..., object] | None = None,
+        reason: Callable[..., object] | None = None,
+    ) -> None:
+        monkeypatch.setattr(
+            "bijux_agent.run",
+            run or (lambda agent_id, **_kwargs: agent_payload(agent_id)),
+            raising=False,
+        )
+        monkeypatch.setattr(
+            "bijux_rag.retrieve",
+            retrieve or (lambda **_kwargs: evidence_payload()),
+            raising=False,
+        )
+        monkeypatch.setattr(
+            "bijux_vex.enforce_contract",
+            lambda *_args, **_kwargs: True,
+            raising=False,
+        )
+        monkeypatch.setattr(
+            "bijux_rar.reason", reason or reasoning_bundle, raising=False
+        )
+
+    return _install
+
+
+@pytest.fixture
+def live_flow(
+    resolved_flow_factory,
+    entropy_budget,
+    replay_envelope,
+    dataset_descriptor,
+    tenant_id,
+):
+    def _build(
+        flow_id: str,
+        *,
+        steps: int = 2,
+        inputs: tuple[str, ...] | None = None,
+        dependencies: dict[int, tuple[int, ...]] | None = None,
+        request: RetrievalRequest | None = None,
+    ) -> ExecutionPlan:
+        fingerprints = inputs or tuple(f"inputs-{index}" for index in range(steps))
+        depends_on = dependencies or {}
+        resolved_steps = tuple(
+            ResolvedStep(
+                spec_version="v1",
+                step_index=index,
+                step_type=StepType.AGENT,
+                determinism_level=DeterminismLevel.STRICT,
+                agent_id=AgentID(f"agent-{index}"),
+                inputs_fingerprint=InputsFingerprint(fingerprint),
+                declared_dependencies=tuple(
+                    AgentID(f"agent-{dependency}")
+                    for dependency in depends_on.get(index, ())
+                ),
+                expected_artifacts=(),
+                agent_invocation=AgentInvocation(
+                    spec_version="v1",
+                    agent_id=AgentID(f"agent-{index}"),
+                    agent_version=VersionID("0.0.0"),
+                    inputs_fingerprint=InputsFingerprint(fingerprint),
+                    declared_outputs=(),
+                    execution_mode="seeded",
+                ),
+                retrieval_request=request
+                or RetrievalRequest(
+                    spec_version="v1",
+                    request_id=RequestID(f"req-{index}"),
+                    query=f"query-{index}",
+                    vector_contract_id=ContractID("contract-a"),
+                    top_k=1,
+                    scope="project",
+                ),
+            )
+            for index, fingerprint in enumerate(fingerprints)
+        )
+        manifest = FlowManifest(
+            spec_version="v1",
+            flow_id=FlowID(flow_id),
+            tenant_id=tenant_id,
+            flow_state=FlowState.VALIDATED,
+            determinism_level=DeterminismLevel.STRICT,
+            replay_acceptability=ReplayAcceptability.EXACT_MATCH,
+            entropy_budget=entropy_budget,
+            replay_envelope=replay_envelope,
+            dataset=dataset_descriptor,
+            allow_deprecated_datasets=False,
+            agents=tuple(step.agent_id for step in resolved_steps),
+            dependencies=tuple(
+                f"agent-{index}:agent-{dependency}"
+                for index, dependencies_of in sorted(depends_on.items())
+                for dependency in dependencies_of
+            ),
+            retrieval_contracts=(ContractID("contract-a"),),
+            verification_gates=(GateID("gate-a"),),
+        )
+        return resolved_flow_factory(manifest, resolved_steps)
+
+    return _build
+
+
+@pytest.fixture
+def live_config(baseline_policy, execution_store):
+    def _config(resolved_flow: ExecutionPlan, **overrides: object) -> ExecutionConfig:
+        options: dict[str, Any] = {"execution_store": execution_store, **overrides}
+        return ExecutionConfig(
+            mode=RunMode.LIVE,
+            determinism_level=resolved_flow.manifest.determinism_level,
+            verification_policy=baseline_policy,
+            **options,
+        )
+
+    return _config
+
+
+@pytest.fixture
+def execute_live(live_config):
+    def _execute(resolved_flow: ExecutionPlan, **overrides: object):
+        return execute_flow(
+            resolved_flow=resolved_flow, config=live_config(resolved_flow, **overrides)
+        )
+
+    return _execute
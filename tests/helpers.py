@@ -4,7 +4,11 @@
 from __future__ import annotations
 
 from agentic_flows.spec.model.artifact.artifact import Artifact
+from agentic_flows.spec.model.artifact.reasoning_claim import ReasoningClaim
 from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
+from agentic_flows.spec.model.reasoning_bundle import ReasoningBundle
+from agentic_flows.spec.ontology import EvidenceDeterminism
+from agentic_flows.spec.ontology.ids import AgentID, BundleID, ClaimID
 
 
 def build_claim_statement(
@@ -18,3 +22,55 @@ def build_claim_statement(
     if agent_outputs:
         parts.append(f"artifact_hash={agent_outputs[0].content_hash}")
     return " ".join(parts)
+
+
+def agent_payload(agent_id: str) -> list[dict[str, object]]:
+    return [
+        {
+            "artifact_id": f"artifact-{agent_id}",
+            "artifact_type": "agent_invocation",
+            "content": f"payload-{agent_id}",
+            "parent_artifacts": [],
+        }
+    ]
+
+
+def evidence_payload(
+    evidence_id: str = "ev-1",
+    *,
+    content: str = "content",
+    determinism: EvidenceDeterminism = EvidenceDeterminism.DETERMINISTIC,
+) -> list[dict[str, object]]:
+    return [
+        {
+            "evidence_id": evidence_id,
+            "determinism": determinism.value,
+            "source_uri": "file://doc",
+            "content": content,
+            "score": 0.9,
+            "vector_contract_id": "contract-a",
+        }
+    ]
+
+
+def reasoning_bundle(
+    agent_outputs: list[Artifact],
+    evidence: list[RetrievedEvidence],
+    seed: int,
+) -> ReasoningBundle:
+    return ReasoningBundle(
+        spec_version="v1",
+        bundle_id=BundleID(f"bundle-{seed}"),
+        claims=(
+            ReasoningClaim(
+                spec_version="v1",
+                claim_id=ClaimID(f"claim-{seed}"),
+                statement=build_claim_statement(agent_outputs, evidence),
+                confidence=0.9,
+                supported_by=(evidence[0].evidence_id,),
+            ),
+        ),
+        steps=(),
+        evidence_ids=(evidence[0].evidence_id,),
+        producer_agent_id=AgentID("agent-0"),
+    )
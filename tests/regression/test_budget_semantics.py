@@ -3,13 +3,22 @@
 
 from __future__ import annotations
 
+import importlib
+import threading
+import time
+
 import bijux_agent
 import bijux_rag
 import bijux_rar
 import bijux_vex
 import pytest
 
-from agentic_flows.runtime.budget import ExecutionBudget
+from agentic_flows.runtime.budget import (
+    BudgetState,
+    DeadlineExceededError,
+    ExecutionBudget,
+    _ToolCallPool,
+)
 from agentic_flows.runtime.orchestration.execute_flow import (
     ExecutionConfig,
     RunMode,
@@ -370,3 +379,203 @@ def test_evidence_budget_halts_flow(
     )
 
     assert result.trace.events[-1].event_type == EventType.RETRIEVAL_FAILED
+
+
+def test_hung_agent_call_fails_at_tool_call_deadline(
+    baseline_policy,
+    resolved_flow_factory,
+    entropy_budget,
+    replay_envelope,
+    dataset_descriptor,
+    execution_store,
+    monkeypatch,
+) -> None:
+    release = threading.Event()
+
+    def _hung_run(**_kwargs):
+        release.wait(timeout=10)
+        return []
+
+    monkeypatch.setattr(bijux_agent, "run", _hung_run, raising=False)
+    monkeypatch.setattr(
+        bijux_rag,
+        "retrieve",
+        lambda **_kwargs: [
+            {
+                "evidence_id": "ev-1",
+                "determinism": EvidenceDeterminism.DETERMINISTIC.value,
+                "source_uri": "file://doc",
+                "content": "content",
+                "score": 0.9,
+                "vector_contract_id": "contract-1",
+            }
+        ],
+        raising=False,
+    )
+    monkeypatch.setattr(
+        bijux_vex, "enforce_contract", lambda *_args, **_kwargs: True, raising=False
+    )
+
+    resolved_flow = _resolved_flow_for_budget(
+        resolved_flow_factory, entropy_budget, replay_envelope, dataset_descriptor
+    )
+
+    try:
+        result = execute_flow(
+            resolved_flow=resolved_flow,
+            config=ExecutionConfig(
+                mode=RunMode.LIVE,
+                determinism_level=resolved_flow.manifest.determinism_level,
+                verification_policy=baseline_policy,
+                execution_store=execution_store,
+                budget=ExecutionBudget(
+                    step_limit=None,
+                    token_limit=None,
+                    artifact_limit=None,
+                    artifact_step_limit=None,
+                    evidence_limit=None,
+                    trace_event_limit=None,
+                    tool_call_time_limit=0.05,
+                ),
+            ),
+        )
+    finally:
+        release.set()
+
+    failures = [
+        (event.event_type, event.payload["deadline"])
+        for event in result.trace.events
+        if "deadline" in event.payload
+    ]
+    assert failures == [
+        (EventType.TOOL_CALL_FAIL, "tool_call"),
+        (EventType.STEP_FAILED, "tool_call"),
+    ]
+    assert result.trace.events[-1].event_type == EventType.STEP_FAILED
+
+
+def test_run_deadline_halts_flow_at_step_start(
+    baseline_policy,
+    resolved_flow_factory,
+    entropy_budget,
+    replay_envelope,
+    dataset_descriptor,
+    execution_store,
+) -> None:
+    resolved_flow = _resolved_flow_for_budget(
+        resolved_flow_factory, entropy_budget, replay_envelope, dataset_descriptor
+    )
+
+    result = execute_flow(
+        resolved_flow=resolved_flow,
+        config=ExecutionConfig(
+            mode=RunMode.LIVE,
+            determinism_level=resolved_flow.manifest.determinism_level,
+            verification_policy=baseline_policy,
+            execution_store=execution_store,
+            budget=ExecutionBudget(
+                step_limit=None,
+                token_limit=None,
+                artifact_limit=None,
+                artifact_step_limit=None,
+                evidence_limit=None,
+                trace_event_limit=None,
+                run_time_limit=0.0,
+            ),
+        ),
+    )
+
+    last = result.trace.events[-1]
+    assert last.event_type == EventType.STEP_FAILED
+    assert last.payload["deadline"] == "run"
+    assert not any(
+        event.event_type == EventType.TOOL_CALL_START for event in result.trace.events
+    )
+
+
+def test_preparation_counts_against_run_deadline(
+    baseline_policy,
+    resolved_flow_factory,
+    entropy_budget,
+    replay_envelope,
+    dataset_descriptor,
+    execution_store,
+    monkeypatch,
+) -> None:
+    execute_flow_module = importlib.import_module(
+        "agentic_flows.runtime.orchestration.execute_flow"
+    )
+    ensure_policy = execute_flow_module._ensure_non_determinism_policy
+
+    def _slow_policy(*args, **kwargs):
+        time.sleep(0.2)
+        return ensure_policy(*args, **kwargs)
+
+    monkeypatch.setattr(
+        execute_flow_module, "_ensure_non_determinism_policy", _slow_policy
+    )
+    resolved_flow = _resolved_flow_for_budget(
+        resolved_flow_factory, entropy_budget, replay_envelope, dataset_descriptor
+    )
+
+    result = execute_flow(
+        resolved_flow=resolved_flow,
+        config=ExecutionConfig(
+            mode=RunMode.LIVE,
+            determinism_level=resolved_flow.manifest.determinism_level,
+            verification_policy=baseline_policy,
+            execution_store=execution_store,
+            budget=ExecutionBudget(
+                step_limit=None,
+                token_limit=None,
+                artifact_limit=None,
+                artifact_step_limit=None,
+                evidence_limit=None,
+                trace_event_limit=None,
+                run_time_limit=0.1,
+            ),
+        ),
+    )
+
+    last = result.trace.events[-1]
+    assert last.event_type == EventType.STEP_FAILED
+    assert last.step_index == 0
+    assert last.payload["deadline"] == "run"
+
+
+def test_abandoned_tool_calls_release_their_pool_slot() -> None:
+    pool = _ToolCallPool(max_workers=1)
+    release = threading.Event()
+    hung = pool.submit(lambda: release.wait(timeout=10))
+
+    queued = pool.submit(lambda: "done")
+    with pytest.raises(TimeoutError):
+        queued.result(timeout=0.05)
+
+    pool.abandon(hung)
+    assert queued.result(timeout=10) == "done"
+    release.set()
+    assert hung.result(timeout=10) is True
+
+
+def test_hung_tool_calls_do_not_starve_later_calls() -> None:
+    budget = BudgetState(
+        ExecutionBudget(
+            step_limit=None,
+            token_limit=None,
+            artifact_limit=None,
+            artifact_step_limit=None,
+            evidence_limit=None,
+            trace_event_limit=None,
+            tool_call_time_limit=0.05,
+        )
+    )
+    release = threading.Event()
+    try:
+        # More hung calls than the old shared pool had workers.
+        for _ in range(17):
+            with pytest.raises(DeadlineExceededError, match="tool call"):
+                budget.run_tool_call(lambda: release.wait(timeout=10))
+        assert budget.run_tool_call(lambda: "done") == "done"
+    finally:
+        release.set()
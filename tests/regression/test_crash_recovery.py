@@ -79,6 +79,7 @@ def test_crash_recovery_resume(
     row = connection.execute(
         "SELECT run_id FROM runs ORDER BY created_at DESC LIMIT 1"
     ).fetchone()
+    connection.close()
     assert row is not None
     run_id = RunID(row[0])
 
@@ -115,13 +115,11 @@ def test_long_horizon_flow_is_stable(
         scope="project",
     )
     steps: list[ResolvedStep] = []
-    dependencies: dict[str, list[str]] = {}
     for index in range(50):
         agent_id = AgentID(f"agent-{index}")
         deps = []
         if index > 0:
             deps = [f"agent-{index - 1}"]
-        dependencies[str(agent_id)] = deps
         steps.append(
             ResolvedStep(
                 spec_version="v1",
@@ -162,9 +160,7 @@ def test_long_horizon_flow_is_stable(
         retrieval_contracts=(ContractID("contract-a"),),
         verification_gates=(GateID("gate-a"),),
     )
-    resolved_flow = resolved_flow_factory(
-        manifest, tuple(steps), dependencies=dependencies
-    )
+    resolved_flow = resolved_flow_factory(manifest, tuple(steps))
 
     result = execute_flow(
         resolved_flow=resolved_flow,
@@ -196,9 +192,7 @@ def test_long_horizon_flow_is_stable(
         retrieval_contracts=(ContractID("contract-a"),),
         verification_gates=(GateID("gate-a"),),
     )
-    resolved_flow_two = resolved_flow_factory(
-        manifest_two, tuple(steps), dependencies=dependencies
-    )
+    resolved_flow_two = resolved_flow_factory(manifest_two, tuple(steps))
     result_two = execute_flow(
         resolved_flow=resolved_flow_two,
         config=ExecutionConfig(
@@ -0,0 +1,190 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from tests.helpers import agent_payload, reasoning_bundle
+
+from agentic_flows.runtime.execution.async_executors import (
+    DEFAULT_MAX_FLOWS,
+    SyncBackendAdapter,
+)
+from agentic_flows.runtime.observability.storage.writer_service import (
+    QueuedExecutionWriteStore,
+)
+from agentic_flows.runtime.orchestration.execute_flow import (
+    execute_flow,
+    execute_flow_async,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _chained_flows(live_flow):
+    return [
+        live_flow(flow_id, dependencies={1: (0,)})
+        for flow_id in ("flow-async-a", "flow-async-b")
+    ]
+
+
+def test_async_flows_share_one_loop_and_match_sync_traces(
+    live_backends, live_flow, live_config, tmp_path
+) -> None:
+    # Concurrent flows share one store through its writer thread.
+    execution_store = QueuedExecutionWriteStore(tmp_path / "async.duckdb")
+    flows = _chained_flows(live_flow)
+
+    live_backends()
+    expected = [
+        execute_flow(
+            resolved_flow=flow,
+            config=live_config(flow, execution_store=execution_store),
+        )
+        for flow in flows
+    ]
+
+    async def _run_both():
+        # Each agent call waits until the other flow's call is in flight, so
+        # the flows only finish when they run concurrently on this loop.
+        barrier = asyncio.Barrier(len(flows))
+
+        async def _agent(agent_id, **_kwargs):
+            await asyncio.wait_for(barrier.wait(), timeout=10)
+            return agent_payload(agent_id)
+
+        async def _reason(**kwargs):
+            return reasoning_bundle(**kwargs)
+
+        live_backends(run=_agent, reason=_reason)
+        adapter = SyncBackendAdapter(max_workers=2)
+        try:
+            return await asyncio.gather(
+                *(
+                    execute_flow_async(
+                        resolved_flow=flow,
+                        config=live_config(flow, execution_store=execution_store),
+                        adapter=adapter,
+                    )
+                    for flow in flows
+                )
+            )
+        finally:
+            adapter.close()
+
+    try:
+        results = asyncio.run(_run_both())
+    finally:
+        execution_store.close()
+
+    for result, baseline in zip(results, expected, strict=True):
+        assert result.trace.finalized is True
+        assert result.trace.plan_hash == baseline.trace.plan_hash
+        assert [event.payload_json for event in result.trace.events] == [
+            event.payload_json for event in baseline.trace.events
+        ]
+        assert result.trace.tool_invocations == baseline.trace.tool_invocations
+        assert result.artifacts == baseline.artifacts
+
+
+def test_async_flows_are_bounded_by_the_adapter_flow_pool(
+    live_backends, live_flow, live_config, tmp_path
+) -> None:
+    execution_store = QueuedExecutionWriteStore(tmp_path / "async.duckdb")
+    flows = _chained_flows(live_flow)
+    flow_workers: set[str] = set()
+
+    async def _agent(agent_id, **_kwargs):
+        # The calling flow's step loop is blocked on this call, so its worker
+        # is alive while the agent runs.
+        flow_workers.update(
+            thread.name
+            for thread in threading.enumerate()
+            if thread.name.startswith("agentic-flows-flow")
+        )
+        return agent_payload(agent_id)
+
+    live_backends(run=_agent)
+
+    async def _run_both():
+        adapter = SyncBackendAdapter(max_workers=2, max_flows=1)
+        try:
+            return await asyncio.gather(
+                *(
+                    execute_flow_async(
+                        resolved_flow=flow,
+                        config=live_config(flow, execution_store=execution_store),
+                        adapter=adapter,
+                    )
+                    for flow in flows
+                )
+            )
+        finally:
+            adapter.close()
+
+    try:
+        results = asyncio.run(_run_both())
+    finally:
+        execution_store.close()
+
+    assert [result.trace.finalized for result in results] == [True, True]
+    assert len(flow_workers) == 1
+    with pytest.raises(ValueError, match="max_flows"):
+        SyncBackendAdapter(max_flows=0)
+
+
+def test_async_flows_beyond_the_default_flow_pool_run_concurrently(
+    live_backends, live_flow, live_config, tmp_path
+) -> None:
+    execution_store = QueuedExecutionWriteStore(tmp_path / "async.duckdb")
+    flow_count = DEFAULT_MAX_FLOWS + 8
+    # Every step loop waits here on its first event, so the flows only finish
+    # when all of them hold a flow worker at once.
+    step_loops = threading.Barrier(flow_count, timeout=30)
+
+    class _WaitForAllFlows:
+        def __init__(self) -> None:
+            self.waited = False
+
+        def on_event(self, _event) -> None:
+            if not self.waited:
+                self.waited = True
+                step_loops.wait()
+
+    live_backends()
+    flows = [live_flow(f"flow-wide-{index}", steps=1) for index in range(flow_count)]
+
+    async def _run_all():
+        return await asyncio.gather(
+            *(
+                execute_flow_async(
+                    resolved_flow=flow,
+                    config=live_config(
+                        flow,
+                        execution_store=execution_store,
+                        observers=(_WaitForAllFlows(),),
+                    ),
+                    max_flows=flow_count,
+                )
+                for flow in flows
+            )
+        )
+
+    try:
+        results = asyncio.run(_run_all())
+    finally:
+        execution_store.close()
+
+    assert [result.trace.finalized for result in results] == [True] * flow_count
+    assert not step_loops.broken
+    with pytest.raises(ValueError, match="max_flows"):
+        asyncio.run(
+            execute_flow_async(
+                resolved_flow=flows[0],
+                adapter=SyncBackendAdapter.shared(),
+                max_flows=flow_count,
+            )
+        )
@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import importlib
+import signal
+
+import bijux_agent
+import pytest
+
+from agentic_flows.core.errors import ExecutionFailure
+from agentic_flows.runtime.cancellation import CancellationToken
+from agentic_flows.runtime.orchestration.execute_flow import (
+    ExecutionConfig,
+    RunMode,
+    execute_flow,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_cancelled_flow_stops_in_worker_thread(
+    resolved_flow, baseline_policy, execution_store, monkeypatch
+) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(
+        bijux_agent,
+        "run",
+        lambda agent_id, **_kwargs: calls.append(agent_id) or [],
+        raising=False,
+    )
+    cancellation = CancellationToken()
+    cancellation.cancel("shutdown")
+    config = ExecutionConfig(
+        mode=RunMode.LIVE,
+        determinism_level=resolved_flow.manifest.determinism_level,
+        verification_policy=baseline_policy,
+        execution_store=execution_store,
+        cancellation=cancellation,
+    )
+    handler = signal.getsignal(signal.SIGINT)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(execute_flow, resolved_flow=resolved_flow, config=config)
+        with pytest.raises(ExecutionFailure, match="execution interrupted"):
+            future.result(timeout=30)
+
+    assert calls == []
+    assert signal.getsignal(signal.SIGINT) is handler
+    assert cancellation.reason == "shutdown"
+
+
+def test_cli_interrupt_cancels_token() -> None:
+    cli_main = importlib.import_module("agentic_flows.cli.main")
+    cancellation = CancellationToken()
+    handler = signal.getsignal(signal.SIGINT)
+
+    with cli_main._cancel_on_interrupt(cancellation):
+        signal.raise_signal(signal.SIGINT)
+
+    assert cancellation.is_cancelled() is True
+    assert cancellation.reason == "sigint"
+    assert signal.getsignal(signal.SIGINT) is handler
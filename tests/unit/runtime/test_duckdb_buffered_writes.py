@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import pytest
+
+from agentic_flows.runtime.context import RunMode
+from agentic_flows.runtime.observability.classification.fingerprint import (
+    fingerprint_inputs,
+)
+from agentic_flows.runtime.observability.storage.execution_store import (
+    DuckDBExecutionReadStore,
+    DuckDBExecutionWriteStore,
+)
+from agentic_flows.runtime.orchestration.execute_flow import (
+    ExecutionConfig,
+    execute_flow,
+)
+from agentic_flows.spec.model.identifiers.execution_event import ExecutionEvent
+from agentic_flows.spec.ontology import CausalityTag
+from agentic_flows.spec.ontology.public import EventType
+
+pytestmark = pytest.mark.unit
+
+
+def _event(index: int) -> ExecutionEvent:
+    payload = {"event_type": EventType.STEP_START.value, "index": index}
+    return ExecutionEvent(
+        spec_version="v1",
+        event_index=index,
+        step_index=0,
+        event_type=EventType.STEP_START,
+        causality_tag=CausalityTag.AGENT,
+        timestamp_utc="1970-01-01T00:00:00Z",
+        payload=payload,
+        payload_hash=fingerprint_inputs(payload),
+    )
+
+
+def test_buffered_events_commit_with_checkpoint(tmp_path, resolved_flow) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    store = DuckDBExecutionWriteStore(db_path, buffered=True)
+    reader = DuckDBExecutionReadStore(db_path)
+    tenant_id = resolved_flow.plan.tenant_id
+    run_id = store.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+    store.save_events(run_id=run_id, tenant_id=tenant_id, events=(_event(0),))
+    store.save_events(run_id=run_id, tenant_id=tenant_id, events=(_event(1),))
+
+    assert reader.load_events(run_id, tenant_id=tenant_id) == ()
+    assert reader.load_checkpoint(run_id, tenant_id=tenant_id) is None
+
+    store.save_checkpoint(
+        run_id=run_id, tenant_id=tenant_id, step_index=0, event_index=1
+    )
+
+    assert len(reader.load_events(run_id, tenant_id=tenant_id)) == 2
+    assert reader.load_checkpoint(run_id, tenant_id=tenant_id) == (0, 1)
+
+
+def test_buffered_writes_flush_on_row_limit(tmp_path, resolved_flow) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    store = DuckDBExecutionWriteStore(db_path, buffered=True, flush_rows=2)
+    reader = DuckDBExecutionReadStore(db_path)
+    tenant_id = resolved_flow.plan.tenant_id
+    run_id = store.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+    store.save_events(run_id=run_id, tenant_id=tenant_id, events=(_event(0),))
+    assert reader.load_events(run_id, tenant_id=tenant_id) == ()
+    store.save_events(run_id=run_id, tenant_id=tenant_id, events=(_event(1),))
+    assert len(reader.load_events(run_id, tenant_id=tenant_id)) == 2
+
+
+def test_buffered_store_persists_full_trace(tmp_path, resolved_flow) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    store = DuckDBExecutionWriteStore(db_path, buffered=True)
+    result = execute_flow(
+        resolved_flow=resolved_flow,
+        config=ExecutionConfig(
+            mode=RunMode.DRY_RUN,
+            determinism_level=resolved_flow.manifest.determinism_level,
+            execution_store=store,
+        ),
+    )
+    stored = DuckDBExecutionReadStore(db_path).load_trace(
+        result.run_id, tenant_id=resolved_flow.manifest.tenant_id
+    )
+    assert stored.events == result.trace.events
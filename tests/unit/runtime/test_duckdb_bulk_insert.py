@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import pytest
+
+from agentic_flows.runtime.context import RunMode
+from agentic_flows.runtime.observability.storage.execution_store import (
+    DuckDBExecutionReadStore,
+    DuckDBExecutionWriteStore,
+)
+from agentic_flows.spec.model.artifact.artifact import Artifact
+from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
+from agentic_flows.spec.ontology import (
+    ArtifactScope,
+    ArtifactType,
+    EvidenceDeterminism,
+)
+from agentic_flows.spec.ontology.ids import (
+    ArtifactID,
+    ContentHash,
+    ContractID,
+    EvidenceID,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_bulk_insert_roundtrips_multi_row_batches(
+    execution_store: DuckDBExecutionWriteStore,
+    execution_read_store: DuckDBExecutionReadStore,
+    resolved_flow,
+) -> None:
+    tenant_id = resolved_flow.plan.tenant_id
+    run_id = execution_store.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+    execution_store.save_steps(
+        run_id=run_id, tenant_id=tenant_id, plan=resolved_flow.plan
+    )
+    artifacts = [
+        Artifact(
+            spec_version="v1",
+            artifact_id=ArtifactID(f"artifact-{index}"),
+            tenant_id=tenant_id,
+            artifact_type=ArtifactType.AGENT_INVOCATION,
+            producer="agent",
+            parent_artifacts=tuple(
+                ArtifactID(f"artifact-{parent}") for parent in range(index)
+            ),
+            content_hash=ContentHash(f"hash-{index}"),
+            scope=ArtifactScope.AUDIT,
+        )
+        for index in range(4)
+    ]
+    evidence = [
+        RetrievedEvidence(
+            spec_version="v1",
+            evidence_id=EvidenceID(f"evidence-{index}"),
+            tenant_id=tenant_id,
+            determinism=EvidenceDeterminism.DETERMINISTIC,
+            source_uri=f"file://doc-{index}",
+            content_hash=ContentHash(f"content-{index}"),
+            score=1.0 / (index + 1),
+            vector_contract_id=ContractID("contract-a"),
+        )
+        for index in range(5)
+    ]
+    execution_store.save_artifacts(run_id=run_id, artifacts=artifacts)
+    execution_store.append_evidence(run_id=run_id, evidence=evidence, starting_index=0)
+
+    stored_artifacts = {
+        artifact.artifact_id: artifact
+        for artifact in execution_read_store.load_artifacts(run_id, tenant_id=tenant_id)
+    }
+    assert {
+        artifact_id: set(artifact.parent_artifacts)
+        for artifact_id, artifact in stored_artifacts.items()
+    } == {
+        artifact.artifact_id: set(artifact.parent_artifacts) for artifact in artifacts
+    }
+    assert execution_read_store.load_evidence(run_id, tenant_id=tenant_id) == tuple(
+        evidence
+    )
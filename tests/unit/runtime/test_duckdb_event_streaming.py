@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import pytest
+
+from agentic_flows.runtime.context import RunMode
+from agentic_flows.runtime.observability.classification.fingerprint import (
+    fingerprint_inputs,
+)
+from agentic_flows.runtime.observability.storage.execution_store import (
+    DuckDBExecutionReadStore,
+    DuckDBExecutionWriteStore,
+)
+from agentic_flows.spec.model.identifiers.execution_event import ExecutionEvent
+from agentic_flows.spec.ontology import CausalityTag
+from agentic_flows.spec.ontology.public import EventType
+
+pytestmark = pytest.mark.unit
+
+
+def _event(index: int, step_index: int, event_type: EventType) -> ExecutionEvent:
+    payload = {"event_type": event_type.value, "index": index}
+    return ExecutionEvent(
+        spec_version="v1",
+        event_index=index,
+        step_index=step_index,
+        event_type=event_type,
+        causality_tag=CausalityTag.AGENT,
+        timestamp_utc="1970-01-01T00:00:00Z",
+        payload=payload,
+        payload_hash=fingerprint_inputs(payload),
+    )
+
+
+def test_iter_events_pages_and_filters_in_sql(
+    execution_store: DuckDBExecutionWriteStore,
+    execution_read_store: DuckDBExecutionReadStore,
+    resolved_flow,
+) -> None:
+    tenant_id = resolved_flow.plan.tenant_id
+    run_id = execution_store.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+    events = tuple(
+        _event(
+            index,
+            index // 2,
+            EventType.STEP_FAILED if index % 3 == 0 else EventType.STEP_START,
+        )
+        for index in range(7)
+    )
+    execution_store.save_events(run_id=run_id, tenant_id=tenant_id, events=events)
+
+    streamed = tuple(
+        execution_read_store.iter_events(run_id, tenant_id=tenant_id, batch_size=2)
+    )
+    assert streamed == events
+    assert streamed == execution_read_store.load_events(run_id, tenant_id=tenant_id)
+
+    in_range = execution_read_store.iter_events(
+        run_id, tenant_id=tenant_id, batch_size=2, step_range=(1, 3)
+    )
+    assert [event.event_index for event in in_range] == [2, 3, 4, 5]
+
+    last_failure = next(
+        execution_read_store.iter_events(
+            run_id,
+            tenant_id=tenant_id,
+            batch_size=1,
+            event_types=(EventType.STEP_FAILED,),
+            newest_first=True,
+        )
+    )
+    assert last_failure == events[6]
+
+    undecoded = tuple(
+        execution_read_store.iter_events(
+            run_id, tenant_id=tenant_id, batch_size=3, decode_payloads=False
+        )
+    )
+    assert [event.payload for event in undecoded] == [{}] * len(events)
+    assert [event.payload_hash for event in undecoded] == [
+        event.payload_hash for event in events
+    ]
@@ -27,7 +27,7 @@ def test_duckdb_migrations_apply(tmp_path: Path) -> None:
     rows = connection.execute(
         "SELECT version, checksum FROM schema_migrations ORDER BY version"
     ).fetchall()
-    assert [int(row[0]) for row in rows] == [1, 2, SCHEMA_VERSION]
+    assert [int(row[0]) for row in rows] == [1, 2, 3, 4, 5, 6, 7, SCHEMA_VERSION]
     expected_init = DuckDBExecutionWriteStore._hash_payload(
         (MIGRATIONS_DIR / "001_init.sql").read_text(encoding="utf-8")
     )
@@ -37,13 +37,31 @@ def test_duckdb_migrations_apply(tmp_path: Path) -> None:
         )
     )
     expected_slices = DuckDBExecutionWriteStore._hash_payload(
-        (MIGRATIONS_DIR / "003_entropy_budget_slices.sql").read_text(
-            encoding="utf-8"
-        )
+        (MIGRATIONS_DIR / "003_entropy_budget_slices.sql").read_text(encoding="utf-8")
+    )
+    expected_payloads = DuckDBExecutionWriteStore._hash_payload(
+        (MIGRATIONS_DIR / "004_event_payloads.sql").read_text(encoding="utf-8")
     )
     assert rows[0][1] == expected_init
     assert rows[1][1] == expected_update
     assert rows[2][1] == expected_slices
+    expected_archive = DuckDBExecutionWriteStore._hash_payload(
+        (MIGRATIONS_DIR / "005_archived_runs.sql").read_text(encoding="utf-8")
+    )
+    assert rows[3][1] == expected_payloads
+    assert rows[4][1] == expected_archive
+    expected_plan_nodes = DuckDBExecutionWriteStore._hash_payload(
+        (MIGRATIONS_DIR / "006_plan_nodes.sql").read_text(encoding="utf-8")
+    )
+    assert rows[5][1] == expected_plan_nodes
+    expected_step_outputs = DuckDBExecutionWriteStore._hash_payload(
+        (MIGRATIONS_DIR / "007_step_outputs.sql").read_text(encoding="utf-8")
+    )
+    assert rows[6][1] == expected_step_outputs
+    expected_timings = DuckDBExecutionWriteStore._hash_payload(
+        (MIGRATIONS_DIR / "008_timings.sql").read_text(encoding="utf-8")
+    )
+    assert rows[7][1] == expected_timings
     contract_row = connection.execute(
         "SELECT schema_version, schema_hash FROM schema_contract"
     ).fetchone()
@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import shutil
+
+import pytest
+
+from agentic_flows.runtime.context import RunMode
+from agentic_flows.runtime.observability.classification.fingerprint import (
+    encode_canonical,
+    fingerprint_inputs,
+)
+from agentic_flows.runtime.observability.storage.execution_store import (
+    MIGRATIONS_DIR,
+    DuckDBExecutionReadStore,
+    DuckDBExecutionWriteStore,
+)
+from agentic_flows.runtime.observability.storage.schema_contracts import (
+    hash_payload,
+)
+from agentic_flows.spec.model.identifiers.execution_event import ExecutionEvent
+from agentic_flows.spec.ontology import CausalityTag
+from agentic_flows.spec.ontology.public import EventType
+
+pytestmark = pytest.mark.unit
+
+
+def _event(index: int, payload: dict[str, object]) -> ExecutionEvent:
+    return ExecutionEvent(
+        spec_version="v1",
+        event_index=index,
+        step_index=0,
+        event_type=EventType.STEP_START,
+        causality_tag=CausalityTag.AGENT,
+        timestamp_utc="1970-01-01T00:00:00Z",
+        payload=payload,
+        payload_hash=fingerprint_inputs(payload),
+    )
+
+
+def test_repeated_payloads_are_stored_once(
+    execution_store: DuckDBExecutionWriteStore,
+    execution_read_store: DuckDBExecutionReadStore,
+    resolved_flow,
+) -> None:
+    tenant_id = resolved_flow.plan.tenant_id
+    shared = {"event_type": EventType.STEP_START.value, "agent_id": "agent-a"}
+    run_ids = []
+    for _ in range(2):
+        run_id = execution_store.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+        execution_store.save_events(
+            run_id=run_id,
+            tenant_id=tenant_id,
+            events=(_event(0, shared), _event(1, shared), _event(2, {"index": 2})),
+        )
+        run_ids.append(run_id)
+
+    connection = execution_store._store._connection
+    assert connection.execute("SELECT count(*) FROM payloads").fetchone() == (2,)
+    for run_id in run_ids:
+        events = execution_read_store.load_events(run_id, tenant_id=tenant_id)
+        assert [event.payload for event in events] == [shared, shared, {"index": 2}]
+
+    # Events loaded from a shared payload do not share the decoded dict.
+    first, second, _ = execution_read_store.load_events(run_ids[0], tenant_id=tenant_id)
+    first.payload["agent_id"] = "edited"
+    assert second.payload == shared
+    reloaded = execution_read_store.load_events(run_ids[1], tenant_id=tenant_id)
+    assert reloaded[0].payload == shared
+
+
+def test_encoded_payload_bytes_are_stored_verbatim(
+    execution_store: DuckDBExecutionWriteStore,
+    execution_read_store: DuckDBExecutionReadStore,
+    resolved_flow,
+) -> None:
+    tenant_id = resolved_flow.plan.tenant_id
+    payload = {
+        "step_index": 0,
+        "event_type": EventType.STEP_START.value,
+        "evidence_ids": ["ev-b", "ev-a", "ev-c"],
+    }
+    payload_json, payload_hash, payload_key = encode_canonical(payload)
+    event = ExecutionEvent(
+        spec_version="v1",
+        event_index=0,
+        step_index=0,
+        event_type=EventType.STEP_START,
+        causality_tag=CausalityTag.AGENT,
+        timestamp_utc="1970-01-01T00:00:00Z",
+        payload=payload,
+        payload_hash=payload_hash,
+        payload_json=payload_json,
+        payload_key=payload_key,
+    )
+    run_id = execution_store.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+    execution_store.save_events(run_id=run_id, tenant_id=tenant_id, events=(event,))
+
+    connection = execution_store._store._connection
+    assert connection.execute(
+        "SELECT payload_key, payload_json FROM payloads"
+    ).fetchall() == [(hash_payload(payload_json), payload_json)]
+    assert payload_key == hash_payload(payload_json)
+    assert payload_hash == fingerprint_inputs(payload)
+    (loaded,) = execution_read_store.load_events(run_id, tenant_id=tenant_id)
+    assert loaded == event
+    assert loaded.payload_json == payload_json
+    # Stored payloads keep list order; only the hash is order-insensitive.
+    assert loaded.payload["evidence_ids"] == ["ev-b", "ev-a", "ev-c"]
+
+
+def test_payload_migration_backfills_existing_events(
+    tmp_path: Path, monkeypatch, resolved_flow
+) -> None:
+    legacy_migrations = tmp_path / "migrations"
+    legacy_migrations.mkdir()
+    for migration in sorted(MIGRATIONS_DIR.glob("00[123]_*.sql")):
+        shutil.copy(migration, legacy_migrations / migration.name)
+    db_path = tmp_path / "execution.duckdb"
+    tenant_id = resolved_flow.plan.tenant_id
+    payload = {"event_type": EventType.STEP_START.value}
+
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            "agentic_flows.runtime.observability.storage.execution_store.MIGRATIONS_DIR",
+            legacy_migrations,
+        )
+        legacy = DuckDBExecutionWriteStore(db_path)
+        run_id = legacy.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+        legacy._store._connection.execute(
+            """
+            INSERT INTO events (
+                tenant_id, run_id, event_index, step_index, event_type,
+                causality_tag, timestamp_utc, payload_hash, agent_id, payload_json
+            )
+            VALUES (?, ?, 0, 0, 'STEP_START', 'agent', ?, ?, NULL, ?)
+            """,
+            (
+                str(tenant_id),
+                str(run_id),
+                "1970-01-01T00:00:00Z",
+                fingerprint_inputs(payload),
+                json.dumps(payload, separators=(",", ":")),
+            ),
+        )
+        legacy.close()
+
+    DuckDBExecutionWriteStore(db_path).close()
+
+    events = DuckDBExecutionReadStore(db_path).load_events(run_id, tenant_id=tenant_id)
+    assert [event.payload for event in events] == [payload]
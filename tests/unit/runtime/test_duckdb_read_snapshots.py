@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+import pickle
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import agentic_flows
+from agentic_flows.cli.main import _inspect_run
+from agentic_flows.runtime.context import RunMode
+from agentic_flows.runtime.observability.storage.execution_store import (
+    DuckDBExecutionReadStore,
+    DuckDBExecutionWriteStore,
+)
+from agentic_flows.runtime.observability.storage.reader_service import (
+    read_socket_path,
+)
+from agentic_flows.runtime.observability.storage.writer_service import (
+    RemoteExecutionWriteStore,
+)
+
+pytestmark = pytest.mark.unit
+
+_HOLD_WRITER = """
+import sys
+import duckdb
+
+connection = duckdb.connect(sys.argv[1])
+print("ready", flush=True)
+sys.stdin.read()
+connection.close()
+"""
+
+# Holds a write store open and begins one run per line read from stdin.
+_HOLD_STORE = """
+import pickle
+import sys
+from pathlib import Path
+
+from agentic_flows.runtime.context import RunMode
+from agentic_flows.runtime.observability.storage.execution_store import (
+    DuckDBExecutionWriteStore,
+)
+
+plan = pickle.loads(Path(sys.argv[2]).read_bytes())
+store = DuckDBExecutionWriteStore(Path(sys.argv[1]))
+print("ready", flush=True)
+for _ in sys.stdin:
+    print(store.begin_run(plan=plan, mode=RunMode.LIVE), flush=True)
+store.close()
+"""
+
+
+def test_read_store_skips_writer_lock(tmp_path, resolved_flow) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    store = DuckDBExecutionWriteStore(db_path)
+    run_id = store.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+    store.close()
+
+    reader = DuckDBExecutionReadStore(db_path)
+    descriptor = reader.load_dataset_descriptor(
+        run_id, tenant_id=resolved_flow.plan.tenant_id
+    )
+
+    assert descriptor == resolved_flow.plan.dataset
+    assert not db_path.with_suffix(".duckdb.lock").exists()
+    assert not read_socket_path(db_path).exists()
+    assert not reader.is_remote
+
+
+def test_read_store_waits_for_other_process_writer(tmp_path, resolved_flow) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    store = DuckDBExecutionWriteStore(db_path)
+    run_id = store.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+    store.close()
+
+    holder = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-c", _HOLD_WRITER, str(db_path)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert holder.stdout is not None
+        assert holder.stdout.readline().strip() == "ready"
+        impatient = DuckDBExecutionReadStore(db_path, lock_timeout=0)
+        with pytest.raises(RuntimeError, match="locked by another process"):
+            impatient.load_checkpoint(run_id, tenant_id=resolved_flow.plan.tenant_id)
+        threading.Timer(0.2, holder.communicate, kwargs={"input": ""}).start()
+        reader = DuckDBExecutionReadStore(db_path, lock_timeout=30)
+        descriptor = reader.load_dataset_descriptor(
+            run_id, tenant_id=resolved_flow.plan.tenant_id
+        )
+    finally:
+        holder.wait(timeout=30)
+
+    assert descriptor == resolved_flow.plan.dataset
+    assert not reader.is_remote
+
+
+def _spawn(script: str, *args: object) -> subprocess.Popen[str]:
+    process = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-c", script, *map(str, args)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(agentic_flows.__file__).parents[1])},
+    )
+    assert process.stdout is not None
+    assert process.stdout.readline().strip() == "ready"
+    return process
+
+
+def _begin_run(writer: subprocess.Popen[str]) -> str:
+    assert writer.stdin is not None
+    assert writer.stdout is not None
+    writer.stdin.write("\n")
+    writer.stdin.flush()
+    return writer.stdout.readline().strip()
+
+
+def test_read_store_reads_from_writer_in_another_process(
+    tmp_path, resolved_flow
+) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    plan_path = tmp_path / "plan.pickle"
+    plan_path.write_bytes(pickle.dumps(resolved_flow.plan))
+    tenant_id = resolved_flow.plan.tenant_id
+    writer = _spawn(_HOLD_STORE, db_path, plan_path)
+    try:
+        first = _begin_run(writer)
+        # The writer serves the reads, so nothing waits for its lock.
+        reader = DuckDBExecutionReadStore(db_path, lock_timeout=0)
+        with reader.session():
+            assert reader.load_checkpoint(first, tenant_id=tenant_id) is None
+            assert reader.is_remote
+            second = _begin_run(writer)
+            # The session keeps the view it started with.
+            with pytest.raises(KeyError, match="Run not found"):
+                reader.load_replay_envelope(second, tenant_id=tenant_id)
+        assert (
+            reader.load_dataset_descriptor(second, tenant_id=tenant_id)
+            == resolved_flow.plan.dataset
+        )
+        with reader.session():
+            # Closing the writer ends open sessions instead of waiting on them.
+            assert writer.stdin is not None
+            writer.stdin.close()
+            assert writer.wait(timeout=30) == 0
+    finally:
+        writer.kill()
+        writer.wait(timeout=30)
+
+    assert not read_socket_path(db_path).exists()
+
+
+def test_inspect_reads_from_writer_in_another_process(
+    tmp_path, resolved_flow, capsys
+) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    plan_path = tmp_path / "plan.pickle"
+    plan_path.write_bytes(pickle.dumps(resolved_flow.plan))
+    writer = _spawn(_HOLD_STORE, db_path, plan_path)
+    try:
+        run_id = _begin_run(writer)
+        _inspect_run(
+            argparse.Namespace(
+                run_id=run_id,
+                tenant_id=str(resolved_flow.plan.tenant_id),
+                db_path=str(db_path),
+                timings=True,
+            ),
+            json_output=False,
+        )
+    finally:
+        writer.communicate(input="")
+
+    assert capsys.readouterr().out == (
+        f"Run {run_id}: events=0 tool_invocations=0 entropy_entries=0\n"
+    )
+
+
+def test_read_store_reads_through_daemon(store_daemon, resolved_flow) -> None:
+    client = RemoteExecutionWriteStore(store_daemon)
+    reader = DuckDBExecutionReadStore(client.path, lock_timeout=0)
+    tenant_id = resolved_flow.plan.tenant_id
+    first = client.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+    assert reader.load_checkpoint(first, tenant_id=tenant_id) is None
+    assert reader.is_remote
+
+    # Each read outside a session sees every write committed before it.
+    second = client.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+    assert (
+        reader.load_dataset_descriptor(second, tenant_id=tenant_id)
+        == resolved_flow.plan.dataset
+    )
+    client.close()
+
+
+def test_read_store_sees_writes_of_same_process_writer(
+    execution_store, execution_read_store, resolved_flow
+) -> None:
+    tenant_id = resolved_flow.plan.tenant_id
+    first = execution_store.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+    assert execution_read_store.load_checkpoint(first, tenant_id=tenant_id) is None
+    second = execution_store.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+
+    assert (
+        execution_read_store.load_dataset_descriptor(second, tenant_id=tenant_id)
+        == resolved_flow.plan.dataset
+    )
+    assert not execution_read_store.is_remote
+
+
+def test_read_store_never_creates_missing_database(tmp_path) -> None:
+    reader = DuckDBExecutionReadStore(tmp_path / "missing.duckdb")
+
+    with pytest.raises(RuntimeError, match="not found"):
+        reader.load_checkpoint("run-a", tenant_id="tenant-a")
+    assert not (tmp_path / "missing.duckdb").exists()
@@ -0,0 +1,159 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+import threading
+
+import pytest
+
+from agentic_flows.runtime.context import RunMode
+from agentic_flows.runtime.observability.storage.execution_store import (
+    DuckDBExecutionReadStore,
+    DuckDBExecutionStore,
+    DuckDBExecutionWriteStore,
+)
+from agentic_flows.runtime.orchestration.execute_flow import (
+    ExecutionConfig,
+    execute_flow,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_archived_runs_load_from_parquet(tmp_path, monkeypatch, resolved_flow) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    archive_dir = tmp_path / "archive"
+    tenant_id = resolved_flow.manifest.tenant_id
+    store = DuckDBExecutionWriteStore(db_path)
+    result = execute_flow(
+        resolved_flow=resolved_flow,
+        config=ExecutionConfig(
+            mode=RunMode.DRY_RUN,
+            determinism_level=resolved_flow.manifest.determinism_level,
+            execution_store=store,
+        ),
+    )
+    reader = DuckDBExecutionReadStore(db_path)
+    hot = reader.load_trace(result.run_id, tenant_id=tenant_id)
+    hot_loads = _run_scoped_loads(reader, result.run_id, tenant_id)
+
+    cutoff = datetime.now(tz=UTC)
+    assert store.archive_runs(archive_dir, before=cutoff - timedelta(days=1)) == ()
+    assert store.archive_runs(archive_dir, before=cutoff + timedelta(days=1)) == (
+        result.run_id,
+    )
+    assert store.archive_runs(archive_dir, before=cutoff + timedelta(days=1)) == ()
+
+    connection = store._store._connection
+    for table in ("runs", "steps", "events", "payloads"):
+        assert connection.execute(f"SELECT count(*) FROM {table}").fetchone() == (0,)  # noqa: S608
+    partitions = sorted(
+        path.relative_to(archive_dir / "events").parent.as_posix()
+        for path in (archive_dir / "events").rglob("*.parquet")
+    )
+    assert partitions == [f"tenant_id={tenant_id}/run_date={cutoff.date()}"]
+
+    monkeypatch.setattr(DuckDBExecutionStore, "_archive", None)
+    migrations = []
+    original = DuckDBExecutionStore._migrate
+
+    def counting(self) -> None:
+        migrations.append(self)
+        original(self)
+
+    monkeypatch.setattr(DuckDBExecutionStore, "_migrate", counting)
+    cold = reader.load_trace(result.run_id, tenant_id=tenant_id)
+    assert cold == hot
+    assert cold.events == result.trace.events
+    # Every run-scoped loader follows the archive mark, and the in-memory
+    # archive store is migrated once for all of them.
+    assert _run_scoped_loads(reader, result.run_id, tenant_id) == hot_loads
+    assert len(migrations) == 1
+
+
+def test_concurrent_loads_of_one_archived_run(tmp_path, resolved_flow) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    tenant_id = resolved_flow.manifest.tenant_id
+    store = DuckDBExecutionWriteStore(db_path)
+    result = execute_flow(
+        resolved_flow=resolved_flow,
+        config=ExecutionConfig(
+            mode=RunMode.DRY_RUN,
+            determinism_level=resolved_flow.manifest.determinism_level,
+            execution_store=store,
+        ),
+    )
+    cutoff = datetime.now(tz=UTC) + timedelta(days=1)
+    assert store.archive_runs(tmp_path / "archive", before=cutoff) == (result.run_id,)
+    reader = DuckDBExecutionReadStore(db_path)
+    loaders = 8
+    barrier = threading.Barrier(loaders, timeout=10)
+
+    def _load(_index: int):
+        # Every loader reads the same run's partitions at once.
+        barrier.wait()
+        return [reader.load_trace(result.run_id, tenant_id=tenant_id) for _ in range(5)]
+
+    with ThreadPoolExecutor(max_workers=loaders) as pool:
+        traces = list(pool.map(_load, range(loaders)))
+
+    assert all(
+        trace.events == result.trace.events for batch in traces for trace in batch
+    )
+
+
+def test_eviction_keeps_runs_still_referenced(tmp_path, resolved_flow) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    tenant_id = resolved_flow.manifest.tenant_id
+    store = DuckDBExecutionWriteStore(db_path)
+    result = execute_flow(
+        resolved_flow=resolved_flow,
+        config=ExecutionConfig(
+            mode=RunMode.DRY_RUN,
+            determinism_level=resolved_flow.manifest.determinism_level,
+            execution_store=store,
+        ),
+    )
+    connection = store._store._connection
+    # A table outside the archived set that still points at the run.
+    connection.execute(
+        """
+        CREATE TABLE run_notes (
+            tenant_id TEXT NOT NULL,
+            run_id TEXT NOT NULL,
+            FOREIGN KEY (tenant_id, run_id) REFERENCES runs (tenant_id, run_id)
+        )
+        """
+    )
+    connection.execute(
+        "INSERT INTO run_notes VALUES (?, ?)", (str(tenant_id), str(result.run_id))
+    )
+
+    cutoff = datetime.now(tz=UTC) + timedelta(days=1)
+    assert store.archive_runs(tmp_path / "archive", before=cutoff) == (result.run_id,)
+
+    assert connection.execute("SELECT count(*) FROM runs").fetchone() == (1,)
+    assert connection.execute("SELECT count(*) FROM events").fetchone() == (0,)
+    reader = DuckDBExecutionReadStore(db_path)
+    assert reader.load_trace(result.run_id, tenant_id=tenant_id).events == (
+        result.trace.events
+    )
+
+
+def _run_scoped_loads(reader, run_id, tenant_id) -> dict[str, object]:
+    return {
+        "events": reader.load_events(run_id, tenant_id=tenant_id),
+        "streamed": tuple(reader.iter_events(run_id, tenant_id=tenant_id)),
+        "artifacts": reader.load_artifacts(run_id, tenant_id=tenant_id),
+        "evidence": reader.load_evidence(run_id, tenant_id=tenant_id),
+        "tool_invocations": reader.load_tool_invocations(run_id, tenant_id=tenant_id),
+        "entropy_usage": reader.load_entropy_usage(run_id, tenant_id=tenant_id),
+        "claim_ids": reader.load_claim_ids(run_id, tenant_id=tenant_id),
+        "checkpoint": reader.load_checkpoint(run_id, tenant_id=tenant_id),
+        "replay_envelope": reader.load_replay_envelope(run_id, tenant_id=tenant_id),
+        "dataset": reader.load_dataset_descriptor(run_id, tenant_id=tenant_id),
+        "timings": reader.load_timings(run_id, tenant_id=tenant_id),
+    }
@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from agentic_flows.runtime.observability.storage.execution_store import (
+    DuckDBExecutionWriteStore,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_reopen_skips_migration_files(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    DuckDBExecutionWriteStore(db_path).close()
+    reads: list[Path] = []
+    read_text = Path.read_text
+
+    def tracking_read_text(self: Path, *args, **kwargs) -> str:
+        reads.append(self)
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", tracking_read_text)
+    DuckDBExecutionWriteStore(db_path).close()
+
+    assert reads == []
+
+
+def test_store_open_latency(tmp_path: Path, benchmark) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    DuckDBExecutionWriteStore(db_path).close()
+
+    def open_store() -> None:
+        DuckDBExecutionWriteStore(db_path).close()
+
+    benchmark.pedantic(open_store, rounds=20, iterations=1)
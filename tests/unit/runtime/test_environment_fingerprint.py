@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from importlib import metadata
+
+import pytest
+
+from agentic_flows.runtime.observability.capture import environment
+
+pytestmark = pytest.mark.unit
+
+
+def test_environment_fingerprint_is_computed_once_per_process(monkeypatch) -> None:
+    lookups: list[str] = []
+    version = metadata.version
+
+    def counting_version(name: str) -> str:
+        lookups.append(name)
+        return version(name)
+
+    monkeypatch.setattr(environment.metadata, "version", counting_version)
+    environment.invalidate_environment_fingerprint()
+    try:
+        first = environment.compute_environment_fingerprint()
+        second = environment.compute_environment_fingerprint()
+        assert first == second
+        assert len(lookups) == 5
+
+        environment.invalidate_environment_fingerprint()
+        assert environment.compute_environment_fingerprint() == first
+        assert len(lookups) == 10
+    finally:
+        environment.invalidate_environment_fingerprint()
+
+
+def test_detailed_snapshot_extends_fingerprinted_fields() -> None:
+    snapshot = environment.environment_snapshot()
+    detailed = environment.environment_snapshot(detailed=True)
+
+    assert {key: detailed[key] for key in snapshot} == snapshot
+    assert set(detailed["details"]) == {
+        "python_implementation",
+        "executable",
+        "machine",
+        "bijux_distributions",
+    }
@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from agentic_flows.runtime.observability.storage.writer_service import (
+    QueuedExecutionWriteStore,
+)
+from agentic_flows.runtime.orchestration.execute_batch import execute_flows
+from agentic_flows.runtime.orchestration.execute_flow import (
+    ExecutionConfig,
+    RunMode,
+)
+from agentic_flows.spec.ontology.ids import AgentID, FlowID
+
+pytestmark = pytest.mark.unit
+
+
+def _manifest(resolved_flow, flow_id: str, dependencies: tuple[str, ...] = ()):
+    return replace(
+        resolved_flow.manifest,
+        flow_id=FlowID(flow_id),
+        agents=(AgentID("agent-0"), AgentID("agent-1")),
+        dependencies=dependencies,
+    )
+
+
+def test_batch_summarizes_every_flow_in_manifest_order(resolved_flow, tmp_path) -> None:
+    manifests = [
+        _manifest(resolved_flow, "flow-batch-a", ("agent-1:agent-0",)),
+        _manifest(resolved_flow, "flow-batch-b", ("agent-1:agent-missing",)),
+        _manifest(resolved_flow, "flow-batch-c"),
+        _manifest(resolved_flow, "flow-batch-a", ("agent-1:agent-0",)),
+    ]
+    store = QueuedExecutionWriteStore(tmp_path / "execution.duckdb")
+    streamed = []
+    try:
+        summaries = execute_flows(
+            manifests,
+            ExecutionConfig(
+                mode=RunMode.DRY_RUN,
+                determinism_level=None,
+                execution_store=store,
+            ),
+            max_workers=3,
+            on_summary=streamed.append,
+        )
+    finally:
+        store.close()
+
+    assert [summary.index for summary in summaries] == [0, 1, 2, 3]
+    assert [summary.status for summary in summaries] == [
+        "finalized",
+        "failed",
+        "finalized",
+        "finalized",
+    ]
+    assert sorted(streamed, key=lambda summary: summary.index) == summaries
+    assert summaries[1].run_id is None
+    assert summaries[1].error
+    assert summaries[0].plan_hash == summaries[3].plan_hash
+    assert summaries[0].run_id != summaries[3].run_id
+    assert summaries[0].plan_hash != summaries[2].plan_hash
+
+
+def test_batch_rejects_thread_unsafe_store(resolved_flow, execution_store) -> None:
+    config = ExecutionConfig(
+        mode=RunMode.DRY_RUN,
+        determinism_level=None,
+        execution_store=execution_store,
+    )
+
+    with pytest.raises(ValueError, match="shared across threads"):
+        execute_flows([_manifest(resolved_flow, "flow-batch-x")], config, max_workers=2)
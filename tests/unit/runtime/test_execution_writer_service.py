@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import importlib
+import stat
+import threading
+
+import pytest
+
+from agentic_flows.runtime.context import RunMode
+from agentic_flows.runtime.observability.storage.execution_store import (
+    DuckDBExecutionReadStore,
+)
+from agentic_flows.runtime.observability.storage.writer_service import (
+    ExecutionStoreServer,
+    QueuedExecutionWriteStore,
+    RemoteExecutionWriteStore,
+    ping_store_daemon,
+    store_authkey_path,
+)
+from agentic_flows.runtime.orchestration.execute_flow import (
+    ExecutionConfig,
+    execute_flow,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_queued_store_serves_concurrent_flows(tmp_path, resolved_flow) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    store = QueuedExecutionWriteStore(db_path)
+
+    def run_once(_: int):
+        return execute_flow(
+            resolved_flow=resolved_flow,
+            config=ExecutionConfig(
+                mode=RunMode.DRY_RUN,
+                determinism_level=resolved_flow.manifest.determinism_level,
+                execution_store=store,
+            ),
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(run_once, range(4)))
+    store.close()
+
+    reader = DuckDBExecutionReadStore(db_path)
+    assert len({result.run_id for result in results}) == 4
+    for result in results:
+        stored = reader.load_trace(
+            result.run_id, tenant_id=resolved_flow.manifest.tenant_id
+        )
+        assert stored.events == result.trace.events
+
+
+def test_remote_store_roundtrip(tmp_path, resolved_flow) -> None:
+    db_path = tmp_path / "execution.duckdb"
+    address = tmp_path / "store.sock"
+    server = ExecutionStoreServer(db_path, address, authkey=b"secret")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert ping_store_daemon(address, authkey=b"secret")
+        assert not ping_store_daemon(address, authkey=b"wrong")
+        client = RemoteExecutionWriteStore(address, authkey=b"secret")
+        run_id = client.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+        client.save_steps(
+            run_id=run_id,
+            tenant_id=resolved_flow.plan.tenant_id,
+            plan=resolved_flow.plan,
+        )
+        client.close()
+    finally:
+        server.close()
+        thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    reader = DuckDBExecutionReadStore(db_path)
+    assert (
+        reader.load_checkpoint(run_id, tenant_id=resolved_flow.plan.tenant_id) is None
+    )
+    assert (
+        reader.load_dataset_descriptor(run_id, tenant_id=resolved_flow.plan.tenant_id)
+        == resolved_flow.plan.dataset
+    )
+
+
+def test_remote_store_requires_generated_key(
+    tmp_path, monkeypatch, resolved_flow
+) -> None:
+    monkeypatch.delenv("AGENTIC_FLOWS_STORE_AUTHKEY", raising=False)
+    db_path = tmp_path / "execution.duckdb"
+    address = tmp_path / "store.sock"
+    server = ExecutionStoreServer(db_path, address)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    key_path = store_authkey_path(address)
+    try:
+        assert stat.S_IMODE(key_path.stat().st_mode) == 0o600
+        assert stat.S_IMODE(address.stat().st_mode) & 0o077 == 0
+        assert not ping_store_daemon(address, authkey=b"guess")
+        client = RemoteExecutionWriteStore(address)
+        assert client.path == db_path
+        run_id = client.begin_run(plan=resolved_flow.plan, mode=RunMode.LIVE)
+        execute_flow_module = importlib.import_module(
+            "agentic_flows.runtime.orchestration.execute_flow"
+        )
+        read_store = execute_flow_module._resolve_read_store(
+            ExecutionConfig(
+                mode=RunMode.LIVE,
+                determinism_level=resolved_flow.manifest.determinism_level,
+                execution_store=client,
+            )
+        )
+        assert isinstance(read_store, DuckDBExecutionReadStore)
+        assert (
+            read_store.load_dataset_descriptor(
+                run_id, tenant_id=resolved_flow.plan.tenant_id
+            )
+            == resolved_flow.plan.dataset
+        )
+        client.close()
+    finally:
+        server.close()
+        thread.join(timeout=5)
+
+    assert not key_path.exists()
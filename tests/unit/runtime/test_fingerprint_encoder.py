@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+from agentic_flows.runtime.observability.classification import fingerprint
+from agentic_flows.runtime.observability.classification.fingerprint import (
+    CanonicalPayload,
+    encode_canonical,
+    fingerprint_inputs,
+)
+from agentic_flows.spec.ontology.public import EventType
+
+pytestmark = pytest.mark.unit
+
+
+def _reference(value):
+    if isinstance(value, dict):
+        return {key: _reference(value[key]) for key in sorted(value)}
+    if isinstance(value, list | tuple | set):
+        return sorted(
+            (_reference(item) for item in value),
+            key=lambda item: json.dumps(item, sort_keys=True, separators=(",", ":")),
+        )
+    return value
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"b": [3, 1, 2], "a": {"z": None, "y": [{"k": [2, 1]}, {"k": [1]}]}},
+        {"set": {"x", "y☃"}, "tuple": (1.5, float("inf"), -0.0, True, None)},
+        {"escaped": 'q"\\\n\U0001f600', "enum": EventType.STEP_START},
+        {1: "int key", 10: [[3, 2], [1]], 2: 1e300},
+    ],
+)
+def test_fingerprint_matches_canonical_json(data) -> None:
+    canonical = json.dumps(
+        _reference(data), sort_keys=True, separators=(",", ":"), ensure_ascii=True
+    )
+    expected = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    assert fingerprint_inputs(data) == expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"b": [1, 2], "a": {"z": None}},
+        {"b": [3, 1, 2], "a": {"z": None, "y": [{"k": [2, 1]}, {"k": [1]}]}},
+    ],
+)
+def test_encode_canonical_derives_every_value_in_one_pass(data) -> None:
+    ordered = json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+    payload_json, payload_hash, payload_key = encode_canonical(data)
+
+    assert payload_json == ordered
+    assert payload_hash == fingerprint_inputs(data)
+    assert payload_key == hashlib.sha256(ordered.encode("utf-8")).hexdigest()
+    annotated = {**data, "cache": "hit"}
+    annotated_json, annotated_hash, annotated_key = encode_canonical(
+        annotated, unhashed={"cache"}
+    )
+    assert json.loads(annotated_json) == annotated
+    assert annotated_hash == payload_hash
+    assert annotated_key == hashlib.sha256(annotated_json.encode()).hexdigest()
+
+
+def test_fingerprint_rejects_unserializable_values() -> None:
+    with pytest.raises(TypeError):
+        fingerprint_inputs({"value": object()})
+
+
+def test_canonical_payload_fingerprints_once(monkeypatch) -> None:
+    data = {"tool_id": "bijux-agent.run", "evidence_ids": ["b", "a"]}
+    payload = CanonicalPayload(data)
+    calls = []
+    monkeypatch.setattr(fingerprint, "_encode", lambda value: calls.append(value))
+
+    assert payload.fingerprint == fingerprint_inputs(payload)
+    assert calls == []
+    monkeypatch.undo()
+    assert payload.fingerprint == fingerprint_inputs(data)
+    assert fingerprint_inputs({"nested": payload}) == fingerprint_inputs(
+        {"nested": data}
+    )
+    with pytest.raises(TypeError):
+        payload.data["tool_id"] = "other"  # type: ignore[index]
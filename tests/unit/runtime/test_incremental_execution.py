@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+from tests.helpers import agent_payload
+
+from agentic_flows.runtime.observability.storage.writer_service import (
+    RemoteExecutionWriteStore,
+)
+from agentic_flows.runtime.orchestration.execute_flow import (
+    ExecutionConfig,
+    RunMode,
+    execute_flow,
+)
+from agentic_flows.spec.ontology import DeterminismLevel
+from agentic_flows.spec.ontology.public import EventType
+
+pytestmark = pytest.mark.unit
+
+
+def _recording_agent(agent_calls: list[str]):
+    def _run(agent_id, **_kwargs):
+        agent_calls.append(agent_id)
+        return agent_payload(agent_id)
+
+    return _run
+
+
+def _agent_cache(result) -> list[tuple[object, object]]:
+    return [
+        (event.payload["cache"], event.payload.get("reused_run_id"))
+        for event in result.trace.events
+        if event.event_type == EventType.TOOL_CALL_END
+        and event.payload["tool_id"] == "bijux-agent.run"
+    ]
+
+
+@pytest.mark.parametrize("max_parallel_steps", [1, 2])
+def test_incremental_run_reuses_unchanged_steps(
+    live_backends, live_flow, execute_live, max_parallel_steps
+) -> None:
+    agent_calls: list[str] = []
+    live_backends(run=_recording_agent(agent_calls))
+    original = live_flow("flow-incremental", inputs=("inputs-0", "inputs-1"))
+    edited = live_flow("flow-incremental", inputs=("inputs-0", "inputs-1-edited"))
+
+    first = execute_live(
+        original, max_parallel_steps=max_parallel_steps, incremental=True
+    )
+    second = execute_live(
+        original, max_parallel_steps=max_parallel_steps, incremental=True
+    )
+    third = execute_live(
+        edited, max_parallel_steps=max_parallel_steps, incremental=True
+    )
+
+    assert sorted(agent_calls) == ["agent-0", "agent-1", "agent-1"]
+    assert _agent_cache(first) == [("miss", None), ("miss", None)]
+    assert _agent_cache(second) == [
+        ("hit", first.run_id),
+        ("hit", first.run_id),
+    ]
+    assert _agent_cache(third) == [("hit", second.run_id), ("miss", None)]
+    assert second.artifacts == first.artifacts
+    assert second.trace.tool_invocations == first.trace.tool_invocations
+    assert second.trace.finalized is True
+
+
+def test_incremental_run_through_store_daemon_reuses_steps(
+    live_backends, live_flow, execute_live, store_daemon
+) -> None:
+    agent_calls: list[str] = []
+    live_backends(run=_recording_agent(agent_calls))
+    flow = live_flow("flow-incremental-daemon")
+    # No read store is configured: the daemon holds the file, so earlier
+    # outputs are looked up through the reads its writer serves.
+    client = RemoteExecutionWriteStore(store_daemon)
+    try:
+        first = execute_live(flow, incremental=True, execution_store=client)
+        second = execute_live(flow, incremental=True, execution_store=client)
+    finally:
+        client.close()
+
+    assert sorted(agent_calls) == ["agent-0", "agent-1"]
+    assert _agent_cache(second) == [
+        ("hit", first.run_id),
+        ("hit", first.run_id),
+    ]
+    assert second.artifacts == first.artifacts
+
+
+def test_incremental_requires_strict_flow(
+    resolved_flow, baseline_policy, execution_store
+) -> None:
+    bounded = replace(
+        resolved_flow,
+        manifest=replace(
+            resolved_flow.manifest, determinism_level=DeterminismLevel.BOUNDED
+        ),
+    )
+
+    with pytest.raises(ValueError, match="requires strict determinism"):
+        execute_flow(
+            resolved_flow=bounded,
+            config=ExecutionConfig(
+                mode=RunMode.LIVE,
+                determinism_level=DeterminismLevel.BOUNDED,
+                verification_policy=baseline_policy,
+                execution_store=execution_store,
+                incremental=True,
+            ),
+        )
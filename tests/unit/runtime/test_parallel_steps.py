@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from collections import Counter
+import threading
+
+import pytest
+from tests.helpers import agent_payload
+
+from agentic_flows.runtime.budget import ExecutionBudget
+from agentic_flows.spec.ontology.public import EventType
+
+pytestmark = pytest.mark.unit
+
+_FAN_OUT = 3
+
+
+def _counting_agent(agent_calls: Counter[str], barrier=None):
+    def _run(agent_id, **_kwargs):
+        agent_calls[str(agent_id)] += 1
+        if barrier is not None and str(agent_id) != "agent-0":
+            barrier.wait()
+        return agent_payload(agent_id)
+
+    return _run
+
+
+def test_parallel_steps_match_sequential_trace(
+    live_backends, live_flow, execute_live
+) -> None:
+    resolved_flow = live_flow(
+        "flow-fan-out",
+        steps=_FAN_OUT + 1,
+        dependencies=dict.fromkeys(range(1, _FAN_OUT + 1), (0,)),
+    )
+
+    sequential_calls: Counter[str] = Counter()
+    live_backends(run=_counting_agent(sequential_calls))
+    sequential = execute_live(resolved_flow, max_parallel_steps=1)
+
+    # The dependents of agent-0 only get past the barrier when all of them
+    # are running at once, so a serial schedule fails the run.
+    parallel_calls: Counter[str] = Counter()
+    live_backends(
+        run=_counting_agent(parallel_calls, threading.Barrier(_FAN_OUT, timeout=10))
+    )
+    parallel = execute_live(resolved_flow, max_parallel_steps=_FAN_OUT)
+
+    assert parallel.trace.finalized is True
+    assert parallel_calls == sequential_calls
+    assert set(parallel_calls.values()) == {1}
+    assert parallel.trace.plan_hash == sequential.trace.plan_hash
+    assert [event.payload_json for event in parallel.trace.events] == [
+        event.payload_json for event in sequential.trace.events
+    ]
+    assert parallel.trace.tool_invocations == sequential.trace.tool_invocations
+    assert parallel.evidence == sequential.evidence
+    assert parallel.artifacts == sequential.artifacts
+
+
+def test_parallel_steps_stay_within_the_step_budget(
+    live_backends, live_flow, execute_live
+) -> None:
+    agent_calls: Counter[str] = Counter()
+    live_backends(run=_counting_agent(agent_calls))
+
+    result = execute_live(
+        live_flow("flow-budget", steps=_FAN_OUT),
+        max_parallel_steps=_FAN_OUT,
+        budget=ExecutionBudget(
+            step_limit=1,
+            token_limit=None,
+            artifact_limit=None,
+            artifact_step_limit=None,
+            evidence_limit=None,
+            trace_event_limit=None,
+        ),
+    )
+
+    assert agent_calls == Counter({"agent-0": 1})
+    assert [
+        event.step_index
+        for event in result.trace.events
+        if event.event_type == EventType.STEP_FAILED
+    ] == [1]
+
+
+def test_parallel_steps_stop_after_a_failed_step(
+    live_backends, live_flow, execute_live
+) -> None:
+    agent_calls: Counter[str] = Counter()
+
+    def _run(agent_id, **_kwargs):
+        agent_calls[str(agent_id)] += 1
+        if str(agent_id) == "agent-0":
+            raise RuntimeError("agent backend unavailable")
+        return agent_payload(agent_id)
+
+    live_backends(run=_run)
+
+    result = execute_live(
+        live_flow("flow-failure", steps=_FAN_OUT, dependencies={1: (0,), 2: (1,)}),
+        max_parallel_steps=_FAN_OUT,
+    )
+
+    assert agent_calls == Counter({"agent-0": 1})
+    assert result.trace.finalized is True
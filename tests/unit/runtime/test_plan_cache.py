@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from dataclasses import replace
+import json
+
+import pytest
+
+from agentic_flows.runtime.orchestration import planner as planner_module
+from agentic_flows.runtime.orchestration.planner import ExecutionPlanner
+from agentic_flows.spec.ontology.ids import FlowID
+
+pytestmark = pytest.mark.unit
+
+
+def _fail_validation(_manifest) -> None:
+    raise AssertionError("cache hit must skip validation")
+
+
+def test_planner_reuses_cached_plans(tmp_path, monkeypatch, resolved_flow) -> None:
+    manifest = resolved_flow.manifest
+    ExecutionPlanner._plan_cache.clear()
+    first = ExecutionPlanner(cache_dir=tmp_path).resolve(manifest)
+
+    monkeypatch.setattr(planner_module, "validate_flow_manifest", _fail_validation)
+    assert ExecutionPlanner(cache_dir=tmp_path).resolve(manifest) is first
+
+    ExecutionPlanner._plan_cache.clear()
+    assert ExecutionPlanner(cache_dir=tmp_path).resolve(manifest) == first
+    assert ExecutionPlanner().resolve(manifest) == first
+
+    monkeypatch.setattr(
+        planner_module, "compute_environment_fingerprint", lambda: "env-changed"
+    )
+    with pytest.raises(AssertionError, match="skip validation"):
+        ExecutionPlanner(cache_dir=tmp_path).resolve(manifest)
+
+
+def test_planner_rejects_foreign_plan_files(tmp_path, resolved_flow) -> None:
+    manifest = resolved_flow.manifest
+    other = replace(manifest, flow_id=FlowID("flow-other"))
+    ExecutionPlanner._plan_cache.clear()
+    ExecutionPlanner(cache_dir=tmp_path).resolve(manifest)
+    ExecutionPlanner(cache_dir=tmp_path).resolve(other)
+    files = {
+        json.loads(path.read_text())["plan"]["manifest"]["flow_id"]: path
+        for path in tmp_path.glob("*.json")
+    }
+    target, source = files[str(manifest.flow_id)], files["flow-other"]
+
+    # A plan copied under another manifest's name keeps its own key, and a
+    # rewritten key still cannot make it claim a different manifest.
+    target.write_text(source.read_text())
+    ExecutionPlanner._plan_cache.clear()
+    assert ExecutionPlanner(cache_dir=tmp_path).resolve(manifest).manifest == manifest
+    payload = json.loads(source.read_text())
+    payload["key"] = target.stem
+    target.write_text(json.dumps(payload))
+    ExecutionPlanner._plan_cache.clear()
+    assert ExecutionPlanner(cache_dir=tmp_path).resolve(manifest).manifest == manifest
+
+    target.write_text("not json")
+    ExecutionPlanner._plan_cache.clear()
+    assert ExecutionPlanner(cache_dir=tmp_path).resolve(manifest).manifest == manifest
+    assert b"pickle" not in target.read_bytes()
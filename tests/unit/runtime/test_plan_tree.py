@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from dataclasses import replace
+import hashlib
+
+import pytest
+
+from agentic_flows.runtime.orchestration import plan_tree
+from agentic_flows.runtime.orchestration.determinism_guard import (
+    ReplayDiffError,
+    replay_diff,
+)
+from agentic_flows.runtime.orchestration.execute_flow import (
+    ExecutionConfig,
+    RunMode,
+    execute_flow,
+)
+from agentic_flows.runtime.orchestration.planner import ExecutionPlanner
+from agentic_flows.spec.ontology.ids import AgentID, FlowID
+
+pytestmark = pytest.mark.unit
+
+
+def _manifest(resolved_flow, flow_id: str, dependencies: tuple[str, ...]):
+    return replace(
+        resolved_flow.manifest,
+        flow_id=FlowID(flow_id),
+        agents=tuple(AgentID(f"agent-{index}") for index in range(5)),
+        dependencies=dependencies,
+    )
+
+
+def test_replanning_rehashes_only_changed_steps(resolved_flow, monkeypatch) -> None:
+    planner = ExecutionPlanner()
+    before = planner.resolve(
+        _manifest(resolved_flow, "flow-merkle-reuse", ("agent-1:agent-0",))
+    )
+    hashed: list[str] = []
+    original = plan_tree.step_leaf_hash
+
+    def counting(step):
+        hashed.append(str(step.agent_id))
+        return original(step)
+
+    monkeypatch.setattr(plan_tree, "step_leaf_hash", counting)
+    edited = _manifest(
+        resolved_flow, "flow-merkle-reuse", ("agent-1:agent-0", "agent-4:agent-0")
+    )
+    after = planner.resolve(edited)
+
+    assert hashed == ["agent-4"]
+    assert after.plan.plan_hash != before.plan.plan_hash
+    monkeypatch.setattr(plan_tree, "step_leaf_hash", original)
+    fresh = plan_tree.build_plan_tree({}, after.plan.steps)
+    assert fresh.step_levels == after.plan.plan_tree.step_levels
+    assert plan_tree.diff_plan_trees(before.plan.plan_tree, after.plan.plan_tree) == {
+        "sections": [],
+        "steps": ["agent-4"],
+    }
+
+
+def test_plan_hash_fixture_matches_planner(resolved_flow, plan_hash_for) -> None:
+    manifest = _manifest(
+        resolved_flow, "flow-merkle-fixture", ("agent-1:agent-0", "agent-2:agent-1")
+    )
+    planned = ExecutionPlanner().resolve(manifest)
+
+    assert (
+        plan_hash_for(
+            manifest.flow_id,
+            str(manifest.tenant_id),
+            manifest.flow_state,
+            planned.plan.steps,
+            determinism_level=manifest.determinism_level,
+            replay_acceptability=manifest.replay_acceptability,
+            entropy_budget=manifest.entropy_budget,
+            replay_envelope=manifest.replay_envelope,
+            dataset=manifest.dataset,
+            allow_deprecated_datasets=manifest.allow_deprecated_datasets,
+            replay_mode=manifest.replay_mode,
+            allowed_variance_class=manifest.allowed_variance_class,
+            nondeterminism_intent=manifest.nondeterminism_intent,
+        )
+        == planned.plan.plan_hash
+    )
+
+
+def test_replay_diff_names_changed_steps_from_stored_tree(
+    resolved_flow, execution_store, execution_read_store
+) -> None:
+    planner = ExecutionPlanner()
+    recorded = planner.resolve(
+        _manifest(resolved_flow, "flow-merkle-replay", ("agent-1:agent-0",))
+    )
+    result = execute_flow(
+        resolved_flow=recorded,
+        config=ExecutionConfig(
+            mode=RunMode.DRY_RUN,
+            determinism_level=recorded.manifest.determinism_level,
+            execution_store=execution_store,
+        ),
+    )
+    stored = execution_read_store.load_trace(
+        result.run_id, tenant_id=recorded.plan.tenant_id
+    )
+    assert stored.plan_tree == recorded.plan.plan_tree
+
+    edited = planner.resolve(
+        _manifest(resolved_flow, "flow-merkle-replay", ("agent-2:agent-0",))
+    )
+    with pytest.raises(ReplayDiffError) as excinfo:
+        replay_diff(stored, edited.plan)
+
+    assert excinfo.value.diffs["plan_hash"]["changed"] == {
+        "sections": [],
+        "steps": ["agent-1", "agent-2"],
+    }
+
+
+def test_diff_falls_back_to_agents_when_steps_move(resolved_flow) -> None:
+    planner = ExecutionPlanner()
+    before = planner.resolve(_manifest(resolved_flow, "flow-merkle-shape", ()))
+    shrunk = replace(
+        before.manifest,
+        agents=before.manifest.agents[:4],
+        allow_deprecated_datasets=True,
+    )
+    after = planner.resolve(shrunk)
+
+    assert plan_tree.diff_plan_trees(before.plan.plan_tree, after.plan.plan_tree) == {
+        "sections": ["flow"],
+        "steps": ["agent-4"],
+    }
+
+
+def test_previous_trees_are_bounded(resolved_flow, monkeypatch) -> None:
+    monkeypatch.setattr(ExecutionPlanner, "_max_previous_trees", 2)
+    planner = ExecutionPlanner()
+    # Each manifest differs, so every resolve misses the plan cache and
+    # refreshes its flow's entry.
+    for name, dependencies in (
+        ("flow-lru-a", ()),
+        ("flow-lru-b", ()),
+        ("flow-lru-a", ("agent-1:agent-0",)),
+        ("flow-lru-c", ()),
+    ):
+        planner.resolve(_manifest(resolved_flow, name, dependencies))
+
+    assert [key[1] for key in ExecutionPlanner._previous_trees] == [
+        "flow-lru-a",
+        "flow-lru-c",
+    ]
+
+
+def test_leaves_and_nodes_hash_in_separate_domains(resolved_flow) -> None:
+    plan = ExecutionPlanner().resolve(_manifest(resolved_flow, "flow-domains", ()))
+    leaves, parents = plan.plan.plan_tree.step_levels[:2]
+
+    assert parents[:2] == tuple(
+        hashlib.sha256(
+            b"\x01" + (leaves[start] + leaves[start + 1]).encode()
+        ).hexdigest()
+        for start in (0, 2)
+    )
+    assert not set(parents[:2]) & set(leaves)
@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from dataclasses import replace
+import random
+
+import pytest
+
+from agentic_flows.runtime.orchestration.planner import ExecutionPlanner
+from agentic_flows.spec.model.flow_manifest import FlowManifest
+from agentic_flows.spec.ontology.ids import AgentID
+
+pytestmark = pytest.mark.unit
+
+
+def _manifest(base: FlowManifest, agents: int, fan_in: int, seed: int) -> FlowManifest:
+    rng = random.Random(seed)  # noqa: S311
+    names = [f"agent-{index:06d}" for index in range(agents)]
+    dependencies = tuple(
+        f"{names[index]}:{names[dependency]}"
+        for index in range(1, agents)
+        for dependency in rng.sample(range(index), min(index, fan_in))
+    )
+    rng.shuffle(names)
+    return replace(
+        base,
+        agents=tuple(AgentID(name) for name in names),
+        dependencies=dependencies,
+    )
+
+
+def _sorted_ready_toposort(manifest: FlowManifest) -> list[str]:
+    forward: dict[str, list[str]] = {agent: [] for agent in manifest.agents}
+    indegree = dict.fromkeys(manifest.agents, 0)
+    for entry in manifest.dependencies:
+        agent, dependency = entry.split(":")
+        forward[dependency].append(agent)
+        indegree[agent] += 1
+    ready = sorted(agent for agent, degree in indegree.items() if degree == 0)
+    ordered = []
+    while ready:
+        current = ready.pop(0)
+        ordered.append(current)
+        for downstream in sorted(forward[current]):
+            indegree[downstream] -= 1
+            if indegree[downstream] == 0:
+                ready.append(downstream)
+                ready.sort()
+    return ordered
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_toposort_matches_lexical_ready_order(resolved_flow, seed) -> None:
+    manifest = _manifest(resolved_flow.manifest, agents=300, fan_in=3, seed=seed)
+
+    assert ExecutionPlanner()._toposort_agents(manifest) == _sorted_ready_toposort(
+        manifest
+    )
+
+
+@pytest.mark.parametrize(
+    "agents",
+    [10_000, pytest.param(100_000, marks=pytest.mark.slow)],
+)
+def test_toposort_scales_to_large_manifests(resolved_flow, benchmark, agents) -> None:
+    manifest = _manifest(resolved_flow.manifest, agents=agents, fan_in=8, seed=0)
+    planner = ExecutionPlanner()
+
+    ordered = benchmark.pedantic(
+        planner._toposort_agents, args=(manifest,), rounds=1, iterations=1
+    )
+
+    assert len(ordered) == agents
+
+
+def test_resolve_scales_to_large_manifests(resolved_flow, benchmark) -> None:
+    manifest = _manifest(resolved_flow.manifest, agents=10_000, fan_in=8, seed=0)
+    planner = ExecutionPlanner()
+
+    resolved = benchmark.pedantic(
+        planner._resolve, args=(manifest,), rounds=1, iterations=1
+    )
+
+    assert len(resolved.plan.steps) == 10_000
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+from tests.helpers import reasoning_bundle
+
+from agentic_flows.runtime.execution.reasoning_cache import (
+    ReasoningCache,
+    ReasoningCacheKey,
+)
+from agentic_flows.runtime.orchestration.replay_store import replay_with_store
+from agentic_flows.spec.model.reasoning_bundle import ReasoningBundle
+from agentic_flows.spec.ontology import DeterminismLevel
+from agentic_flows.spec.ontology.ids import AgentID, BundleID, EvidenceID, TenantID
+from agentic_flows.spec.ontology.public import EventType
+
+pytestmark = pytest.mark.unit
+
+
+def _bundle(seed: int) -> ReasoningBundle:
+    return ReasoningBundle(
+        spec_version="v1",
+        bundle_id=BundleID(f"bundle-{seed}"),
+        claims=(),
+        steps=(),
+        evidence_ids=(EvidenceID("ev-1"),),
+        producer_agent_id=AgentID("agent-0"),
+    )
+
+
+def _recording_reasoning(reasoning_calls: list[int]):
+    def _reason(agent_outputs, evidence, seed):
+        reasoning_calls.append(seed)
+        return reasoning_bundle(agent_outputs, evidence, seed)
+
+    return _reason
+
+
+def _cache_outcomes(result) -> list[object]:
+    return [
+        event.payload["cache"]
+        for event in result.trace.events
+        if event.event_type == EventType.REASONING_END
+    ]
+
+
+@pytest.mark.parametrize("max_parallel_steps", [1, 2])
+def test_strict_replay_is_served_from_reasoning_cache(
+    live_backends,
+    live_flow,
+    live_config,
+    execute_live,
+    execution_read_store,
+    tmp_path,
+    max_parallel_steps,
+) -> None:
+    reasoning_calls: list[int] = []
+    live_backends(reason=_recording_reasoning(reasoning_calls))
+    resolved_flow = live_flow("flow-reasoning-cache")
+
+    original = execute_live(
+        resolved_flow,
+        reasoning_cache=ReasoningCache(cache_dir=tmp_path / "reasoning"),
+    )
+    # A fresh cache over the same directory only has the on-disk tier.
+    diff, replayed = replay_with_store(
+        store=execution_read_store,
+        run_id=original.run_id,
+        tenant_id=TenantID("tenant-a"),
+        resolved_flow=resolved_flow,
+        config=live_config(
+            resolved_flow,
+            max_parallel_steps=max_parallel_steps,
+            reasoning_cache=ReasoningCache(cache_dir=tmp_path / "reasoning"),
+        ),
+    )
+
+    assert len(reasoning_calls) == 2
+    assert _cache_outcomes(original) == ["miss", "miss"]
+    assert _cache_outcomes(replayed) == ["hit", "hit"]
+    assert diff == {}
+    assert replayed.reasoning_bundles == original.reasoning_bundles
+
+
+def test_reasoning_cache_rejects_bundles_that_fail_their_hash(
+    resolved_flow, tmp_path
+) -> None:
+    step = resolved_flow.plan.steps[0]
+    key = ReasoningCacheKey.for_inputs(step, (), (), tenant_id=TenantID("tenant-a"))
+    cache = ReasoningCache(cache_dir=tmp_path)
+    cache.put(key, _bundle(1))
+    assert ReasoningCache(cache_dir=tmp_path).get(key) == _bundle(1)
+
+    (bundle_file,) = (tmp_path / "bundles").iterdir()
+    bundle_file.write_text(
+        bundle_file.read_text(encoding="utf-8").replace("bundle-1", "bundle-2"),
+        encoding="utf-8",
+    )
+    assert ReasoningCache(cache_dir=tmp_path).get(key) is None
+
+    bounded = replace(step, determinism_level=DeterminismLevel.BOUNDED)
+    assert (
+        ReasoningCacheKey.for_inputs(bounded, (), (), tenant_id=TenantID("tenant-a"))
+        is None
+    )
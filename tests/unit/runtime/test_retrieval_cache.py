@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+from tests.helpers import evidence_payload
+
+from agentic_flows.runtime.execution.retrieval_cache import (
+    RetrievalCache,
+    RetrievalCacheKey,
+)
+from agentic_flows.runtime.observability.analysis.trace_diff import (
+    semantic_trace_diff,
+)
+from agentic_flows.spec.model.artifact.retrieved_evidence import RetrievedEvidence
+from agentic_flows.spec.model.datasets.retrieval_request import RetrievalRequest
+from agentic_flows.spec.ontology import DatasetState, EvidenceDeterminism
+from agentic_flows.spec.ontology.ids import (
+    ContentHash,
+    ContractID,
+    EvidenceID,
+    RequestID,
+    TenantID,
+)
+from agentic_flows.spec.ontology.public import EventType
+
+pytestmark = pytest.mark.unit
+
+_REQUEST = RetrievalRequest(
+    spec_version="v1",
+    request_id=RequestID("req-cache"),
+    query="cache",
+    vector_contract_id=ContractID("contract-a"),
+    top_k=1,
+    scope="project",
+)
+
+
+def _counting_retrieval(retrievals: list[str], determinism: EvidenceDeterminism):
+    def _retrieve(query, **_kwargs):
+        retrievals.append(query)
+        return evidence_payload(determinism=determinism)
+
+    return _retrieve
+
+
+def _cache_outcomes(result) -> list[object]:
+    return [
+        event.payload["cache"]
+        for event in result.trace.events
+        if event.event_type == EventType.RETRIEVAL_END
+    ]
+
+
+def test_frozen_dataset_retrieval_is_served_from_cache(
+    live_backends, live_flow, execute_live, tmp_path
+) -> None:
+    resolved_flow = live_flow("flow-retrieval-cache", request=_REQUEST)
+    retrievals: list[str] = []
+    live_backends(
+        retrieve=_counting_retrieval(retrievals, EvidenceDeterminism.DETERMINISTIC)
+    )
+
+    first = execute_live(
+        resolved_flow,
+        retrieval_cache=RetrievalCache(cache_dir=tmp_path / "retrieval"),
+    )
+    # A fresh cache over the same directory only has the on-disk tier.
+    second = execute_live(
+        resolved_flow,
+        retrieval_cache=RetrievalCache(cache_dir=tmp_path / "retrieval"),
+    )
+
+    assert retrievals == ["cache"]
+    assert _cache_outcomes(first) == ["miss", "hit"]
+    assert _cache_outcomes(second) == ["hit", "hit"]
+    assert second.evidence == first.evidence
+    assert second.trace.tool_invocations == first.trace.tool_invocations
+    # The cache outcome is not part of the hashed payload.
+    assert semantic_trace_diff(first.trace, second.trace) == {}
+
+
+def test_cache_skips_unfrozen_datasets_and_nondeterministic_evidence(
+    dataset_descriptor,
+) -> None:
+    unfrozen = replace(dataset_descriptor, dataset_state=DatasetState.EXPERIMENTAL)
+    assert (
+        RetrievalCacheKey.for_request(_REQUEST, unfrozen, tenant_id=TenantID("t"))
+        is None
+    )
+
+    cache = RetrievalCache()
+    key = RetrievalCacheKey.for_request(
+        _REQUEST, dataset_descriptor, tenant_id=TenantID("tenant-a")
+    )
+    evidence = RetrievedEvidence(
+        spec_version="v1",
+        evidence_id=EvidenceID("ev-1"),
+        tenant_id=TenantID("tenant-a"),
+        determinism=EvidenceDeterminism.SAMPLED,
+        source_uri="file://doc",
+        content_hash=ContentHash("hash"),
+        score=0.9,
+        vector_contract_id=ContractID("contract-a"),
+    )
+    cache.put(key, (evidence,))
+    assert cache.get(key) is None
+
+    deterministic = replace(evidence, determinism=EvidenceDeterminism.DETERMINISTIC)
+    cache.put(key, (deterministic,))
+    assert cache.get(key) == (deterministic,)
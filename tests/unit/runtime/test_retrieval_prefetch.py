@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+from tests.helpers import evidence_payload
+
+from agentic_flows.spec.ontology.public import EventType
+
+pytestmark = pytest.mark.unit
+
+_STEPS = 3
+
+
+def _retrieval(*, barrier=None, failing_query=None):
+    def _retrieve(query, **_kwargs):
+        if barrier is not None:
+            barrier.wait()
+        if query == failing_query:
+            raise RuntimeError("retrieval backend unavailable")
+        return evidence_payload(f"ev-{query}", content=f"content-{query}")
+
+    return _retrieve
+
+
+def test_lookahead_retrievals_keep_the_sequential_trace(
+    live_backends, live_flow, execute_live
+) -> None:
+    resolved_flow = live_flow("flow-retrieval-prefetch", steps=_STEPS)
+    live_backends(retrieve=_retrieval())
+    sequential = execute_live(resolved_flow, retrieval_lookahead=0)
+
+    # Every retrieval waits for the others, so the run only gets through when
+    # all of them were issued before the first step consumed its evidence.
+    live_backends(retrieve=_retrieval(barrier=threading.Barrier(_STEPS, timeout=10)))
+    ahead = execute_live(resolved_flow, retrieval_lookahead=_STEPS)
+
+    assert ahead.trace.finalized is True
+    assert [event.payload_json for event in ahead.trace.events] == [
+        event.payload_json for event in sequential.trace.events
+    ]
+    assert ahead.trace.tool_invocations == sequential.trace.tool_invocations
+    assert ahead.evidence == sequential.evidence
+
+
+def test_lookahead_failure_surfaces_at_the_failing_step(
+    live_backends, live_flow, execute_live
+) -> None:
+    resolved_flow = live_flow("flow-retrieval-prefetch", steps=_STEPS)
+    live_backends(retrieve=_retrieval(failing_query="query-1"))
+
+    def _failures(lookahead):
+        result = execute_live(resolved_flow, retrieval_lookahead=lookahead)
+        return [
+            (event.event_index, event.step_index)
+            for event in result.trace.events
+            if event.event_type == EventType.RETRIEVAL_FAILED
+        ]
+
+    sequential = _failures(0)
+    assert [step_index for _, step_index in sequential] == [1]
+    assert _failures(2) == sequential
@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+
+import pytest
+
+from agentic_flows.runtime.observability.analysis.trace_diff import (
+    semantic_trace_diff,
+)
+from agentic_flows.runtime.observability.capture.timings import (
+    TIMING_SCOPES,
+    TimingRecorder,
+)
+from agentic_flows.runtime.orchestration.execute_flow import execute_flow
+from agentic_flows.spec.ontology.ids import TenantID
+
+pytestmark = pytest.mark.unit
+
+
+def test_timings_are_persisted_beside_the_trace(
+    live_backends,
+    live_flow,
+    live_config,
+    execution_read_store,
+    tmp_path,
+    capsys,
+) -> None:
+    live_backends()
+    resolved_flow = live_flow("flow-timings")
+    config = live_config(resolved_flow)
+
+    first = execute_flow(resolved_flow=resolved_flow, config=config)
+    second = execute_flow(resolved_flow=resolved_flow, config=config)
+
+    timings = execution_read_store.load_timings(
+        first.run_id, tenant_id=TenantID("tenant-a")
+    )
+    assert {item.scope for item in timings} == set(TIMING_SCOPES)
+    assert all(item.duration_ns >= 0 for item in timings)
+    assert {item.label for item in timings if item.scope == "tool_call"} == {
+        "bijux-agent.run",
+        "bijux-rag.retrieve",
+        "bijux-rar.reason",
+    }
+    assert [item.step_index for item in timings if item.scope == "step"] == [0, 1]
+    # Real durations never reach the deterministic trace.
+    assert semantic_trace_diff(first.trace, second.trace) == {}
+    assert [event.payload_hash for event in first.trace.events] == [
+        event.payload_hash for event in second.trace.events
+    ]
+
+    args = argparse.Namespace(
+        run_id=str(first.run_id),
+        tenant_id="tenant-a",
+        db_path=str(tmp_path / "execution.duckdb"),
+        timings=True,
+    )
+    cli_main = importlib.import_module("agentic_flows.cli.main")
+    cli_main._inspect_run(args, json_output=True)
+    payload = json.loads(capsys.readouterr().out)
+    assert len(payload["timings"]) == len(timings)
+    assert payload["timings"][0]["duration_ns"] == timings[0].duration_ns
+
+
+def test_timings_survive_a_failed_step_loop(
+    live_backends,
+    live_flow,
+    execute_live,
+    execution_store,
+    execution_read_store,
+    monkeypatch,
+) -> None:
+    live_backends()
+    run_ids = []
+    save_checkpoint = execution_store.save_checkpoint
+
+    def _failing_checkpoint(*, run_id, step_index, **kwargs):
+        run_ids.append(run_id)
+        if step_index == 1:
+            raise RuntimeError("store went away")
+        save_checkpoint(run_id=run_id, step_index=step_index, **kwargs)
+
+    monkeypatch.setattr(execution_store, "save_checkpoint", _failing_checkpoint)
+
+    with pytest.raises(RuntimeError, match="store went away"):
+        execute_live(live_flow("flow-timings"))
+
+    timings = execution_read_store.load_timings(
+        run_ids[0], tenant_id=TenantID("tenant-a")
+    )
+    # Step 1 never reached a checkpoint; its samples are saved on the way out.
+    assert [item.step_index for item in timings if item.scope == "step"] == [0, 1]
+    assert {item.step_index for item in timings if item.scope == "event"} >= {0, 1}
+
+
+def test_drained_samples_are_dropped() -> None:
+    recorder = TimingRecorder(starting_index=3)
+    with recorder.measure("tool_call", "bijux-agent.run"):
+        pass
+
+    assert recorder.drain()[0] == 3
+    assert recorder.records() == ()
+    with recorder.measure("tool_call", "bijux-rag.retrieve"):
+        pass
+    starting_index, pending = recorder.drain()
+    assert starting_index == 4
+    assert [item.label for item in pending] == ["bijux-rag.retrieve"]
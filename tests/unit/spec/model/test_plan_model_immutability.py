@@ -99,7 +99,6 @@ def test_plan_is_structurally_immutable(plan_hash_for) -> None:
             "tenant-a",
             FlowState.VALIDATED,
             (step,),
-            {},
             determinism_level=DeterminismLevel.STRICT,
             replay_acceptability=ReplayAcceptability.EXACT_MATCH,
             entropy_budget=entropy_budget,